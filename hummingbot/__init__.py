@@ -19,19 +19,19 @@ __all__ = ["root_path", "get_executor", "init_logging"]
 logging.setLogRecordFactory(StructLogRecord)
 logging.setLoggerClass(StructLogger)
 
-_shared_executor = None
-
 
 def root_path() -> str:
     from os.path import realpath, join
     return realpath(join(__file__, "../../"))
 
 
-def get_executor() -> ThreadPoolExecutor:
-    global _shared_executor
-    if _shared_executor is None:
-        _shared_executor = ThreadPoolExecutor()
-    return _shared_executor
+def get_executor(pool: str = "misc") -> ThreadPoolExecutor:
+    """
+    Returns the thread pool for blocking calls of a subsystem - see `hummingbot.core.utils.executor_pools` for the pool
+    names.
+    """
+    from hummingbot.core.utils.executor_pools import get_executor_pool
+    return get_executor_pool(pool)
 
 
 def prefix_path() -> str:
@@ -62,7 +62,8 @@ def add_remote_logger_handler(loggers):
     try:
         remote_logger = ReportingProxyHandler(level="DEBUG",
                                               proxy_url="https://api.coinalpha.com/reporting-proxy",
-                                              capacity=5
+                                              capacity=5,
+                                              batched=True
                                               )
         root_logger.addHandler(remote_logger)
         for logger_name in loggers:
@@ -115,6 +115,34 @@ global_config_map = {
                                                   required_if=lambda: False,
                                                   type_str="bool",
                                                   default=False),
+    # Whether or not to run the strategy as soon as an order book changes, rather than on the next clock tick
+    "reactive_mode":                    ConfigVar(key="reactive_mode",
+                                                  prompt="Would you like the strategy to react to order book changes "
+                                                         "immediately, rather than on the next clock tick? >>> ",
+                                                  required_if=lambda: False,
+                                                  type_str="bool",
+                                                  default=False),
+    # Whether or not order books keep cumulative depth indices, which speed up volume and price queries on deep books
+    "order_book_depth_index":           ConfigVar(key="order_book_depth_index",
+                                                  prompt="Would you like order books to keep cumulative depth "
+                                                         "indices, for faster volume and price queries? >>> ",
+                                                  required_if=lambda: False,
+                                                  type_str="bool",
+                                                  default=False),
+    # Whether or not Binance order books apply all the pending diffs at once, rather than one diff at a time
+    "order_book_coalesce_diffs":        ConfigVar(key="order_book_coalesce_diffs",
+                                                  prompt="Would you like Binance order books to apply pending "
+                                                         "updates all at once, when they arrive faster than they "
+                                                         "are applied? >>> ",
+                                                  required_if=lambda: False,
+                                                  type_str="bool",
+                                                  default=False),
+    "clock_tick_size":                  ConfigVar(key="clock_tick_size",
+                                                  prompt="How often, in seconds, should the strategy be run? "
+                                                         "(Default 1.0) >>> ",
+                                                  required_if=lambda: False,
+                                                  type_str="float",
+                                                  default=1.0),
     "exchange_rate_conversion":         ConfigVar(key="exchange_rate_conversion",
                                                   prompt="Enter your custom exchange rate conversion settings >>> ",
                                                   required_if=lambda: False,
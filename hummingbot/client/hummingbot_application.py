@@ -99,6 +99,7 @@ from hummingbot.strategy.discovery import (
 from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversion
 from hummingbot.core.utils.ethereum import check_web3
 from hummingbot.core.utils.stop_loss_tracker import StopLossTracker
+from hummingbot.core.utils.http_client_manager import HttpClientManager
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.data_feed.coin_cap_data_feed import CoinCapDataFeed
 from hummingbot.notifier.notifier_base import NotifierBase
@@ -449,13 +450,16 @@ class HummingbotApplication:
 
     def _initialize_markets(self, market_names: List[Tuple[str, List[str]]]):
         ethereum_rpc_url = global_config_map.get("ethereum_rpc_url").value
+        use_order_book_depth_index = global_config_map.get("order_book_depth_index").value
+        coalesce_order_book_diffs = global_config_map.get("order_book_coalesce_diffs").value
         for market_name, symbols in market_names:
             if market_name == "ddex" and self.wallet:
                 market = DDEXMarket(wallet=self.wallet,
                                     ethereum_rpc_url=ethereum_rpc_url,
                                     order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
                                     symbols=symbols,
-                                    trading_required=self._trading_required)
+                                    trading_required=self._trading_required,
+                                    use_order_book_depth_index=use_order_book_depth_index)
 
             elif market_name == "binance":
                 binance_api_key = global_config_map.get("binance_api_key").value
@@ -465,18 +469,22 @@ class HummingbotApplication:
                                        binance_api_secret=binance_api_secret,
                                        order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
                                        symbols=symbols,
-                                       trading_required=self._trading_required)
+                                       trading_required=self._trading_required,
+                                       use_order_book_depth_index=use_order_book_depth_index,
+                                       coalesce_order_book_diffs=coalesce_order_book_diffs)
 
             elif market_name == "radar_relay" and self.wallet:
                 market = RadarRelayMarket(wallet=self.wallet,
                                           ethereum_rpc_url=ethereum_rpc_url,
                                           symbols=symbols,
-                                          trading_required=self._trading_required)
+                                          trading_required=self._trading_required,
+                                          use_order_book_depth_index=use_order_book_depth_index)
 
             elif market_name == "bamboo_relay" and self.wallet:
                 market = BambooRelayMarket(wallet=self.wallet,
                                            ethereum_rpc_url=ethereum_rpc_url,
-                                           symbols=symbols)
+                                           symbols=symbols,
+                                           use_order_book_depth_index=use_order_book_depth_index)
 
             elif market_name == "coinbase_pro":
                 coinbase_pro_api_key = global_config_map.get("coinbase_pro_api_key").value
@@ -488,7 +496,8 @@ class HummingbotApplication:
                                            coinbase_pro_secret_key=coinbase_pro_secret_key,
                                            coinbase_pro_passphrase=coinbase_pro_passphrase,
                                            symbols=symbols,
-                                           trading_required=self._trading_required)
+                                           trading_required=self._trading_required,
+                                           use_order_book_depth_index=use_order_book_depth_index)
 
             else:
                 raise ValueError(f"Market name {market_name} is invalid.")
@@ -616,6 +625,9 @@ class HummingbotApplication:
         else:
             self._notify(self.strategy.format_status() + "\n")
 
+        if self.clock is not None:
+            self._notify(self.clock.format_status() + "\n")
+
         # Application warnings.
         self._expire_old_application_warnings()
         if len(self._app_warnings) > 0:
@@ -911,13 +923,16 @@ class HummingbotApplication:
             raise NotImplementedError
 
         try:
-            self.clock = Clock(ClockMode.REALTIME)
+            clock_tick_size: float = global_config_map.get("clock_tick_size").value or 1.0
+            self.clock = Clock(ClockMode.REALTIME, tick_size=clock_tick_size)
             if self.wallet is not None:
                 self.clock.add_iterator(self.wallet)
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
             if self.strategy:
+                if global_config_map.get("reactive_mode").value:
+                    self.strategy.enable_reactive_mode()
                 self.clock.add_iterator(self.strategy)
             self.strategy_task: asyncio.Task = asyncio.ensure_future(self._run_clock(), loop=self.ev_loop)
             self._notify(f"\n  '{strategy_name}' strategy started.\n"
@@ -991,6 +1006,7 @@ class HummingbotApplication:
         for notifier in self.notifiers:
             notifier.stop()
 
+        await HttpClientManager.shared_instance().close()
         self.app.exit()
 
     async def export_private_key(self):
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+import asyncio
+from collections import deque
+import threading
+import time
+from typing import (
+    Callable,
+    Deque,
+    Optional
+)
+
+DEFAULT_REFRESH_INTERVAL = 0.1
+DEFAULT_MAXIMUM_PENDING_LINE_COUNT = 5000
+
+
+class OutputBuffer:
+    """
+    Append-only line buffer behind a text pane.
+
+    New lines are queued, and moved into the pane in one redraw at most every `refresh_interval` seconds - so a burst of
+    log lines costs one redraw rather than one per line. The queue is bounded: when lines come in faster than the
+    pane is redrawn, the oldest queued lines are dropped and counted, and the pane shows how many were dropped.
+
+    `append()` may be called from any thread. The redraws happen on the event loop the buffer was created on.
+    """
+    def __init__(self,
+                 render: Callable[[str], None],
+                 maximum_line_count: int,
+                 maximum_pending_line_count: int = DEFAULT_MAXIMUM_PENDING_LINE_COUNT,
+                 refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+                 ev_loop: Optional[asyncio.AbstractEventLoop] = None):
+        self._render: Callable[[str], None] = render
+        self._lines: Deque[str] = deque(maxlen=maximum_line_count)
+        self._pending_lines: Deque[str] = deque()
+        self._maximum_pending_line_count: int = maximum_pending_line_count
+        self._refresh_interval: float = refresh_interval
+        self._ev_loop: asyncio.AbstractEventLoop = ev_loop or asyncio.get_event_loop()
+        self._lock: threading.Lock = threading.Lock()
+        self._redraw_scheduled: bool = False
+        self._last_redraw_time: float = 0.0
+        self._dropped_line_count: int = 0
+        self._unreported_dropped_line_count: int = 0
+
+    @property
+    def lines(self) -> Deque[str]:
+        return self._lines
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self._lines)
+
+    @property
+    def pending_line_count(self) -> int:
+        return len(self._pending_lines)
+
+    @property
+    def dropped_line_count(self) -> int:
+        return self._dropped_line_count
+
+    def append(self, text: str):
+        with self._lock:
+            self._pending_lines.extend(str(text).split("\n"))
+            overflow: int = len(self._pending_lines) - self._maximum_pending_line_count
+            for _ in range(overflow):
+                self._pending_lines.popleft()
+            if overflow > 0:
+                self._dropped_line_count += overflow
+                self._unreported_dropped_line_count += overflow
+            if self._redraw_scheduled:
+                return
+            self._redraw_scheduled = True
+        self._ev_loop.call_soon_threadsafe(self._schedule_redraw)
+
+    def _schedule_redraw(self):
+        delay: float = self._last_redraw_time + self._refresh_interval - time.monotonic()
+        if delay > 0:
+            self._ev_loop.call_later(delay, self.redraw)
+        else:
+            self.redraw()
+
+    def redraw(self):
+        """
+        Moves the queued lines into the pane and re-renders it.
+        """
+        with self._lock:
+            if self._unreported_dropped_line_count > 0:
+                self._lines.append(f"... {self._unreported_dropped_line_count} lines dropped ...")
+                self._unreported_dropped_line_count = 0
+            self._lines.extend(self._pending_lines)
+            self._pending_lines.clear()
+            self._redraw_scheduled = False
+        self._last_redraw_time = time.monotonic()
+        self._render(self.text)
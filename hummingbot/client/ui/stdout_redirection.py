@@ -1,13 +1,11 @@
 #!/usr/bin/env python
 
 from __future__ import unicode_literals
-from prompt_toolkit.eventloop import get_event_loop
 from prompt_toolkit.document import Document
 from hummingbot.client.settings import MAXIMUM_LOG_PANE_LINE_COUNT
+from hummingbot.client.ui.output_buffer import OutputBuffer
 
 from contextlib import contextmanager
-from collections import deque
-from typing import Deque
 import threading
 import sys
 
@@ -56,21 +54,16 @@ class StdoutProxy(object):
         self.errors = original_stdout.errors
         self.encoding = original_stdout.encoding
         self.log_field = log_field
-        self.log_lines: Deque[str] = deque()
-        self.log_lines.append("Running logs\n")
+        self.log_buffer: OutputBuffer = OutputBuffer(self._render_log, MAXIMUM_LOG_PANE_LINE_COUNT)
+        self.log_buffer.append("Running logs\n")
+
+    def _render_log(self, new_text: str):
+        self.log_field.buffer.document = Document(text=new_text, cursor_position=len(new_text))
 
     def _write_and_flush(self, text):
         if not text:
             return
-
-        def write_and_flush():
-            self.log_lines.extend(text.split("\n"))
-            while len(self.log_lines) > MAXIMUM_LOG_PANE_LINE_COUNT:
-                self.log_lines.popleft()
-            new_text: str = "\n".join(self.log_lines)
-            self.log_field.buffer.document = Document(text=new_text, cursor_position=len(new_text))
-
-        get_event_loop().call_from_executor(write_and_flush)
+        self.log_buffer.append(text)
 
     def _write(self, data):
         if '\n' in data:
@@ -1,5 +1,20 @@
 # distutils: language=c++
 
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+
+cdef class TickDurationHistogram:
+    cdef:
+        vector[double] _bucket_bounds
+        vector[int64_t] _bucket_counts
+        int64_t _count
+        double _total_duration
+        double _max_duration
+        double _last_duration
+
+    cdef c_record(self, double duration)
+
+
 cdef class Clock:
     cdef:
         object _clock_mode
@@ -10,3 +25,10 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        int64_t _tick_count
+        int64_t _overrun_count
+        int64_t _skipped_tick_count
+        TickDurationHistogram _tick_durations
+        dict _iterator_tick_durations
+
+    cdef c_tick_iterators(self, list iterators)
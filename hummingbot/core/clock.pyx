@@ -3,7 +3,13 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import (
+    Dict,
+    List,
+    Tuple
+)
+
+from libc.stdint cimport int64_t
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
@@ -12,6 +18,79 @@ from hummingbot.logger import HummingbotLogger
 
 s_logger = None
 
+# Upper bounds of the tick duration histogram buckets, in seconds.
+TICK_DURATION_BUCKET_BOUNDS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                               1.0, 2.5, 5.0, float("inf"))
+
+
+cdef class TickDurationHistogram:
+    """
+    Histogram of the durations of c_tick() calls, with fixed log scale buckets from 0.1ms up to 5s.
+    """
+    def __init__(self):
+        for bound in TICK_DURATION_BUCKET_BOUNDS:
+            self._bucket_bounds.push_back(bound)
+            self._bucket_counts.push_back(0)
+        self._count = 0
+        self._total_duration = 0.0
+        self._max_duration = 0.0
+        self._last_duration = 0.0
+
+    cdef c_record(self, double duration):
+        cdef:
+            size_t i = 0
+        while duration > self._bucket_bounds[i]:
+            i += 1
+        self._bucket_counts[i] += 1
+        self._count += 1
+        self._total_duration += duration
+        self._last_duration = duration
+        if duration > self._max_duration:
+            self._max_duration = duration
+
+    def record(self, duration: float):
+        self.c_record(duration)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._total_duration / self._count if self._count > 0 else 0.0
+
+    @property
+    def max(self) -> float:
+        return self._max_duration
+
+    @property
+    def last(self) -> float:
+        return self._last_duration
+
+    @property
+    def buckets(self) -> List[Tuple[float, int]]:
+        """
+        The (upper bound in seconds, number of durations) pairs of the histogram buckets.
+        """
+        return list(zip(self._bucket_bounds, self._bucket_counts))
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns the upper bound of the bucket that the given percentile of the durations falls into. The maximum
+        duration is returned for the last bucket.
+        """
+        cdef:
+            double target = self._count * percent / 100.0
+            int64_t cumulative_count = 0
+            size_t i
+        if self._count < 1:
+            return 0.0
+        for i in range(self._bucket_counts.size() - 1):
+            cumulative_count += self._bucket_counts[i]
+            if cumulative_count >= target:
+                return min(self._bucket_bounds[i], self._max_duration)
+        return self._max_duration
+
 
 cdef class Clock:
     @classmethod
@@ -24,10 +103,12 @@ cdef class Clock:
     def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
         """
         :param clock_mode: either real time mode or back testing mode
-        :param tick_size: time interval of each tick
+        :param tick_size: time interval of each tick, in seconds - can be less than a second
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
         """
+        if tick_size <= 0:
+            raise ValueError("tick_size must be positive.")
         self._clock_mode = clock_mode
         self._tick_size = tick_size
         self._start_time = start_time
@@ -36,6 +117,11 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._tick_count = 0
+        self._overrun_count = 0
+        self._skipped_tick_count = 0
+        self._tick_durations = TickDurationHistogram()
+        self._iterator_tick_durations = {}
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +143,55 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def tick_count(self) -> int:
+        return self._tick_count
+
+    @property
+    def overrun_count(self) -> int:
+        """
+        Number of real time ticks whose child iterators took longer than the tick size to run.
+        """
+        return self._overrun_count
+
+    @property
+    def skipped_tick_count(self) -> int:
+        """
+        Number of real time ticks that were skipped, because the previous ticks overran into them.
+        """
+        return self._skipped_tick_count
+
+    @property
+    def tick_durations(self) -> TickDurationHistogram:
+        """
+        Durations of whole ticks, i.e. of running all the child iterators once.
+        """
+        return self._tick_durations
+
+    @property
+    def iterator_tick_durations(self) -> Dict[TimeIterator, TickDurationHistogram]:
+        return self._iterator_tick_durations.copy()
+
+    def reset_metrics(self):
+        self._tick_count = 0
+        self._overrun_count = 0
+        self._skipped_tick_count = 0
+        self._tick_durations = TickDurationHistogram()
+        self._iterator_tick_durations = {}
+
+    def format_status(self) -> str:
+        cdef:
+            TickDurationHistogram histogram
+            list lines = [f"  Clock: tick size {self._tick_size}s, {self._tick_count} ticks, "
+                          f"{self._overrun_count} overruns, {self._skipped_tick_count} skipped ticks",
+                          f"    {'iterator':<40}{'mean (ms)':>12}{'p99 (ms)':>12}{'max (ms)':>12}"]
+        for iterator, histogram in [("(whole tick)", self._tick_durations)] + list(
+                self._iterator_tick_durations.items()):
+            name = iterator if isinstance(iterator, str) else type(iterator).__name__
+            lines.append(f"    {name:<40}{histogram.mean * 1e3:>12.3f}{histogram.percentile(99) * 1e3:>12.3f}"
+                         f"{histogram.max * 1e3:>12.3f}")
+        return "\n".join(lines)
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -81,6 +216,35 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._iterator_tick_durations.pop(iterator, None)
+
+    cdef c_tick_iterators(self, list iterators):
+        """
+        Runs c_tick() on the iterators, and records how long each of them took. StopIteration is passed on to the
+        caller, while other exceptions are logged.
+        """
+        cdef:
+            TimeIterator child_iterator
+            TickDurationHistogram histogram
+            double tick_start_time = time.perf_counter()
+            double iterator_start_time
+        for ci in iterators:
+            child_iterator = ci
+            histogram = self._iterator_tick_durations.get(child_iterator)
+            if histogram is None:
+                histogram = TickDurationHistogram()
+                self._iterator_tick_durations[child_iterator] = histogram
+            iterator_start_time = time.perf_counter()
+            try:
+                child_iterator.c_tick(self._current_tick)
+            except StopIteration:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error running clock tick.", exc_info=True)
+            finally:
+                histogram.c_record(time.perf_counter() - iterator_start_time)
+        self._tick_durations.c_record(time.perf_counter() - tick_start_time)
+        self._tick_count += 1
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -90,6 +254,7 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            int64_t skipped_ticks
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -107,21 +272,23 @@ cdef class Clock:
                 if now >= timestamp:
                     return
 
-                # Sleep until the next tick
+                # Sleep until the next tick. The tick grid stays aligned with the wall clock, so any ticks that were
+                # overrun by the previous tick are skipped - and counted.
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
+                skipped_ticks = <int64_t>((next_tick_time - self._current_tick) / self._tick_size + 0.5) - 1
+                if skipped_ticks > 0:
+                    self._skipped_tick_count += skipped_ticks
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
 
                 # Run through all the child iterators.
-                for ci in self._current_context:
-                    child_iterator = ci
-                    try:
-                        child_iterator.c_tick(self._current_tick)
-                    except StopIteration:
-                        self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
-                        return
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                try:
+                    self.c_tick_iterators(self._current_context)
+                except StopIteration:
+                    self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+                    return
+                if self._tick_durations._last_duration > self._tick_size:
+                    self._overrun_count += 1
         finally:
             for ci in self._current_context:
                 child_iterator = ci
@@ -139,14 +306,7 @@ cdef class Clock:
         try:
             while not (self._current_tick >= timestamp):
                 self._current_tick += self._tick_size
-                for ci in self._child_iterators:
-                    child_iterator = ci
-                    try:
-                        child_iterator.c_tick(self._current_tick)
-                    except StopIteration:
-                        raise
-                    except Exception:
-                        self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                self.c_tick_iterators(self._child_iterators)
         except StopIteration:
             return
         finally:
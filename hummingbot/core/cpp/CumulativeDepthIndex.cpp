@@ -0,0 +1,287 @@
+#include "CumulativeDepthIndex.h"
+#include <cmath>
+#include <vector>
+
+CumulativeDepthIndex::CumulativeDepthIndex() : root(nullptr), levelCount(0), randomGenerator(0x5eed) {
+}
+
+CumulativeDepthIndex::~CumulativeDepthIndex() {
+    destroy(this->root);
+}
+
+CumulativeDepthIndex::Node *CumulativeDepthIndex::newNode(double price, double amount) {
+    Node *node = new Node();
+    node->price = price;
+    node->amount = amount;
+    node->sumAmount = amount;
+    node->sumQuote = amount * price;
+    node->priority = this->randomGenerator();
+    node->left = node->right = nullptr;
+    return node;
+}
+
+double CumulativeDepthIndex::sumAmount(const Node *node) {
+    return node != nullptr ? node->sumAmount : 0;
+}
+
+double CumulativeDepthIndex::sumQuote(const Node *node) {
+    return node != nullptr ? node->sumQuote : 0;
+}
+
+void CumulativeDepthIndex::update(Node *node) {
+    node->sumAmount = sumAmount(node->left) + node->amount + sumAmount(node->right);
+    node->sumQuote = sumQuote(node->left) + node->amount * node->price + sumQuote(node->right);
+}
+
+void CumulativeDepthIndex::destroy(Node *node) {
+    if (node == nullptr) {
+        return;
+    }
+    destroy(node->left);
+    destroy(node->right);
+    delete node;
+}
+
+size_t CumulativeDepthIndex::destroyCounted(Node *node) {
+    if (node == nullptr) {
+        return 0;
+    }
+    size_t count = 1 + destroyCounted(node->left) + destroyCounted(node->right);
+    delete node;
+    return count;
+}
+
+/**
+ * Splits the subtree at `node` into levels below `price` (or at and below `price`, if `inclusive`), and the rest.
+ */
+void CumulativeDepthIndex::split(Node *node, double price, bool inclusive, Node *&left, Node *&right) {
+    if (node == nullptr) {
+        left = right = nullptr;
+        return;
+    }
+    if (node->price < price || (inclusive && node->price == price)) {
+        this->split(node->right, price, inclusive, node->right, right);
+        left = node;
+    } else {
+        this->split(node->left, price, inclusive, left, node->left);
+        right = node;
+    }
+    update(node);
+}
+
+CumulativeDepthIndex::Node *CumulativeDepthIndex::merge(Node *left, Node *right) {
+    if (left == nullptr) {
+        return right;
+    }
+    if (right == nullptr) {
+        return left;
+    }
+    if (left->priority > right->priority) {
+        left->right = this->merge(left->right, right);
+        update(left);
+        return left;
+    }
+    right->left = this->merge(left, right->left);
+    update(right);
+    return right;
+}
+
+void CumulativeDepthIndex::clear() {
+    destroy(this->root);
+    this->root = nullptr;
+    this->levelCount = 0;
+}
+
+void CumulativeDepthIndex::rebuild(const std::set<OrderBookEntry> &book) {
+    // Builds the treap from the already sorted book in O(n), by maintaining the right spine of the tree on a stack.
+    std::vector<Node *> rightSpine;
+    std::vector<Node *> nodes;
+    this->clear();
+    nodes.reserve(book.size());
+    for (std::set<OrderBookEntry>::const_iterator it = book.begin(); it != book.end(); ++it) {
+        Node *node = this->newNode(it->getPrice(), it->getAmount());
+        Node *lastPopped = nullptr;
+        while (!rightSpine.empty() && rightSpine.back()->priority < node->priority) {
+            lastPopped = rightSpine.back();
+            rightSpine.pop_back();
+        }
+        node->left = lastPopped;
+        if (!rightSpine.empty()) {
+            rightSpine.back()->right = node;
+        }
+        rightSpine.push_back(node);
+        nodes.push_back(node);
+    }
+    if (!rightSpine.empty()) {
+        this->root = rightSpine.front();
+    }
+    this->levelCount = nodes.size();
+
+    // Children always come before their parents in a post-order walk, so recompute the subtree sums bottom up.
+    std::vector<Node *> stack;
+    std::vector<Node *> postOrder;
+    postOrder.reserve(nodes.size());
+    if (this->root != nullptr) {
+        stack.push_back(this->root);
+    }
+    while (!stack.empty()) {
+        Node *node = stack.back();
+        stack.pop_back();
+        postOrder.push_back(node);
+        if (node->left != nullptr) {
+            stack.push_back(node->left);
+        }
+        if (node->right != nullptr) {
+            stack.push_back(node->right);
+        }
+    }
+    for (std::vector<Node *>::reverse_iterator it = postOrder.rbegin(); it != postOrder.rend(); ++it) {
+        update(*it);
+    }
+}
+
+void CumulativeDepthIndex::setLevel(double price, double amount) {
+    Node *below;
+    Node *level;
+    Node *above;
+    Node *rest;
+
+    this->split(this->root, price, false, below, rest);
+    this->split(rest, price, true, level, above);
+    if (level != nullptr) {
+        this->levelCount -= this->destroyCounted(level);
+        level = nullptr;
+    }
+    if (amount > 0) {
+        level = this->newNode(price, amount);
+        this->levelCount += 1;
+    }
+    this->root = this->merge(this->merge(below, level), above);
+}
+
+void CumulativeDepthIndex::eraseBelow(double price) {
+    Node *below;
+    Node *rest;
+    this->split(this->root, price, false, below, rest);
+    this->levelCount -= this->destroyCounted(below);
+    this->root = rest;
+}
+
+void CumulativeDepthIndex::eraseAbove(double price) {
+    Node *rest;
+    Node *above;
+    this->split(this->root, price, true, rest, above);
+    this->levelCount -= this->destroyCounted(above);
+    this->root = rest;
+}
+
+size_t CumulativeDepthIndex::size() const {
+    return this->levelCount;
+}
+
+/**
+ * Finds the first level, in walking order, at which the cumulative base (or quote) volume reaches `target`.
+ *
+ * `baseBefore` and `quoteBefore` receive the cumulative volumes of all the levels before the returned level. If the
+ * whole book side does not reach `target`, nullptr is returned and they receive the totals of the book side.
+ */
+const CumulativeDepthIndex::Node *CumulativeDepthIndex::findCrossing(bool fromLowest, double target, bool useQuote,
+                                                                     double &baseBefore, double &quoteBefore) const {
+    const Node *node = this->root;
+    baseBefore = quoteBefore = 0;
+    while (node != nullptr) {
+        const Node *nearSide = fromLowest ? node->left : node->right;
+        const Node *farSide = fromLowest ? node->right : node->left;
+        const double accumulated = useQuote ? quoteBefore : baseBefore;
+        const double nearVolume = useQuote ? sumQuote(nearSide) : sumAmount(nearSide);
+        if (nearSide != nullptr && accumulated + nearVolume >= target) {
+            node = nearSide;
+            continue;
+        }
+        const double nodeVolume = useQuote ? node->amount * node->price : node->amount;
+        baseBefore += sumAmount(nearSide);
+        quoteBefore += sumQuote(nearSide);
+        if (accumulated + nearVolume + nodeVolume >= target) {
+            return node;
+        }
+        baseBefore += node->amount;
+        quoteBefore += node->amount * node->price;
+        node = farSide;
+    }
+    return nullptr;
+}
+
+DepthWalkResult CumulativeDepthIndex::getPriceForVolume(bool fromLowest, double volume) const {
+    double baseBefore, quoteBefore;
+    const Node *node = this->findCrossing(fromLowest, volume, false, baseBefore, quoteBefore);
+    if (node == nullptr) {
+        return {NAN, baseBefore};
+    }
+    return {node->price, baseBefore + node->amount};
+}
+
+DepthWalkResult CumulativeDepthIndex::getPriceForQuoteVolume(bool fromLowest, double quoteVolume) const {
+    double baseBefore, quoteBefore;
+    const Node *node = this->findCrossing(fromLowest, quoteVolume, true, baseBefore, quoteBefore);
+    if (node == nullptr) {
+        return {NAN, quoteBefore};
+    }
+    return {node->price, quoteBefore + node->amount * node->price};
+}
+
+DepthWalkResult CumulativeDepthIndex::getVwapForVolume(bool fromLowest, double volume) const {
+    double baseBefore, quoteBefore;
+    const Node *node = this->findCrossing(fromLowest, volume, false, baseBefore, quoteBefore);
+    if (node == nullptr) {
+        return {NAN, baseBefore};
+    }
+    const double incrementalAmount = volume - baseBefore;
+    const double totalCost = quoteBefore + incrementalAmount * node->price;
+    const double totalVolume = baseBefore + incrementalAmount;
+    return {totalVolume > 0 ? totalCost / totalVolume : node->price, totalVolume};
+}
+
+DepthWalkResult CumulativeDepthIndex::getQuoteVolumeForBaseAmount(bool fromLowest, double baseAmount) const {
+    double baseBefore, quoteBefore;
+    const Node *node = this->findCrossing(fromLowest, baseAmount, false, baseBefore, quoteBefore);
+    if (node == nullptr) {
+        return {NAN, quoteBefore};
+    }
+    return {NAN, quoteBefore + (baseAmount - baseBefore) * node->price};
+}
+
+DepthWalkResult CumulativeDepthIndex::getVolumeForPrice(bool fromLowest, double price) const {
+    const Node *node = this->root;
+    double cumulativeVolume = 0;
+    double resultPrice = NAN;
+    while (node != nullptr) {
+        const Node *nearSide = fromLowest ? node->left : node->right;
+        const Node *farSide = fromLowest ? node->right : node->left;
+        if (fromLowest ? node->price <= price : node->price >= price) {
+            cumulativeVolume += sumAmount(nearSide) + node->amount;
+            resultPrice = node->price;
+            node = farSide;
+        } else {
+            node = nearSide;
+        }
+    }
+    return {resultPrice, cumulativeVolume};
+}
+
+DepthWalkResult CumulativeDepthIndex::getQuoteVolumeForPrice(bool fromLowest, double price) const {
+    const Node *node = this->root;
+    double cumulativeVolume = 0;
+    double resultPrice = NAN;
+    while (node != nullptr) {
+        const Node *nearSide = fromLowest ? node->left : node->right;
+        const Node *farSide = fromLowest ? node->right : node->left;
+        if (fromLowest ? node->price <= price : node->price >= price) {
+            cumulativeVolume += sumQuote(nearSide) + node->amount * node->price;
+            resultPrice = node->price;
+            node = farSide;
+        } else {
+            node = nearSide;
+        }
+    }
+    return {resultPrice, cumulativeVolume};
+}
@@ -0,0 +1,66 @@
+#ifndef _CUMULATIVE_DEPTH_INDEX_H
+#define _CUMULATIVE_DEPTH_INDEX_H
+
+#include <stddef.h>
+#include <stdint.h>
+#include <random>
+#include <set>
+#include "OrderBookEntry.h"
+#include "OrderBookDepthWalk.h"
+
+/**
+ * Price-keyed treap over one side of an order book, where every node carries the total base and quote volume of its
+ * subtree. This allows the depth queries in OrderBookDepthWalk.h to be answered in O(log n) instead of walking the
+ * book level by level.
+ *
+ * The query semantics match the depth walks - `fromLowest` walks up from the lowest price (ask book), and false
+ * walks down from the highest price (bid book).
+ */
+class CumulativeDepthIndex {
+    struct Node {
+        double price;
+        double amount;
+        double sumAmount;
+        double sumQuote;
+        uint32_t priority;
+        Node *left;
+        Node *right;
+    };
+
+    Node *root;
+    size_t levelCount;
+    std::mt19937 randomGenerator;
+
+    Node *newNode(double price, double amount);
+    static void update(Node *node);
+    static void destroy(Node *node);
+    static double sumAmount(const Node *node);
+    static double sumQuote(const Node *node);
+    void split(Node *node, double price, bool inclusive, Node *&left, Node *&right);
+    Node *merge(Node *left, Node *right);
+    size_t destroyCounted(Node *node);
+
+    const Node *findCrossing(bool fromLowest, double target, bool useQuote, double &baseBefore, double &quoteBefore) const;
+
+    public:
+        CumulativeDepthIndex();
+        CumulativeDepthIndex(const CumulativeDepthIndex &other) = delete;
+        CumulativeDepthIndex &operator=(const CumulativeDepthIndex &other) = delete;
+        ~CumulativeDepthIndex();
+
+        void clear();
+        void rebuild(const std::set<OrderBookEntry> &book);
+        void setLevel(double price, double amount);
+        void eraseBelow(double price);
+        void eraseAbove(double price);
+        size_t size() const;
+
+        DepthWalkResult getPriceForVolume(bool fromLowest, double volume) const;
+        DepthWalkResult getPriceForQuoteVolume(bool fromLowest, double quoteVolume) const;
+        DepthWalkResult getVwapForVolume(bool fromLowest, double volume) const;
+        DepthWalkResult getQuoteVolumeForBaseAmount(bool fromLowest, double baseAmount) const;
+        DepthWalkResult getVolumeForPrice(bool fromLowest, double price) const;
+        DepthWalkResult getQuoteVolumeForPrice(bool fromLowest, double price) const;
+};
+
+#endif
@@ -0,0 +1,128 @@
+#include "OrderBookDepthWalk.h"
+#include <cmath>
+
+template <typename Iterator>
+static DepthWalkResult walkPriceForVolume(Iterator it, const Iterator end, double volume) {
+    double cumulativeVolume = 0;
+    double resultPrice = NAN;
+    for (; it != end; ++it) {
+        cumulativeVolume += it->getAmount();
+        if (cumulativeVolume >= volume) {
+            resultPrice = it->getPrice();
+            break;
+        }
+    }
+    return {resultPrice, cumulativeVolume};
+}
+
+template <typename Iterator>
+static DepthWalkResult walkPriceForQuoteVolume(Iterator it, const Iterator end, double quoteVolume) {
+    double cumulativeVolume = 0;
+    double resultPrice = NAN;
+    for (; it != end; ++it) {
+        cumulativeVolume += it->getAmount() * it->getPrice();
+        if (cumulativeVolume >= quoteVolume) {
+            resultPrice = it->getPrice();
+            break;
+        }
+    }
+    return {resultPrice, cumulativeVolume};
+}
+
+template <typename Iterator>
+static DepthWalkResult walkVwapForVolume(Iterator it, const Iterator end, double volume) {
+    double totalCost = 0;
+    double totalVolume = 0;
+    double resultVwap = NAN;
+    for (; it != end; ++it) {
+        const double price = it->getPrice();
+        const double amount = it->getAmount();
+        if (totalVolume + amount >= volume) {
+            // Only take the part of the last level that's needed to fill the volume.
+            const double incrementalAmount = volume - totalVolume;
+            totalCost += incrementalAmount * price;
+            totalVolume += incrementalAmount;
+            resultVwap = totalVolume > 0 ? totalCost / totalVolume : price;
+            break;
+        }
+        totalCost += amount * price;
+        totalVolume += amount;
+    }
+    return {resultVwap, totalVolume};
+}
+
+template <typename Iterator>
+static DepthWalkResult walkQuoteVolumeForBaseAmount(Iterator it, const Iterator end, double baseAmount) {
+    double cumulativeVolume = 0;
+    double cumulativeBaseAmount = 0;
+    for (; it != end; ++it) {
+        double rowAmount = it->getAmount();
+        if (rowAmount + cumulativeBaseAmount >= baseAmount) {
+            rowAmount = baseAmount - cumulativeBaseAmount;
+        }
+        cumulativeBaseAmount += rowAmount;
+        cumulativeVolume += rowAmount * it->getPrice();
+        if (cumulativeBaseAmount >= baseAmount) {
+            break;
+        }
+    }
+    return {NAN, cumulativeVolume};
+}
+
+template <typename Iterator>
+static DepthWalkResult walkVolumeForPrice(Iterator it, const Iterator end, bool fromLowest, double price,
+                                          bool quoteVolume) {
+    double cumulativeVolume = 0;
+    double resultPrice = NAN;
+    for (; it != end; ++it) {
+        const double rowPrice = it->getPrice();
+        if (fromLowest ? rowPrice > price : rowPrice < price) {
+            break;
+        }
+        cumulativeVolume += quoteVolume ? it->getAmount() * rowPrice : it->getAmount();
+        resultPrice = rowPrice;
+    }
+    return {resultPrice, cumulativeVolume};
+}
+
+DepthWalkResult getPriceForVolume(const std::set<OrderBookEntry> &book, bool fromLowest, double volume) {
+    if (fromLowest) {
+        return walkPriceForVolume(book.begin(), book.end(), volume);
+    }
+    return walkPriceForVolume(book.rbegin(), book.rend(), volume);
+}
+
+DepthWalkResult getPriceForQuoteVolume(const std::set<OrderBookEntry> &book, bool fromLowest, double quoteVolume) {
+    if (fromLowest) {
+        return walkPriceForQuoteVolume(book.begin(), book.end(), quoteVolume);
+    }
+    return walkPriceForQuoteVolume(book.rbegin(), book.rend(), quoteVolume);
+}
+
+DepthWalkResult getVwapForVolume(const std::set<OrderBookEntry> &book, bool fromLowest, double volume) {
+    if (fromLowest) {
+        return walkVwapForVolume(book.begin(), book.end(), volume);
+    }
+    return walkVwapForVolume(book.rbegin(), book.rend(), volume);
+}
+
+DepthWalkResult getQuoteVolumeForBaseAmount(const std::set<OrderBookEntry> &book, bool fromLowest, double baseAmount) {
+    if (fromLowest) {
+        return walkQuoteVolumeForBaseAmount(book.begin(), book.end(), baseAmount);
+    }
+    return walkQuoteVolumeForBaseAmount(book.rbegin(), book.rend(), baseAmount);
+}
+
+DepthWalkResult getVolumeForPrice(const std::set<OrderBookEntry> &book, bool fromLowest, double price) {
+    if (fromLowest) {
+        return walkVolumeForPrice(book.begin(), book.end(), true, price, false);
+    }
+    return walkVolumeForPrice(book.rbegin(), book.rend(), false, price, false);
+}
+
+DepthWalkResult getQuoteVolumeForPrice(const std::set<OrderBookEntry> &book, bool fromLowest, double price) {
+    if (fromLowest) {
+        return walkVolumeForPrice(book.begin(), book.end(), true, price, true);
+    }
+    return walkVolumeForPrice(book.rbegin(), book.rend(), false, price, true);
+}
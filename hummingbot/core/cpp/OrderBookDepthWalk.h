@@ -0,0 +1,25 @@
+#ifndef _ORDER_BOOK_DEPTH_WALK_H
+#define _ORDER_BOOK_DEPTH_WALK_H
+
+#include <set>
+#include "OrderBookEntry.h"
+
+/**
+ * Depth walks over one side of an order book.
+ *
+ * `fromLowest` selects the walking direction - true walks up from the lowest price (i.e. the ask book when buying),
+ * false walks down from the highest price (i.e. the bid book when selling).
+ */
+struct DepthWalkResult {
+    double resultPrice;
+    double resultVolume;
+};
+
+DepthWalkResult getPriceForVolume(const std::set<OrderBookEntry> &book, bool fromLowest, double volume);
+DepthWalkResult getPriceForQuoteVolume(const std::set<OrderBookEntry> &book, bool fromLowest, double quoteVolume);
+DepthWalkResult getVwapForVolume(const std::set<OrderBookEntry> &book, bool fromLowest, double volume);
+DepthWalkResult getQuoteVolumeForBaseAmount(const std::set<OrderBookEntry> &book, bool fromLowest, double baseAmount);
+DepthWalkResult getVolumeForPrice(const std::set<OrderBookEntry> &book, bool fromLowest, double price);
+DepthWalkResult getQuoteVolumeForPrice(const std::set<OrderBookEntry> &book, bool fromLowest, double price);
+
+#endif
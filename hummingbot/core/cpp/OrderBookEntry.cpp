@@ -1,5 +1,6 @@
 #include "OrderBookEntry.h"
 #include <iostream>
+#include <algorithm>
 
 OrderBookEntry::OrderBookEntry() {
     this->price = this->amount = 0;
@@ -49,14 +50,43 @@ void truncateOverlapEntries(std::set<OrderBookEntry> &bidBook, std::set<OrderBoo
     }
 }
 
-double OrderBookEntry::getPrice() {
+/**
+ * Reduces a sequence of diff entries to one net entry per price level, where the last entry for each price wins.
+ * The result is sorted by price.
+ */
+void coalesceEntries(std::vector<OrderBookEntry> &entries) {
+    std::stable_sort(entries.begin(), entries.end());
+    std::vector<OrderBookEntry>::iterator writeIterator = entries.begin();
+    for (std::vector<OrderBookEntry>::iterator it = entries.begin(); it != entries.end(); ++it) {
+        std::vector<OrderBookEntry>::iterator next = std::next(it);
+        if (next == entries.end() || it->price != next->price) {
+            *writeIterator++ = *it;
+        }
+    }
+    entries.erase(writeIterator, entries.end());
+}
+
+/**
+ * Replaces the contents of `book` with `entries`. The entries are sorted first, so every insertion happens at the end
+ * of the set in amortized constant time. If a price appears more than once, the first entry is kept - the same as
+ * inserting the entries one by one.
+ */
+void bulkLoadEntries(std::set<OrderBookEntry> &book, std::vector<OrderBookEntry> &entries) {
+    std::stable_sort(entries.begin(), entries.end());
+    book.clear();
+    for (std::vector<OrderBookEntry>::const_iterator it = entries.begin(); it != entries.end(); ++it) {
+        book.insert(book.end(), *it);
+    }
+}
+
+double OrderBookEntry::getPrice() const {
     return this->price;
 }
 
-double OrderBookEntry::getAmount() {
+double OrderBookEntry::getAmount() const {
     return this->amount;
 }
 
-int64_t OrderBookEntry::getUpdateId() {
+int64_t OrderBookEntry::getUpdateId() const {
     return this->updateId;
 }
@@ -4,6 +4,7 @@
 #include <stdint.h>
 #include <set>
 #include <iterator>
+#include <vector>
 
 class OrderBookEntry {
     double price;
@@ -17,10 +18,13 @@ class OrderBookEntry {
         OrderBookEntry &operator=(const OrderBookEntry &other);
         friend bool operator<(OrderBookEntry const &a, OrderBookEntry const &b);
         friend void truncateOverlapEntries(std::set<OrderBookEntry> &bidBook, std::set<OrderBookEntry> &askBook);
+        friend void coalesceEntries(std::vector<OrderBookEntry> &entries);
 
-        double getPrice();
-        double getAmount();
-        int64_t getUpdateId();
+        double getPrice() const;
+        double getAmount() const;
+        int64_t getUpdateId() const;
 };
 
+void bulkLoadEntries(std::set<OrderBookEntry> &book, std::vector<OrderBookEntry> &entries);
+
 #endif
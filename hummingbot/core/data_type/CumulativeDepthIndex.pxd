@@ -0,0 +1,22 @@
+# distutils: language=c++
+
+from libcpp.set cimport set
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.OrderBookDepthWalk cimport DepthWalkResult
+
+cdef extern from "../cpp/CumulativeDepthIndex.h":
+    cdef cppclass CumulativeDepthIndex:
+        CumulativeDepthIndex()
+        void clear()
+        void rebuild(const set[OrderBookEntry] &book)
+        void setLevel(double price, double amount)
+        void eraseBelow(double price)
+        void eraseAbove(double price)
+        size_t size()
+        DepthWalkResult getPriceForVolume(bint fromLowest, double volume)
+        DepthWalkResult getPriceForQuoteVolume(bint fromLowest, double quoteVolume)
+        DepthWalkResult getVwapForVolume(bint fromLowest, double volume)
+        DepthWalkResult getQuoteVolumeForBaseAmount(bint fromLowest, double baseAmount)
+        DepthWalkResult getVolumeForPrice(bint fromLowest, double price)
+        DepthWalkResult getQuoteVolumeForPrice(bint fromLowest, double price)
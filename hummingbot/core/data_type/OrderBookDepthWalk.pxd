@@ -0,0 +1,17 @@
+# distutils: language=c++
+
+from libcpp.set cimport set
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+
+cdef extern from "../cpp/OrderBookDepthWalk.h":
+    cdef struct DepthWalkResult:
+        double resultPrice
+        double resultVolume
+
+    DepthWalkResult getPriceForVolume(const set[OrderBookEntry] &book, bint fromLowest, double volume)
+    DepthWalkResult getPriceForQuoteVolume(const set[OrderBookEntry] &book, bint fromLowest, double quoteVolume)
+    DepthWalkResult getVwapForVolume(const set[OrderBookEntry] &book, bint fromLowest, double volume)
+    DepthWalkResult getQuoteVolumeForBaseAmount(const set[OrderBookEntry] &book, bint fromLowest, double baseAmount)
+    DepthWalkResult getVolumeForPrice(const set[OrderBookEntry] &book, bint fromLowest, double price)
+    DepthWalkResult getQuoteVolumeForPrice(const set[OrderBookEntry] &book, bint fromLowest, double price)
@@ -2,6 +2,7 @@
 
 from libc.stdint cimport int64_t
 from libcpp.set cimport set
+from libcpp.vector cimport vector
 
 cdef extern from "../cpp/OrderBookEntry.h":
     cdef cppclass OrderBookEntry:
@@ -14,3 +15,5 @@ cdef extern from "../cpp/OrderBookEntry.h":
         int64_t getUpdateId()
 
     void truncateOverlapEntries(set[OrderBookEntry] &bid_book, set[OrderBookEntry] &ask_book)
+    void coalesceEntries(vector[OrderBookEntry] &entries)
+    void bulkLoadEntries(set[OrderBookEntry] &book, vector[OrderBookEntry] &entries)
@@ -0,0 +1,47 @@
+# distutils: language=c++
+
+cimport numpy as np
+
+cdef enum:
+    L3_NO_SIDE = 0
+    L3_BID = 1
+    L3_ASK = 2
+
+
+cdef class L3OrderStore:
+    cdef:
+        double[:] _prices
+        double[:] _amounts
+        signed char[:] _sides
+        Py_ssize_t _slot_count
+        list _free_slots
+        list _order_ids
+        dict _order_slots
+        dict _bid_level_totals
+        dict _bid_level_counts
+        dict _ask_level_totals
+        dict _ask_level_counts
+
+    cdef c_grow(self, Py_ssize_t min_capacity)
+    cdef Py_ssize_t c_allocate_slot(self, str order_id) except -1
+    cdef double c_add_to_level(self, bint is_bid, double price, double amount, Py_ssize_t order_count_delta) except? -1
+    cdef Py_ssize_t c_get_slot(self, str order_id)
+    cdef bint c_is_bid(self, Py_ssize_t slot)
+    cdef double c_get_order_price(self, Py_ssize_t slot)
+    cdef double c_get_order_amount(self, Py_ssize_t slot)
+    cdef double c_get_level_total(self, bint is_bid, double price)
+    cdef bint c_has_level(self, bint is_bid, double price)
+    cdef double c_set_order(self, str order_id, bint is_bid, double price, double amount) except? -1
+    cdef double c_set_order_amount(self, Py_ssize_t slot, double amount) except? -1
+    cdef double c_remove_order(self, Py_ssize_t slot) except? -1
+    cdef c_clear(self)
+    cdef tuple c_load_snapshot(self,
+                               list bid_ids, object bid_prices, object bid_amounts,
+                               list ask_ids, object ask_prices, object ask_amounts,
+                               double timestamp, double update_id)
+    cdef np.ndarray c_get_levels_np_array(self, bint is_bid, double timestamp, double update_id)
+    cdef dict c_get_active_orders(self, bint is_bid)
+
+
+cdef tuple c_diff_to_np_arrays(int side, double timestamp, double price, double quantity, double update_id)
+cdef tuple c_diff_to_order_book_rows(int side, double price, double quantity, object update_id)
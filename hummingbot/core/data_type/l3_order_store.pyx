@@ -0,0 +1,350 @@
+# distutils: language=c++
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+s_empty_diff = np.ndarray(shape=(0, 4), dtype="float64")
+
+DEFAULT_L3_ORDER_STORE_CAPACITY = 1024
+
+
+cdef class L3OrderStore:
+    """
+    Column store for the individual orders of a level 3 order book, shared by the active order trackers of the L3
+    exchanges.
+
+    Every tracked order occupies a slot in the parallel price / amount / side arrays, and is found by its order id via
+    `_order_slots`. The slots of removed orders are recycled. Each book side also keeps a running total and an order
+    count per price level, so the volume of a level is known in O(1) after any order update.
+
+    Price levels are keyed by float prices.
+    """
+    def __init__(self, int initial_capacity=DEFAULT_L3_ORDER_STORE_CAPACITY):
+        self._prices = np.zeros(max(initial_capacity, 1), dtype="float64")
+        self._amounts = np.zeros(max(initial_capacity, 1), dtype="float64")
+        self._sides = np.zeros(max(initial_capacity, 1), dtype="int8")
+        self._slot_count = 0
+        self._free_slots = []
+        self._order_ids = []
+        self._order_slots = {}
+        self._bid_level_totals = {}
+        self._bid_level_counts = {}
+        self._ask_level_totals = {}
+        self._ask_level_counts = {}
+
+    def __len__(self) -> int:
+        return len(self._order_slots)
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._order_slots
+
+    @property
+    def capacity(self) -> int:
+        return self._prices.shape[0]
+
+    @property
+    def bid_level_count(self) -> int:
+        return len(self._bid_level_totals)
+
+    @property
+    def ask_level_count(self) -> int:
+        return len(self._ask_level_totals)
+
+    cdef c_grow(self, Py_ssize_t min_capacity):
+        cdef:
+            Py_ssize_t capacity = self._prices.shape[0]
+            object prices
+            object amounts
+            object sides
+
+        while capacity < min_capacity:
+            capacity *= 2
+        if capacity == self._prices.shape[0]:
+            return
+        prices = np.zeros(capacity, dtype="float64")
+        amounts = np.zeros(capacity, dtype="float64")
+        sides = np.zeros(capacity, dtype="int8")
+        prices[:self._slot_count] = np.asarray(self._prices[:self._slot_count])
+        amounts[:self._slot_count] = np.asarray(self._amounts[:self._slot_count])
+        sides[:self._slot_count] = np.asarray(self._sides[:self._slot_count])
+        self._prices = prices
+        self._amounts = amounts
+        self._sides = sides
+
+    cdef Py_ssize_t c_allocate_slot(self, str order_id) except -1:
+        cdef:
+            Py_ssize_t slot
+
+        if len(self._free_slots) > 0:
+            slot = self._free_slots.pop()
+            self._order_ids[slot] = order_id
+        else:
+            if self._slot_count >= self._prices.shape[0]:
+                self.c_grow(self._slot_count + 1)
+            slot = self._slot_count
+            self._slot_count += 1
+            self._order_ids.append(order_id)
+        self._order_slots[order_id] = slot
+        return slot
+
+    cdef double c_add_to_level(self, bint is_bid, double price, double amount, Py_ssize_t order_count_delta) except? -1:
+        """
+        Adds `amount` and `order_count_delta` orders to a price level, and returns the new total of the level. A level
+        is removed as soon as it has no orders left, so its total doesn't carry any floating point residue.
+        """
+        cdef:
+            dict level_totals = self._bid_level_totals if is_bid else self._ask_level_totals
+            dict level_counts = self._bid_level_counts if is_bid else self._ask_level_counts
+            Py_ssize_t order_count = level_counts.get(price, 0) + order_count_delta
+            double level_total
+
+        if order_count < 1:
+            level_totals.pop(price, None)
+            level_counts.pop(price, None)
+            return 0.0
+        level_total = level_totals.get(price, 0.0) + amount
+        level_totals[price] = level_total
+        level_counts[price] = order_count
+        return level_total
+
+    cdef Py_ssize_t c_get_slot(self, str order_id):
+        """
+        Returns the slot of an order, or -1 if the order is not tracked.
+        """
+        cdef object slot = self._order_slots.get(order_id)
+        return -1 if slot is None else slot
+
+    cdef bint c_is_bid(self, Py_ssize_t slot):
+        return self._sides[slot] == L3_BID
+
+    cdef double c_get_order_price(self, Py_ssize_t slot):
+        return self._prices[slot]
+
+    cdef double c_get_order_amount(self, Py_ssize_t slot):
+        return self._amounts[slot]
+
+    cdef double c_get_level_total(self, bint is_bid, double price):
+        cdef dict level_totals = self._bid_level_totals if is_bid else self._ask_level_totals
+        return level_totals.get(price, 0.0)
+
+    cdef bint c_has_level(self, bint is_bid, double price):
+        return price in (self._bid_level_totals if is_bid else self._ask_level_totals)
+
+    cdef double c_set_order(self, str order_id, bint is_bid, double price, double amount) except? -1:
+        """
+        Starts tracking an order, or replaces a tracked order with the same id. Returns the new total of the order's
+        price level.
+        """
+        cdef:
+            Py_ssize_t slot = self.c_get_slot(order_id)
+
+        if slot >= 0:
+            if self.c_is_bid(slot) == is_bid and self._prices[slot] == price:
+                return self.c_set_order_amount(slot, amount)
+            self.c_remove_order(slot)
+        slot = self.c_allocate_slot(order_id)
+        self._prices[slot] = price
+        self._amounts[slot] = amount
+        self._sides[slot] = L3_BID if is_bid else L3_ASK
+        return self.c_add_to_level(is_bid, price, amount, 1)
+
+    cdef double c_set_order_amount(self, Py_ssize_t slot, double amount) except? -1:
+        """
+        Updates the remaining amount of a tracked order, and returns the new total of its price level.
+        """
+        cdef:
+            double delta = amount - self._amounts[slot]
+
+        self._amounts[slot] = amount
+        return self.c_add_to_level(self.c_is_bid(slot), self._prices[slot], delta, 0)
+
+    cdef double c_remove_order(self, Py_ssize_t slot) except? -1:
+        """
+        Stops tracking an order, and returns the new total of its price level - 0 if the level is now empty.
+        """
+        cdef:
+            bint is_bid = self.c_is_bid(slot)
+            double price = self._prices[slot]
+            double amount = self._amounts[slot]
+
+        del self._order_slots[self._order_ids[slot]]
+        self._order_ids[slot] = None
+        self._sides[slot] = L3_NO_SIDE
+        self._free_slots.append(slot)
+        return self.c_add_to_level(is_bid, price, -amount, -1)
+
+    cdef c_clear(self):
+        self._slot_count = 0
+        self._free_slots.clear()
+        self._order_ids.clear()
+        self._order_slots.clear()
+        self._bid_level_totals.clear()
+        self._bid_level_counts.clear()
+        self._ask_level_totals.clear()
+        self._ask_level_counts.clear()
+
+    cdef tuple c_load_snapshot(self,
+                               list bid_ids, object bid_prices, object bid_amounts,
+                               list ask_ids, object ask_prices, object ask_amounts,
+                               double timestamp, double update_id):
+        """
+        Replaces all tracked orders with the orders in a snapshot, given as columns of order ids, prices and amounts.
+
+        The columns are copied into the store and aggregated into price levels with numpy, instead of going through
+        the orders one by one. Returns the (timestamp, price, quantity, update_id) level tables of the bid and ask
+        books, sorted by descending price.
+        """
+        cdef:
+            Py_ssize_t bid_count = len(bid_ids)
+            Py_ssize_t order_count = bid_count + len(ask_ids)
+            Py_ssize_t i
+            object side_prices
+            object side_amounts
+            object level_prices
+            object level_indices
+            object level_totals
+            object level_counts
+            list level_tables = []
+
+        bid_prices = np.asarray(bid_prices, dtype="float64")
+        bid_amounts = np.asarray(bid_amounts, dtype="float64")
+        ask_prices = np.asarray(ask_prices, dtype="float64")
+        ask_amounts = np.asarray(ask_amounts, dtype="float64")
+        if bid_prices.shape[0] != bid_count or bid_amounts.shape[0] != bid_count or \
+                ask_prices.shape[0] != order_count - bid_count or ask_amounts.shape[0] != order_count - bid_count:
+            raise ValueError("Snapshot order ids, prices and amounts must have the same lengths.")
+
+        self.c_clear()
+        self.c_grow(order_count)
+        np.asarray(self._prices)[:bid_count] = bid_prices
+        np.asarray(self._prices)[bid_count:order_count] = ask_prices
+        np.asarray(self._amounts)[:bid_count] = bid_amounts
+        np.asarray(self._amounts)[bid_count:order_count] = ask_amounts
+        np.asarray(self._sides)[:bid_count] = L3_BID
+        np.asarray(self._sides)[bid_count:order_count] = L3_ASK
+        self._order_ids.extend(bid_ids)
+        self._order_ids.extend(ask_ids)
+        self._order_slots.update(zip(self._order_ids, range(order_count)))
+        self._slot_count = order_count
+
+        if len(self._order_slots) != order_count:
+            # Duplicated order ids - the later entries replace the earlier ones, like they would in diff messages.
+            self.c_clear()
+            for i in range(bid_count):
+                self.c_set_order(bid_ids[i], True, bid_prices[i], bid_amounts[i])
+            for i in range(order_count - bid_count):
+                self.c_set_order(ask_ids[i], False, ask_prices[i], ask_amounts[i])
+            return (self.c_get_levels_np_array(True, timestamp, update_id),
+                    self.c_get_levels_np_array(False, timestamp, update_id))
+
+        for side_prices, side_amounts, is_bid in [(bid_prices, bid_amounts, True), (ask_prices, ask_amounts, False)]:
+            level_prices, level_indices = np.unique(side_prices, return_inverse=True)
+            level_totals = np.bincount(level_indices, weights=side_amounts, minlength=level_prices.shape[0])
+            level_counts = np.bincount(level_indices, minlength=level_prices.shape[0])
+            if is_bid:
+                self._bid_level_totals.update(zip(level_prices.tolist(), level_totals.tolist()))
+                self._bid_level_counts.update(zip(level_prices.tolist(), level_counts.tolist()))
+            else:
+                self._ask_level_totals.update(zip(level_prices.tolist(), level_totals.tolist()))
+                self._ask_level_counts.update(zip(level_prices.tolist(), level_counts.tolist()))
+            level_tables.append(np.column_stack([
+                np.full(level_prices.shape[0], timestamp),
+                level_prices[::-1],
+                level_totals[::-1],
+                np.full(level_prices.shape[0], update_id)
+            ]).astype("float64", copy=False))
+
+        return level_tables[0], level_tables[1]
+
+    cdef np.ndarray c_get_levels_np_array(self, bint is_bid, double timestamp, double update_id):
+        """
+        Returns the (timestamp, price, quantity, update_id) level table of a book side, sorted by descending price.
+        """
+        cdef:
+            dict level_totals = self._bid_level_totals if is_bid else self._ask_level_totals
+            np.ndarray[np.float64_t, ndim=2] levels = np.array(
+                [[timestamp, price, quantity, update_id]
+                 for price, quantity in sorted(level_totals.items(), reverse=True)], dtype="float64", ndmin=2)
+
+        # If there're no rows, the shape would become (1, 0) and not (0, 4).
+        # Reshape to fix that.
+        if levels.shape[1] != 4:
+            levels = levels.reshape((0, 4))
+        return levels
+
+    cdef dict c_get_active_orders(self, bint is_bid):
+        cdef:
+            dict active_orders = {}
+            dict level_orders
+            str order_id
+            Py_ssize_t slot
+            double price
+
+        for order_id, slot in self._order_slots.items():
+            if self.c_is_bid(slot) != is_bid:
+                continue
+            price = self._prices[slot]
+            level_orders = active_orders.get(price)
+            if level_orders is None:
+                level_orders = active_orders[price] = {}
+            level_orders[order_id] = self._amounts[slot]
+        return active_orders
+
+    def set_order(self, order_id: str, is_bid: bool, price: float, amount: float) -> float:
+        return self.c_set_order(order_id, is_bid, price, amount)
+
+    def set_order_amount(self, order_id: str, amount: float) -> float:
+        return self.c_set_order_amount(self._order_slots[order_id], amount)
+
+    def remove_order(self, order_id: str) -> float:
+        return self.c_remove_order(self._order_slots[order_id])
+
+    def get_order(self, order_id: str):
+        """
+        Returns the (is_bid, price, amount) of a tracked order, or None.
+        """
+        cdef Py_ssize_t slot = self.c_get_slot(order_id)
+        if slot < 0:
+            return None
+        return self.c_is_bid(slot), self._prices[slot], self._amounts[slot]
+
+    def get_level_total(self, is_bid: bool, price: float) -> float:
+        return self.c_get_level_total(is_bid, price)
+
+    def load_snapshot(self, bid_ids, bid_prices, bid_amounts, ask_ids, ask_prices, ask_amounts,
+                      timestamp: float = 0.0, update_id: float = 0.0):
+        return self.c_load_snapshot(list(bid_ids), bid_prices, bid_amounts, list(ask_ids), ask_prices, ask_amounts,
+                                    timestamp, update_id)
+
+    def get_active_orders(self, is_bid: bool):
+        """
+        Returns a {price: {order_id: amount}} copy of the orders on one side of the book.
+        """
+        return self.c_get_active_orders(is_bid)
+
+    def clear(self):
+        self.c_clear()
+
+
+cdef tuple c_diff_to_np_arrays(int side, double timestamp, double price, double quantity, double update_id):
+    """
+    Converts a single level update from an active order tracker into the (bids, asks) diff tables.
+    """
+    if side == L3_NO_SIDE:
+        return s_empty_diff, s_empty_diff
+    diff_row = np.array([[timestamp, price, quantity, update_id]], dtype="float64")
+    if side == L3_BID:
+        return diff_row, s_empty_diff
+    return s_empty_diff, diff_row
+
+
+cdef tuple c_diff_to_order_book_rows(int side, double price, double quantity, object update_id):
+    """
+    Converts a single level update from an active order tracker into (bids, asks) order book row lists.
+    """
+    if side == L3_NO_SIDE:
+        return [], []
+    if side == L3_BID:
+        return [OrderBookRow(price, quantity, update_id)], []
+    return [], [OrderBookRow(price, quantity, update_id)]
@@ -5,6 +5,7 @@ from libcpp.set cimport set
 from libcpp.vector cimport vector
 cimport numpy as np
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.CumulativeDepthIndex cimport CumulativeDepthIndex
 from hummingbot.core.pubsub cimport PubSub
 
 from .order_book_query_result cimport OrderBookQueryResult
@@ -14,18 +15,24 @@ cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _ask_book
     cdef int64_t _snapshot_uid
     cdef int64_t _last_diff_uid
+    cdef int64_t _version
     cdef double _best_bid
     cdef double _best_ask
+    cdef bint _use_depth_index
+    cdef CumulativeDepthIndex _bid_depth_index
+    cdef CumulativeDepthIndex _ask_depth_index
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
-    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id)
+    cdef c_apply_raw_diffs(self, object raw_bids, object raw_asks, int64_t update_id)
+    cdef c_apply_raw_snapshot(self, object raw_bids, object raw_asks, int64_t update_id)
+    cdef c_apply_diff_messages(self, list diff_messages)
     cdef c_apply_trade(self, object trade_event)
-    cdef c_apply_numpy_diffs(self,
-                             np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array)
-    cdef c_apply_numpy_snapshot(self,
-                                np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_set_use_depth_index(self, bint use_depth_index)
+    cdef c_apply_numpy_diffs(self, const double[:, :] bids_array, const double[:, :] asks_array)
+    cdef c_apply_numpy_snapshot(self, const double[:, :] bids_array, const double[:, :] asks_array,
+                                int64_t update_id=*)
+    cdef c_write_numpy_snapshot(self, double[:, :] bids_array, double[:, :] asks_array)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
@@ -1,5 +1,5 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+# distutils: sources=[hummingbot/core/cpp/OrderBookEntry.cpp, hummingbot/core/cpp/OrderBookDepthWalk.cpp, hummingbot/core/cpp/CumulativeDepthIndex.cpp]
 
 import bisect
 import logging
@@ -10,6 +10,7 @@ from cython.operator cimport (
     address as ref
 )
 from aiokafka import ConsumerRecord
+from libc.stdlib cimport strtod
 import pandas as pd
 import numpy as np
 cimport numpy as np
@@ -22,7 +23,20 @@ from typing import (
 )
 
 from sqlalchemy.engine import RowProxy
-from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
+from hummingbot.core.data_type.OrderBookEntry cimport (
+    truncateOverlapEntries,
+    coalesceEntries,
+    bulkLoadEntries
+)
+from hummingbot.core.data_type.OrderBookDepthWalk cimport (
+    DepthWalkResult,
+    getPriceForVolume,
+    getPriceForQuoteVolume,
+    getVwapForVolume,
+    getQuoteVolumeForBaseAmount,
+    getVolumeForPrice,
+    getQuoteVolumeForPrice
+)
 from hummingbot.core.event.events import (
     OrderBookEvent,
     OrderBookTradeEvent
@@ -35,6 +49,64 @@ from .order_book_query_result import OrderBookQueryResult
 ob_logger = None
 NaN = float("nan")
 
+
+cdef extern from "Python.h":
+    const char *PyUnicode_AsUTF8AndSize(object unicode_object, Py_ssize_t *size) except NULL
+
+
+cdef inline double c_parse_raw_number(object value) except? -1:
+    """
+    Parses a price or amount field from a raw exchange payload. Decimal strings are parsed straight from the string's
+    UTF-8 buffer without creating an intermediate Python float; anything else goes through float().
+    """
+    cdef:
+        const char *c_str
+        char *c_str_end
+        Py_ssize_t length
+        double result
+    if type(value) is str:
+        c_str = PyUnicode_AsUTF8AndSize(value, &length)
+        result = strtod(c_str, &c_str_end)
+        if length > 0 and c_str_end == c_str + length:
+            return result
+    return float(value)
+
+
+cdef c_raw_entries_to_vector(object raw_entries, int64_t update_id, vector[OrderBookEntry] &entries):
+    """
+    Converts raw [price, amount, ...] entries, as found in the "bids" and "asks" fields of exchange payloads, into
+    order book entries in a single pass.
+    """
+    for raw_entry in raw_entries:
+        entries.push_back(OrderBookEntry(c_parse_raw_number(raw_entry[0]),
+                                         c_parse_raw_number(raw_entry[1]),
+                                         update_id))
+
+
+cdef int64_t c_numpy_rows_to_vector(const double[:, :] rows, vector[OrderBookEntry] &entries) except? -1:
+    """
+    Converts [price, amount, update_id] rows into order book entries, reading the rows straight from the array's
+    buffer. Returns the largest update ID among the rows, or 0 if there are no rows.
+    """
+    cdef:
+        Py_ssize_t row_count = rows.shape[0]
+        Py_ssize_t i
+        int64_t update_id
+        int64_t last_update_id = 0
+
+    if row_count < 1:
+        return 0
+    if rows.shape[1] < 3:
+        raise ValueError(f"Order book arrays must have [price, amount, update_id] columns, "
+                         f"got {rows.shape[1]} columns.")
+    entries.reserve(entries.size() + row_count)
+    for i in range(row_count):
+        update_id = <int64_t>rows[i, 2]
+        entries.push_back(OrderBookEntry(rows[i, 0], rows[i, 1], update_id))
+        if update_id > last_update_id:
+            last_update_id = update_id
+    return last_update_id
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -45,11 +117,13 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self):
+    def __init__(self, use_depth_index: bool = False):
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
+        self._version = 0
         self._best_bid = self._best_ask = float("NaN")
+        self._use_depth_index = use_depth_index
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -68,12 +142,16 @@ cdef class OrderBook(PubSub):
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
+            if self._use_depth_index:
+                self._bid_depth_index.setLevel(bid.getPrice(), bid.getAmount())
         for ask in asks:
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
+            if self._use_depth_index:
+                self._ask_depth_index.setLevel(ask.getPrice(), ask.getAmount())
 
         # If there's any overlapping entries between the bid and ask books, the newer entries win.
         truncateOverlapEntries(self._bid_book, self._ask_book)
@@ -88,36 +166,59 @@ cdef class OrderBook(PubSub):
             top_ask = deref(ask_iterator)
             self._best_ask = top_ask.getPrice()
 
+        # Drop the levels removed by the overlap truncation from the depth indices as well.
+        if self._use_depth_index:
+            if bid_iterator != self._bid_book.rend():
+                self._bid_depth_index.eraseAbove(top_bid.getPrice())
+            else:
+                self._bid_depth_index.clear()
+            if ask_iterator != self._ask_book.end():
+                self._ask_depth_index.eraseBelow(top_ask.getPrice())
+            else:
+                self._ask_depth_index.clear()
+
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self._version += 1
 
-    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] &bids, vector[OrderBookEntry] &asks, int64_t update_id):
+        """
+        Replaces the order book with the given entries. `bids` and `asks` are sorted in place.
+        """
         cdef:
-            double best_bid_price = float("NaN")
-            double best_ask_price = float("NaN")
+            set[OrderBookEntry].reverse_iterator bid_iterator
+            set[OrderBookEntry].iterator ask_iterator
 
-        # Start with an empty order book, and then insert all entries.
-        self._bid_book.clear()
-        self._ask_book.clear()
-        for bid in bids:
-            self._bid_book.insert(bid)
-            if not (bid.getPrice() <= best_bid_price):
-                best_bid_price = bid.getPrice()
-        for ask in asks:
-            self._ask_book.insert(ask)
-            if not (ask.getPrice() >= best_ask_price):
-                best_ask_price = ask.getPrice()
+        # Rebuild both sides of the order book from the sorted entries.
+        bulkLoadEntries(self._bid_book, bids)
+        bulkLoadEntries(self._ask_book, asks)
 
         # Record the current best prices, for faster c_get_price() calls.
-        self._best_bid = best_bid_price
-        self._best_ask = best_ask_price
+        bid_iterator = self._bid_book.rbegin()
+        ask_iterator = self._ask_book.begin()
+        self._best_bid = deref(bid_iterator).getPrice() if bid_iterator != self._bid_book.rend() else NaN
+        self._best_ask = deref(ask_iterator).getPrice() if ask_iterator != self._ask_book.end() else NaN
+
+        if self._use_depth_index:
+            self._bid_depth_index.rebuild(self._bid_book)
+            self._ask_depth_index.rebuild(self._ask_book)
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self._version += 1
 
     cdef c_apply_trade(self, object trade_event):
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    cdef c_set_use_depth_index(self, bint use_depth_index):
+        if use_depth_index and not self._use_depth_index:
+            self._bid_depth_index.rebuild(self._bid_book)
+            self._ask_depth_index.rebuild(self._ask_book)
+        elif not use_depth_index:
+            self._bid_depth_index.clear()
+            self._ask_depth_index.clear()
+        self._use_depth_index = use_depth_index
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -126,14 +227,41 @@ cdef class OrderBook(PubSub):
     def last_diff_uid(self) -> int:
         return self._last_diff_uid
 
+    @property
+    def version(self) -> int:
+        """
+        Number of diffs and snapshots applied to the order book so far. It changes whenever any price level may have
+        changed, which the update IDs alone do not show - e.g. diffs may be applied with the same update ID.
+        """
+        return self._version
+
+    @property
+    def use_depth_index(self) -> bool:
+        """
+        Whether the order book maintains cumulative depth indices, which answer the volume and price queries in
+        O(log n) rather than walking the book from the top. The indices cost an extra O(log n) per applied diff
+        entry, so they are only worth it for order books that are queried more often than they are updated.
+        """
+        return self._use_depth_index
+
+    @use_depth_index.setter
+    def use_depth_index(self, bint value):
+        self.c_set_use_depth_index(value)
+
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_array, asks_array = self.get_numpy_snapshot()
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields)
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields)
         return bids_df, asks_df
 
+    @property
+    def entry_counts(self) -> Tuple[int, int]:
+        """
+        The number of price levels in the bid and ask books.
+        """
+        return self._bid_book.size(), self._ask_book.size()
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -154,6 +282,58 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_diffs(self, raw_bids: List[List[str]], raw_asks: List[List[str]], update_id: int):
+        """
+        Applies diffs directly from the raw "bids" and "asks" fields of an order book message's content, without
+        going through OrderBookMessage.bids / OrderBookMessage.asks.
+        """
+        self.c_apply_raw_diffs(raw_bids, raw_asks, update_id)
+
+    def apply_raw_snapshot(self, raw_bids: List[List[str]], raw_asks: List[List[str]], update_id: int):
+        """
+        Applies a snapshot directly from the raw "bids" and "asks" fields of an order book message's content.
+        """
+        self.c_apply_raw_snapshot(raw_bids, raw_asks, update_id)
+
+    cdef c_apply_raw_diffs(self, object raw_bids, object raw_asks, int64_t update_id):
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_raw_entries_to_vector(raw_bids, update_id, cpp_bids)
+        c_raw_entries_to_vector(raw_asks, update_id, cpp_asks)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
+    def apply_diff_messages(self, diff_messages: List[OrderBookMessage]):
+        """
+        Applies a batch of diff messages as a single net diff, where the last update to each price level wins.
+        The messages must be in the order they were received in.
+        """
+        self.c_apply_diff_messages(diff_messages)
+
+    cdef c_apply_diff_messages(self, list diff_messages):
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+            int64_t update_id = 0
+
+        if len(diff_messages) < 1:
+            return
+        for diff_message in diff_messages:
+            update_id = diff_message.update_id
+            c_raw_entries_to_vector(diff_message.content["bids"], update_id, cpp_bids)
+            c_raw_entries_to_vector(diff_message.content["asks"], update_id, cpp_asks)
+        coalesceEntries(cpp_bids)
+        coalesceEntries(cpp_asks)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
+    cdef c_apply_raw_snapshot(self, object raw_bids, object raw_asks, int64_t update_id):
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_raw_entries_to_vector(raw_bids, update_id, cpp_bids)
+        c_raw_entries_to_vector(raw_asks, update_id, cpp_asks)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -172,9 +352,7 @@ cdef class OrderBook(PubSub):
         """
         self.c_apply_numpy_diffs(bids_array, asks_array)
 
-    cdef c_apply_numpy_diffs(self,
-                             np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+    cdef c_apply_numpy_diffs(self, const double[:, :] bids_array, const double[:, :] asks_array):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -182,42 +360,78 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            int64_t last_update_id = max(c_numpy_rows_to_vector(bids_array, cpp_bids),
+                                         c_numpy_rows_to_vector(asks_array, cpp_asks))
+
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
-        The diffs data frame must have 3 columns, [price, amount, update_id].
-        All columns are of double type.
+        The snapshot arrays must have 3 columns, [price, amount, update_id], and can be any view of float64 arrays -
+        e.g. column slices of a larger table. All columns are of double type.
+
+        If `update_id` is not given, the largest update ID in the arrays is used as the snapshot update ID.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(bids_array, asks_array, -1 if update_id is None else update_id)
 
-    cdef c_apply_numpy_snapshot(self,
-                                np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+    cdef c_apply_numpy_snapshot(self, const double[:, :] bids_array, const double[:, :] asks_array,
+                                int64_t update_id=-1):
         """
-        The diffs data frame must have 3 columns, [price, amount, update_id].
-        All columns are of double type.
+        Bulk loads a snapshot from [price, amount, update_id] float64 buffers, without creating any Python objects
+        per row.
         """
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
+            int64_t last_update_id = max(c_numpy_rows_to_vector(bids_array, cpp_bids),
+                                         c_numpy_rows_to_vector(asks_array, cpp_asks))
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, update_id if update_id >= 0 else last_update_id)
+
+    def get_numpy_snapshot(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the bid and ask books as [price, amount, update_id] float64 arrays. Bids are sorted from the best
+        price down, and asks from the best price up.
+        """
+        bids_array = np.empty((self._bid_book.size(), 3), dtype="float64")
+        asks_array = np.empty((self._ask_book.size(), 3), dtype="float64")
+        self.c_write_numpy_snapshot(bids_array, asks_array)
+        return bids_array, asks_array
+
+    def write_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+        """
+        Writes the order book into [price, amount, update_id] float64 arrays, in the same order as
+        `get_numpy_snapshot()`. The arrays must have exactly as many rows as `entry_counts`, and can be any writable
+        views of float64 arrays - e.g. row slices of a column-major table.
+        """
+        self.c_write_numpy_snapshot(bids_array, asks_array)
+
+    cdef c_write_numpy_snapshot(self, double[:, :] bids_array, double[:, :] asks_array):
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            Py_ssize_t i = 0
+
+        if bids_array.shape[0] != <Py_ssize_t>self._bid_book.size() or \
+                asks_array.shape[0] != <Py_ssize_t>self._ask_book.size():
+            raise ValueError(f"Order book arrays must have {self.entry_counts} rows, "
+                             f"got {(bids_array.shape[0], asks_array.shape[0])}.")
+        if bids_array.shape[1] < 3 or asks_array.shape[1] < 3:
+            raise ValueError("Order book arrays must have [price, amount, update_id] columns.")
+
+        while bid_iterator != self._bid_book.rend():
+            bids_array[i, 0] = deref(bid_iterator).getPrice()
+            bids_array[i, 1] = deref(bid_iterator).getAmount()
+            bids_array[i, 2] = deref(bid_iterator).getUpdateId()
+            inc(bid_iterator)
+            i += 1
+        i = 0
+        while ask_iterator != self._ask_book.end():
+            asks_array[i, 0] = deref(ask_iterator).getPrice()
+            asks_array[i, 1] = deref(ask_iterator).getAmount()
+            asks_array[i, 2] = deref(ask_iterator).getUpdateId()
+            inc(ask_iterator)
+            i += 1
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
@@ -277,143 +491,69 @@ cdef class OrderBook(PubSub):
 
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            CumulativeDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+            DepthWalkResult result
+        if self._use_depth_index:
+            result = deref(depth_index).getPriceForVolume(is_buy, volume)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-
-        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+            result = getPriceForVolume(deref(book), is_buy, volume)
+        return OrderBookQueryResult(NaN, volume, result.resultPrice, min(result.resultVolume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
-            double total_cost  = 0
-            double total_volume = 0
-            double result_vwap = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    incremental_amount = total_volume - volume
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            CumulativeDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+            DepthWalkResult result
+        if self._use_depth_index:
+            result = deref(depth_index).getVwapForVolume(is_buy, volume)
         else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    incremental_amount = total_volume - volume
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-
-        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+            result = getVwapForVolume(deref(book), is_buy, volume)
+        return OrderBookQueryResult(NaN, volume, result.resultPrice, min(result.resultVolume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            CumulativeDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+            DepthWalkResult result
+        if self._use_depth_index:
+            result = deref(depth_index).getPriceForQuoteVolume(is_buy, quote_volume)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-
-        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+            result = getPriceForQuoteVolume(deref(book), is_buy, quote_volume)
+        return OrderBookQueryResult(NaN, quote_volume, result.resultPrice, min(result.resultVolume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
-            double cumulative_volume = 0
-            double cumulative_base_amount = 0
-            double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            CumulativeDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+            DepthWalkResult result
+        if self._use_depth_index:
+            result = deref(depth_index).getQuoteVolumeForBaseAmount(is_buy, base_amount)
         else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-
-        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+            result = getQuoteVolumeForBaseAmount(deref(book), is_buy, base_amount)
+        return OrderBookQueryResult(NaN, base_amount, NaN, result.resultVolume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            CumulativeDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+            DepthWalkResult result
+        if self._use_depth_index:
+            result = deref(depth_index).getVolumeForPrice(is_buy, price)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+            result = getVolumeForPrice(deref(book), is_buy, price)
+        return OrderBookQueryResult(price, NaN, result.resultPrice, result.resultVolume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            CumulativeDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+            DepthWalkResult result
+        if self._use_depth_index:
+            result = deref(depth_index).getQuoteVolumeForPrice(is_buy, price)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+            result = getQuoteVolumeForPrice(deref(book), is_buy, price)
+        return OrderBookQueryResult(price, NaN, result.resultPrice, result.resultVolume)
 
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
@@ -456,7 +596,7 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.c_apply_raw_snapshot(snapshot.content["bids"], snapshot.content["asks"], snapshot.update_id)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.c_apply_raw_diffs(diff.content["bids"], diff.content["asks"], diff.update_id)
 
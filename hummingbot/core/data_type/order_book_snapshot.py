@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+"""
+Compact binary format for snapshots of many order books, e.g. the whole order book tracker.
+
+All numbers are little-endian. A snapshot is laid out as:
+
+    header          4s magic, uint16 format version, uint16 reserved, uint32 symbol count, uint32 symbol table size
+    row counts      int64[symbol count, 2] - the number of bid and ask rows of each order book
+    symbol table    the UTF-8 encoded symbols joined by newlines, zero padded to a multiple of 8 bytes
+    columns         float64[3, total row count] - the price, amount and update_id columns of all the order books
+
+Each order book's rows are stored together in the columns - bids from the best price down, followed by asks from
+the best price up - in the order of the symbol table.
+
+Decoding only parses the header and the symbol table. The order book arrays it returns are views into the snapshot
+buffer, which `OrderBook.apply_numpy_snapshot()` reads directly.
+"""
+
+import numpy as np
+import struct
+from typing import (
+    Dict,
+    Tuple,
+    Type
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+ORDER_BOOK_SNAPSHOT_MAGIC = b"HBOB"
+ORDER_BOOK_SNAPSHOT_VERSION = 1
+ORDER_BOOK_SNAPSHOT_CONTENT_TYPE = "application/x-hummingbot-order-book-snapshot"
+
+_HEADER: struct.Struct = struct.Struct("<4sHHII")
+_ROW_COUNT_DTYPE: np.dtype = np.dtype("<i8")
+_COLUMN_DTYPE: np.dtype = np.dtype("<f8")
+
+
+def encode_order_book_snapshots(order_books: Dict[str, OrderBook]) -> bytes:
+    symbols = list(order_books.keys())
+    row_counts: np.ndarray = np.array([order_books[symbol].entry_counts for symbol in symbols],
+                                      dtype=_ROW_COUNT_DTYPE).reshape(len(symbols), 2)
+    columns: np.ndarray = np.empty((3, int(row_counts.sum())), dtype=_COLUMN_DTYPE)
+    rows: np.ndarray = columns.T
+    start: int = 0
+    for symbol, (bid_count, ask_count) in zip(symbols, row_counts):
+        order_books[symbol].write_numpy_snapshot(rows[start:start + bid_count],
+                                                 rows[start + bid_count:start + bid_count + ask_count])
+        start += bid_count + ask_count
+
+    symbol_table: bytes = "\n".join(symbols).encode("utf8")
+    return b"".join([
+        _HEADER.pack(ORDER_BOOK_SNAPSHOT_MAGIC, ORDER_BOOK_SNAPSHOT_VERSION, 0, len(symbols), len(symbol_table)),
+        row_counts.tobytes(),
+        symbol_table,
+        b"\0" * (-len(symbol_table) % 8),
+        columns.tobytes()
+    ])
+
+
+def decode_order_book_snapshots(data: bytes) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Returns the [price, amount, update_id] bid and ask arrays of each symbol in a snapshot. The arrays are read-only
+    views into `data`.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Order book snapshot is too short.")
+    magic, version, _, symbol_count, symbol_table_size = _HEADER.unpack_from(data)
+    if magic != ORDER_BOOK_SNAPSHOT_MAGIC:
+        raise ValueError("Data is not an order book snapshot.")
+    if version != ORDER_BOOK_SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported order book snapshot version {version}.")
+
+    offset: int = _HEADER.size
+    row_counts_size: int = symbol_count * 2 * _ROW_COUNT_DTYPE.itemsize
+    if len(data) < offset + row_counts_size + symbol_table_size:
+        raise ValueError("Order book snapshot is truncated.")
+    row_counts: np.ndarray = np.frombuffer(data, dtype=_ROW_COUNT_DTYPE, count=symbol_count * 2,
+                                           offset=offset).reshape(symbol_count, 2)
+    offset += row_counts_size
+    symbols = bytes(data[offset:offset + symbol_table_size]).decode("utf8").split("\n") if symbol_count > 0 else []
+    offset += symbol_table_size + (-symbol_table_size % 8)
+
+    # The row counts come from remote data - check them before they are summed and used to slice the columns.
+    available_row_count: int = max(len(data) - offset, 0) // (3 * _COLUMN_DTYPE.itemsize)
+    if symbol_count > 0 and row_counts.min() < 0:
+        raise ValueError("Order book snapshot has negative row counts.")
+    if symbol_count > 0 and row_counts.max() > available_row_count:
+        raise ValueError(f"Order book snapshot row counts exceed the {available_row_count} rows in the snapshot.")
+    row_count: int = sum(int(bid_count) + int(ask_count) for bid_count, ask_count in row_counts)
+    if row_count > available_row_count:
+        raise ValueError(f"Order book snapshot row counts exceed the {available_row_count} rows in the snapshot.")
+    if len(symbols) != symbol_count or len(data) != offset + row_count * 3 * _COLUMN_DTYPE.itemsize:
+        raise ValueError("Order book snapshot is truncated or corrupted.")
+    rows: np.ndarray = np.frombuffer(data, dtype=_COLUMN_DTYPE, count=row_count * 3,
+                                     offset=offset).reshape(3, row_count).T
+
+    retval: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+    start: int = 0
+    for symbol, (bid_count, ask_count) in zip(symbols, row_counts):
+        retval[symbol] = (rows[start:start + bid_count], rows[start + bid_count:start + bid_count + ask_count])
+        start += bid_count + ask_count
+    return retval
+
+
+def load_order_book_snapshots(data: bytes, order_book_class: Type[OrderBook] = OrderBook) -> Dict[str, OrderBook]:
+    """
+    Creates an order book of `order_book_class` for each symbol in a snapshot.
+    """
+    retval: Dict[str, OrderBook] = {}
+    for symbol, (bids_array, asks_array) in decode_order_book_snapshots(data).items():
+        order_book: OrderBook = order_book_class()
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        retval[symbol] = order_book
+    return retval
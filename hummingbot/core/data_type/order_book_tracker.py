@@ -17,6 +17,11 @@ from typing import (
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_snapshot import encode_order_book_snapshots
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookChangedEvent
+)
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from .order_book_message import (
     OrderBookMessageType,
@@ -44,8 +49,12 @@ class OrderBookTracker(ABC):
         return cls._obt_logger
 
     def __init__(self,
-                 data_source_type: OrderBookTrackerDataSourceType = OrderBookTrackerDataSourceType.EXCHANGE_API):
+                 data_source_type: OrderBookTrackerDataSourceType = OrderBookTrackerDataSourceType.EXCHANGE_API,
+                 coalesce_diffs: bool = False,
+                 use_depth_index: bool = False):
         self._data_source_type: OrderBookTrackerDataSourceType = data_source_type
+        self._coalesce_diffs: bool = coalesce_diffs
+        self._use_depth_index: bool = use_depth_index
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -72,6 +81,31 @@ class OrderBookTracker(ABC):
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_books
 
+    @property
+    def coalesce_diffs(self) -> bool:
+        """
+        If true, each order book tracking task drains all the pending messages of its order book at once, and applies
+        the diffs among them as one net diff - rather than applying the diff messages one by one.
+        """
+        return self._coalesce_diffs
+
+    @coalesce_diffs.setter
+    def coalesce_diffs(self, value: bool):
+        self._coalesce_diffs = value
+
+    @property
+    def use_depth_index(self) -> bool:
+        """
+        If true, the tracked order books maintain cumulative depth indices - see `OrderBook.use_depth_index`.
+        """
+        return self._use_depth_index
+
+    @use_depth_index.setter
+    def use_depth_index(self, value: bool):
+        self._use_depth_index = value
+        for order_book in self._order_books.values():
+            order_book.use_depth_index = value
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -79,6 +113,13 @@ class OrderBookTracker(ABC):
             for symbol, order_book in self._order_books.items()
         }
 
+    @property
+    def binary_snapshot(self) -> bytes:
+        """
+        All the order books in the compact binary snapshot format, see `order_book_snapshot`.
+        """
+        return encode_order_book_snapshots(self._order_books)
+
     async def _refresh_tracking_tasks(self):
         """
         Starts tracking for any new trading pairs, and stop tracking for any inactive trading pairs.
@@ -92,6 +133,7 @@ class OrderBookTracker(ABC):
 
         for symbol in new_symbols:
             self._order_books[symbol] = available_pairs[symbol].order_book
+            self._order_books[symbol].use_depth_index = self._use_depth_index
             self._tracking_message_queues[symbol] = asyncio.Queue()
             self._tracking_tasks[symbol] = asyncio.ensure_future(self._track_single_book(symbol))
             self.logger().info("Started order book tracking for %s.", symbol)
@@ -177,8 +219,53 @@ class OrderBookTracker(ABC):
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _did_change_order_book(symbol: str, order_book: OrderBook):
+        """
+        Tells the listeners of an order book, e.g. strategies running in reactive mode, that it has just been updated.
+        Nothing is done for order books without listeners, which is the usual case outside of reactive mode.
+        """
+        if order_book.has_listeners(OrderBookEvent.OrderBookChanged):
+            order_book.trigger_event(OrderBookEvent.OrderBookChanged, OrderBookChangedEvent(symbol, time.time()))
+
+    @staticmethod
+    def _drain_message_queue(message_queue: asyncio.Queue, messages: List[OrderBookMessage]):
+        while not message_queue.empty():
+            messages.append(message_queue.get_nowait())
+
+    def _apply_message_batch(self,
+                             order_book: OrderBook,
+                             messages: List[OrderBookMessage],
+                             past_diffs_window: Deque[OrderBookMessage]) -> int:
+        """
+        Applies a batch of order book messages, in order. Consecutive diff messages are coalesced into one net diff.
+        Snapshots are applied in their original position in the batch, after all the diffs that came before them.
+
+        :return: the number of diff messages applied
+        """
+        pending_diffs: List[OrderBookMessage] = []
+        diff_messages_applied: int = 0
+
+        for message in messages:
+            if message.type is OrderBookMessageType.DIFF:
+                pending_diffs.append(message)
+            elif message.type is OrderBookMessageType.SNAPSHOT:
+                if len(pending_diffs) > 0:
+                    order_book.apply_diff_messages(pending_diffs)
+                    past_diffs_window.extend(pending_diffs)
+                    diff_messages_applied += len(pending_diffs)
+                    pending_diffs = []
+                past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+                order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+
+        if len(pending_diffs) > 0:
+            order_book.apply_diff_messages(pending_diffs)
+            past_diffs_window.extend(pending_diffs)
+            diff_messages_applied += len(pending_diffs)
+        return diff_messages_applied
+
     async def _track_single_book(self, symbol: str):
-        past_diffs_window: Deque[OrderBookMessage] = deque()
+        past_diffs_window: Deque[OrderBookMessage] = deque(maxlen=self.PAST_DIFF_WINDOW_SIZE)
         self._past_diffs_windows[symbol] = past_diffs_window
 
         message_queue: asyncio.Queue = self._tracking_message_queues[symbol]
@@ -189,11 +276,21 @@ class OrderBookTracker(ABC):
         while True:
             try:
                 message: OrderBookMessage = await message_queue.get()
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                if self._coalesce_diffs:
+                    messages: List[OrderBookMessage] = [message]
+                    self._drain_message_queue(message_queue, messages)
+                    diff_messages_accepted += self._apply_message_batch(order_book, messages, past_diffs_window)
+
+                    # Output some statistics periodically.
+                    now: float = time.time()
+                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                        self.logger().info("Processed %d order book diffs for %s.",
+                                           diff_messages_accepted, symbol)
+                        diff_messages_accepted = 0
+                    last_message_timestamp = now
+                elif message.type is OrderBookMessageType.DIFF:
+                    order_book.apply_raw_diffs(message.content["bids"], message.content["asks"], message.update_id)
                     past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
@@ -207,6 +304,8 @@ class OrderBookTracker(ABC):
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
                     self.logger().debug("Processed order book snapshot for %s.", symbol)
+
+                self._did_change_order_book(symbol, order_book)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -20,7 +20,12 @@ import conf
 from hummingbot.market.binance.binance_order_book import BinanceOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_manager import HttpClientManager
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+from hummingbot.core.data_type.order_book_snapshot import (
+    ORDER_BOOK_SNAPSHOT_CONTENT_TYPE,
+    load_order_book_snapshots
+)
 
 
 class RemoteAPIOrderBookDataSource(OrderBookTrackerDataSource):
@@ -41,7 +46,6 @@ class RemoteAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     def __init__(self):
         super().__init__()
-        self._client_session: Optional[aiohttp.ClientSession] = None
 
     @property
     def authentication_headers(self) -> Dict[str, str]:
@@ -52,23 +56,32 @@ class RemoteAPIOrderBookDataSource(OrderBookTrackerDataSource):
         }
 
     async def get_client_session(self) -> aiohttp.ClientSession:
-        if self._client_session is None:
-            self._client_session = aiohttp.ClientSession()
-        return self._client_session
+        return HttpClientManager.shared_instance().client()
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         auth: aiohttp.BasicAuth = aiohttp.BasicAuth(login=conf.coinalpha_order_book_api_username,
                                                     password=conf.coinalpha_order_book_api_password)
         client_session: aiohttp.ClientSession = await self.get_client_session()
-        response: aiohttp.ClientResponse = await client_session.get(self.SNAPSHOT_REST_URL, auth=auth)
+        response: aiohttp.ClientResponse = await client_session.get(
+            self.SNAPSHOT_REST_URL,
+            auth=auth,
+            headers={"Accept": f"{ORDER_BOOK_SNAPSHOT_CONTENT_TYPE}, application/octet-stream;q=0.5"}
+        )
         timestamp: float = time.time()
         if response.status != 200:
             raise EnvironmentError(f"Error fetching order book tracker snapshot from {self.SNAPSHOT_REST_URL}.")
 
         binary_data: bytes = await response.read()
-        order_book_tracker_data: Dict[str, Tuple[pd.DataFrame, pd.DataFrame]] = pickle.loads(binary_data)
         retval: Dict[str, OrderBookTrackerEntry] = {}
 
+        if response.content_type == ORDER_BOOK_SNAPSHOT_CONTENT_TYPE:
+            order_books: Dict[str, BinanceOrderBook] = load_order_book_snapshots(binary_data, BinanceOrderBook)
+            for symbol, order_book in order_books.items():
+                retval[symbol] = OrderBookTrackerEntry(symbol, timestamp, order_book)
+            return retval
+
+        # Snapshot servers that do not support the binary snapshot format yet send a pickle.
+        order_book_tracker_data: Dict[str, Tuple[pd.DataFrame, pd.DataFrame]] = pickle.loads(binary_data)
         for symbol, (bids_df, asks_df) in order_book_tracker_data.items():
             order_book: BinanceOrderBook = BinanceOrderBook()
             order_book.apply_numpy_snapshot(bids_df.values, asks_df.values)
@@ -5,7 +5,12 @@ cdef class EventLogger(EventListener):
     cdef:
         str _event_source
         object _logged_events
+        object _capacity
+        bint _spill_to_disk
+        str _spill_path
+        object _spill_file
+        int _spilled_event_count
         dict _waiting
         dict _wait_returns
     cdef c_call(self, object event_object)
-
+    cdef c_spill_event(self, object event_object)
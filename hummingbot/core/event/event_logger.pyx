@@ -2,7 +2,11 @@
 
 import asyncio
 from async_timeout import timeout
+from collections import deque
+import pickle
+import tempfile
 from typing import (
+    Deque,
     List,
     Optional,
 )
@@ -11,47 +15,132 @@ from hummingbot.core.event.event_listener cimport EventListener
 
 
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    """
+    Keeps all the events received, unless `capacity` is given - then only the last `capacity` events are kept, in a
+    ring buffer. If `spill_to_disk` is also true, events pushed out of the ring buffer are appended to a spill file
+    instead of being dropped, and can be read back via `spilled_events()`. The spill file is `spill_path` if given,
+    or else an anonymous temporary file that is deleted when the logger is closed.
+
+    Only bound an event logger without spilling where losing old events is acceptable. E.g. the market event loggers
+    spill, since the strategy trade lists and performance reports are built from every logged fill.
+    """
+    def __init__(self,
+                 event_source: Optional[str] = None,
+                 capacity: Optional[int] = None,
+                 spill_to_disk: bool = False,
+                 spill_path: Optional[str] = None):
         super().__init__()
+        if capacity is not None and capacity < 1:
+            raise ValueError(f"EventLogger capacity must be positive, got {capacity}.")
+        if capacity is None and (spill_to_disk or spill_path is not None):
+            raise ValueError("EventLogger can only spill events to disk if it has a capacity.")
         self._event_source = event_source
-        self._logged_events = []
+        self._capacity = capacity
+        self._logged_events = deque(maxlen=capacity)
+        self._spill_to_disk = spill_to_disk or spill_path is not None
+        self._spill_path = spill_path
+        self._spill_file = None
+        self._spilled_event_count = 0
         self._waiting = {}
         self._wait_returns = {}
 
     @property
-    def event_log(self) -> List[any]:
-        return self._logged_events.copy()
+    def event_log(self) -> Deque[any]:
+        """
+        The events kept in memory, oldest first. This is the logger's own buffer rather than a copy, so it changes as
+        events are logged - copy it with list() to keep it as it is.
+        """
+        return self._logged_events
 
     @property
     def event_source(self) -> str:
         return self._event_source
 
+    @property
+    def capacity(self) -> Optional[int]:
+        return self._capacity
+
+    @property
+    def spilled_event_count(self) -> int:
+        return self._spilled_event_count
+
+    @property
+    def all_events(self) -> List[any]:
+        """
+        All the logged events, oldest first - the spilled events followed by the events kept in memory.
+        """
+        return self.spilled_events() + list(self._logged_events)
+
     def clear(self):
         self._logged_events.clear()
+        if self._spill_file is not None:
+            self._spill_file.seek(0)
+            self._spill_file.truncate()
+        self._spilled_event_count = 0
+
+    def close(self):
+        """
+        Closes the spill file. The spilled events are no longer readable afterwards, and are deleted unless the
+        logger has a `spill_path`.
+        """
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        self._spilled_event_count = 0
+
+    def spilled_events(self) -> List[any]:
+        """
+        Reads back the events that were pushed out of the ring buffer and written to the spill file, oldest first.
+        """
+        cdef:
+            list retval = []
+
+        if self._spill_file is None or self._spilled_event_count < 1:
+            return retval
+        end_position = self._spill_file.tell()
+        self._spill_file.seek(0)
+        try:
+            for _ in range(self._spilled_event_count):
+                retval.append(pickle.load(self._spill_file))
+        finally:
+            self._spill_file.seek(end_position)
+        return retval
 
     async def wait_for(self, event_type, timeout_seconds: float = 180):
         notifier = asyncio.Event()
-        self._waiting[notifier] = event_type
+        if event_type not in self._waiting:
+            self._waiting[event_type] = set()
+        self._waiting[event_type].add(notifier)
 
-        async with timeout(timeout_seconds):
-            await notifier.wait()
+        try:
+            async with timeout(timeout_seconds):
+                await notifier.wait()
+        finally:
+            if event_type in self._waiting:
+                self._waiting[event_type].discard(notifier)
+                if len(self._waiting[event_type]) < 1:
+                    del self._waiting[event_type]
 
-        retval = self._wait_returns.get(notifier)
-        if notifier in self._wait_returns:
-            del self._wait_returns[notifier]
-        return retval
+        return self._wait_returns.pop(notifier, None)
 
     def __call__(self, event_object):
         self.c_call(event_object)
 
+    cdef c_spill_event(self, object event_object):
+        if self._spill_file is None:
+            # Any events left over in the spill file by earlier runs are truncated.
+            self._spill_file = (open(self._spill_path, "w+b") if self._spill_path is not None
+                                else tempfile.TemporaryFile(prefix="hummingbot_events_"))
+        pickle.dump(event_object, self._spill_file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._spilled_event_count += 1
+
     cdef c_call(self, object event_object):
+        if self._spill_to_disk and len(self._logged_events) >= <int>self._capacity:
+            self.c_spill_event(self._logged_events[0])
         self._logged_events.append(event_object)
-        event_object_type = type(event_object)
 
-        should_notify = []
-        for notifier, waiting_event_type in self._waiting.items():
-            if event_object_type is waiting_event_type:
-                should_notify.append(notifier)
+        notifiers = self._waiting.pop(type(event_object), None)
+        if notifiers is not None:
+            for notifier in notifiers:
                 self._wait_returns[notifier] = event_object
-        for notifier in should_notify:
-            notifier.set()
+                notifier.set()
@@ -51,6 +51,7 @@ class ERC20WatcherEvent(Enum):
 
 class OrderBookEvent(Enum):
     TradeEvent = 901
+    OrderBookChanged = 902
 
 
 class TradeType(Enum):
@@ -184,6 +185,11 @@ class OrderBookTradeEvent(NamedTuple):
     amount: float
 
 
+class OrderBookChangedEvent(NamedTuple):
+    symbol: str
+    timestamp: float
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
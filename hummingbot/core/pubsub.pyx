@@ -64,6 +64,9 @@ cdef class PubSub:
     def get_listeners(self, event_tag: Enum) -> List[EventListener]:
         return self.c_get_listeners(event_tag.value)
 
+    def has_listeners(self, event_tag: Enum) -> bool:
+        return self.c_has_listeners(event_tag.value)
+
     def trigger_event(self, event_tag: Enum, message: any):
         self.c_trigger_event(event_tag.value, message)
 
@@ -143,6 +146,11 @@ cdef class PubSub:
             retval.append(typed_listener)
         return retval
 
+    cdef bint c_has_listeners(self, int64_t event_tag):
+        # Dead listeners are only removed when the listeners of an event are looked up, so this can be true when they
+        # are all gone - it is meant as a cheap check before building an event that may have no one to go to.
+        return self._events.find(event_tag) != self._events.end()
+
     cdef c_trigger_event(self, int64_t event_tag, object arg):
         self.c_remove_dead_listeners(event_tag)
 
@@ -2,26 +2,109 @@
 
 import asyncio
 from async_timeout import timeout
+from enum import IntEnum
+import itertools
 import logging
+import time
 from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
     Optional,
     Coroutine,
     NamedTuple,
-    Callable
+    Union
 )
 
 import hummingbot
+from hummingbot.core.utils.executor_pools import MISC_POOL
 from hummingbot.logger import HummingbotLogger
 
 
+class AsyncCallPriority(IntEnum):
+    """
+    Priority classes of scheduled calls. Within a lane, queued calls of a lower value go first, and calls of the same
+    priority go in order of arrival.
+    """
+    CANCEL = 0
+    ORDER = 1
+    DEFAULT = 2
+    POLLING = 3
+
+
 class AsyncCallSchedulerItem(NamedTuple):
     future: asyncio.Future
-    coroutine: Coroutine
+    # Either a coroutine, or a function that creates the awaitable when the call is due.
+    coroutine: Union[Coroutine, Callable[[], Awaitable]]
     timeout_seconds: float
     app_warning_msg: str = "API call error."
+    enqueue_time: float = 0.0
+
+
+class AsyncCallLaneMetrics(NamedTuple):
+    lane: str
+    concurrency: int
+    queue_depth: int
+    in_flight: int
+    completed_calls: int
+    mean_wait_time: float
+    max_wait_time: float
+    last_wait_time: float
+
+
+class AsyncCallLane:
+    """
+    A queue of scheduled calls, with its own workers. Up to `concurrency` calls of a lane run at the same time, and
+    each worker waits `call_interval` seconds after each of its calls.
+    """
+    def __init__(self, name: str, concurrency: int = 1, call_interval: float = 0.01):
+        if concurrency < 1:
+            raise ValueError("The concurrency of an async call lane must be at least 1.")
+        self.name: str = name
+        self.concurrency: int = concurrency
+        self.call_interval: float = call_interval
+        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self.workers: List[asyncio.Task] = []
+        self.in_flight: int = 0
+        self.completed_calls: int = 0
+        self.total_wait_time: float = 0.0
+        self.max_wait_time: float = 0.0
+        self.last_wait_time: float = 0.0
+        self._sequence: Iterator[int] = itertools.count()
+
+    def put(self, priority: int, item: AsyncCallSchedulerItem):
+        self.queue.put_nowait((priority, next(self._sequence), item))
+
+    def record_wait_time(self, wait_time: float):
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+        self.last_wait_time = wait_time
+
+    @property
+    def metrics(self) -> AsyncCallLaneMetrics:
+        started_calls: int = self.completed_calls + self.in_flight
+        return AsyncCallLaneMetrics(self.name,
+                                    self.concurrency,
+                                    self.queue.qsize(),
+                                    self.in_flight,
+                                    self.completed_calls,
+                                    self.total_wait_time / started_calls if started_calls > 0 else 0.0,
+                                    self.max_wait_time,
+                                    self.last_wait_time)
 
 
 class AsyncCallScheduler:
+    """
+    Runs API calls in the background, in lanes. Each lane has its own queue, concurrency limit and call interval, so
+    e.g. the calls of one exchange do not queue behind the calls of another. Within a lane, cancels and orders go
+    before polling calls - see `AsyncCallPriority`.
+
+    The default lane runs one call at a time, with `call_interval` seconds between calls.
+    """
+    DEFAULT_LANE = "default"
+
     _acs_shared_instance: Optional["AsyncCallScheduler"] = None
     _acs_logger: Optional[HummingbotLogger] = None
 
@@ -38,45 +121,98 @@ class AsyncCallScheduler:
         return cls._acs_logger
 
     def __init__(self, call_interval: float = 0.01):
-        self._coro_queue: asyncio.Queue = asyncio.Queue()
-        self._coro_scheduler_task: Optional[asyncio.Task] = None
         self._call_interval: float = call_interval
+        self._lanes: Dict[str, AsyncCallLane] = {
+            self.DEFAULT_LANE: AsyncCallLane(self.DEFAULT_LANE, concurrency=1, call_interval=call_interval)
+        }
+        self._started: bool = False
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
 
     @property
-    def coro_queue(self) -> asyncio.Queue:
-        return self._coro_queue
+    def coro_queue(self) -> asyncio.PriorityQueue:
+        return self._lanes[self.DEFAULT_LANE].queue
 
     @property
     def coro_scheduler_task(self) -> Optional[asyncio.Task]:
-        return self._coro_scheduler_task
+        default_workers: List[asyncio.Task] = self._lanes[self.DEFAULT_LANE].workers
+        return default_workers[0] if len(default_workers) > 0 else None
 
     @property
     def started(self) -> bool:
-        return self._coro_scheduler_task is not None
+        return self._started
+
+    @property
+    def lanes(self) -> List[str]:
+        return list(self._lanes.keys())
+
+    def add_lane(self, lane: str, concurrency: int = 1, call_interval: float = 0.0):
+        """
+        Adds a lane, or changes the concurrency and call interval of an existing lane. Calls already queued in the
+        lane are kept, but changing a running lane cancels its calls in flight.
+        """
+        if lane in self._lanes:
+            lane_obj: AsyncCallLane = self._lanes[lane]
+            if lane_obj.concurrency == concurrency and lane_obj.call_interval == call_interval:
+                return
+            if concurrency < 1:
+                raise ValueError("The concurrency of an async call lane must be at least 1.")
+            self._stop_lane(lane_obj)
+            lane_obj.concurrency = concurrency
+            lane_obj.call_interval = call_interval
+        else:
+            lane_obj = self._lanes[lane] = AsyncCallLane(lane, concurrency=concurrency, call_interval=call_interval)
+        if self._started:
+            self._start_lane(lane_obj)
+
+    def lane_metrics(self, lane: Optional[str] = None) -> Union[AsyncCallLaneMetrics, Dict[str, AsyncCallLaneMetrics]]:
+        """
+        Returns the queue depth, in flight call count and queue wait times of a lane, or of all lanes if no lane is
+        given.
+        """
+        if lane is not None:
+            return self._lanes[lane].metrics
+        return {name: lane_obj.metrics for name, lane_obj in self._lanes.items()}
+
+    def _start_lane(self, lane: AsyncCallLane):
+        lane.workers = [asyncio.ensure_future(self._coro_scheduler(lane)) for _ in range(lane.concurrency)]
+
+    @staticmethod
+    def _stop_lane(lane: AsyncCallLane):
+        for worker in lane.workers:
+            worker.cancel()
+        lane.workers = []
 
     def start(self):
-        if self._coro_scheduler_task is not None:
+        if self._started:
             self.stop()
-        self._coro_scheduler_task = asyncio.ensure_future(
-            self._coro_scheduler(
-                self._coro_queue,
-                self._call_interval
-            )
-        )
+        for lane in self._lanes.values():
+            self._start_lane(lane)
+        self._started = True
 
     def stop(self):
-        if self._coro_scheduler_task is not None:
-            self._coro_scheduler_task.cancel()
-            self._coro_scheduler_task = None
+        for lane in self._lanes.values():
+            self._stop_lane(lane)
+        self._started = False
 
-    async def _coro_scheduler(self, coro_queue: asyncio.Queue, interval: float = 0.01):
+    async def _coro_scheduler(self, lane: AsyncCallLane):
         while True:
             app_warning_msg = "API call error."
+            fut = None
             try:
-                fut, coro, timeout_seconds, app_warning_msg = await coro_queue.get()
-                async with timeout(timeout_seconds):
-                    fut.set_result(await coro)
+                _, _, (fut, coro, timeout_seconds, app_warning_msg, enqueue_time) = await lane.queue.get()
+                if fut.done():
+                    # The caller has stopped waiting for the call, e.g. after a timeout. Skip it.
+                    if asyncio.iscoroutine(coro):
+                        coro.close()
+                    continue
+                lane.record_wait_time(time.monotonic() - enqueue_time)
+                lane.in_flight += 1
+                try:
+                    async with timeout(timeout_seconds):
+                        fut.set_result(await (coro() if callable(coro) else coro))
+                finally:
+                    lane.in_flight -= 1
+                    lane.completed_calls += 1
             except asyncio.CancelledError:
                 try:
                     fut.cancel()
@@ -96,30 +232,47 @@ class AsyncCallScheduler:
                     pass
 
             try:
-                await asyncio.sleep(interval)
+                await asyncio.sleep(lane.call_interval)
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger().error("Scheduler sleep interrupted.", exc_info=True)
 
     async def schedule_async_call(self,
-                                  coro: Coroutine,
+                                  coro: Union[Coroutine, Callable[[], Awaitable]],
                                   timeout_seconds: float,
-                                  app_warning_msg: str = "API call error.") -> any:
+                                  app_warning_msg: str = "API call error.",
+                                  lane: str = DEFAULT_LANE,
+                                  priority: int = AsyncCallPriority.DEFAULT) -> any:
+        """
+        Queues a call in a lane, and waits for its result. `coro` can also be a function creating the awaitable, so
+        that e.g. an executor call only starts when it is due.
+        """
+        if lane not in self._lanes:
+            self.add_lane(lane)
         fut: asyncio.Future = self._ev_loop.create_future()
-        self._coro_queue.put_nowait(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
-                                                           app_warning_msg=app_warning_msg))
-        if self._coro_scheduler_task is None:
+        self._lanes[lane].put(priority, AsyncCallSchedulerItem(fut, coro, timeout_seconds,
+                                                               app_warning_msg=app_warning_msg,
+                                                               enqueue_time=time.monotonic()))
+        if not self._started:
             self.start()
         return await fut
 
     async def call_async(self,
                          func: Callable, *args,
                          timeout_seconds: float = 5.0,
-                         app_warning_msg: str = "API call error.") -> any:
-        coro: Coroutine = self._ev_loop.run_in_executor(
-            hummingbot.get_executor(),
-            func,
-            *args,
-        )
-        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg)
+                         app_warning_msg: str = "API call error.",
+                         lane: str = DEFAULT_LANE,
+                         priority: int = AsyncCallPriority.DEFAULT,
+                         executor_pool: str = MISC_POOL) -> any:
+        """
+        Schedules a blocking function call, which runs in the thread pool `executor_pool` when it is due.
+        """
+        def executor_call() -> Awaitable:
+            return self._ev_loop.run_in_executor(
+                hummingbot.get_executor(executor_pool),
+                func,
+                *args,
+            )
+        return await self.schedule_async_call(executor_call, timeout_seconds, app_warning_msg=app_warning_msg,
+                                              lane=lane, priority=priority)
@@ -8,6 +8,8 @@ from typing import (
 )
 from web3 import Web3
 
+from hummingbot.core.utils.http_client_manager import HttpClientManager
+
 
 DDEX_ENDPOINT = "https://api.ddex.io/v3/markets"
 RADAR_RELAY_ENDPOINT = "https://api.radarrelay.com/v2/markets?perPage=100&page=1"
@@ -16,55 +18,55 @@ API_CALL_TIMEOUT = 5
 
 
 async def download_ddex_token_addresses(token_dict: Dict[str, str]):
-    async with aiohttp.ClientSession() as client:
-        async with client.get(DDEX_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
-            if response.status == 200:
-                try:
-                    response = await response.json()
-                    markets = response.get("data").get("markets")
-                    for market in markets:
-                        base = market.get("baseToken")
-                        quote = market.get("quoteToken")
-                        if base not in token_dict:
-                            token_dict[base] = Web3.toChecksumAddress(market.get("baseTokenAddress"))
-                        if quote not in token_dict:
-                            token_dict[quote] = Web3.toChecksumAddress(market.get("quoteTokenAddress"))
-                except Exception as err:
-                    logging.getLogger().error(err)
+    client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+    async with client.get(DDEX_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
+        if response.status == 200:
+            try:
+                response = await response.json()
+                markets = response.get("data").get("markets")
+                for market in markets:
+                    base = market.get("baseToken")
+                    quote = market.get("quoteToken")
+                    if base not in token_dict:
+                        token_dict[base] = Web3.toChecksumAddress(market.get("baseTokenAddress"))
+                    if quote not in token_dict:
+                        token_dict[quote] = Web3.toChecksumAddress(market.get("quoteTokenAddress"))
+            except Exception as err:
+                logging.getLogger().error(err)
 
 
 async def download_radar_relay_token_addresses(token_dict: Dict[str, str]):
-    async with aiohttp.ClientSession() as client:
-        async with client.get(RADAR_RELAY_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
-            if response.status == 200:
-                try:
-                    markets = await response.json()
-                    for market in markets:
-                        market_id = market.get("id")
-                        base, quote = market_id.split("-")
-                        if base not in token_dict:
-                            token_dict[base] = Web3.toChecksumAddress(market.get("baseTokenAddress"))
-                        if quote not in token_dict:
-                            token_dict[quote] = Web3.toChecksumAddress(market.get("quoteTokenAddress"))
-                except Exception as err:
-                    logging.getLogger().error(err)
+    client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+    async with client.get(RADAR_RELAY_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
+        if response.status == 200:
+            try:
+                markets = await response.json()
+                for market in markets:
+                    market_id = market.get("id")
+                    base, quote = market_id.split("-")
+                    if base not in token_dict:
+                        token_dict[base] = Web3.toChecksumAddress(market.get("baseTokenAddress"))
+                    if quote not in token_dict:
+                        token_dict[quote] = Web3.toChecksumAddress(market.get("quoteTokenAddress"))
+            except Exception as err:
+                logging.getLogger().error(err)
 
 
 async def download_bamboo_relay_token_addresses(token_dict: Dict[str, str]):
-    async with aiohttp.ClientSession() as client:
-        async with client.get(BAMBOO_RELAY_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
-            if response.status == 200:
-                try:
-                    markets = await response.json()
-                    for market in markets:
-                        market_id = market.get("id")
-                        base, quote = market_id.split("-")
-                        if base not in token_dict:
-                            token_dict[base] = Web3.toChecksumAddress(market.get("baseTokenAddress"))
-                        if quote not in token_dict:
-                            token_dict[quote] = Web3.toChecksumAddress(market.get("quoteTokenAddress"))
-                except Exception as err:
-                    logging.getLogger().error(err)
+    client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+    async with client.get(BAMBOO_RELAY_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
+        if response.status == 200:
+            try:
+                markets = await response.json()
+                for market in markets:
+                    market_id = market.get("id")
+                    base, quote = market_id.split("-")
+                    if base not in token_dict:
+                        token_dict[base] = Web3.toChecksumAddress(market.get("baseTokenAddress"))
+                    if quote not in token_dict:
+                        token_dict[quote] = Web3.toChecksumAddress(market.get("quoteTokenAddress"))
+            except Exception as err:
+                logging.getLogger().error(err)
 
 
 async def download_erc20_token_addresses(token_dict: Dict[str, str] = {}):
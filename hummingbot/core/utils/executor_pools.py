@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor
+)
+import os
+import threading
+from typing import (
+    Callable,
+    Dict,
+    NamedTuple,
+    Optional
+)
+
+# Blocking calls are run in separate thread pools by subsystem, so that e.g. a slow Ethereum node holding up all of the
+# chain RPC threads cannot delay exchange order placement.
+EXCHANGE_REST_POOL = "exchange_rest"
+CHAIN_RPC_POOL = "chain_rpc"
+CPU_POOL = "cpu"
+MISC_POOL = "misc"
+
+DEFAULT_POOL_SIZES: Dict[str, int] = {
+    EXCHANGE_REST_POOL: 16,
+    CHAIN_RPC_POOL: 16,
+    CPU_POOL: os.cpu_count() or 1,
+    MISC_POOL: min(32, (os.cpu_count() or 1) + 4),
+}
+
+
+class ExecutorPoolMetrics(NamedTuple):
+    name: str
+    max_workers: int
+    queue_depth: int
+    max_queue_depth: int
+    running: int
+    completed: int
+    saturation: float
+
+
+class ExecutorPool(ThreadPoolExecutor):
+    """
+    A thread pool that keeps track of its queued and running calls.
+
+    `saturation` is the ratio of running calls to worker threads - a pool at 1.0 with a growing queue depth needs more
+    threads, or has a slow downstream.
+    """
+    def __init__(self, name: str, max_workers: int):
+        super().__init__(max_workers=max_workers, thread_name_prefix=f"hummingbot-{name}")
+        self._pool_name: str = name
+        self._pool_size: int = max_workers
+        self._metrics_lock: threading.Lock = threading.Lock()
+        self._queue_depth: int = 0
+        self._max_queue_depth: int = 0
+        self._running: int = 0
+        self._completed: int = 0
+
+    @property
+    def name(self) -> str:
+        return self._pool_name
+
+    @property
+    def max_workers(self) -> int:
+        return self._pool_size
+
+    @property
+    def metrics(self) -> ExecutorPoolMetrics:
+        with self._metrics_lock:
+            return ExecutorPoolMetrics(self._pool_name,
+                                       self._pool_size,
+                                       self._queue_depth,
+                                       self._max_queue_depth,
+                                       self._running,
+                                       self._completed,
+                                       self._running / self._pool_size)
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        def run_call():
+            with self._metrics_lock:
+                self._queue_depth -= 1
+                self._running += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._metrics_lock:
+                    self._running -= 1
+                    self._completed += 1
+
+        def did_finish(future: Future):
+            if future.cancelled():
+                # The call was cancelled while queued, so it never ran.
+                with self._metrics_lock:
+                    self._queue_depth -= 1
+
+        with self._metrics_lock:
+            self._queue_depth += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queue_depth)
+        try:
+            future: Future = super().submit(run_call)
+        except Exception:
+            with self._metrics_lock:
+                self._queue_depth -= 1
+            raise
+        future.add_done_callback(did_finish)
+        return future
+
+
+_executor_pools: Dict[str, ExecutorPool] = {}
+_pool_sizes: Dict[str, int] = dict(DEFAULT_POOL_SIZES)
+_pools_lock: threading.Lock = threading.Lock()
+
+
+def get_executor_pool(name: str = MISC_POOL) -> ExecutorPool:
+    """
+    Returns the thread pool of a subsystem, creating it on first use. Unknown pool names get a pool of the size of the
+    misc pool.
+    """
+    pool: Optional[ExecutorPool] = _executor_pools.get(name)
+    if pool is None:
+        with _pools_lock:
+            pool = _executor_pools.get(name)
+            if pool is None:
+                pool = _executor_pools[name] = ExecutorPool(name, _pool_sizes.get(name, _pool_sizes[MISC_POOL]))
+    return pool
+
+
+def configure_executor_pool(name: str, max_workers: int):
+    """
+    Sets the number of threads of a pool. If the pool is already running, it is shut down once its queued calls have
+    finished, and later calls go to a new pool of the new size.
+    """
+    if max_workers < 1:
+        raise ValueError("An executor pool must have at least 1 worker thread.")
+    with _pools_lock:
+        _pool_sizes[name] = max_workers
+        pool: Optional[ExecutorPool] = _executor_pools.pop(name, None)
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+
+def executor_pool_metrics() -> Dict[str, ExecutorPoolMetrics]:
+    return {name: pool.metrics for name, pool in list(_executor_pools.items())}
+
+
+def shutdown_executor_pools(wait: bool = True):
+    with _pools_lock:
+        pools = list(_executor_pools.values())
+        _executor_pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+
+import aiohttp
+import asyncio
+import logging
+from typing import Optional
+
+from hummingbot.logger import HummingbotLogger
+
+
+class HttpClientManager:
+    """
+    Process-wide HTTP client. Markets and data sources send all their REST requests through the one aiohttp client
+    session held here. Its connector keeps a pool of keep-alive connections per host, and caches DNS lookups. So a
+    request only pays for a TCP and TLS handshake when no idle connection to its host is left in the pool.
+
+    The shared session must only be used from the event loop it was created on. If it is requested from another
+    event loop, e.g. by unit tests that create a loop per test case, a new session is created for that loop.
+    """
+    _hcm_shared_instance: Optional["HttpClientManager"] = None
+    _hcm_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def shared_instance(cls) -> "HttpClientManager":
+        if cls._hcm_shared_instance is None:
+            cls._hcm_shared_instance = HttpClientManager()
+        return cls._hcm_shared_instance
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._hcm_logger is None:
+            cls._hcm_logger = logging.getLogger(__name__)
+        return cls._hcm_logger
+
+    def __init__(self,
+                 connection_limit: int = 100,
+                 connection_limit_per_host: int = 20,
+                 keepalive_timeout: float = 30.0,
+                 dns_cache_ttl: float = 300.0,
+                 request_timeout: Optional[float] = None):
+        self._connection_limit: int = connection_limit
+        self._connection_limit_per_host: int = connection_limit_per_host
+        self._keepalive_timeout: float = keepalive_timeout
+        self._dns_cache_ttl: float = dns_cache_ttl
+        self._request_timeout: Optional[float] = request_timeout
+        self._client: Optional[aiohttp.ClientSession] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def connection_limit(self) -> int:
+        return self._connection_limit
+
+    @property
+    def connection_limit_per_host(self) -> int:
+        return self._connection_limit_per_host
+
+    @property
+    def keepalive_timeout(self) -> float:
+        return self._keepalive_timeout
+
+    @property
+    def dns_cache_ttl(self) -> float:
+        return self._dns_cache_ttl
+
+    @property
+    def request_timeout(self) -> Optional[float]:
+        return self._request_timeout
+
+    def configure(self,
+                  connection_limit: Optional[int] = None,
+                  connection_limit_per_host: Optional[int] = None,
+                  keepalive_timeout: Optional[float] = None,
+                  dns_cache_ttl: Optional[float] = None,
+                  request_timeout: Optional[float] = None):
+        """
+        Changes the connection pool settings. The current client session, if any, is closed, and later requests get a
+        new client session with the new settings.
+        """
+        if connection_limit is not None:
+            self._connection_limit = connection_limit
+        if connection_limit_per_host is not None:
+            self._connection_limit_per_host = connection_limit_per_host
+        if keepalive_timeout is not None:
+            self._keepalive_timeout = keepalive_timeout
+        if dns_cache_ttl is not None:
+            self._dns_cache_ttl = dns_cache_ttl
+        if request_timeout is not None:
+            self._request_timeout = request_timeout
+        self._release_client()
+
+    @property
+    def client_started(self) -> bool:
+        return self._client is not None and not self._client.closed
+
+    def client(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared client session of the current event loop. The session must not be closed, or used in an
+        `async with` block, by the caller.
+        """
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        if self._client is None or self._client.closed or self._client_loop is not ev_loop:
+            self._release_client()
+            connector: aiohttp.TCPConnector = aiohttp.TCPConnector(limit=self._connection_limit,
+                                                                   limit_per_host=self._connection_limit_per_host,
+                                                                   keepalive_timeout=self._keepalive_timeout,
+                                                                   use_dns_cache=True,
+                                                                   ttl_dns_cache=self._dns_cache_ttl,
+                                                                   enable_cleanup_closed=True)
+            if self._request_timeout is not None:
+                self._client = aiohttp.ClientSession(connector=connector,
+                                                     timeout=aiohttp.ClientTimeout(total=self._request_timeout))
+            else:
+                self._client = aiohttp.ClientSession(connector=connector)
+            self._client_loop = ev_loop
+        return self._client
+
+    def _release_client(self):
+        client: Optional[aiohttp.ClientSession] = self._client
+        client_loop: Optional[asyncio.AbstractEventLoop] = self._client_loop
+        self._client = None
+        self._client_loop = None
+        if client is None or client.closed or client_loop.is_closed():
+            return
+        try:
+            if client_loop.is_running():
+                client_loop.call_soon_threadsafe(asyncio.ensure_future, client.close())
+            else:
+                client_loop.run_until_complete(client.close())
+        except RuntimeError:
+            # Another event loop is running, so the event loop of the client session cannot be run from here.
+            self.logger().debug("Could not close the HTTP client session of an inactive event loop.", exc_info=True)
+
+    async def close(self):
+        """
+        Closes the shared client session, and all of its pooled connections.
+        """
+        client: Optional[aiohttp.ClientSession] = self._client
+        self._client = None
+        self._client_loop = None
+        if client is not None and not client.closed:
+            await client.close()
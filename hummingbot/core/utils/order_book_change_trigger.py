@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+
+import asyncio
+import logging
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Set
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookChangedEvent
+)
+from hummingbot.logger import HummingbotLogger
+
+DEFAULT_DEBOUNCE_INTERVAL = 0.05
+
+
+class OrderBookChangeTrigger:
+    """
+    Listens to the change events of a number of order books, and calls back with the keys of the order books that
+    have changed.
+
+    The callback is debounced - it is called at most once per `debounce_interval` seconds, with all the order books that
+    changed in the mean time. So a burst of diff messages on a busy order book results in a single callback.
+    """
+    _obct_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obct_logger is None:
+            cls._obct_logger = logging.getLogger(__name__)
+        return cls._obct_logger
+
+    def __init__(self,
+                 callback: Callable[[Set[Hashable]], None],
+                 debounce_interval: float = DEFAULT_DEBOUNCE_INTERVAL):
+        self._callback: Callable[[Set[Hashable]], None] = callback
+        self._debounce_interval: float = debounce_interval
+        self._order_books: Dict[Hashable, OrderBook] = {}
+        # Order books only hold weak references to their listeners, so the forwarders are kept here.
+        self._forwarders: Dict[Hashable, EventForwarder] = {}
+        self._changed_keys: Set[Hashable] = set()
+        self._pending_callback: Optional[asyncio.Handle] = None
+
+    @property
+    def debounce_interval(self) -> float:
+        return self._debounce_interval
+
+    @property
+    def watched_keys(self) -> Set[Hashable]:
+        return set(self._order_books.keys())
+
+    def watch(self, key: Hashable, order_book: OrderBook):
+        """
+        Starts listening to the changes of an order book. Watching the same order book again under the same key does
+        nothing, so it is safe to call this on every clock tick.
+        """
+        if self._order_books.get(key) is order_book:
+            return
+        self.unwatch(key)
+        forwarder: EventForwarder = EventForwarder(lambda event: self._did_change_order_book(key, event))
+        order_book.add_listener(OrderBookEvent.OrderBookChanged, forwarder)
+        self._order_books[key] = order_book
+        self._forwarders[key] = forwarder
+
+    def unwatch(self, key: Hashable):
+        if key not in self._order_books:
+            return
+        self._order_books.pop(key).remove_listener(OrderBookEvent.OrderBookChanged, self._forwarders.pop(key))
+        self._changed_keys.discard(key)
+
+    def stop(self):
+        for key in list(self._order_books.keys()):
+            self.unwatch(key)
+        if self._pending_callback is not None:
+            self._pending_callback.cancel()
+            self._pending_callback = None
+        self._changed_keys.clear()
+
+    def _did_change_order_book(self, key: Hashable, event: OrderBookChangedEvent):
+        self._changed_keys.add(key)
+        if self._pending_callback is None:
+            self._pending_callback = asyncio.get_event_loop().call_later(self._debounce_interval,
+                                                                         self._trigger_callback)
+
+    def _trigger_callback(self):
+        changed_keys: Set[Hashable] = self._changed_keys
+        self._changed_keys = set()
+        self._pending_callback = None
+        if len(changed_keys) < 1:
+            return
+        try:
+            self._callback(changed_keys)
+        except Exception:
+            self.logger().error("Unexpected error processing order book changes.", exc_info=True)
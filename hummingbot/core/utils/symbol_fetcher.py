@@ -1,11 +1,19 @@
 import aiohttp
 import asyncio
+import json
+import logging
+import os
+import time
 from typing import (
     List,
     Dict,
     Any,
+    Optional,
 )
 
+from hummingbot.core.utils.http_client_manager import HttpClientManager
+from hummingbot.logger import HummingbotLogger
+
 
 BINANCE_ENDPOINT = "https://api.binance.com/api/v1/exchangeInfo"
 DDEX_ENDPOINT = "https://api.ddex.io/v3/markets"
@@ -13,10 +21,26 @@ RADAR_RELAY_ENDPOINT = "https://api.radarrelay.com/v2/markets"
 BAMBOO_RELAY_ENDPOINT = "https://rest.bamboorelay.com/main/0x/markets"
 COINBASE_PRO_ENDPOINT = "https://api.pro.coinbase.com/products/"
 API_CALL_TIMEOUT = 5
+SYMBOLS_CACHE_PATH = "conf/symbols_cache.json"
+SYMBOLS_CACHE_VERSION = 1
+SYMBOLS_CACHE_TTL = 60 * 60 * 24
 
 
 class SymbolFetcher:
+    """
+    Fetches the trading symbols of all supported exchanges, for autocomplete and symbol validation in the CLI.
+
+    The symbols are kept in an on-disk cache. A cache younger than `cache_ttl` seconds is served right away at start
+    up, and the exchanges are queried again in the background to bring it up to date.
+    """
     _sf_shared_instance: "SymbolFetcher" = None
+    _sf_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._sf_logger is None:
+            cls._sf_logger = logging.getLogger(__name__)
+        return cls._sf_logger
 
     @classmethod
     def get_instance(cls) -> "SymbolFetcher":
@@ -24,111 +48,176 @@ class SymbolFetcher:
             cls._sf_shared_instance = SymbolFetcher()
         return cls._sf_shared_instance
 
-    def __init__(self):
-        self.ready = False
+    def __init__(self, cache_path: Optional[str] = SYMBOLS_CACHE_PATH, cache_ttl: float = SYMBOLS_CACHE_TTL):
         self.symbols: Dict[str, Any] = {}
-        asyncio.ensure_future(self.fetch_all())
+        self._cache_path: Optional[str] = cache_path
+        self._cache_ttl: float = cache_ttl
+        self._last_updated: float = 0.0
+        self.ready: bool = self.load_cache()
+        self._fetch_task: asyncio.Task = asyncio.ensure_future(self.fetch_all())
+
+    @property
+    def last_updated(self) -> float:
+        return self._last_updated
+
+    @property
+    def fetch_task(self) -> asyncio.Task:
+        return self._fetch_task
+
+    def load_cache(self) -> bool:
+        """
+        Loads the symbols from the on-disk cache. Returns False if there is no cache, or if it was written by a
+        different cache version or has expired.
+        """
+        if self._cache_path is None or not os.path.isfile(self._cache_path):
+            return False
+        try:
+            with open(self._cache_path) as fd:
+                cache: Dict[str, Any] = json.load(fd)
+            if cache.get("version") != SYMBOLS_CACHE_VERSION:
+                return False
+            timestamp: float = float(cache["timestamp"])
+            if time.time() - timestamp > self._cache_ttl:
+                return False
+            self.symbols = dict((exchange, list(symbols)) for exchange, symbols in cache["symbols"].items())
+            self._last_updated = timestamp
+            return True
+        except Exception:
+            self.logger().debug(f"Error loading the symbols cache at {self._cache_path}.", exc_info=True)
+            return False
+
+    def save_cache(self):
+        if self._cache_path is None:
+            return
+        # Write to a temporary file first, so an interrupted write never leaves a corrupted cache behind.
+        temp_path: str = f"{self._cache_path}.tmp"
+        try:
+            cache_dir: str = os.path.dirname(self._cache_path)
+            if cache_dir != "":
+                os.makedirs(cache_dir, exist_ok=True)
+            with open(temp_path, "w") as fd:
+                json.dump({
+                    "version": SYMBOLS_CACHE_VERSION,
+                    "timestamp": self._last_updated,
+                    "symbols": self.symbols
+                }, fd)
+            os.replace(temp_path, self._cache_path)
+        except Exception:
+            self.logger().debug(f"Error writing the symbols cache to {self._cache_path}.", exc_info=True)
 
     @staticmethod
     async def fetch_binance_symbols() -> List[str]:
-        async with aiohttp.ClientSession() as client:
-            async with client.get(BINANCE_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
-                if response.status == 200:
-                    try:
-                        data = await response.json()
-                        symbol_structs = data.get("symbols")
-                        symbols = list(map(lambda symbol_details: symbol_details.get('symbol'), symbol_structs))
-                        return symbols
-                    except Exception:
-                        pass
-                        # Do nothing if the request fails -- there will be no autocomplete for binance symbols
-                return []
+        client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+        async with client.get(BINANCE_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
+            if response.status == 200:
+                try:
+                    data = await response.json()
+                    symbol_structs = data.get("symbols")
+                    symbols = list(map(lambda symbol_details: symbol_details.get('symbol'), symbol_structs))
+                    return symbols
+                except Exception:
+                    pass
+                    # Do nothing if the request fails -- there will be no autocomplete for binance symbols
+            return []
 
     @staticmethod
     async def fetch_ddex_symbols() -> List[str]:
-        async with aiohttp.ClientSession() as client:
-            async with client.get(DDEX_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
-                if response.status == 200:
-                    try:
-                        response = await response.json()
-                        markets = response.get("data").get("markets")
-                        symbols = list(map(lambda symbol_details: symbol_details.get('id'), markets))
-                        return symbols
-                    except Exception:
-                        pass
-                        # Do nothing if the request fails -- there will be no autocomplete for binance symbols
-                return []
+        client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+        async with client.get(DDEX_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
+            if response.status == 200:
+                try:
+                    response = await response.json()
+                    markets = response.get("data").get("markets")
+                    symbols = list(map(lambda symbol_details: symbol_details.get('id'), markets))
+                    return symbols
+                except Exception:
+                    pass
+                    # Do nothing if the request fails -- there will be no autocomplete for binance symbols
+            return []
 
     @staticmethod
     async def fetch_radar_relay_symbols() -> List[str]:
         symbols = set()
         page_count = 1
+        client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
         while True:
-            async with aiohttp.ClientSession() as client:
-                async with client.get(f"{RADAR_RELAY_ENDPOINT}?perPage=100&page={page_count}", timeout=API_CALL_TIMEOUT) \
-                        as response:
-                    if response.status == 200:
-                        try:
-                            markets = await response.json()
-                            new_symbols = set(map(lambda symbol_details: symbol_details.get('id'), markets))
-                            if len(new_symbols) == 0:
-                                break
-                            else:
-                                symbols = symbols.union(new_symbols)
-                            page_count += 1
-                        except Exception:
-                            # Do nothing if the request fails -- there will be no autocomplete for radar symbols
-                            break
+            async with client.get(f"{RADAR_RELAY_ENDPOINT}?perPage=100&page={page_count}", timeout=API_CALL_TIMEOUT) \
+                    as response:
+                if response.status != 200:
+                    break
+                try:
+                    markets = await response.json()
+                    new_symbols = set(map(lambda symbol_details: symbol_details.get('id'), markets))
+                    if len(new_symbols) == 0:
+                        break
+                    else:
+                        symbols = symbols.union(new_symbols)
+                    page_count += 1
+                except Exception:
+                    # Do nothing if the request fails -- there will be no autocomplete for radar symbols
+                    break
         return list(symbols)
 
     @staticmethod
     async def fetch_bamboo_relay_symbols() -> List[str]:
         symbols = set()
         page_count = 1
+        client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
         while True:
-            async with aiohttp.ClientSession() as client:
-                async with client.get(f"{BAMBOO_RELAY_ENDPOINT}?perPage=1000&page={page_count}", timeout=API_CALL_TIMEOUT) \
-                        as response:
-                    if response.status == 200:
-                        try:
-                            markets = await response.json()
-                            new_symbols = set(map(lambda symbol_details: symbol_details.get('id'), markets))
-                            if len(new_symbols) == 0:
-                                break
-                            else:
-                                symbols = symbols.union(new_symbols)
-                            page_count += 1
-                        except Exception:
-                            # Do nothing if the request fails -- there will be no autocomplete for bamboo symbols
-                            break
+            async with client.get(f"{BAMBOO_RELAY_ENDPOINT}?perPage=1000&page={page_count}", timeout=API_CALL_TIMEOUT) \
+                    as response:
+                if response.status != 200:
+                    break
+                try:
+                    markets = await response.json()
+                    new_symbols = set(map(lambda symbol_details: symbol_details.get('id'), markets))
+                    if len(new_symbols) == 0:
+                        break
+                    else:
+                        symbols = symbols.union(new_symbols)
+                    page_count += 1
+                except Exception:
+                    # Do nothing if the request fails -- there will be no autocomplete for bamboo symbols
+                    break
         return list(symbols)
 
     @staticmethod
     async def fetch_coinbase_pro_symbols() -> List[str]:
-        async with aiohttp.ClientSession() as client:
-            async with client.get(COINBASE_PRO_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
-                if response.status == 200:
-                    try:
-                        markets = await response.json()
-                        symbols = list(map(lambda symbol_details: symbol_details.get('id'), markets))
-                        return symbols
-                    except Exception:
-                        pass
-                        # Do nothing if the request fails -- there will be no autocomplete for binance symbols
-                return []
+        client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+        async with client.get(COINBASE_PRO_ENDPOINT, timeout=API_CALL_TIMEOUT) as response:
+            if response.status == 200:
+                try:
+                    markets = await response.json()
+                    symbols = list(map(lambda symbol_details: symbol_details.get('id'), markets))
+                    return symbols
+                except Exception:
+                    pass
+                    # Do nothing if the request fails -- there will be no autocomplete for binance symbols
+            return []
 
     async def fetch_all(self):
-        binance_symbols = await self.fetch_binance_symbols()
-        ddex_symbols = await self.fetch_ddex_symbols()
-        radar_relay_symbols = await self.fetch_radar_relay_symbols()
-        bamboo_relay_symbols = await self.fetch_bamboo_relay_symbols()
-        coinbase_pro_symbols = await self.fetch_coinbase_pro_symbols()
-        self.symbols = {
-            "binance": binance_symbols,
-            "ddex": ddex_symbols,
-            "radar_relay": radar_relay_symbols,
-            "bamboo_relay": bamboo_relay_symbols,
-            "coinbase_pro": coinbase_pro_symbols,
+        fetchers = {
+            "binance": self.fetch_binance_symbols,
+            "ddex": self.fetch_ddex_symbols,
+            "radar_relay": self.fetch_radar_relay_symbols,
+            "bamboo_relay": self.fetch_bamboo_relay_symbols,
+            "coinbase_pro": self.fetch_coinbase_pro_symbols,
         }
+        results: List[Any] = await asyncio.gather(*[fetcher() for fetcher in fetchers.values()],
+                                                  return_exceptions=True)
+        symbols: Dict[str, Any] = dict(self.symbols)
+        fetched_any: bool = False
+        for exchange, result in zip(fetchers.keys(), results):
+            if isinstance(result, Exception):
+                self.logger().debug(f"Error fetching {exchange} symbols.", exc_info=result)
+            if isinstance(result, list) and len(result) > 0:
+                symbols[exchange] = result
+                fetched_any = True
+            elif exchange not in symbols:
+                # Keep the cached symbols of an exchange that is unreachable right now.
+                symbols[exchange] = []
+        self.symbols = symbols
         self.ready = True
-
+        if fetched_any:
+            self._last_updated = time.time()
+            self.save_cache()
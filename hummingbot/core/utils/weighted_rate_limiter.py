@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+
+import asyncio
+from collections import deque
+import logging
+import time
+from typing import (
+    Deque,
+    Optional
+)
+
+from hummingbot.logger import HummingbotLogger
+
+
+class WeightedRateLimiterWaiter:
+    __slots__ = ("weight", "reserve", "future")
+
+    def __init__(self, weight: float, reserve: float, future: asyncio.Future):
+        self.weight: float = weight
+        self.reserve: float = reserve
+        self.future: asyncio.Future = future
+
+
+class WeightedRateLimiter:
+    """
+    Token bucket rate limiter for exchange APIs that assign a weight to each request, e.g. Binance's request weight
+    limit of 1200 per minute, where an order book snapshot of 1000 levels weighs 10.
+
+    The bucket holds up to `weight_limit` tokens, and is refilled at `weight_limit / interval` tokens per second.
+    `acquire()` returns as soon as the bucket holds enough tokens for the request, so independent requests can run
+    concurrently up to the budget. Past the budget, callers wait in line until the bucket is refilled.
+
+    Background requests, e.g. periodic order book snapshot refreshes, can pass a `reserve` to `acquire()`. They are
+    only let through while at least `reserve` tokens are left in the bucket after them, so they cannot use up the
+    budget of order and status requests.
+    """
+    _wrl_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._wrl_logger is None:
+            cls._wrl_logger = logging.getLogger(__name__)
+        return cls._wrl_logger
+
+    def __init__(self, weight_limit: float, interval: float, name: str = "API"):
+        if weight_limit <= 0 or interval <= 0:
+            raise ValueError("The weight limit and interval of a rate limiter must be positive.")
+        self._name: str = name
+        self._weight_limit: float = weight_limit
+        self._interval: float = interval
+        self._refill_rate: float = weight_limit / interval
+        self._tokens: float = weight_limit
+        self._last_refill_time: float = time.monotonic()
+        self._paused_until: float = 0.0
+        self._waiters: Deque[WeightedRateLimiterWaiter] = deque()
+        self._wakeup_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def weight_limit(self) -> float:
+        return self._weight_limit
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def available_weight(self) -> float:
+        self._refill(time.monotonic())
+        return self._tokens
+
+    @property
+    def waiting_count(self) -> int:
+        return len(self._waiters)
+
+    def _refill(self, now: float):
+        if now > self._last_refill_time:
+            self._tokens = min(self._weight_limit,
+                               self._tokens + (now - self._last_refill_time) * self._refill_rate)
+            self._last_refill_time = now
+
+    def _can_consume(self, now: float, weight: float, reserve: float) -> bool:
+        return now >= self._paused_until and self._tokens - weight >= reserve
+
+    def _time_until_available(self, now: float, weight: float, reserve: float) -> float:
+        missing_tokens: float = weight + reserve - self._tokens
+        return max(self._paused_until - now, missing_tokens / self._refill_rate, 0.0)
+
+    def _release_waiters(self):
+        """
+        Lets through the waiting requests that fit into the bucket, in order of arrival. A request that does not fit
+        holds back all the later requests with the same or a larger reserve, so large requests are not starved by
+        smaller ones behind them.
+        """
+        now: float = time.monotonic()
+        self._refill(now)
+        blocked_reserve: Optional[float] = None
+        next_wakeup: Optional[float] = None
+        remaining: Deque[WeightedRateLimiterWaiter] = deque()
+        for waiter in self._waiters:
+            if waiter.future.done():
+                continue
+            if blocked_reserve is not None and waiter.reserve >= blocked_reserve:
+                remaining.append(waiter)
+                continue
+            if self._can_consume(now, waiter.weight, waiter.reserve):
+                self._tokens -= waiter.weight
+                waiter.future.set_result(None)
+                continue
+            delay: float = self._time_until_available(now, waiter.weight, waiter.reserve)
+            next_wakeup = delay if next_wakeup is None else min(next_wakeup, delay)
+            blocked_reserve = waiter.reserve if blocked_reserve is None else min(blocked_reserve, waiter.reserve)
+            remaining.append(waiter)
+        self._waiters = remaining
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+            self._wakeup_handle = None
+        if next_wakeup is not None:
+            self._wakeup_handle = asyncio.get_event_loop().call_later(next_wakeup, self._on_wakeup)
+
+    def _on_wakeup(self):
+        self._wakeup_handle = None
+        self._release_waiters()
+
+    async def acquire(self, weight: float = 1.0, reserve: float = 0.0):
+        """
+        Waits until a request of the given weight can be sent, and takes its weight out of the bucket.
+        """
+        if weight + reserve > self._weight_limit:
+            raise ValueError(f"Request weight {weight} with reserve {reserve} exceeds the {self._name} weight limit "
+                             f"of {self._weight_limit}.")
+        now: float = time.monotonic()
+        self._refill(now)
+        if len(self._waiters) == 0 and self._can_consume(now, weight, reserve):
+            self._tokens -= weight
+            return
+
+        waiter: WeightedRateLimiterWaiter = WeightedRateLimiterWaiter(weight, reserve,
+                                                                      asyncio.get_event_loop().create_future())
+        self._waiters.append(waiter)
+        self._release_waiters()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if not waiter.future.cancelled():
+                # The weight was taken out of the bucket right before the cancellation. Give it back.
+                self._tokens = min(self._weight_limit, self._tokens + weight)
+            # The cancelled request may have been holding back the requests behind it.
+            self._release_waiters()
+            raise
+
+    def pause(self, seconds: float):
+        """
+        Holds back all requests for the given number of seconds, and empties the bucket. This is for backing off when
+        the exchange reports that the rate limit has been exceeded anyway, e.g. by other processes on the same IP.
+        """
+        now: float = time.monotonic()
+        self._refill(now)
+        self._tokens = 0.0
+        self._paused_until = max(self._paused_until, now + seconds)
+        self.logger().warning(f"{self._name} rate limit exceeded. Holding back requests for {seconds:.1f} seconds.")
+        self._release_waiters()
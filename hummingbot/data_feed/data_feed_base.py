@@ -7,6 +7,7 @@ from typing import (
 )
 
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_manager import HttpClientManager
 
 
 class DataFeedBase:
@@ -20,7 +21,6 @@ class DataFeedBase:
 
     def __init__(self):
         self._ready_event = asyncio.Event()
-        self._shared_client: Optional[aiohttp.ClientSession] = None
 
     @property
     def name(self):
@@ -34,9 +34,7 @@ class DataFeedBase:
         raise NotImplementedError
 
     async def _http_client(self) -> aiohttp.ClientSession:
-        if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
-        return self._shared_client
+        return HttpClientManager.shared_instance().client()
 
     async def get_ready(self):
         try:
@@ -1,3 +1,5 @@
+import asyncio
+from collections import deque
 import io
 import traceback
 from typing import Optional
@@ -15,6 +17,14 @@ CLIENT_VERSION = open(VERSIONFILE, "rt").read()
 
 
 class ReportingProxyHandler(logging.Handler):
+    """
+    Forwards logs, events and metrics to the reporting proxy.
+
+    By default, every emit() flushes the queues once they hold more than `capacity` records. In batched mode, emit()
+    only enqueues the record - a background task sends the queued records whenever `capacity` records have been
+    queued, or every `flush_interval` seconds. Each queue then holds at most `max_queue_size` records, and the oldest
+    records are dropped (and counted) when it's full.
+    """
     _rrh_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -26,21 +36,43 @@ class ReportingProxyHandler(logging.Handler):
     def __init__(self,
                  level=logging.INFO,
                  proxy_url="https://127.0.0.1:9000",
-                 capacity=1):
+                 capacity=1,
+                 batched=False,
+                 flush_interval=5.0,
+                 max_queue_size=10000):
         super().__init__()
         self.setLevel(level)
+        self.batched: bool = batched
+        self.capacity: int = capacity
+        self.flush_interval: float = flush_interval
+        self.max_queue_size: int = max_queue_size
         self._log_queue: list = []
         self._event_queue: list = []
         self._metrics_queue: list = []
-        self.capacity: int = capacity
+        self._dropped_record_count: int = 0
+        self._flush_requested: bool = False
+        self._flush_notifier: Optional[asyncio.Event] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._ev_loop: Optional[asyncio.AbstractEventLoop] = None
         self.proxy_url: str = proxy_url
         self.log_server_client: LogServerClient = LogServerClient.get_instance()
         self.log_server_client.start()
+        if self.batched:
+            self._log_queue = deque()
+            self._event_queue = deque()
+            self._metrics_queue = deque()
+            self._ev_loop = asyncio.get_event_loop()
+            self._flush_notifier = asyncio.Event()
+            self._flush_task = asyncio.ensure_future(self.flush_loop())
 
     @property
     def client_id(self):
         return global_config_map["client_id"].value
 
+    @property
+    def dropped_record_count(self) -> int:
+        return self._dropped_record_count
+
     def emit(self, record):
         if record.__dict__.get("do_not_send", False):
             return
@@ -52,7 +84,40 @@ class ReportingProxyHandler(logging.Handler):
         else:
             self.process_log(record)
 
-        self.flush()
+        if self.batched:
+            self.notify_batch_ready()
+        else:
+            self.flush()
+
+    def enqueue(self, queue: list, item: dict):
+        if self.batched and len(queue) >= self.max_queue_size:
+            queue.popleft()
+            self._dropped_record_count += 1
+        queue.append(item)
+
+    def notify_batch_ready(self):
+        if max(len(self._log_queue), len(self._event_queue), len(self._metrics_queue)) < self.capacity:
+            return
+        if self._flush_requested:
+            return
+        # Records may be logged from executor threads, so the notifier must be set from within the event loop.
+        self._flush_requested = True
+        self._ev_loop.call_soon_threadsafe(self._flush_notifier.set)
+
+    async def flush_loop(self):
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(self._flush_notifier.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._flush_notifier.clear()
+                self._flush_requested = False
+                self.flush(send_all=True)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Error flushing logs.", exc_info=True, extra={"do_not_send": True})
 
     def formatException(self, ei):
         """
@@ -85,7 +150,7 @@ class ReportingProxyHandler(logging.Handler):
             message["exc_info"] = self.formatException(log.exc_info)
             message["exception_type"] = str(log.exc_info[0])
             message["exception_msg"] = str(log.exc_info[1])
-        self._log_queue.append(message)
+        self.enqueue(self._log_queue, message)
 
     def process_event_log(self, log):
         event_dict = log.__dict__.get("dict_msg", {})
@@ -95,7 +160,7 @@ class ReportingProxyHandler(logging.Handler):
 
         if event_dict:
             REPORT_EVENT_QUEUE.put_nowait(event_dict)
-            self._event_queue.append(event_dict)
+            self.enqueue(self._event_queue, event_dict)
 
     def process_metric_log(self, log):
         metric_dict = log.__dict__.get("dict_msg", {})
@@ -103,7 +168,7 @@ class ReportingProxyHandler(logging.Handler):
             metric_dict["tags"] = metric_dict.get("tags", []) + \
                                   [f"client_id:{self.client_id}", "source:hummingbot-client"]
 
-            self._metrics_queue.append(metric_dict)
+            self.enqueue(self._metrics_queue, metric_dict)
 
     def send_logs(self, logs):
         request_obj = {
@@ -162,22 +227,25 @@ class ReportingProxyHandler(logging.Handler):
             min_send_capacity = 0
         try:
             if len(self._log_queue) > min_send_capacity:
-                self.send_logs(self._log_queue)
-                self._log_queue = []
+                self.send_logs(list(self._log_queue))
+                self._log_queue.clear()
             if len(self._event_queue) > min_send_capacity:
-                self.send_event_logs(self._event_queue)
-                self._event_queue = []
+                self.send_event_logs(list(self._event_queue))
+                self._event_queue.clear()
             if len(self._metrics_queue) > min_send_capacity:
-                self.send_metric_logs(self._metrics_queue)
-                self._metrics_queue = []
+                self.send_metric_logs(list(self._metrics_queue))
+                self._metrics_queue.clear()
 
         except Exception:
-            self.logger().error(f"Error sending logs.", exc_info=True, extra={"do_not_send": True})
+            self.logger().error("Error sending logs.", exc_info=True, extra={"do_not_send": True})
         finally:
             self.release()
 
     def close(self):
         try:
+            if self._flush_task is not None:
+                self._flush_task.cancel()
+                self._flush_task = None
             self.flush(send_all=True)
             self.log_server_client.stop()
         finally:
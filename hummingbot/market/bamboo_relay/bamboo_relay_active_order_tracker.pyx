@@ -1,5 +1,6 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+
 import logging
 import numpy as np
 from decimal import Decimal
@@ -7,23 +8,31 @@ from typing import Dict
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.l3_order_store cimport (
+    L3OrderStore,
+    L3_NO_SIDE,
+    L3_BID,
+    L3_ASK,
+    c_diff_to_np_arrays,
+    c_diff_to_order_book_rows
+)
 
 _rraot_logger = None
 
-s_empty_diff = np.ndarray(shape=(0, 4), dtype="float64")
-
-BambooRelayOrderBookTrackingDictionary = Dict[Decimal, Dict[str, Dict[str, any]]]
+# Price level -> order hash -> remaining base token amount.
+BambooRelayOrderBookTrackingDictionary = Dict[float, Dict[str, float]]
 
 
 cdef class BambooRelayActiveOrderTracker:
     def __init__(self,
                  active_asks: BambooRelayOrderBookTrackingDictionary = None,
-                 active_bids: BambooRelayOrderBookTrackingDictionary = None,
-                 order_price_map: Dict[str, Decimal] = None):
+                 active_bids: BambooRelayOrderBookTrackingDictionary = None):
         super().__init__()
-        self._active_asks = active_asks or {}
-        self._active_bids = active_bids or {}
-        self._order_price_map = order_price_map or {}
+        self._order_store = L3OrderStore()
+        for active_orders, is_bid in [(active_asks or {}, False), (active_bids or {}, True)]:
+            for price, level_orders in active_orders.items():
+                for order_hash, remaining_amount in level_orders.items():
+                    self._order_store.c_set_order(order_hash, is_bid, float(price), float(remaining_amount))
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -32,213 +41,120 @@ cdef class BambooRelayActiveOrderTracker:
             _rraot_logger = logging.getLogger(__name__)
         return _rraot_logger
 
+    @property
+    def order_store(self) -> L3OrderStore:
+        return self._order_store
+
     @property
     def active_asks(self) -> BambooRelayOrderBookTrackingDictionary:
-        return self._active_asks
+        return self._order_store.c_get_active_orders(False)
 
     @property
     def active_bids(self) -> BambooRelayOrderBookTrackingDictionary:
-        return self._active_bids
+        return self._order_store.c_get_active_orders(True)
 
     @property
-    def order_price_map(self) -> Dict[str, Decimal]:
-        return self._order_price_map
+    def order_price_map(self) -> Dict[str, float]:
+        return {order_hash: price
+                for active_orders in (self.active_bids, self.active_asks)
+                for price, level_orders in active_orders.items()
+                for order_hash in level_orders}
 
     def volume_for_ask_price(self, price) -> float:
-        return sum([float(msg["remainingBaseTokenAmount"]) for msg in self._active_asks[price].values()])
+        return self._order_store.c_get_level_total(False, float(price))
 
     def volume_for_bid_price(self, price) -> float:
-        return sum([float(msg["remainingBaseTokenAmount"]) for msg in self._active_bids[price].values()])
+        return self._order_store.c_get_level_total(True, float(price))
 
-    cdef tuple c_convert_diff_message_to_np_arrays(self, object message):
-        # "CANCEL" and "REMOVE" messages contain only orderHash and not price which is why "_order_price_map" is
-        # required.
+    cdef int c_apply_diff_message(self, object message, double *price_out, double *quantity_out) except -1:
+        """
+        Applies a diff message to the tracked orders.
+
+        Returns L3_BID or L3_ASK with the updated price level written to `price_out` and `quantity_out`, or
+        L3_NO_SIDE if the message doesn't change the order book.
+        """
+        # "CANCEL" and "REMOVE" messages contain only orderHash and not price, which is why the order store keeps the
+        # price of every tracked order.
         cdef:
             str action = message.content["action"]
             dict event = message.content["event"]
             str order_side
             str order_hash
-            object price
-            double timestamp = message.timestamp
-            double quantity = 0
+            double price
+            bint is_bid
+            Py_ssize_t slot
 
         if action == "NEW":
             order_side = event["order"]["type"]
             order_hash = event["order"]["orderHash"]
-            price = Decimal(event["order"]["price"])
-            self._order_price_map[order_hash] = price
-            order_dict = {
-                "orderHash": order_hash,
-                "remainingBaseTokenAmount": event["order"]["remainingBaseTokenAmount"]
-            }
-            if order_side == "BID":
-                if price in self._active_bids:
-                    self._active_bids[price][order_hash] = order_dict
-                else:
-                    self._active_bids[price] = {order_hash: order_dict}
-
-                quantity = self.volume_for_bid_price(price)
-                return np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"), s_empty_diff
-
-            elif order_side == "ASK":
-                if price in self._active_asks:
-                    self._active_asks[price][order_hash] = order_dict
-                else:
-                    self._active_asks[price] = {order_hash: order_dict}
-
-                quantity = self.volume_for_ask_price(price)
-                return s_empty_diff, np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-            else:
+            price = float(event["order"]["price"])
+            if order_side not in ["BID", "ASK"]:
                 raise ValueError(f"Unknown order side '{order_side}'. Aborting.")
+            is_bid = order_side == "BID"
+            quantity_out[0] = self._order_store.c_set_order(order_hash, is_bid, price,
+                                                            float(event["order"]["remainingBaseTokenAmount"]))
+            price_out[0] = price
+            return L3_BID if is_bid else L3_ASK
 
         elif action in ["REMOVE", "CANCEL"]:
             order_side = event["orderType"]
             order_hash = event["orderHash"]
-            if order_hash in self._order_price_map:
-                price = self._order_price_map[order_hash]
-            else:
+            slot = self._order_store.c_get_slot(order_hash)
+            if slot < 0:
                 self.logger().debug(f"OrderHash {order_hash} {message.timestamp} order not found in order price map")
-                return s_empty_diff, s_empty_diff
-
-            del self._order_price_map[order_hash]
-
-            if order_side == "BID":
-                if price in self._active_bids:
-                    if order_hash in self._active_bids[price]:
-                        del self._active_bids[price][order_hash]
-
-                    if len(self._active_bids[price]) < 1:
-                        del self._active_bids[price]
-
-                        return (np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64"),
-                                s_empty_diff)
-                    else:
-                        quantity = self.volume_for_bid_price(price)
-                        return (np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                                s_empty_diff)
-                else:
-                    return s_empty_diff, s_empty_diff
-            elif order_side == "ASK":
-                if price in self._active_asks:
-                    if order_hash in self._active_asks[price]:
-                        del self._active_asks[price][order_hash]
-
-                    if len(self._active_asks[price]) < 1:
-                        del self._active_asks[price]
-                        return (s_empty_diff,
-                                np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64"))
-                    else:
-                        quantity = self.volume_for_ask_price(price)
-                        return (s_empty_diff,
-                                np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"))
-                else:
-                    return s_empty_diff, s_empty_diff
-            else:
+                return L3_NO_SIDE
+            if order_side not in ["BID", "ASK"]:
                 raise ValueError(f"Unknown order side '{order_side}'. Aborting.")
+            is_bid = self._order_store.c_is_bid(slot)
+            price_out[0] = self._order_store.c_get_order_price(slot)
+            quantity_out[0] = self._order_store.c_remove_order(slot)
+            return L3_BID if is_bid else L3_ASK
 
         elif action == "FILL":
-            remaining_base_amount = Decimal(event["order"]["remainingBaseTokenAmount"])
             order_hash = event["order"]["orderHash"]
-            price = Decimal(event["order"]["price"])
+            price = float(event["order"]["price"])
             order_side = event["type"]
-            if order_side == "BUY":
-                if price in self._active_bids:
-                    if order_hash in self._active_bids[price]:
-                        if event["order"]["state"] == "FILLED":
-                            del self._order_price_map[order_hash]
-                            del self._active_bids[price][order_hash]
-                        else: # update the remaining amount of the order
-                            self._active_bids[price][order_hash]["remainingBaseTokenAmount"] = remaining_base_amount
-
-                        if len(self._active_bids[price]) < 1:
-                            del self._active_bids[price]
-                            return (np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64"),
-                                    s_empty_diff)
-                        else:
-                            quantity = self.volume_for_bid_price(price)
-                            return (np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                                    s_empty_diff)
-
-                # return empty diff if order or price is not found
-                return s_empty_diff, s_empty_diff
-            elif order_side == "SELL":
-                if price in self._active_asks:
-                    if order_hash in self._active_asks[price]:
-                        if event["order"]["state"] == "FILLED":
-                            del self._order_price_map[order_hash]
-                            del self._active_asks[price][order_hash]
-                        else: # update the remaining amount of the order
-                            self._active_asks[price][order_hash]["remainingBaseTokenAmount"] = remaining_base_amount
-
-                        if len(self._active_asks[price]) < 1:
-                            del self._active_asks[price]
-                            return (s_empty_diff,
-                                    np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64"))
-                        else:
-                            quantity = self.volume_for_ask_price(price)
-                            return (s_empty_diff,
-                                np.array([[timestamp, float(price), quantity, message.update_id]],
-                                         dtype="float64"))
-
-                # return empty diff if order or price is not found
-                return s_empty_diff, s_empty_diff
+            if order_side not in ["BUY", "SELL"]:
+                return L3_NO_SIDE
+            is_bid = order_side == "BUY"
+            slot = self._order_store.c_get_slot(order_hash)
+            # return empty diff if order or price is not found
+            if slot < 0 or self._order_store.c_is_bid(slot) != is_bid or \
+                    self._order_store.c_get_order_price(slot) != price:
+                return L3_NO_SIDE
+            if event["order"]["state"] == "FILLED":
+                quantity_out[0] = self._order_store.c_remove_order(slot)
+            else: # update the remaining amount of the order
+                quantity_out[0] = self._order_store.c_set_order_amount(
+                    slot, float(event["order"]["remainingBaseTokenAmount"]))
+            price_out[0] = price
+            return L3_BID if is_bid else L3_ASK
 
         else:
             raise ValueError(f"Unknown action type '{action}'. Must be 'NEW', 'REMOVE', 'CANCEL' or 'FILL'.")
 
-    cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message):
+    cdef tuple c_convert_diff_message_to_np_arrays(self, object message):
         cdef:
-            object price
-            str order_hash
-            str amount
-
-        # Refresh all order tracking.
-        self._active_bids.clear()
-        self._active_asks.clear()
-        self._order_price_map.clear()
-        for snapshot_orders, active_orders in [(message.content["bids"], self._active_bids),
-                                               (message.content["asks"], self._active_asks)]:
-            for order in snapshot_orders:
-                price = Decimal(order["price"])
-                order_hash = order["orderHash"]
-                order_dict = {
-                    "orderHash": order_hash,
-                    "remainingBaseTokenAmount": order["remainingBaseTokenAmount"]
-                }
+            double price = 0
+            double quantity = 0
+            int diff_side = self.c_apply_diff_message(message, &price, &quantity)
 
-                if price in active_orders:
-                    active_orders[price][order_hash] = order_dict
-                else:
-                    active_orders[price] = {
-                        order_hash: order_dict
-                    }
-                self._order_price_map[order_hash] = price
+        return c_diff_to_np_arrays(diff_side, message.timestamp, price, quantity, message.update_id)
 
-        # Return the sorted snapshot tables.
+    cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message):
         cdef:
-            np.ndarray[np.float64_t, ndim=2] bids = np.array(
-                [[message.timestamp,
-                  float(price),
-                  sum([float(order_dict["remainingBaseTokenAmount"])
-                       for order_dict in self._active_bids[price].values()]),
-                  message.update_id]
-                 for price in sorted(self._active_bids.keys(), reverse=True)], dtype="float64", ndmin=2)
-            np.ndarray[np.float64_t, ndim=2] asks = np.array(
-                [[message.timestamp,
-                  float(price),
-                  sum([float(order_dict["remainingBaseTokenAmount"])
-                       for order_dict in self._active_asks[price].values()]),
-                  message.update_id]
-                 for price in sorted(self._active_asks.keys(), reverse=True)], dtype="float64", ndmin=2)
-
-        # If there're no rows, the shape would become (1, 0) and not (0, 4).
-        # Reshape to fix that.
-        if bids.shape[1] != 4:
-            bids = bids.reshape((0, 4))
-        if asks.shape[1] != 4:
-            asks = asks.reshape((0, 4))
-
-        return bids, asks
+            list bids = message.content["bids"]
+            list asks = message.content["asks"]
+
+        return self._order_store.c_load_snapshot(
+            [order["orderHash"] for order in bids],
+            [order["price"] for order in bids],
+            [order["remainingBaseTokenAmount"] for order in bids],
+            [order["orderHash"] for order in asks],
+            [order["price"] for order in asks],
+            [order["remainingBaseTokenAmount"] for order in asks],
+            message.timestamp, message.update_id
+        )
 
     cdef np.ndarray[np.float64_t, ndim=1] c_convert_trade_message_to_np_array(self, object message):
         cdef:
@@ -250,15 +166,24 @@ cdef class BambooRelayActiveOrderTracker:
         return np.array([message.timestamp, trade_type_value, float(price), float(filled_base_amount)],
                         dtype="float64")
 
-
     def convert_diff_message_to_order_book_row(self, message):
-        np_bids, np_asks = self.c_convert_diff_message_to_np_arrays(message)
-        bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
-        asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
-        return bids_row, asks_row
+        cdef:
+            double price = 0
+            double quantity = 0
+            int diff_side = self.c_apply_diff_message(message, &price, &quantity)
+
+        return c_diff_to_order_book_rows(diff_side, price, quantity, message.update_id)
+
+    def convert_snapshot_message_to_np_arrays(self, message):
+        """
+        Returns the (timestamp, price, quantity, update_id) level tables of a snapshot message. Columns 1 to 3 can be
+        passed straight to OrderBook.apply_numpy_snapshot().
+        """
+        return self.c_convert_snapshot_message_to_np_arrays(message)
 
     def convert_snapshot_message_to_order_book_row(self, message):
         np_bids, np_asks = self.c_convert_snapshot_message_to_np_arrays(message)
-        bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
-        asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
+        update_id = message.update_id
+        bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, _ in np_bids.tolist()]
+        asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, _ in np_asks.tolist()]
         return bids_row, asks_row
@@ -23,6 +23,7 @@ from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerE
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, BambooRelayOrderBookMessage
 from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversion
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_manager import HttpClientManager
 
 TRADING_PAIR_FILTER = re.compile(r"(WETH|DAI|CUSD)$")
 
@@ -38,7 +39,6 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
     PING_TIMEOUT = 10.0
 
     _rraobds_logger: Optional[HummingbotLogger] = None
-    _client: Optional[aiohttp.ClientSession] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,11 +52,9 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     def http_client(cls) -> aiohttp.ClientSession:
-        if cls._client is None:
-            if not asyncio.get_event_loop().is_running():
-                raise EnvironmentError("Event loop must be running to start HTTP client session.")
-            cls._client = aiohttp.ClientSession()
-        return cls._client
+        if not asyncio.get_event_loop().is_running():
+            raise EnvironmentError("Event loop must be running to start HTTP client session.")
+        return HttpClientManager.shared_instance().client()
 
     @classmethod
     async def get_all_token_info(cls) -> Dict[str, any]:
@@ -128,37 +126,37 @@ class BambooRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
-            trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, OrderBookTrackerEntry] = {}
+        client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+        trading_pairs: List[str] = await self.get_trading_pairs()
+        retval: Dict[str, OrderBookTrackerEntry] = {}
 
-            for trading_pair in trading_pairs:
-                try:
-                    snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
-                    snapshot_timestamp: float = time.time()
-                    snapshot_msg: BambooRelayOrderBookMessage = self.order_book_class.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        metadata={"symbol": trading_pair}
-                    )
-
-                    bamboo_relay_order_book: BambooRelayOrderBook = BambooRelayOrderBook()
-                    bamboo_relay_active_order_tracker: BambooRelayActiveOrderTracker = BambooRelayActiveOrderTracker()
-                    bids, asks = bamboo_relay_active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
-                    bamboo_relay_order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
-
-                    retval[trading_pair] = BambooRelayOrderBookTrackerEntry(
-                        trading_pair,
-                        snapshot_timestamp,
-                        bamboo_relay_order_book,
-                        bamboo_relay_active_order_tracker
-                    )
-
-                    await asyncio.sleep(0.7)
-
-                except Exception:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
-            return retval
+        for trading_pair in trading_pairs:
+            try:
+                snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
+                snapshot_timestamp: float = time.time()
+                snapshot_msg: BambooRelayOrderBookMessage = self.order_book_class.snapshot_message_from_exchange(
+                    snapshot,
+                    snapshot_timestamp,
+                    metadata={"symbol": trading_pair}
+                )
+
+                bamboo_relay_order_book: BambooRelayOrderBook = BambooRelayOrderBook()
+                bamboo_relay_active_order_tracker: BambooRelayActiveOrderTracker = BambooRelayActiveOrderTracker()
+                bids, asks = bamboo_relay_active_order_tracker.convert_snapshot_message_to_np_arrays(snapshot_msg)
+                bamboo_relay_order_book.apply_numpy_snapshot(bids[:, 1:], asks[:, 1:], snapshot_msg.update_id)
+
+                retval[trading_pair] = BambooRelayOrderBookTrackerEntry(
+                    trading_pair,
+                    snapshot_timestamp,
+                    bamboo_relay_order_book,
+                    bamboo_relay_active_order_tracker
+                )
+
+                await asyncio.sleep(0.7)
+
+            except Exception:
+                self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
+        return retval
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
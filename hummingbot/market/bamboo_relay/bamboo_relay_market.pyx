@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 from async_timeout import timeout
 from collections import deque
@@ -19,6 +18,7 @@ from web3 import Web3
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.market.bamboo_relay.bamboo_relay_api_order_book_data_source import BambooRelayAPIOrderBookDataSource
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_manager import HttpClientManager
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.market.market_base cimport MarketBase
 from hummingbot.market.market_base import (
@@ -224,10 +224,12 @@ cdef class BambooRelayMarket(MarketBase):
                  order_book_tracker_data_source_type: OrderBookTrackerDataSourceType =
                     OrderBookTrackerDataSourceType.EXCHANGE_API,
                  wallet_spender_address: str = ZERO_EX_MAINNET_ERC20_PROXY,
-                 symbols: Optional[List[str]] = None):
+                 symbols: Optional[List[str]] = None,
+                 use_order_book_depth_index: bool = False):
         super().__init__()
         self._order_book_tracker = BambooRelayOrderBookTracker(data_source_type=order_book_tracker_data_source_type,
-                                                              symbols=symbols)
+                                                              symbols=symbols,
+                                                              use_depth_index=use_order_book_depth_index)
         self._account_balances = {}
         self._ev_loop = asyncio.get_event_loop()
         self._poll_notifier = asyncio.Event()
@@ -617,28 +619,28 @@ cdef class BambooRelayMarket(MarketBase):
                            url: str,
                            data: Optional[Dict[str, Any]] = None,
                            headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as client:
-            async with client.request(http_method,
-                                      url=url,
-                                      timeout=self.API_CALL_TIMEOUT,
-                                      data=data,
-                                      headers=headers) as response:
-                try:
-                    if response.status == 201:
-                        return response
-                    elif response.status == 200:
-                        response_json = await response.json()
-                        return response_json
-                    else:
-                        raise IOError
-                except Exception:
-                    if response.status == 502:
-                        raise IOError(f"Error fetching data from {url}. "
-                                      f"HTTP status is {response.status} - Server Error: Bad Gateway.")
-                    else:
-                        response_text = await response.text()
-                        raise IOError(f"Error fetching data from {url}. "
-                                      f"HTTP status is {response.status} - {response_text}.")
+        client = HttpClientManager.shared_instance().client()
+        async with client.request(http_method,
+                                  url=url,
+                                  timeout=self.API_CALL_TIMEOUT,
+                                  data=data,
+                                  headers=headers) as response:
+            try:
+                if response.status == 201:
+                    return response
+                elif response.status == 200:
+                    response_json = await response.json()
+                    return response_json
+                else:
+                    raise IOError
+            except Exception:
+                if response.status == 502:
+                    raise IOError(f"Error fetching data from {url}. "
+                                  f"HTTP status is {response.status} - Server Error: Bad Gateway.")
+                else:
+                    response_text = await response.text()
+                    raise IOError(f"Error fetching data from {url}. "
+                                  f"HTTP status is {response.status} - {response_text}.")
 
     async def request_signed_market_orders(self, symbol: str, side: TradeType, amount: str) -> Dict[str, Any]:
         if side is TradeType.BUY:
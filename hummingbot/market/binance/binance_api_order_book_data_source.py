@@ -16,9 +16,11 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.market.binance import binance_rate_limits
 from hummingbot.market.binance.binance_order_book import BinanceOrderBook
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_manager import HttpClientManager
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -54,49 +56,49 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Returned data frame should have symbol as index and include usd volume, baseAsset and quoteAsset
         """
-        async with aiohttp.ClientSession() as client:
-
-            market_response, exchange_response = await asyncio.gather(
-                client.get(TICKER_PRICE_CHANGE_URL),
-                client.get(EXCHANGE_INFO_URL)
+        client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+
+        market_response, exchange_response = await asyncio.gather(
+            client.get(TICKER_PRICE_CHANGE_URL),
+            client.get(EXCHANGE_INFO_URL)
+        )
+        market_response: aiohttp.ClientResponse = market_response
+        exchange_response: aiohttp.ClientResponse = exchange_response
+
+        if market_response.status != 200:
+            raise IOError(f"Error fetching Binance markets information. "
+                          f"HTTP status is {market_response.status}.")
+        if exchange_response.status != 200:
+            raise IOError(f"Error fetching Binance exchange information. "
+                          f"HTTP status is {exchange_response.status}.")
+
+        market_data = await market_response.json()
+        exchange_data = await exchange_response.json()
+
+        trading_pairs: Dict[str, any] = {item["symbol"]: {k: item[k] for k in ["baseAsset", "quoteAsset"]}
+                                         for item in exchange_data["symbols"]
+                                         if item["status"] == "TRADING"}
+
+        market_data: List[Dict[str, any]] = [{**item, **trading_pairs[item["symbol"]]}
+                                             for item in market_data
+                                             if item["symbol"] in trading_pairs]
+
+        # Build the data frame.
+        all_markets: pd.DataFrame = pd.DataFrame.from_records(data=market_data, index="symbol")
+        btc_price: float = float(all_markets.loc["BTCUSDT"].lastPrice)
+        eth_price: float = float(all_markets.loc["ETHUSDT"].lastPrice)
+        usd_volume: float = [
+            (
+                quoteVolume * btc_price if symbol.endswith("BTC") else
+                quoteVolume * eth_price if symbol.endswith("ETH") else
+                quoteVolume
             )
-            market_response: aiohttp.ClientResponse = market_response
-            exchange_response: aiohttp.ClientResponse = exchange_response
-
-            if market_response.status != 200:
-                raise IOError(f"Error fetching Binance markets information. "
-                              f"HTTP status is {market_response.status}.")
-            if exchange_response.status != 200:
-                raise IOError(f"Error fetching Binance exchange information. "
-                              f"HTTP status is {exchange_response.status}.")
-
-            market_data = await market_response.json()
-            exchange_data = await exchange_response.json()
-
-            trading_pairs: Dict[str, any] = {item["symbol"]: {k: item[k] for k in ["baseAsset", "quoteAsset"]}
-                                             for item in exchange_data["symbols"]
-                                             if item["status"] == "TRADING"}
-
-            market_data: List[Dict[str, any]] = [{**item, **trading_pairs[item["symbol"]]}
-                                                 for item in market_data
-                                                 if item["symbol"] in trading_pairs]
-
-            # Build the data frame.
-            all_markets: pd.DataFrame = pd.DataFrame.from_records(data=market_data, index="symbol")
-            btc_price: float = float(all_markets.loc["BTCUSDT"].lastPrice)
-            eth_price: float = float(all_markets.loc["ETHUSDT"].lastPrice)
-            usd_volume: float = [
-                (
-                    quoteVolume * btc_price if symbol.endswith("BTC") else
-                    quoteVolume * eth_price if symbol.endswith("ETH") else
-                    quoteVolume
-                )
-                for symbol, quoteVolume in zip(all_markets.index,
-                                               all_markets.quoteVolume.astype("float"))]
-            all_markets.loc[:, "USDVolume"] = usd_volume
-            all_markets.loc[:, "volume"] = all_markets.quoteVolume
+            for symbol, quoteVolume in zip(all_markets.index,
+                                           all_markets.quoteVolume.astype("float"))]
+        all_markets.loc[:, "USDVolume"] = usd_volume
+        all_markets.loc[:, "volume"] = all_markets.quoteVolume
 
-            return all_markets.sort_values("USDVolume", ascending=False)
+        return all_markets.sort_values("USDVolume", ascending=False)
 
     @property
     def order_book_class(self) -> BinanceOrderBook:
@@ -111,47 +113,62 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return trading_pairs
 
     @staticmethod
-    async def get_snapshot(client: aiohttp.ClientSession, trading_pair: str, limit: int = 1000) -> Dict[str, any]:
-            params: Dict = {"limit": str(limit), "symbol": trading_pair} if limit != 0 else {"symbol": trading_pair}
-            async with client.get(SNAPSHOT_REST_URL, params=params) as response:
-                response: aiohttp.ClientResponse = response
-                if response.status != 200:
-                    raise IOError(f"Error fetching Binance market snapshot for {trading_pair}. "
-                                  f"HTTP status is {response.status}.")
-                data: Dict[str, any] = await response.json()
-
-                # Need to add the symbol into the snapshot message for the Kafka message queue.
-                # Because otherwise, there'd be no way for the receiver to know which market the
-                # snapshot belongs to.
-
-                return data
+    async def get_snapshot(client: aiohttp.ClientSession,
+                           trading_pair: str,
+                           limit: int = 1000,
+                           background: bool = False) -> Dict[str, any]:
+        """
+        Fetches an order book snapshot, once the Binance request weight limit allows for it. Background snapshot
+        requests leave part of the request weight budget unused, for order and status requests.
+        """
+        await binance_rate_limits.request_weight_limiter().acquire(
+            binance_rate_limits.depth_request_weight(limit),
+            reserve=binance_rate_limits.BACKGROUND_REQUEST_RESERVE if background else 0
+        )
+        params: Dict = {"limit": str(limit), "symbol": trading_pair} if limit != 0 else {"symbol": trading_pair}
+        async with client.get(SNAPSHOT_REST_URL, params=params) as response:
+            response: aiohttp.ClientResponse = response
+            if response.status in (418, 429):
+                binance_rate_limits.request_weight_limiter().pause(float(response.headers.get("Retry-After", 60)))
+            if response.status != 200:
+                raise IOError(f"Error fetching Binance market snapshot for {trading_pair}. "
+                              f"HTTP status is {response.status}.")
+            data: Dict[str, any] = await response.json()
+
+            # Need to add the symbol into the snapshot message for the Kafka message queue.
+            # Because otherwise, there'd be no way for the receiver to know which market the
+            # snapshot belongs to.
+
+            return data
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
-            trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, OrderBookTrackerEntry] = {}
+        client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+        trading_pairs: List[str] = await self.get_trading_pairs()
+        retval: Dict[str, OrderBookTrackerEntry] = {}
+        number_of_pairs: int = len(trading_pairs)
 
-            number_of_pairs: int = len(trading_pairs)
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair, 1000)
-                    snapshot_timestamp: float = time.time()
-                    snapshot_msg: OrderBookMessage = self.order_book_class.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        metadata={"symbol": trading_pair}
-                    )
-                    order_book: BinanceOrderBook = self.order_book_class.from_snapshot(snapshot_msg)
-                    retval[trading_pair] = OrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book)
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                        f"{index+1}/{number_of_pairs} completed.")
-                    # Each 1000 limit snapshot costs 10 requests and Binance rate limit is 20 requests per second.
-                    await asyncio.sleep(0.4)
-                except Exception:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
-                    await asyncio.sleep(5)
-            return retval
+        async def init_order_book(trading_pair: str):
+            # The snapshot requests are sent concurrently, as fast as the request weight limit allows.
+            try:
+                snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair, 1000)
+                snapshot_timestamp: float = time.time()
+                snapshot_msg: OrderBookMessage = self.order_book_class.snapshot_message_from_exchange(
+                    snapshot,
+                    snapshot_timestamp,
+                    metadata={"symbol": trading_pair}
+                )
+                order_book: BinanceOrderBook = self.order_book_class.from_snapshot(snapshot_msg)
+                retval[trading_pair] = OrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{len(retval)}/{number_of_pairs} completed.")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
+
+        await asyncio.gather(*[init_order_book(trading_pair) for trading_pair in trading_pairs])
+        return retval
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
@@ -200,29 +217,27 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
-                    for trading_pair in trading_pairs:
-                        try:
-                            snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
-                            snapshot_timestamp: float = time.time()
-                            snapshot_msg: OrderBookMessage = self.order_book_class.snapshot_message_from_exchange(
-                                snapshot,
-                                snapshot_timestamp,
-                                metadata={"symbol": trading_pair}
-                            )
-                            output.put_nowait(snapshot_msg)
-                            self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-                            # Be careful not to go above Binance's API rate limits.
-                            await asyncio.sleep(5.0)
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception:
-                            self.logger().error("Unexpected error.", exc_info=True)
-                            await asyncio.sleep(5.0)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
+                client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+                for trading_pair in trading_pairs:
+                    try:
+                        snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair, background=True)
+                        snapshot_timestamp: float = time.time()
+                        snapshot_msg: OrderBookMessage = self.order_book_class.snapshot_message_from_exchange(
+                            snapshot,
+                            snapshot_timestamp,
+                            metadata={"symbol": trading_pair}
+                        )
+                        output.put_nowait(snapshot_msg)
+                        self.logger().debug(f"Saved order book snapshot for {trading_pair}")
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception:
+                        self.logger().error("Unexpected error.", exc_info=True)
+                        await asyncio.sleep(5.0)
+                this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
+                next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
+                delta: float = next_hour.timestamp() - time.time()
+                await asyncio.sleep(delta)
             except asyncio.CancelledError:
                 raise
             except Exception:
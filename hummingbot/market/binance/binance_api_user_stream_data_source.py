@@ -13,6 +13,7 @@ import websockets
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from binance.client import Client as BinanceClient
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_manager import HttpClientManager
 
 BINANCE_API_ENDPOINT = "https://api.binance.com/api/v1/"
 BINANCE_USER_STREAM_ENDPOINT = "userDataStream"
@@ -38,25 +39,25 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
         super().__init__()
 
     async def get_listen_key(self):
-        async with aiohttp.ClientSession() as client:
-            async with client.post(f"{BINANCE_API_ENDPOINT}{BINANCE_USER_STREAM_ENDPOINT}",
-                                   headers={"X-MBX-APIKEY": self._binance_client.API_KEY}) as response:
-                response: aiohttp.ClientResponse = response
-                if response.status != 200:
-                    raise IOError(f"Error fetching Binance user stream listen key. HTTP status is {response.status}.")
-                data: Dict[str, str] = await response.json()
-                return data["listenKey"]
+        client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+        async with client.post(f"{BINANCE_API_ENDPOINT}{BINANCE_USER_STREAM_ENDPOINT}",
+                               headers={"X-MBX-APIKEY": self._binance_client.API_KEY}) as response:
+            response: aiohttp.ClientResponse = response
+            if response.status != 200:
+                raise IOError(f"Error fetching Binance user stream listen key. HTTP status is {response.status}.")
+            data: Dict[str, str] = await response.json()
+            return data["listenKey"]
 
     async def ping_listen_key(self, listen_key: str) -> bool:
-        async with aiohttp.ClientSession() as client:
-            async with client.put(f"{BINANCE_API_ENDPOINT}{BINANCE_USER_STREAM_ENDPOINT}",
-                                  headers={"X-MBX-APIKEY": self._binance_client.API_KEY},
-                                  params={"listenKey": listen_key}) as response:
-                data: [str, any] = await response.json()
-                if "code" in data:
-                    self.logger().warning(f"Failed to refresh the listen key {listen_key}: {data}")
-                    return False
-                return True
+        client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+        async with client.put(f"{BINANCE_API_ENDPOINT}{BINANCE_USER_STREAM_ENDPOINT}",
+                              headers={"X-MBX-APIKEY": self._binance_client.API_KEY},
+                              params={"listenKey": listen_key}) as response:
+            data: [str, any] = await response.json()
+            if "code" in data:
+                self.logger().warning(f"Failed to refresh the listen key {listen_key}: {data}")
+                return False
+            return True
 
     async def _inner_messages(self, ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
         try:
@@ -29,6 +29,7 @@ cdef class BinanceMarket(MarketBase):
         public object _order_tracker_task
         public object _trading_rules_polling_task
         object _async_scheduler
+        bint _reconcile_order_status
         object _set_server_time_offset_task
 
     cdef c_did_timeout_tx(self, str tracking_id)
@@ -43,4 +44,5 @@ cdef class BinanceMarket(MarketBase):
                                 bint is_buy,
                                 object amount,
                                 object order_type)
-    cdef c_stop_tracking_order(self, str order_id)
\ No newline at end of file
+    cdef c_stop_tracking_order(self, str order_id)
+    cdef c_process_order_update(self, object tracked_order, dict order_update)
\ No newline at end of file
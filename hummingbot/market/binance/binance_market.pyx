@@ -1,5 +1,4 @@
 import math
-import aiohttp
 from aiokafka import (
     AIOKafkaConsumer,
     ConsumerRecord
@@ -20,16 +19,28 @@ from typing import (
     List,
     AsyncIterable,
     Optional,
+    Awaitable,
+    Callable,
     Coroutine,
     Tuple,
+    Union,
 )
 from web3 import Web3
 import conf
 import hummingbot
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.executor_pools import (
+    CHAIN_RPC_POOL,
+    EXCHANGE_REST_POOL
+)
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallPriority,
+    AsyncCallScheduler
+)
 from hummingbot.core.clock cimport Clock
 from hummingbot.market.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
+from hummingbot.market.binance import binance_rate_limits
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_manager import HttpClientManager
 from hummingbot.core.event.events import (
     MarketEvent,
     MarketReceivedAssetEvent,
@@ -66,6 +77,22 @@ s_logger = None
 s_decimal_0 = Decimal(0)
 SYMBOL_SPLITTER = re.compile(r"^(\w+)(BTC|ETH|BNB|XRP|USDT|USDC|TUSD|PAX)$")
 
+# Binance API calls run in their own lane of the shared async call scheduler. Cancels and orders go before polling.
+BINANCE_CALL_LANE = "binance"
+BINANCE_CALL_CONCURRENCY = 8
+BINANCE_CALL_PRIORITIES = {
+    "cancel_order": AsyncCallPriority.CANCEL,
+    "order_limit_buy": AsyncCallPriority.ORDER,
+    "order_limit_sell": AsyncCallPriority.ORDER,
+    "order_market_buy": AsyncCallPriority.ORDER,
+    "order_market_sell": AsyncCallPriority.ORDER,
+    "get_order": AsyncCallPriority.POLLING,
+    "get_open_orders": AsyncCallPriority.POLLING,
+    "get_account": AsyncCallPriority.POLLING,
+    "get_trade_fee": AsyncCallPriority.POLLING,
+    "get_deposit_history": AsyncCallPriority.POLLING,
+}
+
 
 cdef class BinanceMarketTransactionTracker(TransactionTracker):
     cdef:
@@ -264,13 +291,18 @@ cdef class BinanceMarket(MarketBase):
                  user_stream_tracker_data_source_type: UserStreamTrackerDataSourceType =
                     UserStreamTrackerDataSourceType.EXCHANGE_API,
                  symbols: Optional[List[str]] = None,
-                 trading_required: bool = True):
+                 trading_required: bool = True,
+                 reconcile_order_status: bool = True,
+                 use_order_book_depth_index: bool = False,
+                 coalesce_order_book_diffs: bool = False):
 
         self.monkey_patch_binance_time()
         super().__init__()
         self._trading_required = trading_required
         self._order_book_tracker = BinanceOrderBookTracker(data_source_type=order_book_tracker_data_source_type,
-                                                           symbols=symbols)
+                                                           symbols=symbols,
+                                                           use_depth_index=use_order_book_depth_index,
+                                                           coalesce_diffs=coalesce_order_book_diffs)
         self._binance_client = BinanceClient(binance_api_key, binance_api_secret)
         self._user_stream_tracker = BinanceUserStreamTracker(
             data_source_type=user_stream_tracker_data_source_type, binance_client=self._binance_client)
@@ -293,7 +325,9 @@ cdef class BinanceMarket(MarketBase):
         self._user_stream_event_listener_task = None
         self._order_tracker_task = None
         self._trading_rules_polling_task = None
-        self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
+        self._reconcile_order_status = reconcile_order_status
+        self._async_scheduler = AsyncCallScheduler.shared_instance()
+        self._async_scheduler.add_lane(BINANCE_CALL_LANE, concurrency=BINANCE_CALL_CONCURRENCY)
 
     @staticmethod
     def split_symbol(symbol: str) -> Tuple[str, str]:
@@ -341,10 +375,14 @@ cdef class BinanceMarket(MarketBase):
 
     async def schedule_async_call(
             self,
-            coro: Coroutine,
+            coro: Union[Coroutine, Callable[[], Awaitable]],
             timeout_seconds: float,
-            app_warning_msg: str = "Binance API call failed. Check API key and network connection.") -> any:
-        return await self._async_scheduler.schedule_async_call(coro, timeout_seconds)
+            app_warning_msg: str = "Binance API call failed. Check API key and network connection.",
+            priority: int = AsyncCallPriority.DEFAULT) -> any:
+        return await self._async_scheduler.schedule_async_call(coro, timeout_seconds,
+                                                               app_warning_msg=app_warning_msg,
+                                                               lane=BINANCE_CALL_LANE,
+                                                               priority=priority)
 
     async def query_api(
             self,
@@ -352,17 +390,34 @@ cdef class BinanceMarket(MarketBase):
             *args,
             app_warning_msg: str = "Binance API call failed. Check API key and network connection.",
             **kwargs) -> Dict[str, any]:
+        cdef:
+            str method_name = func.__name__
+
+        async def api_call():
+            try:
+                return await self._ev_loop.run_in_executor(hummingbot.get_executor(EXCHANGE_REST_POOL),
+                                                           partial(func, *args, **kwargs))
+            except BinanceAPIException as e:
+                if e.status_code in (418, 429):
+                    binance_rate_limits.request_weight_limiter().pause(60.0)
+                raise
+
+        # Waiting for request weight throttles the call, rather than failing it - so the wait is not part of the
+        # call timeout.
+        await binance_rate_limits.acquire_client_method_weight(method_name, kwargs)
         async with timeout(self.API_CALL_TIMEOUT):
-            coro = self._ev_loop.run_in_executor(hummingbot.get_executor(), partial(func, *args, **kwargs))
-            return await self.schedule_async_call(coro, self.API_CALL_TIMEOUT, app_warning_msg=app_warning_msg)
+            return await self.schedule_async_call(api_call, self.API_CALL_TIMEOUT,
+                                                  app_warning_msg=app_warning_msg,
+                                                  priority=BINANCE_CALL_PRIORITIES.get(method_name,
+                                                                                       AsyncCallPriority.DEFAULT))
 
     async def query_url(self, url) -> any:
-        async with aiohttp.ClientSession() as client:
-            async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
-                if response.status != 200:
-                    raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
-                data = await response.json()
-                return data
+        client = HttpClientManager.shared_instance().client()
+        async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
+            if response.status != 200:
+                raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
+            data = await response.json()
+            return data
 
     async def _update_balances(self):
         cdef:
@@ -387,7 +442,7 @@ cdef class BinanceMarket(MarketBase):
 
     async def _check_failed_eth_tx(self):
         in_flight_deposits = [d for d in self._in_flight_deposits.values() if not d.has_tx_receipt]
-        tasks = [self._ev_loop.run_in_executor(hummingbot.get_executor(),
+        tasks = [self._ev_loop.run_in_executor(hummingbot.get_executor(CHAIN_RPC_POOL),
                                                self._w3.eth.getTransactionReceipt, d.tx_hash)
                  for d in in_flight_deposits]
         receipts = await asyncio.gather(*tasks)
@@ -502,6 +557,116 @@ cdef class BinanceMarket(MarketBase):
             for trading_rule in trading_rules_list:
                 self._trading_rules[trading_rule.symbol] = trading_rule
 
+    cdef c_process_order_update(self, object tracked_order, dict order_update):
+        tracked_order.last_state = order_update["status"]
+        client_order_id = tracked_order.client_order_id
+        order_type = OrderType.LIMIT if order_update["type"]=="LIMIT" else OrderType.MARKET
+        if tracked_order.last_state in ["FILLED", "PARTIALLY_FILLED"]:
+            self.c_trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG,
+                                 OrderFilledEvent(
+                                    self._current_timestamp,
+                                    tracked_order.client_order_id,
+                                    tracked_order.symbol,
+                                    TradeType.BUY if tracked_order.is_buy else TradeType.SELL,
+                                    order_type,
+                                    float(order_update["price"]),
+                                    float(order_update["executedQty"]),
+                                    self.c_get_fee(
+                                        tracked_order.base_asset,
+                                        tracked_order.quote_asset,
+                                        order_type,
+                                        TradeType.BUY if tracked_order.is_buy else TradeType.SELL,
+                                        float(order_update["price"]),
+                                        float(order_update["executedQty"])),
+                                 ))
+        if tracked_order.is_done:
+            if not tracked_order.is_failure:
+                if tracked_order.is_buy:
+                    self.logger().info(f"The market buy order {client_order_id} has completed "
+                                       f"according to order status API.")
+                    self.c_trigger_event(self.MARKET_BUY_ORDER_COMPLETED_EVENT_TAG,
+                                         BuyOrderCompletedEvent(self._current_timestamp,
+                                                                tracked_order.client_order_id,
+                                                                tracked_order.base_asset,
+                                                                tracked_order.quote_asset,
+                                                                (tracked_order.fee_asset
+                                                                 or tracked_order.base_asset),
+                                                                float(tracked_order.executed_amount),
+                                                                float(tracked_order.quote_asset_amount),
+                                                                float(tracked_order.fee_paid),
+                                                                order_type))
+                else:
+                    self.logger().info(f"The market sell order {client_order_id} has completed "
+                                       f"according to order status API.")
+                    self.c_trigger_event(self.MARKET_SELL_ORDER_COMPLETED_EVENT_TAG,
+                                         SellOrderCompletedEvent(self._current_timestamp,
+                                                                 tracked_order.client_order_id,
+                                                                 tracked_order.base_asset,
+                                                                 tracked_order.quote_asset,
+                                                                 (tracked_order.fee_asset
+                                                                  or tracked_order.quote_asset),
+                                                                 float(tracked_order.executed_amount),
+                                                                 float(tracked_order.quote_asset_amount),
+                                                                 float(tracked_order.fee_paid),
+                                                                 order_type))
+            else:
+                self.logger().info(f"The market order {client_order_id} has failed according to "
+                                   f"order status API.")
+                self.c_trigger_event(self.MARKET_ORDER_FAILURE_EVENT_TAG,
+                                     MarketOrderFailureEvent(
+                                         self._current_timestamp,
+                                         tracked_order.client_order_id,
+                                         order_type
+                                     ))
+            self.c_stop_tracking_order(tracked_order.client_order_id)
+
+    async def _fetch_order_updates(self, list tracked_orders) -> list:
+        """
+        Fetches the status of each given order, with one order status call per order.
+        """
+        tasks = [self.query_api(self._binance_client.get_order,
+                                symbol=tracked_order.symbol,
+                                origClientOrderId=tracked_order.client_order_id)
+                 for tracked_order in tracked_orders]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _reconcile_order_updates(self, list tracked_orders) -> list:
+        """
+        Fetches the status of each given order, with one open orders call per symbol. Only the orders that are no
+        longer open are queried one by one, to find out whether they have been filled or cancelled.
+        """
+        cdef:
+            dict orders_by_symbol = {}
+            dict order_updates = {}
+            list closed_orders = []
+            list symbols
+            InFlightOrder tracked_order
+
+        for tracked_order in tracked_orders:
+            orders_by_symbol.setdefault(tracked_order.symbol, []).append(tracked_order)
+        symbols = list(orders_by_symbol.keys())
+        open_orders_results = await asyncio.gather(*[self.query_api(self._binance_client.get_open_orders,
+                                                                    symbol=symbol)
+                                                     for symbol in symbols],
+                                                   return_exceptions=True)
+        for symbol, open_orders in zip(symbols, open_orders_results):
+            if isinstance(open_orders, Exception):
+                # Fall back to querying the orders of the symbol one by one.
+                closed_orders.extend(orders_by_symbol[symbol])
+                continue
+            open_orders_by_id = {open_order["clientOrderId"]: open_order for open_order in open_orders}
+            for tracked_order in orders_by_symbol[symbol]:
+                if tracked_order.client_order_id in open_orders_by_id:
+                    order_updates[tracked_order.client_order_id] = open_orders_by_id[tracked_order.client_order_id]
+                else:
+                    closed_orders.append(tracked_order)
+
+        if len(closed_orders) > 0:
+            closed_order_updates = await self._fetch_order_updates(closed_orders)
+            for tracked_order, order_update in zip(closed_orders, closed_order_updates):
+                order_updates[tracked_order.client_order_id] = order_update
+        return [order_updates[tracked_order.client_order_id] for tracked_order in tracked_orders]
+
     async def _update_order_status(self):
         cdef:
             # This is intended to be a backup measure to close straggler orders, in case Binance's user stream events
@@ -512,9 +677,10 @@ cdef class BinanceMarket(MarketBase):
 
         if current_tick > last_tick and len(self._in_flight_orders) > 0:
             tracked_orders = list(self._in_flight_orders.values())
-            tasks = [self.query_api(self._binance_client.get_order, origClientOrderId=o.client_order_id)
-                     for o in tracked_orders]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            if self._reconcile_order_status:
+                results = await self._reconcile_order_updates(tracked_orders)
+            else:
+                results = await self._fetch_order_updates(tracked_orders)
             for order_update, tracked_order in zip(results, tracked_orders):
                 if isinstance(order_update, Exception):
                     self.logger().network(
@@ -522,67 +688,7 @@ cdef class BinanceMarket(MarketBase):
                         app_warning_msg=f"Failed to fetch status update for the order {tracked_order.client_order_id}."
                     )
                     continue
-                tracked_order.last_state = order_update["status"]
-                client_order_id = tracked_order.client_order_id
-                order_type = OrderType.LIMIT if order_update["type"]=="LIMIT" else OrderType.MARKET
-                if tracked_order.last_state in ["FILLED", "PARTIALLY_FILLED"]:
-                    self.c_trigger_event(self.MARKET_ORDER_FILLED_EVENT_TAG,
-                                         OrderFilledEvent(
-                                            self._current_timestamp,
-                                            tracked_order.client_order_id,
-                                            tracked_orders.symbol,
-                                            TradeType.BUY if tracked_order.is_buy else TradeType.SELL,
-                                            order_type,
-                                            float(order_update["price"]),
-                                            float(order_update["executedQty"]),
-                                            self.c_get_fee(
-                                                tracked_order.base_asset,
-                                                tracked_order.quote_asset,
-                                                order_type,
-                                                TradeType.BUY if tracked_order.is_buy else TradeType.SELL,
-                                                float(order_update["price"]),
-                                                float(order_update["executedQty"])),
-                                         ))
-                if tracked_order.is_done:
-                    if not tracked_order.is_failure:
-                        if tracked_order.is_buy:
-                            self.logger().info(f"The market buy order {client_order_id} has completed "
-                                               f"according to order status API.")
-                            self.c_trigger_event(self.MARKET_BUY_ORDER_COMPLETED_EVENT_TAG,
-                                                 BuyOrderCompletedEvent(self._current_timestamp,
-                                                                        tracked_order.client_order_id,
-                                                                        tracked_order.base_asset,
-                                                                        tracked_order.quote_asset,
-                                                                        (tracked_order.fee_asset
-                                                                         or tracked_order.base_asset),
-                                                                        float(tracked_order.executed_amount),
-                                                                        float(tracked_order.quote_asset_amount),
-                                                                        float(tracked_order.fee_paid),
-                                                                        order_type))
-                        else:
-                            self.logger().info(f"The market sell order {client_order_id} has completed "
-                                               f"according to order status API.")
-                            self.c_trigger_event(self.MARKET_SELL_ORDER_COMPLETED_EVENT_TAG,
-                                                 SellOrderCompletedEvent(self._current_timestamp,
-                                                                         tracked_order.client_order_id,
-                                                                         tracked_order.base_asset,
-                                                                         tracked_order.quote_asset,
-                                                                         (tracked_order.fee_asset
-                                                                          or tracked_order.quote_asset),
-                                                                         float(tracked_order.executed_amount),
-                                                                         float(tracked_order.quote_asset_amount),
-                                                                         float(tracked_order.fee_paid),
-                                                                         order_type))
-                    else:
-                        self.logger().info(f"The market order {client_order_id} has failed according to "
-                                           f"order status API.")
-                        self.c_trigger_event(self.MARKET_ORDER_FAILURE_EVENT_TAG,
-                                             MarketOrderFailureEvent(
-                                                 self._current_timestamp,
-                                                 tracked_order.client_order_id,
-                                                 order_type
-                                             ))
-                    self.c_stop_tracking_order(tracked_order.client_order_id)
+                self.c_process_order_update(tracked_order, order_update)
 
     async def _iter_kafka_messages(self, topic: str) -> AsyncIterable[ConsumerRecord]:
         while True:
@@ -836,7 +942,6 @@ cdef class BinanceMarket(MarketBase):
 
     cdef c_stop(self, Clock clock):
         MarketBase.c_stop(self, clock)
-        self._async_scheduler.stop()
 
     async def start_network(self):
         if self._order_tracker_task is not None:
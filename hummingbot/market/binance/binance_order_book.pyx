@@ -123,6 +123,6 @@ cdef class BinanceOrderBook(OrderBook):
     @classmethod
     def from_snapshot(cls, msg: OrderBookMessage) -> "OrderBook":
         retval = BinanceOrderBook()
-        retval.apply_snapshot(msg.bids, msg.asks, msg.update_id)
+        retval.apply_raw_snapshot(msg.content["bids"], msg.content["asks"], msg.update_id)
         return retval
 
@@ -33,8 +33,11 @@ class BinanceOrderBookTracker(OrderBookTracker):
 
     def __init__(self,
                  data_source_type: OrderBookTrackerDataSourceType = OrderBookTrackerDataSourceType.EXCHANGE_API,
-                 symbols: Optional[List[str]] = None):
-        super().__init__(data_source_type=data_source_type)
+                 symbols: Optional[List[str]] = None,
+                 coalesce_diffs: bool = False,
+                 use_depth_index: bool = False):
+        super().__init__(data_source_type=data_source_type, coalesce_diffs=coalesce_diffs,
+                         use_depth_index=use_depth_index)
 
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
@@ -131,7 +134,7 @@ class BinanceOrderBookTracker(OrderBookTracker):
                 await asyncio.sleep(5.0)
 
     async def _track_single_book(self, symbol: str):
-        past_diffs_window: Deque[OrderBookMessage] = deque()
+        past_diffs_window: Deque[OrderBookMessage] = deque(maxlen=self.PAST_DIFF_WINDOW_SIZE)
         self._past_diffs_windows[symbol] = past_diffs_window
 
         message_queue: asyncio.Queue = self._tracking_message_queues[symbol]
@@ -150,11 +153,23 @@ class BinanceOrderBookTracker(OrderBookTracker):
                 else:
                     message = await message_queue.get()
 
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                if self._coalesce_diffs:
+                    messages: List[OrderBookMessage] = [message]
+                    messages.extend(saved_messages)
+                    saved_messages.clear()
+                    self._drain_message_queue(message_queue, messages)
+                    diff_messages_accepted += self._apply_message_batch(order_book, messages, past_diffs_window)
+
+                    # Output some statistics periodically.
+                    now: float = time.time()
+                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
+                        self.logger().info("Processed %d order book diffs for %s.",
+                                           diff_messages_accepted, symbol)
+                        diff_messages_accepted = 0
+                    last_message_timestamp = now
+                elif message.type is OrderBookMessageType.DIFF:
+                    order_book.apply_raw_diffs(message.content["bids"], message.content["asks"], message.update_id)
                     past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
@@ -168,6 +183,8 @@ class BinanceOrderBookTracker(OrderBookTracker):
                     past_diffs: List[OrderBookMessage] = list(past_diffs_window)
                     order_book.restore_from_snapshot_and_diffs(message, past_diffs)
                     self.logger().debug("Processed order book snapshot for %s.", symbol)
+
+                self._did_change_order_book(symbol, order_book)
             except asyncio.CancelledError:
                 raise
             except Exception:
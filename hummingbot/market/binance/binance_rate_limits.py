@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+from typing import (
+    Any,
+    Dict,
+    Optional
+)
+
+from hummingbot.core.utils.weighted_rate_limiter import WeightedRateLimiter
+
+# Binance limits the total request weight per minute for each IP address, and the number of new orders per second for
+# each account.
+REQUEST_WEIGHT_LIMIT = 1200
+REQUEST_WEIGHT_INTERVAL = 60.0
+ORDER_LIMIT = 10
+ORDER_INTERVAL = 1.0
+
+# Request weight that periodic background requests, like order book snapshot refreshes, leave unused for order and
+# status requests.
+BACKGROUND_REQUEST_RESERVE = 400
+
+# Request weights of the Binance client methods called by the Binance market. Methods not listed here weigh 1. WAPI
+# methods, e.g. deposits and withdrawals, do not count towards the request weight limit.
+CLIENT_METHOD_WEIGHTS: Dict[str, int] = {
+    "get_account": 5,
+    "get_all_orders": 5,
+    "get_my_trades": 5,
+    "get_open_orders": 1,
+    "get_deposit_history": 0,
+    "get_deposit_address": 0,
+    "get_trade_fee": 0,
+    "withdraw": 0,
+}
+
+OPEN_ORDERS_ALL_SYMBOLS_WEIGHT = 40
+
+ORDER_CLIENT_METHODS = {
+    "create_order",
+    "order_limit",
+    "order_limit_buy",
+    "order_limit_sell",
+    "order_market",
+    "order_market_buy",
+    "order_market_sell",
+}
+
+_request_weight_limiter: Optional[WeightedRateLimiter] = None
+_order_limiter: Optional[WeightedRateLimiter] = None
+
+
+def depth_request_weight(limit: int) -> int:
+    """
+    Request weight of an order book snapshot, by the number of levels requested. A limit of 0 means Binance's default
+    limit of 100 levels.
+    """
+    if limit <= 100:
+        return 1
+    elif limit <= 500:
+        return 5
+    elif limit <= 1000:
+        return 10
+    return 50
+
+
+def client_method_weight(method_name: str, params: Optional[Dict[str, Any]] = None) -> int:
+    if method_name == "get_open_orders" and (params is None or "symbol" not in params):
+        # Fetching the open orders of all symbols at once is much more expensive.
+        return OPEN_ORDERS_ALL_SYMBOLS_WEIGHT
+    return CLIENT_METHOD_WEIGHTS.get(method_name, 1)
+
+
+def request_weight_limiter() -> WeightedRateLimiter:
+    global _request_weight_limiter
+    if _request_weight_limiter is None:
+        _request_weight_limiter = WeightedRateLimiter(REQUEST_WEIGHT_LIMIT, REQUEST_WEIGHT_INTERVAL,
+                                                      name="Binance request weight")
+    return _request_weight_limiter
+
+
+def order_limiter() -> WeightedRateLimiter:
+    global _order_limiter
+    if _order_limiter is None:
+        _order_limiter = WeightedRateLimiter(ORDER_LIMIT, ORDER_INTERVAL, name="Binance order")
+    return _order_limiter
+
+
+async def acquire_client_method_weight(method_name: str, params: Optional[Dict[str, Any]] = None):
+    weight: int = client_method_weight(method_name, params)
+    if method_name in ORDER_CLIENT_METHODS:
+        await order_limiter().acquire()
+    if weight > 0:
+        await request_weight_limiter().acquire(weight)
@@ -5,6 +5,7 @@ import statistics
 import time
 from collections import deque
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_manager import HttpClientManager
 
 
 class BinanceTime:
@@ -66,12 +67,12 @@ class BinanceTime:
     async def set_server_time_offset(self):
         while True:
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(self.BINANCE_TIME_API) as resp:
-                        time_now_ms = time.time() * 1e3
-                        resp_data = await resp.json()
-                        binance_server_time = resp_data["serverTime"]
-                        time_after_ms = time.time() * 1e3
+                session: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+                async with session.get(self.BINANCE_TIME_API) as resp:
+                    time_now_ms = time.time() * 1e3
+                    resp_data = await resp.json()
+                    binance_server_time = resp_data["serverTime"]
+                    time_after_ms = time.time() * 1e3
                 expected_server_time = int((time_after_ms + time_now_ms)//2)
                 time_offset =  binance_server_time - expected_server_time
                 self.set_time_offset_ms(time_offset)
@@ -97,5 +97,5 @@ cdef class BittrexOrderBook(OrderBook):
     @classmethod
     def from_snapshot(cls, msg: OrderBookMessage) -> "OrderBook":
         retval = BittrexOrderBook()
-        retval.apply_snapshot(msg.bids, msg.asks, msg.update_id)
+        retval.apply_raw_snapshot(msg.content["bids"], msg.content["asks"], msg.update_id)
         return retval
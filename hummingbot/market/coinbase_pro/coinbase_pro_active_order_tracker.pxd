@@ -1,10 +1,16 @@
 # distutils: language=c++
 cimport numpy as np
 
+from hummingbot.core.data_type.l3_order_store cimport L3OrderStore
+
 cdef class CoinbaseProActiveOrderTracker:
-    cdef dict _active_bids
-    cdef dict _active_asks
+    cdef L3OrderStore _order_store
+    cdef int _removed_side
+    cdef double _removed_price
+    cdef double _removed_quantity
 
+    cdef int c_apply_diff_message(self, object message, double *price_out, double *quantity_out) except -1
+    cdef bint c_is_tracked_at(self, Py_ssize_t slot, bint is_bid, double price)
     cdef tuple c_convert_diff_message_to_np_arrays(self, object message)
     cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message)
     cdef np.ndarray[np.float64_t, ndim=1] c_convert_trade_message_to_np_array(self, object message)
@@ -8,11 +8,19 @@ from typing import Dict
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.l3_order_store cimport (
+    L3OrderStore,
+    L3_NO_SIDE,
+    L3_BID,
+    L3_ASK,
+    c_diff_to_np_arrays,
+    c_diff_to_order_book_rows
+)
 
 _cbpaot_logger = None
-s_empty_diff = np.ndarray(shape=(0, 4), dtype="float64")
 
-CoinbaseProOrderBookTrackingDictionary = Dict[Decimal, Dict[str, Dict[str, any]]]
+# Price level -> order id -> remaining size.
+CoinbaseProOrderBookTrackingDictionary = Dict[float, Dict[str, float]]
 
 TYPE_OPEN = "open"
 TYPE_CHANGE = "change"
@@ -21,13 +29,18 @@ TYPE_DONE = "done"
 SIDE_BUY = "buy"
 SIDE_SELL = "sell"
 
+
 cdef class CoinbaseProActiveOrderTracker:
     def __init__(self,
                  active_asks: CoinbaseProOrderBookTrackingDictionary = None,
                  active_bids: CoinbaseProOrderBookTrackingDictionary = None):
         super().__init__()
-        self._active_asks = active_asks or {}
-        self._active_bids = active_bids or {}
+        self._order_store = L3OrderStore()
+        self._removed_side = L3_NO_SIDE
+        for active_orders, is_bid in [(active_asks or {}, False), (active_bids or {}, True)]:
+            for price, level_orders in active_orders.items():
+                for order_id, remaining_size in level_orders.items():
+                    self._order_store.c_set_order(order_id, is_bid, float(price), float(remaining_size))
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -36,33 +49,46 @@ cdef class CoinbaseProActiveOrderTracker:
             _cbpaot_logger = logging.getLogger(__name__)
         return _cbpaot_logger
 
+    @property
+    def order_store(self) -> L3OrderStore:
+        return self._order_store
+
     @property
     def active_asks(self) -> CoinbaseProOrderBookTrackingDictionary:
-        return self._active_asks
+        return self._order_store.c_get_active_orders(False)
 
     @property
     def active_bids(self) -> CoinbaseProOrderBookTrackingDictionary:
-        return self._active_bids
+        return self._order_store.c_get_active_orders(True)
 
     def volume_for_ask_price(self, price) -> float:
-        return sum([float(msg["remaining_size"]) for msg in self._active_asks[price].values()])
+        return self._order_store.c_get_level_total(False, float(price))
 
     def volume_for_bid_price(self, price) -> float:
-        return sum([float(msg["remaining_size"]) for msg in self._active_bids[price].values()])
+        return self._order_store.c_get_level_total(True, float(price))
 
-    cdef tuple c_convert_diff_message_to_np_arrays(self, object message):
+    cdef int c_apply_diff_message(self, object message, double *price_out, double *quantity_out) except -1:
+        """
+        Applies a diff message to the tracked orders.
+
+        Returns L3_BID or L3_ASK with the updated price level written to `price_out` and `quantity_out`, or
+        L3_NO_SIDE if the message doesn't change the order book. An open message for a tracked order at another price
+        level also empties out the order's old level, which is recorded in `_removed_side`, `_removed_price` and
+        `_removed_quantity`.
+        """
         cdef:
             dict content = message.content
             str msg_type = content["type"]
             str order_id
             str order_side
             str price_raw
-            object price
-            dict order_dict
-            str remaining_size
-            double timestamp = message.timestamp
-            double quantity = 0
-        
+            double price
+            double remaining_size
+            bint is_bid
+            Py_ssize_t slot
+
+        self._removed_side = L3_NO_SIDE
+
         order_id = content.get("order_id") or content.get("maker_order_id")
         order_side = content.get("side")
         price_raw = content.get("price")
@@ -73,171 +99,81 @@ cdef class CoinbaseProActiveOrderTracker:
         if price_raw is None:
             raise ValueError(f"Unknown order price for message - '{message}'. Aborting.")
         elif price_raw == "null": # 'change' messages have 'null' as price for market orders
-            return s_empty_diff, s_empty_diff
-        price = Decimal(price_raw)
+            return L3_NO_SIDE
+        price = float(price_raw)
+        is_bid = order_side == SIDE_BUY
+        slot = self._order_store.c_get_slot(order_id)
 
         if msg_type == TYPE_OPEN:
-            order_dict = {
-                "order_id": order_id,
-                "remaining_size": content["remaining_size"]
-            }
-            if order_side == SIDE_BUY:
-                if price in self._active_bids:
-                    self._active_bids[price][order_id] = order_dict
-                else:
-                    self._active_bids[price] = {order_id: order_dict}
-                quantity = self.volume_for_bid_price(price)
-                return np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"), s_empty_diff
-            else:
-                if price in self._active_asks:
-                    self._active_asks[price][order_id] = order_dict
-                else:
-                    self._active_asks[price] = {order_id: order_dict}
-                quantity = self.volume_for_ask_price(price)
-                return s_empty_diff, np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
+            if slot >= 0 and (self._order_store.c_is_bid(slot) != is_bid or
+                              self._order_store.c_get_order_price(slot) != price):
+                self._removed_side = L3_BID if self._order_store.c_is_bid(slot) else L3_ASK
+                self._removed_price = self._order_store.c_get_order_price(slot)
+                self._removed_quantity = self._order_store.c_remove_order(slot)
+            quantity_out[0] = self._order_store.c_set_order(order_id, is_bid, price, float(content["remaining_size"]))
 
         elif msg_type == TYPE_CHANGE:
             if content.get("new_size") is not None:
-                remaining_size = content["new_size"]
+                remaining_size = float(content["new_size"])
             elif content.get("new_funds") is not None:
-                remaining_size = str(Decimal(content["new_funds"]) / price)
+                remaining_size = float(Decimal(content["new_funds"]) / Decimal(price_raw))
             else:
                 raise ValueError(f"Invalid change message - '{message}'. Aborting.")
-            if order_side == SIDE_BUY:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    self._active_bids[price][order_id]["remaining_size"] = remaining_size
-                    quantity = self.volume_for_bid_price(price)
-                    return (
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                        s_empty_diff
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
-            else:
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    self._active_asks[price][order_id]["remaining_size"] = remaining_size
-                    quantity = self.volume_for_ask_price(price)
-                    return (
-                        s_empty_diff,
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
+            if not self.c_is_tracked_at(slot, is_bid, price):
+                return L3_NO_SIDE
+            quantity_out[0] = self._order_store.c_set_order_amount(slot, remaining_size)
 
         elif msg_type == TYPE_MATCH:
-            if order_side == SIDE_BUY:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    remaining_size = self._active_bids[price][order_id]["remaining_size"]
-                    self._active_bids[price][order_id]["remaining_size"] = str(float(remaining_size) - float(content["size"]))
-                    quantity = self.volume_for_bid_price(price)
-                    return (
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                        s_empty_diff
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
-            else:
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    remaining_size = self._active_asks[price][order_id]["remaining_size"]
-                    self._active_asks[price][order_id]["remaining_size"] = str(float(remaining_size) - float(content["size"]))
-                    quantity = self.volume_for_ask_price(price)
-                    return (
-                        s_empty_diff,
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
+            if not self.c_is_tracked_at(slot, is_bid, price):
+                return L3_NO_SIDE
+            remaining_size = self._order_store.c_get_order_amount(slot) - float(content["size"])
+            quantity_out[0] = self._order_store.c_set_order_amount(slot, remaining_size)
 
         elif msg_type == TYPE_DONE:
-            if order_side == SIDE_BUY:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    del self._active_bids[price][order_id]
-                    if len(self._active_bids[price]) < 1:
-                        del self._active_bids[price]
-                        return (
-                            np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64"),
-                            s_empty_diff
-                        )
-                    else:
-                        quantity = self.volume_for_bid_price(price)
-                        return (
-                            np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                            s_empty_diff
-                        )
-                return s_empty_diff, s_empty_diff
-            else:
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    del self._active_asks[price][order_id]
-                    if len(self._active_asks[price]) < 1:
-                        del self._active_asks[price]
-                        return (
-                            s_empty_diff,
-                            np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64")
-                        )
-                    else:
-                        quantity = self.volume_for_ask_price(price)
-                        return (
-                            s_empty_diff,
-                            np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                        )
-                return s_empty_diff, s_empty_diff
+            if not self.c_is_tracked_at(slot, is_bid, price):
+                return L3_NO_SIDE
+            quantity_out[0] = self._order_store.c_remove_order(slot)
 
         else:
             raise ValueError(f"Unknown message type '{msg_type}' - {message}. Aborting.")
 
-    cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message):
+        price_out[0] = price
+        return L3_BID if is_bid else L3_ASK
+
+    cdef bint c_is_tracked_at(self, Py_ssize_t slot, bint is_bid, double price):
+        """
+        Whether the order in `slot` is tracked at the side and price of a message. Messages that don't match the
+        tracked order are ignored, rather than reporting one price level's total as another's.
+        """
+        return (slot >= 0 and
+                self._order_store.c_is_bid(slot) == is_bid and
+                self._order_store.c_get_order_price(slot) == price)
+
+    cdef tuple c_convert_diff_message_to_np_arrays(self, object message):
         cdef:
-            object price
-            str order_id
-            str amount
-            dict order_dict
-
-        # Refresh all order tracking.
-        self._active_bids.clear()
-        self._active_asks.clear()
-        for snapshot_orders, active_orders in [(message.content["bids"], self._active_bids),
-                                               (message.content["asks"], self._active_asks)]:
-            for order in snapshot_orders:
-                price = Decimal(order[0])
-                order_id = order[2]
-                amount = order[1]
-                order_dict = {
-                    "order_id": order_id,
-                    "remaining_size": amount
-                }
-
-                if price in active_orders:
-                    active_orders[price][order_id] = order_dict
-                else:
-                    active_orders[price] = {
-                        order_id: order_dict
-                    }
-
-        # Return the sorted snapshot tables.
+            double price = 0
+            double quantity = 0
+            int diff_side = self.c_apply_diff_message(message, &price, &quantity)
+            tuple diff = c_diff_to_np_arrays(diff_side, message.timestamp, price, quantity, message.update_id)
+            tuple removed_diff
+
+        if self._removed_side == L3_NO_SIDE:
+            return diff
+        removed_diff = c_diff_to_np_arrays(self._removed_side, message.timestamp, self._removed_price,
+                                           self._removed_quantity, message.update_id)
+        return np.concatenate([removed_diff[0], diff[0]]), np.concatenate([removed_diff[1], diff[1]])
+
+    cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message):
         cdef:
-            np.ndarray[np.float64_t, ndim=2] bids = np.array(
-                [[message.timestamp,
-                  float(price),
-                  sum([float(order_dict["remaining_size"])
-                       for order_dict in self._active_bids[price].values()]),
-                  message.update_id]
-                 for price in sorted(self._active_bids.keys(), reverse=True)], dtype="float64", ndmin=2)
-            np.ndarray[np.float64_t, ndim=2] asks = np.array(
-                [[message.timestamp,
-                  float(price),
-                  sum([float(order_dict["remaining_size"])
-                       for order_dict in self._active_asks[price].values()]),
-                  message.update_id]
-                 for price in sorted(self._active_asks.keys(), reverse=True)], dtype="float64", ndmin=2)
-
-        # If there're no rows, the shape would become (1, 0) and not (0, 4).
-        # Reshape to fix that.
-        if bids.shape[1] != 4:
-            bids = bids.reshape((0, 4))
-        if asks.shape[1] != 4:
-            asks = asks.reshape((0, 4))
-
-        return bids, asks
+            list bids = message.content["bids"]
+            list asks = message.content["asks"]
+
+        # Snapshot orders are [price, size, order_id] lists.
+        return self._order_store.c_load_snapshot(
+            [order[2] for order in bids], [order[0] for order in bids], [order[1] for order in bids],
+            [order[2] for order in asks], [order[0] for order in asks], [order[1] for order in asks],
+            message.timestamp, message.update_id
+        )
 
     cdef np.ndarray[np.float64_t, ndim=1] c_convert_trade_message_to_np_array(self, object message):
         cdef:
@@ -249,13 +185,29 @@ cdef class CoinbaseProActiveOrderTracker:
         )
 
     def convert_diff_message_to_order_book_row(self, message):
-        np_bids, np_asks = self.c_convert_diff_message_to_np_arrays(message)
-        bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
-        asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
-        return bids_row, asks_row
+        cdef:
+            double price = 0
+            double quantity = 0
+            int diff_side = self.c_apply_diff_message(message, &price, &quantity)
+            tuple rows = c_diff_to_order_book_rows(diff_side, price, quantity, message.update_id)
+            tuple removed_rows
+
+        if self._removed_side == L3_NO_SIDE:
+            return rows
+        removed_rows = c_diff_to_order_book_rows(self._removed_side, self._removed_price, self._removed_quantity,
+                                                 message.update_id)
+        return removed_rows[0] + rows[0], removed_rows[1] + rows[1]
+
+    def convert_snapshot_message_to_np_arrays(self, message):
+        """
+        Returns the (timestamp, price, quantity, update_id) level tables of a snapshot message. Columns 1 to 3 can be
+        passed straight to OrderBook.apply_numpy_snapshot().
+        """
+        return self.c_convert_snapshot_message_to_np_arrays(message)
 
     def convert_snapshot_message_to_order_book_row(self, message):
         np_bids, np_asks = self.c_convert_snapshot_message_to_np_arrays(message)
-        bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
-        asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
+        update_id = message.update_id
+        bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, _ in np_bids.tolist()]
+        asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, _ in np_asks.tolist()]
         return bids_row, asks_row
@@ -20,6 +20,7 @@ from hummingbot.market.coinbase_pro.coinbase_pro_order_book import CoinbaseProOr
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_manager import HttpClientManager
 from hummingbot.core.data_type.order_book_tracker_entry import (
     CoinbaseProOrderBookTrackerEntry,
     OrderBookTrackerEntry
@@ -56,61 +57,61 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Returns all currently active BTC trading pairs from Coinbase Pro, sorted by volume in descending order.
         """
-        async with aiohttp.ClientSession() as client:
-            async with client.get(f"{COINBASE_REST_URL}/products") as products_response:
-                products_response: aiohttp.ClientResponse = products_response
-                if products_response.status != 200:
-                    raise IOError(f"Error fetching active Coinbase Pro markets. HTTP status is {products_response.status}.")
-                data = await products_response.json()
-                all_markets: pd.DataFrame = pd.DataFrame.from_records(data=data, index="id")
-                all_markets.rename({"base_currency": "baseAsset", "quote_currency": "quoteAsset"},
-                                   axis="columns", inplace=True)
-                ids: List[str] = list(all_markets.index)
-                volumes: List[float] = []
-                prices: List[float] = []
-                for product_id in ids:
-                    ticker_url: str = f"{COINBASE_REST_URL}/products/{product_id}/ticker"
-                    should_retry: bool = True
-                    retry_counter: int = 0
-                    while should_retry:
-                        async with client.get(ticker_url) as ticker_response:
-                            retry_counter += 1
-                            ticker_response: aiohttp.ClientResponse = ticker_response
-                            if ticker_response.status == 200:
-                                data: Dict[str, Any] = await ticker_response.json()
-                                should_retry = False
-                                volumes.append(float(data.get("volume", NaN)))
-                                prices.append(float(data.get("price", NaN)))
-                            elif ticker_response.status != 429 or retry_counter == MAX_RETRIES:
-                                raise IOError(f"Error fetching ticker for {product_id} on Coinbase Pro. "
-                                              f"HTTP status is {ticker_response.status}.")
-                            await asyncio.sleep(0.5)
-                all_markets["volume"] = volumes
-                all_markets["price"] = prices
-                btc_usd_price: float = all_markets.loc["BTC-USD"].price
-                eth_usd_price: float = all_markets.loc["ETH-USD"].price
-                btc_eur_price: float = all_markets.loc["BTC-EUR"].price
-                btc_gbp_price: float = all_markets.loc["BTC-GBP"].price
-                usd_volume: List[float] = []
-                for row in all_markets.itertuples():
-                    product_name: str = row.Index
-                    quote_volume: float = row.volume
-                    quote_price: float = row.price
-                    if product_name.endswith(("USD", "USDC", "USDS", "DAI", "PAX", "TUSD", "USDT")):
-                        usd_volume.append(quote_volume * quote_price)
-                    elif product_name.endswith("BTC"):
-                        usd_volume.append(quote_volume * quote_price * btc_usd_price)
-                    elif product_name.endswith("ETH"):
-                        usd_volume.append(quote_volume * quote_price * eth_usd_price)
-                    elif product_name.endswith("EUR"):
-                        usd_volume.append(quote_volume * quote_price * (btc_usd_price / btc_eur_price))
-                    elif product_name.endswith("GBP"):
-                        usd_volume.append(quote_volume * quote_price * (btc_usd_price / btc_gbp_price))
-                    else:
-                        usd_volume.append(NaN)
-                        cls.logger().error(f"Unable to convert volume to USD for market - {product_name}.")
-                all_markets["USDVolume"] = usd_volume
-                return all_markets.sort_values("USDVolume", ascending=False)
+        client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+        async with client.get(f"{COINBASE_REST_URL}/products") as products_response:
+            products_response: aiohttp.ClientResponse = products_response
+            if products_response.status != 200:
+                raise IOError(f"Error fetching active Coinbase Pro markets. HTTP status is {products_response.status}.")
+            data = await products_response.json()
+            all_markets: pd.DataFrame = pd.DataFrame.from_records(data=data, index="id")
+            all_markets.rename({"base_currency": "baseAsset", "quote_currency": "quoteAsset"},
+                               axis="columns", inplace=True)
+            ids: List[str] = list(all_markets.index)
+            volumes: List[float] = []
+            prices: List[float] = []
+            for product_id in ids:
+                ticker_url: str = f"{COINBASE_REST_URL}/products/{product_id}/ticker"
+                should_retry: bool = True
+                retry_counter: int = 0
+                while should_retry:
+                    async with client.get(ticker_url) as ticker_response:
+                        retry_counter += 1
+                        ticker_response: aiohttp.ClientResponse = ticker_response
+                        if ticker_response.status == 200:
+                            data: Dict[str, Any] = await ticker_response.json()
+                            should_retry = False
+                            volumes.append(float(data.get("volume", NaN)))
+                            prices.append(float(data.get("price", NaN)))
+                        elif ticker_response.status != 429 or retry_counter == MAX_RETRIES:
+                            raise IOError(f"Error fetching ticker for {product_id} on Coinbase Pro. "
+                                          f"HTTP status is {ticker_response.status}.")
+                        await asyncio.sleep(0.5)
+            all_markets["volume"] = volumes
+            all_markets["price"] = prices
+            btc_usd_price: float = all_markets.loc["BTC-USD"].price
+            eth_usd_price: float = all_markets.loc["ETH-USD"].price
+            btc_eur_price: float = all_markets.loc["BTC-EUR"].price
+            btc_gbp_price: float = all_markets.loc["BTC-GBP"].price
+            usd_volume: List[float] = []
+            for row in all_markets.itertuples():
+                product_name: str = row.Index
+                quote_volume: float = row.volume
+                quote_price: float = row.price
+                if product_name.endswith(("USD", "USDC", "USDS", "DAI", "PAX", "TUSD", "USDT")):
+                    usd_volume.append(quote_volume * quote_price)
+                elif product_name.endswith("BTC"):
+                    usd_volume.append(quote_volume * quote_price * btc_usd_price)
+                elif product_name.endswith("ETH"):
+                    usd_volume.append(quote_volume * quote_price * eth_usd_price)
+                elif product_name.endswith("EUR"):
+                    usd_volume.append(quote_volume * quote_price * (btc_usd_price / btc_eur_price))
+                elif product_name.endswith("GBP"):
+                    usd_volume.append(quote_volume * quote_price * (btc_usd_price / btc_gbp_price))
+                else:
+                    usd_volume.append(NaN)
+                    cls.logger().error(f"Unable to convert volume to USD for market - {product_name}.")
+            all_markets["USDVolume"] = usd_volume
+            return all_markets.sort_values("USDVolume", ascending=False)
 
     @property
     def order_book_class(self) -> CoinbaseProOrderBook:
@@ -140,37 +141,37 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
-            trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, OrderBookTrackerEntry] = {}
+        client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+        trading_pairs: List[str] = await self.get_trading_pairs()
+        retval: Dict[str, OrderBookTrackerEntry] = {}
 
-            number_of_pairs: int = len(trading_pairs)
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
-                    snapshot_timestamp: float = time.time()
-                    snapshot_msg: OrderBookMessage = self.order_book_class.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        metadata={"symbol": trading_pair}
-                    )
-                    order_book: CoinbaseProOrderBook = CoinbaseProOrderBook()
-                    active_order_tracker: CoinbaseProActiveOrderTracker = CoinbaseProActiveOrderTracker()
-                    bids, asks = active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
-                    order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
+        number_of_pairs: int = len(trading_pairs)
+        for index, trading_pair in enumerate(trading_pairs):
+            try:
+                snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
+                snapshot_timestamp: float = time.time()
+                snapshot_msg: OrderBookMessage = self.order_book_class.snapshot_message_from_exchange(
+                    snapshot,
+                    snapshot_timestamp,
+                    metadata={"symbol": trading_pair}
+                )
+                order_book: CoinbaseProOrderBook = CoinbaseProOrderBook()
+                active_order_tracker: CoinbaseProActiveOrderTracker = CoinbaseProActiveOrderTracker()
+                bids, asks = active_order_tracker.convert_snapshot_message_to_np_arrays(snapshot_msg)
+                order_book.apply_numpy_snapshot(bids[:, 1:], asks[:, 1:], snapshot_msg.update_id)
 
-                    retval[trading_pair] = CoinbaseProOrderBookTrackerEntry(
-                        trading_pair,
-                        snapshot_timestamp,
-                        order_book,
-                        active_order_tracker
-                    )
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index+1}/{number_of_pairs} completed.")
-                    await asyncio.sleep(0.6)
-                except Exception:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
-            return retval
+                retval[trading_pair] = CoinbaseProOrderBookTrackerEntry(
+                    trading_pair,
+                    snapshot_timestamp,
+                    order_book,
+                    active_order_tracker
+                )
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index+1}/{number_of_pairs} completed.")
+                await asyncio.sleep(0.6)
+            except Exception:
+                self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
+        return retval
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
@@ -235,29 +236,29 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
-                    for trading_pair in trading_pairs:
-                        try:
-                            snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
-                            snapshot_timestamp: float = time.time()
-                            snapshot_msg: OrderBookMessage = self.order_book_class.snapshot_message_from_exchange(
-                                snapshot,
-                                snapshot_timestamp,
-                                metadata={"product_id": trading_pair}
-                            )
-                            output.put_nowait(snapshot_msg)
-                            self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-                            # Be careful not to go above Binance's API rate limits.
-                            await asyncio.sleep(5.0)
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception:
-                            self.logger().error("Unexpected error.", exc_info=True)
-                            await asyncio.sleep(5.0)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
+                client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+                for trading_pair in trading_pairs:
+                    try:
+                        snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
+                        snapshot_timestamp: float = time.time()
+                        snapshot_msg: OrderBookMessage = self.order_book_class.snapshot_message_from_exchange(
+                            snapshot,
+                            snapshot_timestamp,
+                            metadata={"product_id": trading_pair}
+                        )
+                        output.put_nowait(snapshot_msg)
+                        self.logger().debug(f"Saved order book snapshot for {trading_pair}")
+                        # Be careful not to go above Binance's API rate limits.
+                        await asyncio.sleep(5.0)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception:
+                        self.logger().error("Unexpected error.", exc_info=True)
+                        await asyncio.sleep(5.0)
+                this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
+                next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
+                delta: float = next_hour.timestamp() - time.time()
+                await asyncio.sleep(delta)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -26,7 +26,6 @@ cdef class CoinbaseProMarket(MarketBase):
         public object _user_stream_tracker_task
         public object _user_stream_event_listener_task
         public object _trading_rules_polling_task
-        public object _shared_client
 
     cdef c_start_tracking_order(self, str order_id, str exchange_order_id, str symbol, bint is_buy, object order_type,
                                 object amount, object price)
@@ -18,6 +18,7 @@ from libc.stdint cimport int64_t
 
 from hummingbot.core.clock cimport Clock
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_manager import HttpClientManager
 from hummingbot.core.event.events import (
     TradeType,
     TradeFee,
@@ -246,12 +247,14 @@ cdef class CoinbaseProMarket(MarketBase):
                  order_book_tracker_data_source_type: OrderBookTrackerDataSourceType =
                     OrderBookTrackerDataSourceType.EXCHANGE_API,
                  symbols: Optional[List[str]] = None,
-                 trading_required: bool = True):
+                 trading_required: bool = True,
+                 use_order_book_depth_index: bool = False):
         super().__init__()
         self._trading_required = trading_required
         self._coinbase_auth = CoinbaseProAuth(coinbase_pro_api_key, coinbase_pro_secret_key, coinbase_pro_passphrase)
         self._order_book_tracker = CoinbaseProOrderBookTracker(data_source_type=order_book_tracker_data_source_type,
-                                                               symbols=symbols)
+                                                               symbols=symbols,
+                                                               use_depth_index=use_order_book_depth_index)
         self._user_stream_tracker = CoinbaseProUserStreamTracker(coinbase_pro_auth=self._coinbase_auth,
                                                                  symbols=symbols)
         self._account_balances = {}
@@ -271,7 +274,6 @@ cdef class CoinbaseProMarket(MarketBase):
         self._user_stream_tracker_task = None
         self._user_stream_event_listener_task = None
         self._trading_rules_polling_task = None
-        self._shared_client = None
 
     @property
     def name(self) -> str:
@@ -354,9 +356,7 @@ cdef class CoinbaseProMarket(MarketBase):
         self._last_timestamp = timestamp
 
     async def _http_client(self) -> aiohttp.ClientSession:
-        if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
-        return self._shared_client
+        return HttpClientManager.shared_instance().client()
 
     async def _api_request(self,
                            http_method: str,
@@ -8,15 +8,25 @@ from decimal import Decimal
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.l3_order_store cimport (
+    L3OrderStore,
+    L3_NO_SIDE,
+    L3_BID,
+    L3_ASK,
+    c_diff_to_np_arrays,
+    c_diff_to_order_book_rows
+)
 
-s_empty_diff = np.ndarray(shape=(0, 4), dtype="float64")
 _ddaot_logger = None
 
 cdef class DDEXActiveOrderTracker:
     def __init__(self, active_asks=None, active_bids=None):
         super().__init__()
-        self._active_asks = active_asks or {}
-        self._active_bids = active_bids or {}
+        self._order_store = L3OrderStore()
+        for active_orders, is_bid in [(active_asks or {}, False), (active_bids or {}, True)]:
+            for price, level_orders in active_orders.items():
+                for order_id, available_amount in level_orders.items():
+                    self._order_store.c_set_order(order_id, is_bid, float(price), float(available_amount))
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -25,213 +35,128 @@ cdef class DDEXActiveOrderTracker:
             _ddaot_logger = logging.getLogger(__name__)
         return _ddaot_logger
 
+    @property
+    def order_store(self) -> L3OrderStore:
+        return self._order_store
+
     @property
     def active_asks(self):
-        return self._active_asks
+        return self._order_store.c_get_active_orders(False)
 
     @property
     def active_bids(self):
-        return self._active_bids
+        return self._order_store.c_get_active_orders(True)
 
     def volume_for_ask_price(self, price):
-        return sum([float(msg["availableAmount"]) for msg in self._active_asks[price].values()])
+        return self._order_store.c_get_level_total(False, float(price))
 
     def volume_for_bid_price(self, price):
-        return sum([float(msg["availableAmount"]) for msg in self._active_bids[price].values()])
+        return self._order_store.c_get_level_total(True, float(price))
 
-    cdef tuple c_convert_diff_message_to_np_arrays(self, object message):
+    cdef int c_apply_diff_message(self, object message, double *price_out, double *quantity_out) except -1:
+        """
+        Applies a diff message to the tracked orders.
+
+        Returns L3_BID or L3_ASK with the updated price level written to `price_out` and `quantity_out`, or
+        L3_NO_SIDE if the message doesn't change the order book.
+        """
         # Look at the diff message type - it can be "receive" or "done".
         cdef:
-            str message_type = message.content["type"]
-            object price = Decimal(message.content["price"])
-            double timestamp = message.timestamp
-            double quantity = 0
-            str order_type = message.content["orderType"]
+            dict content = message.content
+            str message_type = content["type"]
+            double price = float(content["price"])
+            str order_type = content["orderType"]
+            str side
+            str order_id
+            bint is_bid
+            Py_ssize_t slot
+            double available_amount
 
         # Only process limit orders
         if order_type != "limit":
-            return s_empty_diff, s_empty_diff
+            return L3_NO_SIDE
+        price_out[0] = price
+
         # If it is "trade_success", it means an existing order is either completely or partially filled, and we need to
         # update or remove the order
         if message_type == "trade_success":
-            side = message.content["makerSide"]
-            order_id = message.content["makerOrderId"]
-            if side == "buy":
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    self._active_bids[price][order_id]["availableAmount"] -= float(message.content["amount"])
-                    if self._active_bids[price][order_id]["availableAmount"] == 0:
-                        del self._active_bids[price][order_id]
-
-                    if len(self._active_bids[price]) < 1:
-                        del self._active_bids[price]
-                        return (np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64"),
-                                s_empty_diff)
-                    else:
-                        quantity = self.volume_for_bid_price(price)
-                        return np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"), \
-                               s_empty_diff
-                else:
-                    self.logger().info(f"Order not found in active bids: {message.content}. {price in self._active_bids}")
-
-            elif side == "sell":
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    self._active_asks[price][order_id]["availableAmount"] -= float(message.content["amount"])
-                    if self._active_asks[price][order_id]["availableAmount"] == 0:
-                        del self._active_asks[price][order_id]
-
-                    if len(self._active_asks[price]) < 1:
-                        del self._active_asks[price]
-                        return (s_empty_diff,
-                                np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64"))
-                    else:
-                        quantity = self.volume_for_ask_price(price)
-                        return s_empty_diff, \
-                               np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                else:
-                    self.logger().info(f"Order not found in active asks: {message.content}. {price in self._active_bids}")
+            side = content["makerSide"]
+            order_id = content["makerOrderId"]
+            if side not in ["buy", "sell"]:
+                return L3_NO_SIDE
+            is_bid = side == "buy"
+            slot = self._order_store.c_get_slot(order_id)
+            if slot < 0 or self._order_store.c_is_bid(slot) != is_bid or \
+                    self._order_store.c_get_order_price(slot) != price:
+                self.logger().info(f"Order not found in active {'bids' if is_bid else 'asks'}: {content}.")
+                return L3_NO_SIDE
+            available_amount = self._order_store.c_get_order_amount(slot) - float(content["amount"])
+            if available_amount == 0:
+                quantity_out[0] = self._order_store.c_remove_order(slot)
+            else:
+                quantity_out[0] = self._order_store.c_set_order_amount(slot, available_amount)
+            return L3_BID if is_bid else L3_ASK
 
-            return s_empty_diff, s_empty_diff
         # If it is "receive", it means a new order is opened. Start tracking it and output a diff row on the respective
         # order book.
         if message_type == "receive":
-            side = message.content["side"]
-            order_id = message.content["orderId"]
-            message.content["availableAmount"] = float(message.content["availableAmount"])
-            if side == "buy":
-                if price in self._active_bids:
-                    self._active_bids[price][order_id] = message.content
-                else:
-                    self._active_bids[price] = {order_id: message.content}
-
-                quantity = self.volume_for_bid_price(price)
-                return np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"), s_empty_diff
-            elif side == "sell":
-                if price in self._active_asks:
-                    self._active_asks[price][order_id] = message.content
-                else:
-                    self._active_asks[price] = {order_id: message.content}
-
-                quantity = self.volume_for_ask_price(price)
-                return s_empty_diff, np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-            else:
+            side = content["side"]
+            order_id = content["orderId"]
+            if side not in ["buy", "sell"]:
                 raise ValueError(f"Unknown order side '{side}'. Aborting.")
+            is_bid = side == "buy"
+            quantity_out[0] = self._order_store.c_set_order(order_id, is_bid, price,
+                                                            float(content["availableAmount"]))
+            return L3_BID if is_bid else L3_ASK
 
         # If it is "done", it means an order is removed. Remove it from tracking and output a diff row on the respective
         # order book.
         elif message_type == "done":
-            side = message.content["side"]
-            order_id = message.content["orderId"]
-            message.content["availableAmount"] = float(message.content["availableAmount"])
-            if side == "buy":
-                if price in self._active_bids:
-                    if order_id in self._active_bids[price]:
-                        del self._active_bids[price][order_id]
-                    else:
-                        self.logger().info(f"Order not found in active bids: {message.content}.")
-
-                    if len(self._active_bids[price]) < 1:
-                        del self._active_bids[price]
-                        return (np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64"),
-                                s_empty_diff)
-                    else:
-                        quantity = self.volume_for_bid_price(price)
-                        return (np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                                s_empty_diff)
-                else:
-                    return s_empty_diff, s_empty_diff
-            elif side == "sell":
-                if price in self._active_asks:
-                    if order_id in self._active_asks[price]:
-                        del self._active_asks[price][order_id]
-                    else:
-                        self.logger().info(f"Order not found in active asks: {message.content}.")
-
-                    if len(self._active_asks[price]) < 1:
-                        del self._active_asks[price]
-                        return (s_empty_diff,
-                                np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64"))
-                    else:
-                        quantity = self.volume_for_ask_price(price)
-                        return (s_empty_diff,
-                                np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"))
-                else:
-                    return s_empty_diff, s_empty_diff
-            else:
+            side = content["side"]
+            order_id = content["orderId"]
+            if side not in ["buy", "sell"]:
                 raise ValueError(f"Unknown order side '{side}'. Aborting.")
+            is_bid = side == "buy"
+            if not self._order_store.c_has_level(is_bid, price):
+                return L3_NO_SIDE
+            slot = self._order_store.c_get_slot(order_id)
+            if slot >= 0 and self._order_store.c_is_bid(slot) == is_bid and \
+                    self._order_store.c_get_order_price(slot) == price:
+                quantity_out[0] = self._order_store.c_remove_order(slot)
+            else:
+                self.logger().info(f"Order not found in active {'bids' if is_bid else 'asks'}: {content}.")
+                quantity_out[0] = self._order_store.c_get_level_total(is_bid, price)
+            return L3_BID if is_bid else L3_ASK
+
         elif message_type in ["open", "change", "level3OrderbookSnapshot"]:
             # These messages are not used for tracking order book
-            return s_empty_diff, s_empty_diff
+            return L3_NO_SIDE
         else:
             raise ValueError(f"Unknown message type '{message_type}'. Must be 'trade_success', 'receive', 'change', "
                              f"'level3OrderbookSnapshot' or 'done'.")
 
-    cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message):
+    cdef tuple c_convert_diff_message_to_np_arrays(self, object message):
         cdef:
-            object price
-            str order_id
-            str amount
-
-        # Refresh all order tracking.
-        self._active_bids.clear()
-        self._active_asks.clear()
-
-        for bid_order in message.content["bids"]:
-            price = Decimal(bid_order["price"])
-            order_id = bid_order["orderId"]
-            amount = bid_order["amount"]
-            order_dict = {
-                "availableAmount": float(amount),
-                "orderId": order_id
-            }
-
-            if price in self._active_bids:
-                self._active_bids[price][order_id] = order_dict
-            else:
-                self._active_bids[price] = {
-                    order_id: order_dict
-                }
+            double price = 0
+            double quantity = 0
+            int diff_side = self.c_apply_diff_message(message, &price, &quantity)
 
-        for ask_order in message.content["asks"]:
-            price = Decimal(ask_order["price"])
-            order_id = ask_order["orderId"]
-            amount = ask_order["amount"]
-            order_dict = {
-                "availableAmount": float(amount),
-                "orderId": order_id
-            }
+        return c_diff_to_np_arrays(diff_side, message.timestamp, price, quantity, message.update_id)
 
-            if price in self._active_asks:
-                self._active_asks[price][order_id] = order_dict
-            else:
-                self._active_asks[price] = {
-                    order_id: order_dict
-                }
-
-        # Return the sorted snapshot tables.
+    cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message):
         cdef:
-            np.ndarray[np.float64_t, ndim=2] bids = np.array(
-                [[message.timestamp,
-                  float(price),
-                  sum([float(order_dict["availableAmount"])
-                       for order_dict in self._active_bids[price].values()]),
-                  message.update_id]
-                 for price in sorted(self._active_bids.keys(), reverse=True)], dtype="float64", ndmin=2)
-            np.ndarray[np.float64_t, ndim=2] asks = np.array(
-                [[message.timestamp,
-                  float(price),
-                  sum([float(order_dict["availableAmount"])
-                       for order_dict in self._active_asks[price].values()]),
-                  message.update_id]
-                 for price in sorted(self._active_asks.keys(), reverse=True)], dtype="float64", ndmin=2)
-
-        # If there're no rows, the shape would become (1, 0) and not (0, 4).
-        # Reshape to fix that.
-        if bids.shape[1] != 4:
-            bids = bids.reshape((0, 4))
-        if asks.shape[1] != 4:
-            asks = asks.reshape((0, 4))
-
-        return bids, asks
+            list bids = message.content["bids"]
+            list asks = message.content["asks"]
+
+        return self._order_store.c_load_snapshot(
+            [order["orderId"] for order in bids],
+            [order["price"] for order in bids],
+            [order["amount"] for order in bids],
+            [order["orderId"] for order in asks],
+            [order["price"] for order in asks],
+            [order["amount"] for order in asks],
+            message.timestamp, message.update_id
+        )
 
     cdef np.ndarray[np.float64_t, ndim=1] c_convert_trade_message_to_np_array(self, object message):
         cdef:
@@ -244,13 +169,23 @@ cdef class DDEXActiveOrderTracker:
                         dtype="float64")
 
     def convert_diff_message_to_order_book_row(self, message):
-        np_bids, np_asks = self.c_convert_diff_message_to_np_arrays(message)
-        bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
-        asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
-        return bids_row, asks_row
+        cdef:
+            double price = 0
+            double quantity = 0
+            int diff_side = self.c_apply_diff_message(message, &price, &quantity)
+
+        return c_diff_to_order_book_rows(diff_side, price, quantity, message.update_id)
+
+    def convert_snapshot_message_to_np_arrays(self, message):
+        """
+        Returns the (timestamp, price, quantity, update_id) level tables of a snapshot message. Columns 1 to 3 can be
+        passed straight to OrderBook.apply_numpy_snapshot().
+        """
+        return self.c_convert_snapshot_message_to_np_arrays(message)
 
     def convert_snapshot_message_to_order_book_row(self, message):
         np_bids, np_asks = self.c_convert_snapshot_message_to_np_arrays(message)
-        bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
-        asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
+        update_id = message.update_id
+        bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, _ in np_bids.tolist()]
+        asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, _ in np_asks.tolist()]
         return bids_row, asks_row
@@ -5,7 +5,6 @@ from hummingbot.core.data_type.transaction_tracker cimport TransactionTracker
 cdef class DDEXMarket(MarketBase):
     cdef:
         str _wallet_spender_address
-        object _shared_client
         object _wallet
         object _weth_token
         object _order_book_tracker
@@ -20,6 +20,7 @@ from libc.stdint cimport int64_t
 from web3 import Web3
 
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_manager import HttpClientManager
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.market.ddex.ddex_api_order_book_data_source import DDEXAPIOrderBookDataSource
 from hummingbot.core.event.events import (
@@ -230,10 +231,12 @@ cdef class DDEXMarket(MarketBase):
                     OrderBookTrackerDataSourceType.EXCHANGE_API,
                  wallet_spender_address: str = ZERO_EX_MAINNET_PROXY,
                  symbols: Optional[List[str]] = None,
-                 trading_required: bool = True):
+                 trading_required: bool = True,
+                 use_order_book_depth_index: bool = False):
         super().__init__()
         self._order_book_tracker = DDEXOrderBookTracker(data_source_type=order_book_tracker_data_source_type,
-                                                        symbols=symbols)
+                                                        symbols=symbols,
+                                                        use_depth_index=use_order_book_depth_index)
         self._trading_required = trading_required
         self._account_balances = {}
         self._ev_loop = asyncio.get_event_loop()
@@ -256,7 +259,6 @@ cdef class DDEXMarket(MarketBase):
         self._approval_tx_polling_task = None
         self._wallet = wallet
         self._wallet_spender_address = wallet_spender_address
-        self._shared_client = None
         self._maker_trade_fee = NaN
         self._taker_trade_fee = NaN
         self._gas_fee_weth = NaN
@@ -532,9 +534,7 @@ cdef class DDEXMarket(MarketBase):
         return headers
 
     async def _http_client(self) -> aiohttp.ClientSession:
-        if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
-        return self._shared_client
+        return HttpClientManager.shared_instance().client()
 
     async def _api_request(self,
                            http_method: str,
@@ -914,9 +914,6 @@ cdef class DDEXMarket(MarketBase):
 
     async def stop_network(self):
         self._stop_network()
-        if self._shared_client is not None:
-            await self._shared_client.close()
-            self._shared_client = None
 
     async def check_network(self) -> NetworkStatus:
         if self._wallet.network_status is not NetworkStatus.CONNECTED:
@@ -100,5 +100,5 @@ cdef class HuobiOrderBook(OrderBook):
     @classmethod
     def from_snapshot(cls, msg: OrderBookMessage) -> "OrderBook":
         retval = HuobiOrderBook()
-        retval.apply_snapshot(msg.bids, msg.asks, msg.update_id)
+        retval.apply_raw_snapshot(msg.content["bids"], msg.content["asks"], msg.update_id)
         return retval
@@ -34,11 +34,15 @@ cdef class MarketBase(NetworkIterator):
         MarketEvent.SellOrderCreated,
         MarketEvent.OrderExpired
     ]
+    # Number of market events kept in memory. Older events are spilled to disk, and still read by `event_logs`.
+    EVENT_LOG_CAPACITY = 10000
 
     def __init__(self):
         super().__init__()
         self.event_reporter = EventReporter(event_source=self.__class__.__name__)
-        self.event_logger = EventLogger(event_source=self.name)
+        self.event_logger = EventLogger(event_source=self.name,
+                                        capacity=self.EVENT_LOG_CAPACITY,
+                                        spill_to_disk=True)
         for event_tag in self.MARKET_EVENTS:
             self.c_add_listener(event_tag.value, self.event_reporter)
             self.c_add_listener(event_tag.value, self.event_logger)
@@ -60,7 +64,11 @@ cdef class MarketBase(NetworkIterator):
 
     @property
     def event_logs(self) -> List[any]:
-        return self.event_logger.event_log
+        """
+        All the logged market events, including the older ones spilled to disk - the strategy trade lists and
+        performance reports are built from the logged fills.
+        """
+        return self.event_logger.all_events
 
     @property
     def order_books(self) -> Dict[str, OrderBook]:
@@ -1,11 +1,12 @@
 # distutils: language=c++
 cimport numpy as np
 
+from hummingbot.core.data_type.l3_order_store cimport L3OrderStore
+
 cdef class RadarRelayActiveOrderTracker:
-    cdef dict _active_bids
-    cdef dict _active_asks
-    cdef dict _order_price_map
+    cdef L3OrderStore _order_store
 
+    cdef int c_apply_diff_message(self, object message, double *price_out, double *quantity_out) except -1
     cdef tuple c_convert_diff_message_to_np_arrays(self, object message)
     cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message)
-    cdef np.ndarray[np.float64_t, ndim=1] c_convert_trade_message_to_np_array(self, object message)
\ No newline at end of file
+    cdef np.ndarray[np.float64_t, ndim=1] c_convert_trade_message_to_np_array(self, object message)
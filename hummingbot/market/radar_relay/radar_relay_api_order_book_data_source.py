@@ -20,6 +20,7 @@ from hummingbot.market.radar_relay.radar_relay_order_book import RadarRelayOrder
 from hummingbot.market.radar_relay.radar_relay_active_order_tracker import RadarRelayActiveOrderTracker
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_manager import HttpClientManager
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry, RadarRelayOrderBookTrackerEntry
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, RadarRelayOrderBookMessage
@@ -39,7 +40,6 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
     PING_TIMEOUT = 10.0
 
     _rraobds_logger: Optional[HummingbotLogger] = None
-    _client: Optional[aiohttp.ClientSession] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -53,11 +53,9 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     def http_client(cls) -> aiohttp.ClientSession:
-        if cls._client is None:
-            if not asyncio.get_event_loop().is_running():
-                raise EnvironmentError("Event loop must be running to start HTTP client session.")
-            cls._client = aiohttp.ClientSession()
-        return cls._client
+        if not asyncio.get_event_loop().is_running():
+            raise EnvironmentError("Event loop must be running to start HTTP client session.")
+        return HttpClientManager.shared_instance().client()
 
     @classmethod
     async def get_all_token_info(cls) -> Dict[str, any]:
@@ -130,41 +128,41 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
-            trading_pairs: List[str] = await self.get_trading_pairs()
-            retval: Dict[str, OrderBookTrackerEntry] = {}
+        client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+        trading_pairs: List[str] = await self.get_trading_pairs()
+        retval: Dict[str, OrderBookTrackerEntry] = {}
 
-            number_of_pairs: int = len(trading_pairs)
-            for index, trading_pair in enumerate(trading_pairs):
-                try:
-                    snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
-                    snapshot_timestamp: float = time.time()
-                    snapshot_msg: RadarRelayOrderBookMessage = self.order_book_class.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        metadata={"symbol": trading_pair}
-                    )
-
-                    radar_relay_order_book: RadarRelayOrderBook = RadarRelayOrderBook()
-                    radar_relay_active_order_tracker: RadarRelayActiveOrderTracker = RadarRelayActiveOrderTracker()
-                    bids, asks = radar_relay_active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
-                    radar_relay_order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
-
-                    retval[trading_pair] = RadarRelayOrderBookTrackerEntry(
-                        trading_pair,
-                        snapshot_timestamp,
-                        radar_relay_order_book,
-                        radar_relay_active_order_tracker
-                    )
-                    self.logger().info(f"Initialized order book for {trading_pair}. "
-                                       f"{index+1}/{number_of_pairs} completed.")
-
-                    await asyncio.sleep(0.9)
-
-                except Exception:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
-                    await asyncio.sleep(5.0)
-            return retval
+        number_of_pairs: int = len(trading_pairs)
+        for index, trading_pair in enumerate(trading_pairs):
+            try:
+                snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
+                snapshot_timestamp: float = time.time()
+                snapshot_msg: RadarRelayOrderBookMessage = self.order_book_class.snapshot_message_from_exchange(
+                    snapshot,
+                    snapshot_timestamp,
+                    metadata={"symbol": trading_pair}
+                )
+
+                radar_relay_order_book: RadarRelayOrderBook = RadarRelayOrderBook()
+                radar_relay_active_order_tracker: RadarRelayActiveOrderTracker = RadarRelayActiveOrderTracker()
+                bids, asks = radar_relay_active_order_tracker.convert_snapshot_message_to_np_arrays(snapshot_msg)
+                radar_relay_order_book.apply_numpy_snapshot(bids[:, 1:], asks[:, 1:], snapshot_msg.update_id)
+
+                retval[trading_pair] = RadarRelayOrderBookTrackerEntry(
+                    trading_pair,
+                    snapshot_timestamp,
+                    radar_relay_order_book,
+                    radar_relay_active_order_tracker
+                )
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index+1}/{number_of_pairs} completed.")
+
+                await asyncio.sleep(0.9)
+
+            except Exception:
+                self.logger().error(f"Error getting snapshot for {trading_pair}. ", exc_info=True)
+                await asyncio.sleep(5.0)
+        return retval
 
     async def _inner_messages(self,
                               ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
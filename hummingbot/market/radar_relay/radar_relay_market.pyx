@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 from async_timeout import timeout
 from collections import deque
@@ -18,6 +17,7 @@ from libc.stdint cimport int64_t
 from web3 import Web3
 from hummingbot.market.radar_relay.radar_relay_api_order_book_data_source import RadarRelayAPIOrderBookDataSource
 from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.http_client_manager import HttpClientManager
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.market.market_base cimport MarketBase
 from hummingbot.market.market_base import (
@@ -225,11 +225,13 @@ cdef class RadarRelayMarket(MarketBase):
                     OrderBookTrackerDataSourceType.EXCHANGE_API,
                  wallet_spender_address: str = ZERO_EX_MAINNET_ERC20_PROXY,
                  symbols: Optional[List[str]] = None,
-                 trading_required: bool = True):
+                 trading_required: bool = True,
+                 use_order_book_depth_index: bool = False):
         super().__init__()
         self._trading_required = trading_required
         self._order_book_tracker = RadarRelayOrderBookTracker(data_source_type=order_book_tracker_data_source_type,
-                                                              symbols=symbols)
+                                                              symbols=symbols,
+                                                              use_depth_index=use_order_book_depth_index)
         self._account_balances = {}
         self._ev_loop = asyncio.get_event_loop()
         self._poll_notifier = asyncio.Event()
@@ -625,28 +627,28 @@ cdef class RadarRelayMarket(MarketBase):
                            url: str,
                            data: Optional[Dict[str, Any]] = None,
                            headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as client:
-            async with client.request(http_method,
-                                      url=url,
-                                      timeout=self.API_CALL_TIMEOUT,
-                                      data=data,
-                                      headers=headers) as response:
-                try:
-                    if response.status == 201:
-                        return response
-                    elif response.status == 200:
-                        response_json = await response.json()
-                        return response_json
-                    else:
-                        raise IOError
-                except Exception:
-                    if response.status == 502:
-                        raise IOError(f"Error fetching data from {url}. "
-                                      f"HTTP status is {response.status} - Server Error: Bad Gateway.")
-                    else:
-                        response_text = await response.text()
-                        raise IOError(f"Error fetching data from {url}. "
-                                      f"HTTP status is {response.status} - {response_text}.")
+        client = HttpClientManager.shared_instance().client()
+        async with client.request(http_method,
+                                  url=url,
+                                  timeout=self.API_CALL_TIMEOUT,
+                                  data=data,
+                                  headers=headers) as response:
+            try:
+                if response.status == 201:
+                    return response
+                elif response.status == 200:
+                    response_json = await response.json()
+                    return response_json
+                else:
+                    raise IOError
+            except Exception:
+                if response.status == 502:
+                    raise IOError(f"Error fetching data from {url}. "
+                                  f"HTTP status is {response.status} - Server Error: Bad Gateway.")
+                else:
+                    response_text = await response.text()
+                    raise IOError(f"Error fetching data from {url}. "
+                                  f"HTTP status is {response.status} - {response_text}.")
 
     async def request_signed_market_orders(self, symbol: str, side: TradeType, amount: str) -> Dict[str, Any]:
         if side is TradeType.BUY:
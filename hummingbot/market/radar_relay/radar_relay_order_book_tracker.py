@@ -34,8 +34,9 @@ class RadarRelayOrderBookTracker(OrderBookTracker):
 
     def __init__(self,
                  data_source_type: OrderBookTrackerDataSourceType = OrderBookTrackerDataSourceType.EXCHANGE_API,
-                 symbols: Optional[List[str]] = None):
-        super().__init__(data_source_type=data_source_type)
+                 symbols: Optional[List[str]] = None,
+                 use_depth_index: bool = False):
+        super().__init__(data_source_type=data_source_type, use_depth_index=use_depth_index)
 
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._data_source: Optional[OrderBookTrackerDataSource] = None
@@ -99,6 +100,7 @@ class RadarRelayOrderBookTracker(OrderBookTracker):
             order_book_tracker_entry: RadarRelayOrderBookTrackerEntry = available_pairs[symbol]
             self._active_order_trackers[symbol] = order_book_tracker_entry.active_order_tracker
             self._order_books[symbol] = order_book_tracker_entry.order_book
+            self._order_books[symbol].use_depth_index = self._use_depth_index
             self._tracking_message_queues[symbol] = asyncio.Queue()
             self._tracking_tasks[symbol] = asyncio.ensure_future(self._track_single_book(symbol))
             self.logger().info("Started order book tracking for %s.", symbol)
@@ -203,13 +205,15 @@ class RadarRelayOrderBookTracker(OrderBookTracker):
                     # only replay diffs later than snapshot, first update active order with snapshot then replay diffs
                     replay_position = bisect.bisect_right(past_diffs, message)
                     replay_diffs = past_diffs[replay_position:]
-                    s_bids, s_asks = active_order_tracker.convert_snapshot_message_to_order_book_row(message)
-                    order_book.apply_snapshot(s_bids, s_asks, message.update_id)
+                    s_bids, s_asks = active_order_tracker.convert_snapshot_message_to_np_arrays(message)
+                    order_book.apply_numpy_snapshot(s_bids[:, 1:], s_asks[:, 1:], message.update_id)
                     for diff_message in replay_diffs:
                         d_bids, d_asks = active_order_tracker.convert_diff_message_to_order_book_row(diff_message)
                         order_book.apply_diffs(d_bids, d_asks, diff_message.update_id)
 
                     self.logger().debug("Processed order book snapshot for %s.", symbol)
+
+                self._did_change_order_book(symbol, order_book)
             except asyncio.CancelledError:
                 raise
             except Exception:
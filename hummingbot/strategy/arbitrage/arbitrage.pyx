@@ -248,6 +248,25 @@ cdef class ArbitrageStrategy(StrategyBase):
         finally:
             self._last_timestamp = timestamp
 
+    cdef list c_get_order_book_keys(self):
+        cdef:
+            list order_book_keys = []
+        for market_pair in self._market_pairs:
+            order_book_keys.extend([(market_pair.market_1, market_pair.market_1_trading_pair),
+                                    (market_pair.market_2, market_pair.market_2_trading_pair)])
+        return order_book_keys
+
+    cdef c_did_change_order_books(self, set changed_order_books):
+        if not self._all_markets_ready:
+            return
+        if not all([market.network_status is NetworkStatus.CONNECTED for market in self._markets]):
+            return
+
+        for market_pair in self._market_pairs:
+            if ((market_pair.market_1, market_pair.market_1_trading_pair) in changed_order_books or
+                    (market_pair.market_2, market_pair.market_2_trading_pair) in changed_order_books):
+                self.c_process_market_pair(market_pair)
+
     cdef c_did_complete_buy_order(self, object buy_order_completed_event):
         cdef:
             str order_id = buy_order_completed_event.order_id
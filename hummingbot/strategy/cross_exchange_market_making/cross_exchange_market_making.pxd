@@ -52,6 +52,7 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                                      object order_type = *, double price = *, double expiration_seconds = *)
     cdef c_cancel_order(self, object market_pair, str order_id)
     cdef c_process_market_pair(self, object market_pair, list active_ddex_orders)
+    cdef c_process_market_pairs(self, list market_pairs)
     cdef c_did_fill_order(self, object order_filled_event)
     cdef c_did_fail_order(self, object order_failed_event)
     cdef c_did_cancel_order(self, object cancelled_event)
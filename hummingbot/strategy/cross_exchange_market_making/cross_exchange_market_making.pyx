@@ -389,7 +389,6 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
             int64_t last_tick = <int64_t>(self._last_timestamp // self._status_report_interval)
             bint should_report_warnings = ((current_tick > last_tick) and
                                            (self._logging_options & self.OPTION_LOG_STATUS_REPORT))
-            list active_maker_orders = self.active_maker_orders
 
         try:
             if not self._all_markets_ready:
@@ -408,26 +407,51 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                     self.logger().warning(f"WARNING: Some markets are not connected or are down at the moment. Market "
                                           f"making may be dangerous when markets or networks are unstable.")
 
-            market_pair_to_active_orders = defaultdict(list)
+            self.c_process_market_pairs(list(self._market_pairs.values()))
+            self.c_check_and_cleanup_shadow_records()
+        finally:
+            self._last_timestamp = timestamp
 
-            for maker_market, limit_order in active_maker_orders:
-                market_pair = self._market_pairs.get((maker_market, limit_order.symbol))
-                if market_pair is None:
-                    self.log_with_clock(logging.WARNING,
-                                        f"The in-flight maker order in for the symbol '{limit_order.symbol}' "
-                                        f"does not correspond to any whitelisted market pairs. Skipping.")
-                    continue
+    cdef c_process_market_pairs(self, list market_pairs):
+        cdef:
+            list active_maker_orders = self.active_maker_orders
+            object market_pair_to_active_orders = defaultdict(list)
+
+        for maker_market, limit_order in active_maker_orders:
+            market_pair = self._market_pairs.get((maker_market, limit_order.symbol))
+            if market_pair is None:
+                self.log_with_clock(logging.WARNING,
+                                    f"The in-flight maker order in for the symbol '{limit_order.symbol}' "
+                                    f"does not correspond to any whitelisted market pairs. Skipping.")
+                continue
 
-                if (self._in_flight_cancels.get(limit_order.client_order_id, 0) <
-                        self._current_timestamp - self.CANCEL_EXPIRY_DURATION):
-                    market_pair_to_active_orders[market_pair].append(limit_order)
+            if (self._in_flight_cancels.get(limit_order.client_order_id, 0) <
+                    self._current_timestamp - self.CANCEL_EXPIRY_DURATION):
+                market_pair_to_active_orders[market_pair].append(limit_order)
 
-            for market_pair in self._market_pairs.values():
-                self.c_process_market_pair(market_pair, market_pair_to_active_orders[market_pair])
+        for market_pair in market_pairs:
+            self.c_process_market_pair(market_pair, market_pair_to_active_orders[market_pair])
 
-            self.c_check_and_cleanup_shadow_records()
-        finally:
-            self._last_timestamp = timestamp
+    cdef list c_get_order_book_keys(self):
+        cdef:
+            list order_book_keys = []
+        for market_pair in self._market_pairs.values():
+            order_book_keys.extend([(market_pair.maker_market, market_pair.maker_symbol),
+                                    (market_pair.taker_market, market_pair.taker_symbol)])
+        return order_book_keys
+
+    cdef c_did_change_order_books(self, set changed_order_books):
+        """
+        Re-evaluates the maker orders of the market pairs whose maker or taker order book has changed, without waiting
+        for the next clock tick.
+        """
+        if not self._all_markets_ready:
+            return
+
+        self.c_process_market_pairs([market_pair
+                                     for market_pair in self._market_pairs.values()
+                                     if (market_pair.maker_market, market_pair.maker_symbol) in changed_order_books or
+                                     (market_pair.taker_market, market_pair.taker_symbol) in changed_order_books])
 
     cdef c_process_market_pair(self, object market_pair, list active_orders):
         cdef:
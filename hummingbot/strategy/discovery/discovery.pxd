@@ -23,8 +23,17 @@ cdef class DiscoveryStrategy(StrategyBase):
         dict _equivalent_token_dict
         str _discovery_method
         list _fetch_market_info_task_list
+        dict _trading_pairs
+        dict _order_book_signatures
+        set _changed_order_books
+        dict _market_stats
+        dict _arbitrage_stats
 
     cdef c_process_market_pair(self, object market_pair)
+    cdef list c_get_trading_pairs(self, object market)
+    cdef c_update_changed_order_books(self)
+    cdef c_update_market_stats(self)
+    cdef c_update_arbitrage_stats(self, object market_pair)
     cdef c_tick(self, double timestamp)
     cdef c_calculate_arbitrage_discovery(self, object market_pair, set matching_pairs,
                                          double target_amount, double target_profitability)
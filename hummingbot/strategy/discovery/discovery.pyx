@@ -4,6 +4,7 @@ import logging
 
 import pandas as pd
 from typing import (
+    Dict,
     List
 )
 
@@ -61,6 +62,11 @@ cdef class DiscoveryStrategy(StrategyBase):
         self._target_symbols = target_symbols
         self._equivalent_token_dict = self.parse_equivalent_token(self._equivalent_token)
         self._fetch_market_info_task_list = None
+        self._trading_pairs = {}
+        self._order_book_signatures = {}
+        self._changed_order_books = set()
+        self._market_stats = {}
+        self._arbitrage_stats = {}
 
         cdef:
             MarketBase typed_market
@@ -119,6 +125,8 @@ cdef class DiscoveryStrategy(StrategyBase):
                     self._market_info[market]["base_quote_to_symbol"][(b, q)] = (trading_symbol, b, q)
 
             self._matching_pairs = self.get_matching_pair(market_pair)
+            # Make sure the new trading pairs are recomputed on the next tick.
+            self._order_book_signatures.clear()
 
         except Exception as e:
             self.logger().network(f"Could not fetch market info for {market_pair}", exc_info=True,
@@ -164,6 +172,9 @@ cdef class DiscoveryStrategy(StrategyBase):
             if not self._all_markets_ready:
                 # Markets not ready yet. Don't do anything.
                 return
+
+        self.c_update_changed_order_books()
+        self.c_update_market_stats()
         for market_pair in self._market_pairs:
             try:
                 self.c_process_market_pair(market_pair)
@@ -294,6 +305,10 @@ cdef class DiscoveryStrategy(StrategyBase):
                                                                              )
             arbitrage_discovery.update(discovery_dict)
 
+        return self.arbitrage_discovery_data_frame(arbitrage_discovery)
+
+    @staticmethod
+    def arbitrage_discovery_data_frame(arbitrage_discovery: dict) -> pd.DataFrame:
         arbitrage_discovery_df = pd.DataFrame(
             data=[(names[0], names[1], names[2], names[3], stats[0] * stats[1], stats[2])
                   for names, stats in arbitrage_discovery.items()],
@@ -330,6 +345,10 @@ cdef class DiscoveryStrategy(StrategyBase):
                 except Exception:
                     self.logger().debug(f"Error calculating market stats: {exchange_name}, {symbol}.", exc_info=True)
 
+        return self.market_stats_data_frame(market_stats)
+
+    @staticmethod
+    def market_stats_data_frame(market_stats: dict) -> pd.DataFrame:
         market_stats_discovery_df = pd.DataFrame(
             data=[(name[0], stats[0], stats[1], stats[2], stats[3], stats[4]) for name, stats in market_stats.items()],
             columns=["market", "base", "quote", "mid_price", "spread (%)", "usd_volume"]
@@ -337,22 +356,137 @@ cdef class DiscoveryStrategy(StrategyBase):
 
         return market_stats_discovery_df.sort_values(["usd_volume", "spread (%)"], ascending=False)
 
+    cdef list c_get_trading_pairs(self, object market):
+        """
+        Returns the (symbol, base, quote, usd volume) rows of a market, which are only read out of the market info
+        data frame again after the market info has been refetched.
+        """
+        cdef:
+            object markets = self._market_info[market]["markets"]
+            tuple cached_entry = self._trading_pairs.get(market)
+        if cached_entry is None or cached_entry[0] is not markets:
+            cached_entry = (markets, list(zip(markets.index, markets.baseAsset, markets.quoteAsset, markets.USDVolume)))
+            self._trading_pairs[market] = cached_entry
+        return cached_entry[1]
+
+    cdef c_update_changed_order_books(self):
+        """
+        Finds the order books that have changed since the last tick, by comparing their versions against the ones
+        seen on the last tick. The version counts every diff and snapshot applied, so changes deeper in the book are
+        found as well.
+        """
+        cdef:
+            dict signatures = {}
+            set changed_order_books = set()
+            OrderBook order_book
+            tuple signature
+        for market in self._market_info:
+            for symbol, base_asset, quote_asset, usd_volume in self.c_get_trading_pairs(market):
+                try:
+                    order_book = market.get_order_book(symbol)
+                except Exception:
+                    self.logger().debug(f"Error getting order book: {market.name}, {symbol}.", exc_info=True)
+                    continue
+                # The order book itself is part of the signature, in case the market has replaced it.
+                signature = (order_book, order_book._version)
+                signatures[(market, symbol)] = signature
+                if self._order_book_signatures.get((market, symbol)) != signature:
+                    changed_order_books.add((market, symbol))
+        self._order_book_signatures = signatures
+        self._changed_order_books = changed_order_books
+
+    cdef c_update_market_stats(self):
+        cdef:
+            dict market_stats = {}
+            OrderBook order_book
+            double ask
+            double bid
+            str exchange_name
+            tuple key
+        for market in self._market_info:
+            exchange_name = market.name
+            for symbol, base_asset, quote_asset, usd_volume in self.c_get_trading_pairs(market):
+                key = (exchange_name, symbol)
+                if (market, symbol) not in self._changed_order_books:
+                    if key in self._market_stats:
+                        market_stats[key] = self._market_stats[key]
+                    continue
+                try:
+                    order_book = market.get_order_book(symbol)
+                    ask, bid = order_book.c_get_price(True), order_book.c_get_price(False)
+                    market_stats[key] = (base_asset, quote_asset, (ask + bid) / 2, (ask / bid - 1) * 100,
+                                         float(usd_volume))
+                except Exception:
+                    self.logger().debug(f"Error calculating market stats: {exchange_name}, {symbol}.", exc_info=True)
+        # Trading pairs that are no longer in the market info are dropped here as well.
+        self._market_stats = market_stats
+        self._discovery_stats["market_stats"] = market_stats
+
+    cdef c_update_arbitrage_stats(self, object market_pair):
+        """
+        Recomputes the arbitrage profitability of the matching pairs whose order books, or quote token conversion
+        rates, have changed since the last tick.
+        """
+        cdef:
+            dict arbitrage_stats = {}
+            tuple key
+            tuple conversion_rates
+            tuple cached_entry
+            set changed_order_books = self._changed_order_books
+        exchange_rate_conversion = ExchangeRateConversion.get_instance()
+        for matching_pair in self._matching_pairs:
+            key = (market_pair, matching_pair)
+            conversion_rates = (exchange_rate_conversion.adjust_token_rate(matching_pair[0][2], 1.0),
+                                exchange_rate_conversion.adjust_token_rate(matching_pair[1][2], 1.0))
+            cached_entry = self._arbitrage_stats.get(key)
+            if (cached_entry is None or
+                    cached_entry[0] != conversion_rates or
+                    (market_pair.market_1, matching_pair[0][0]) in changed_order_books or
+                    (market_pair.market_2, matching_pair[1][0]) in changed_order_books):
+                cached_entry = (conversion_rates,
+                                self.c_calculate_single_arbitrage_profitability(market_pair,
+                                                                                matching_pair,
+                                                                                self._target_amount,
+                                                                                self._target_profitability))
+            arbitrage_stats[key] = cached_entry
+
+        # Keep the results of the other market pairs, and drop the matching pairs that no longer exist.
+        for key, cached_entry in self._arbitrage_stats.items():
+            if key[0] is not market_pair:
+                arbitrage_stats[key] = cached_entry
+        self._arbitrage_stats = arbitrage_stats
+        self._discovery_stats["arbitrage"] = arbitrage_stats
+
     cdef c_process_market_pair(self, object market_pair):
-        self._discovery_stats["market_stats"] = self.c_calculate_market_stats(market_pair, self._market_info)
         if self._discovery_method == "arbitrage":
-            self._discovery_stats["arbitrage"] = self.c_calculate_arbitrage_discovery(market_pair,
-                                                                                      self._matching_pairs,
-                                                                                      self._target_amount,
-                                                                                      self._target_profitability)
+            self.c_update_arbitrage_stats(market_pair)
+
+    @property
+    def discovery_stats(self) -> Dict[str, Dict]:
+        """
+        The latest "market_stats" and "arbitrage" results, which are only recomputed for the order books that changed.
+        """
+        return self._discovery_stats
+
+    def get_market_stats_df(self) -> pd.DataFrame:
+        return self.market_stats_data_frame(self._market_stats)
+
+    def get_arbitrage_discovery_df(self) -> pd.DataFrame:
+        cdef:
+            dict arbitrage_discovery = {}
+        for conversion_rates, discovery_dict in self._arbitrage_stats.values():
+            arbitrage_discovery.update(discovery_dict)
+        return self.arbitrage_discovery_data_frame(arbitrage_discovery)
 
     def format_status_arbitrage(self):
         cdef:
             list lines = []
             list df_lines = []
-        if "arbitrage" not in self._discovery_stats or self._discovery_stats["arbitrage"].empty:
+        arbitrage_discovery_df = self.get_arbitrage_discovery_df()
+        if arbitrage_discovery_df.empty:
             lines.extend(["", "Arbitrage discovery not ready yet."])
             return lines
-        df_lines = self._discovery_stats["arbitrage"].to_string(index=False, float_format='%.6g').split("\n")
+        df_lines = arbitrage_discovery_df.to_string(index=False, float_format='%.6g').split("\n")
 
         lines.extend(["", "  Arbitrage Opportunity Report:"] +
                      ["    " + line for line in df_lines])
@@ -362,10 +496,11 @@ cdef class DiscoveryStrategy(StrategyBase):
         cdef:
             list lines = []
             list df_lines = []
-        if "market_stats" not in self._discovery_stats or self._discovery_stats["market_stats"].empty:
+        market_stats_df = self.get_market_stats_df()
+        if market_stats_df.empty:
             lines.extend(["", "Market stats not ready yet."])
             return lines
-        df_lines = self._discovery_stats["market_stats"].to_string(index=False, float_format='%.6g').split("\n")
+        df_lines = market_stats_df.to_string(index=False, float_format='%.6g').split("\n")
 
         lines.extend(["", "  Market Stats:"] +
                      ["    " + line for line in df_lines])
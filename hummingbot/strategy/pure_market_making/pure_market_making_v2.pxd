@@ -56,3 +56,4 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
     cdef c_start_tracking_order(self, object market_info, str order_id, bint is_buy, object price, object quantity)
     cdef c_stop_tracking_order(self, object market_info, str order_id)
     cdef c_execute_orders_proposal(self, object market_info, object orders_proposal)
+    cdef c_process_market_infos(self, list market_infos)
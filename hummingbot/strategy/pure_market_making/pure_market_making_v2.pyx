@@ -449,26 +449,40 @@ cdef class PureMarketMakingStrategyV2(StrategyBase):
                     self.logger().warning(f"WARNING: Some markets are not connected or are down at the moment. Market "
                                           f"making may be dangerous when markets or networks are unstable.")
 
-            market_info_to_active_orders = self.market_info_to_active_orders
-
-            for market_info in self._market_infos.values():
-                self._delegate_lock = True
-                orders_proposal = None
-                try:
-                    orders_proposal = self.c_get_orders_proposal_for_market_info(
-                        market_info,
-                        market_info_to_active_orders[market_info]
-                    )
-                except Exception:
-                    self.logger().error("Unknown error while generating order proposals.", exc_info=True)
-                finally:
-                    self._delegate_lock = False
-                self.c_execute_orders_proposal(market_info, orders_proposal)
-
+            self.c_process_market_infos(list(self._market_infos.values()))
             self.c_check_and_cleanup_shadow_records()
         finally:
             self._last_timestamp = timestamp
 
+    cdef c_process_market_infos(self, list market_infos):
+        cdef:
+            dict market_info_to_active_orders = self.market_info_to_active_orders
+
+        for market_info in market_infos:
+            self._delegate_lock = True
+            orders_proposal = None
+            try:
+                orders_proposal = self.c_get_orders_proposal_for_market_info(
+                    market_info,
+                    market_info_to_active_orders[market_info]
+                )
+            except Exception:
+                self.logger().error("Unknown error while generating order proposals.", exc_info=True)
+            finally:
+                self._delegate_lock = False
+            self.c_execute_orders_proposal(market_info, orders_proposal)
+
+    cdef list c_get_order_book_keys(self):
+        return list(self._market_infos.keys())
+
+    cdef c_did_change_order_books(self, set changed_order_books):
+        if not self._all_markets_ready:
+            return
+
+        self.c_process_market_infos([market_info
+                                     for order_book_key, market_info in self._market_infos.items()
+                                     if order_book_key in changed_order_books])
+
     cdef object c_get_orders_proposal_for_market_info(self, object market_info, list active_orders):
         cdef:
             double last_trade_price
@@ -1,4 +1,9 @@
 from hummingbot.core.time_iterator cimport TimeIterator
 
 cdef class StrategyBase(TimeIterator):
-    pass
\ No newline at end of file
+    cdef:
+        object _order_book_change_trigger
+
+    cdef list c_get_order_book_keys(self)
+    cdef c_watch_order_books(self)
+    cdef c_did_change_order_books(self, set changed_order_books)
@@ -1,8 +1,16 @@
+import time
 from typing import (
-    List)
+    List,
+    Set
+)
 
+from hummingbot.core.clock_mode import ClockMode
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversion
+from hummingbot.core.utils.order_book_change_trigger import (
+    OrderBookChangeTrigger,
+    DEFAULT_DEBOUNCE_INTERVAL
+)
 from hummingbot.strategy.market_symbol_pair import MarketSymbolPair
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.market.market_base cimport MarketBase
@@ -26,6 +34,63 @@ cdef class StrategyBase(TimeIterator):
     def stop(self):
         pass
 
+    @property
+    def reactive_mode(self) -> bool:
+        return self._order_book_change_trigger is not None
+
+    def enable_reactive_mode(self, debounce_interval: float = DEFAULT_DEBOUNCE_INTERVAL):
+        """
+        Makes the strategy process its market pairs as soon as one of their order books changes, rather than only on
+        the next clock tick. Order book changes are debounced by `debounce_interval` seconds. The clock tick keeps
+        running as a heartbeat.
+        """
+        self.disable_reactive_mode()
+        self._order_book_change_trigger = OrderBookChangeTrigger(self._did_change_order_books, debounce_interval)
+
+    def disable_reactive_mode(self):
+        if self._order_book_change_trigger is not None:
+            self._order_book_change_trigger.stop()
+            self._order_book_change_trigger = None
+
+    def _did_change_order_books(self, changed_order_books: Set):
+        # Nothing should be done outside of a running clock.
+        if self._clock is None:
+            return
+        # Order book changes come in between clock ticks, so the strategy's time is moved up to the current time first
+        # - order expiry and cancel age checks would use the time of the last tick otherwise. It never moves backwards,
+        # and the next tick is always later.
+        if self._clock.clock_mode is ClockMode.REALTIME:
+            self._current_timestamp = max(self._current_timestamp, time.time())
+        self.c_did_change_order_books(changed_order_books)
+
+    cdef c_tick(self, double timestamp):
+        TimeIterator.c_tick(self, timestamp)
+        self.c_watch_order_books()
+
+    cdef list c_get_order_book_keys(self):
+        """
+        Returns the (market, symbol) pairs of the order books that the strategy reacts to in reactive mode.
+        """
+        return []
+
+    cdef c_watch_order_books(self):
+        cdef:
+            MarketBase market
+        if self._order_book_change_trigger is None:
+            return
+        for market, symbol in self.c_get_order_book_keys():
+            try:
+                self._order_book_change_trigger.watch((market, symbol), market.c_get_order_book(symbol))
+            except Exception:
+                # The order book may not be tracked yet.
+                continue
+
+    cdef c_did_change_order_books(self, set changed_order_books):
+        """
+        Called in reactive mode, with the (market, symbol) pairs of the order books that have changed.
+        """
+        pass
+
     @property
     def trades(self) -> List[Trade]:
         def event_to_trade(order_filled_event: OrderFilledEvent, market_name: str):
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+
+import asyncio
+from cachetools import LRUCache
+from hexbytes import HexBytes
+import logging
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional
+)
+from web3 import Web3
+from web3.datastructures import AttributeDict
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.wallet.ethereum.json_rpc_batch import JsonRpcBatch
+
+DEFAULT_MAX_BLOCKS = 1024
+DEFAULT_MAX_RECEIPTS = 4096
+
+
+class BlockCache:
+    """
+    LRU cache of block headers and transaction receipts, shared by the watchers of a `NewBlocksWatcher`.
+
+    Lookups of uncached blocks or receipts are coalesced. Concurrent lookups of the same hash wait for the same RPC
+    call, and all the misses of a lookup are fetched together in one JSON-RPC batch request.
+
+    Blocks and receipts that the node does not know about yet are not cached, so they can be looked up again later.
+    """
+    _bc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._bc_logger is None:
+            cls._bc_logger = logging.getLogger(__name__)
+        return cls._bc_logger
+
+    def __init__(self, w3: Web3, max_blocks: int = DEFAULT_MAX_BLOCKS, max_receipts: int = DEFAULT_MAX_RECEIPTS):
+        self._w3: Web3 = w3
+        self._blocks: LRUCache = LRUCache(maxsize=max_blocks)
+        self._receipts: LRUCache = LRUCache(maxsize=max_receipts)
+        self._pending_blocks: Dict[HexBytes, asyncio.Future] = {}
+        self._pending_receipts: Dict[HexBytes, asyncio.Future] = {}
+        self._rpc_call_count: int = 0
+
+    @property
+    def rpc_call_count(self) -> int:
+        """
+        Number of block and receipt RPC calls made by the cache so far.
+        """
+        return self._rpc_call_count
+
+    @staticmethod
+    def block_header(block: AttributeDict) -> AttributeDict:
+        """
+        Returns the block with only the hashes of its transactions, so that cached blocks stay small.
+        """
+        transactions: List[Any] = block.get("transactions", [])
+        if len(transactions) > 0 and not isinstance(transactions[0], (bytes, str)):
+            return AttributeDict({**block, "transactions": [tx["hash"] for tx in transactions]})
+        return block
+
+    def add_block(self, block: AttributeDict):
+        self._blocks[HexBytes(block.hash)] = self.block_header(block)
+
+    def add_transaction_receipt(self, receipt: AttributeDict):
+        self._receipts[HexBytes(receipt.transactionHash)] = receipt
+
+    def get_cached_block(self, block_hash: HexBytes) -> Optional[AttributeDict]:
+        return self._blocks.get(HexBytes(block_hash))
+
+    async def get_block(self, block_hash: HexBytes) -> Optional[AttributeDict]:
+        return (await self.get_blocks([block_hash]))[0]
+
+    async def get_blocks(self, block_hashes: Iterable[HexBytes]) -> List[Optional[AttributeDict]]:
+        """
+        Returns the headers of the given blocks, in order. Blocks unknown to the node are returned as None.
+        """
+        return await self._get_items([HexBytes(block_hash) for block_hash in block_hashes],
+                                     self._blocks,
+                                     self._pending_blocks,
+                                     lambda batch, block_hash: batch.get_block(block_hash, full_transactions=False))
+
+    async def get_transaction_receipt(self, tx_hash: HexBytes) -> Optional[AttributeDict]:
+        return (await self.get_transaction_receipts([tx_hash]))[0]
+
+    async def get_transaction_receipts(self, tx_hashes: Iterable[HexBytes]) -> List[Optional[AttributeDict]]:
+        """
+        Returns the receipts of the given transactions, in order. Receipts of pending or unknown transactions are
+        returned as None.
+        """
+        return await self._get_items([HexBytes(tx_hash) for tx_hash in tx_hashes],
+                                     self._receipts,
+                                     self._pending_receipts,
+                                     lambda batch, tx_hash: batch.get_transaction_receipt(tx_hash))
+
+    async def _get_items(self,
+                         keys: List[HexBytes],
+                         cache: LRUCache,
+                         pending_lookups: Dict[HexBytes, asyncio.Future],
+                         add_call: Callable[[JsonRpcBatch, HexBytes], int]) -> List[Optional[AttributeDict]]:
+        results: Dict[HexBytes, Any] = {}
+        waiting_for: Dict[HexBytes, asyncio.Future] = {}
+        keys_to_fetch: List[HexBytes] = []
+
+        for key in keys:
+            if key in results or key in waiting_for:
+                continue
+            cached_item: Optional[AttributeDict] = cache.get(key)
+            if cached_item is not None:
+                results[key] = cached_item
+            elif key in pending_lookups:
+                waiting_for[key] = pending_lookups[key]
+            else:
+                waiting_for[key] = pending_lookups[key] = asyncio.get_event_loop().create_future()
+                keys_to_fetch.append(key)
+
+        if len(keys_to_fetch) > 0:
+            batch: JsonRpcBatch = JsonRpcBatch(self._w3)
+            for key in keys_to_fetch:
+                add_call(batch, key)
+            self._rpc_call_count += len(keys_to_fetch)
+            try:
+                fetched_items: List[Any] = await batch.execute(return_exceptions=True)
+            except asyncio.CancelledError:
+                for key in keys_to_fetch:
+                    pending_lookups.pop(key).cancel()
+                raise
+            except Exception as e:
+                fetched_items = [e] * len(keys_to_fetch)
+            for key, item in zip(keys_to_fetch, fetched_items):
+                future: asyncio.Future = pending_lookups.pop(key)
+                if isinstance(item, Exception):
+                    future.set_exception(item)
+                    continue
+                if item is not None:
+                    cache[key] = item
+                future.set_result(item)
+
+        if len(waiting_for) > 0:
+            waiting_keys: List[HexBytes] = list(waiting_for.keys())
+            # Lookups of other callers may be cancelled, so do not let a cancellation spread to them.
+            waited_items: List[Any] = await asyncio.gather(*[asyncio.shield(waiting_for[key])
+                                                             for key in waiting_keys],
+                                                           return_exceptions=True)
+            for item in waited_items:
+                if isinstance(item, BaseException):
+                    raise item
+            results.update(zip(waiting_keys, waited_items))
+
+        return [results[key] for key in keys]
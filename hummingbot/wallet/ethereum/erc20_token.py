@@ -16,6 +16,7 @@ from web3.contract import (
 )
 
 import hummingbot
+from hummingbot.core.utils.executor_pools import CHAIN_RPC_POOL
 from hummingbot.logger import HummingbotLogger
 from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
 
@@ -103,7 +104,7 @@ class ERC20Token:
 
         ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
         tasks: List[asyncio.Task] = [
-            ev_loop.run_in_executor(hummingbot.get_executor(), func, *args)
+            ev_loop.run_in_executor(hummingbot.get_executor(CHAIN_RPC_POOL), func, *args)
             for func, args in [
                 (self.get_name_from_contract, [self._contract]),
                 (self.get_symbol_from_contract, [self._contract]),
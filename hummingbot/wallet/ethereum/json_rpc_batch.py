@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+
+import aiohttp
+import asyncio
+from eth_abi import decode_abi
+from hexbytes import HexBytes
+import itertools
+import json
+import logging
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union
+)
+from web3 import (
+    HTTPProvider,
+    Web3
+)
+from web3.contract import ContractFunction
+from web3.datastructures import AttributeDict
+from web3.middleware.pythonic import (
+    block_formatter,
+    receipt_formatter
+)
+from web3.providers.base import BaseProvider
+from web3.utils.abi import (
+    get_abi_output_types,
+    map_abi_data
+)
+from web3.utils.contracts import prepare_transaction
+from web3.utils.normalizers import BASE_RETURN_NORMALIZERS
+
+import hummingbot
+from hummingbot.core.utils.executor_pools import CHAIN_RPC_POOL
+from hummingbot.core.utils.http_client_manager import HttpClientManager
+from hummingbot.logger import HummingbotLogger
+
+
+class JsonRpcBatch:
+    """
+    Collects Ethereum JSON-RPC calls, and sends them to the node together in one batch request - so e.g. the token
+    balances of a wallet can be refreshed with one round trip, rather than one round trip per token.
+
+    Calls are added with the `get_balance()`, `call()`, `get_transaction_receipt()` and `get_block()` methods, and
+    `execute()` returns their results in the same order, formatted like the results of the matching `Web3` methods.
+
+    Batch requests are only sent to HTTP providers. For other providers, e.g. IPC, the calls of a batch are made one by
+    one, concurrently.
+    """
+    DEFAULT_MAX_BATCH_SIZE = 100
+    REQUEST_TIMEOUT = 10.0
+
+    _jrb_logger: Optional[HummingbotLogger] = None
+    _request_ids = itertools.count(1)
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._jrb_logger is None:
+            cls._jrb_logger = logging.getLogger(__name__)
+        return cls._jrb_logger
+
+    def __init__(self, w3: Web3, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE):
+        self._w3: Web3 = w3
+        self._max_batch_size: int = max_batch_size
+        self._calls: List[Dict[str, Any]] = []
+        self._result_formatters: List[Optional[Callable[[Any], Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    @property
+    def _provider(self) -> BaseProvider:
+        return self._w3.providers[0]
+
+    @staticmethod
+    def _to_json_value(value: Any) -> Any:
+        if isinstance(value, (bytes, bytearray)):
+            return HexBytes(value).hex()
+        if isinstance(value, int) and not isinstance(value, bool):
+            return hex(value)
+        return value
+
+    def add(self, method: str, params: List[Any], result_formatter: Optional[Callable[[Any], Any]] = None) -> int:
+        """
+        Adds a raw JSON-RPC call to the batch, and returns the index of its result. `result_formatter` is applied to
+        the raw result of the call.
+        """
+        self._calls.append({
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": [self._to_json_value(param) for param in params],
+        })
+        self._result_formatters.append(result_formatter)
+        return len(self._calls) - 1
+
+    def get_balance(self, address: str, block_identifier: Union[str, int] = "latest") -> int:
+        return self.add("eth_getBalance", [address, block_identifier], lambda result: int(result, 16))
+
+    def call(self, contract_function: ContractFunction, block_identifier: Union[str, int] = "latest") -> int:
+        """
+        Adds a contract function call, e.g. `contract.functions.balanceOf(address)`, to the batch.
+        """
+        call_transaction: Dict[str, Any] = prepare_transaction(contract_function.address,
+                                                               self._w3,
+                                                               fn_identifier=contract_function.function_identifier,
+                                                               contract_abi=contract_function.contract_abi,
+                                                               fn_abi=contract_function.abi,
+                                                               transaction={},
+                                                               fn_args=contract_function.args,
+                                                               fn_kwargs=contract_function.kwargs)
+        output_types: List[str] = get_abi_output_types(contract_function.abi)
+
+        def decode_output(result: str) -> Any:
+            output_data = decode_abi(output_types, HexBytes(result))
+            normalized_data = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output_data)
+            return normalized_data[0] if len(normalized_data) == 1 else normalized_data
+
+        return self.add("eth_call", [call_transaction, block_identifier], decode_output)
+
+    def get_transaction_receipt(self, tx_hash: Union[str, bytes]) -> int:
+        return self.add("eth_getTransactionReceipt", [tx_hash], self._format_receipt)
+
+    def get_block(self, block_identifier: Union[str, bytes, int], full_transactions: bool = False) -> int:
+        if isinstance(block_identifier, int) or block_identifier in ("latest", "earliest", "pending"):
+            method: str = "eth_getBlockByNumber"
+        else:
+            method = "eth_getBlockByHash"
+        return self.add(method, [block_identifier, full_transactions], self._format_block)
+
+    @staticmethod
+    def _format_receipt(result: Optional[Dict[str, Any]]) -> Optional[AttributeDict]:
+        return AttributeDict.recursive(receipt_formatter(result)) if result is not None else None
+
+    @staticmethod
+    def _format_block(result: Optional[Dict[str, Any]]) -> Optional[AttributeDict]:
+        return AttributeDict.recursive(block_formatter(result)) if result is not None else None
+
+    async def execute(self, return_exceptions: bool = False) -> List[Any]:
+        """
+        Sends the calls added so far, and returns their results. Like `asyncio.gather()`, the first failed call raises
+        its exception, unless `return_exceptions` is set - in which case the exceptions are returned in place of the
+        results of the failed calls.
+        """
+        calls: List[Dict[str, Any]] = self._calls
+        result_formatters: List[Optional[Callable[[Any], Any]]] = self._result_formatters
+        self._calls = []
+        self._result_formatters = []
+        if len(calls) < 1:
+            return []
+
+        if isinstance(self._provider, HTTPProvider):
+            responses: List[Dict[str, Any]] = list(itertools.chain.from_iterable(await asyncio.gather(*[
+                self._send_batch(calls[i:i + self._max_batch_size])
+                for i in range(0, len(calls), self._max_batch_size)
+            ])))
+        else:
+            responses = await asyncio.gather(*[self._send_call(call) for call in calls])
+
+        results: List[Any] = []
+        for response, result_formatter in zip(responses, result_formatters):
+            if "error" in response:
+                result: Any = ValueError(response["error"])
+            else:
+                try:
+                    result = (result_formatter(response["result"])
+                              if result_formatter is not None
+                              else response["result"])
+                except Exception as e:
+                    result = e
+            if isinstance(result, Exception) and not return_exceptions:
+                raise result
+            results.append(result)
+        return results
+
+    async def _send_batch(self, calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        provider: HTTPProvider = self._provider
+        request_ids: List[int] = []
+        for call in calls:
+            call["id"] = next(self._request_ids)
+            request_ids.append(call["id"])
+
+        client: aiohttp.ClientSession = HttpClientManager.shared_instance().client()
+        async with client.post(provider.endpoint_uri,
+                               data=json.dumps(calls),
+                               headers={"Content-Type": "application/json"},
+                               timeout=self.REQUEST_TIMEOUT) as response:
+            if response.status != 200:
+                raise IOError(f"Error sending JSON-RPC batch request to {provider.endpoint_uri}. "
+                              f"HTTP status is {response.status}.")
+            batch_response: Any = await response.json(content_type=None)
+
+        if not isinstance(batch_response, list):
+            # Nodes without batch support answer with a single error response.
+            error: Any = batch_response.get("error") if isinstance(batch_response, dict) else batch_response
+            raise IOError(f"JSON-RPC batch request to {provider.endpoint_uri} failed: {error}")
+        # The responses of a batch may come in any order.
+        responses_by_id: Dict[int, Dict[str, Any]] = {r.get("id"): r for r in batch_response}
+        return [responses_by_id.get(request_id, {"error": "Missing response in JSON-RPC batch."})
+                for request_id in request_ids]
+
+    async def _send_call(self, call: Dict[str, Any]) -> Dict[str, Any]:
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        try:
+            return await ev_loop.run_in_executor(hummingbot.get_executor(CHAIN_RPC_POOL),
+                                                 self._provider.make_request,
+                                                 call["method"],
+                                                 call["params"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return {"error": str(e)}
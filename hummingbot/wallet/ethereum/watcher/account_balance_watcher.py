@@ -12,9 +12,9 @@ from web3 import Web3
 from web3.contract import Contract
 from web3.datastructures import AttributeDict
 
-import hummingbot
 from hummingbot.logger import HummingbotLogger
 from hummingbot.wallet.ethereum.erc20_token import ERC20Token
+from hummingbot.wallet.ethereum.json_rpc_batch import JsonRpcBatch
 from hummingbot.core.event.events import NewBlocksWatcherEvent
 from hummingbot.core.event.event_forwarder import EventForwarder
 from .base_watcher import BaseWatcher
@@ -106,26 +106,17 @@ class AccountBalanceWatcher(BaseWatcher):
         asyncio.ensure_future(self.update_balances())
 
     async def update_balances(self):
+        # All the balances are fetched in one JSON-RPC batch request.
+        batch: JsonRpcBatch = JsonRpcBatch(self._w3)
         asset_symbols: List[str] = []
-        asset_update_tasks: List[asyncio.Task] = []
-
         for asset_name, contract in self._erc20_contracts.items():
             asset_symbols.append(asset_name)
-            asset_update_tasks.append(
-                self._ev_loop.run_in_executor(
-                    hummingbot.get_executor(),
-                    contract.functions.balanceOf(self._account_address).call
-                )
-            )
-
+            batch.call(contract.functions.balanceOf(self._account_address))
         asset_symbols.append("ETH")
-        asset_update_tasks.append(self._ev_loop.run_in_executor(
-            hummingbot.get_executor(),
-            self._w3.eth.getBalance, self._account_address
-        ))
+        batch.get_balance(self._account_address)
 
         try:
-            asset_raw_balances: List[int] = await asyncio.gather(*asset_update_tasks)
+            asset_raw_balances: List[int] = await batch.execute()
             for asset_name, raw_balance in zip(asset_symbols, asset_raw_balances):
                 self._raw_account_balances[asset_name] = raw_balance
         except asyncio.CancelledError:
@@ -8,6 +8,7 @@ from typing import (
 from web3 import Web3
 
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.executor_pools import CHAIN_RPC_POOL
 from hummingbot.core.pubsub import PubSub
 
 
@@ -23,7 +24,7 @@ class BaseWatcher(PubSub):
 
     @staticmethod
     async def call_async(func: Callable, *args):
-        return await AsyncCallScheduler.shared_instance().call_async(func, *args)
+        return await AsyncCallScheduler.shared_instance().call_async(func, *args, executor_pool=CHAIN_RPC_POOL)
 
     async def start_network(self):
         raise NotImplementedError
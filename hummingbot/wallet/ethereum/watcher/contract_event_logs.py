@@ -16,6 +16,7 @@ from web3.utils.contracts import find_matching_event_abi
 from web3.utils.events import get_event_data
 from web3.utils.filters import construct_event_filter_params
 import hummingbot
+from hummingbot.core.utils.executor_pools import CHAIN_RPC_POOL
 from hummingbot.logger import HummingbotLogger
 
 DEFAULT_WINDOW_SIZE = 100
@@ -109,7 +110,7 @@ class ContractEventLogger:
                     )
                     break
                 logs = await ev_loop.run_in_executor(
-                    hummingbot.get_executor(),
+                    hummingbot.get_executor(CHAIN_RPC_POOL),
                     functools.partial(
                         self._w3.eth.getLogs,
                         event_filter_params))
@@ -120,10 +120,13 @@ class ERC20EventsWatcher(BaseWatcher):
                 raw_approval_entries = await asyncio.gather(*approval_tasks)
                 transfer_entries = list(cytoolz.concat(raw_transfer_entries))
                 approval_entries = list(cytoolz.concat(raw_approval_entries))
+                timestamps: Dict[HexBytes, int] = await self._blocks_watcher.get_timestamps_for_blocks(
+                    [entry["blockHash"] for entry in transfer_entries + approval_entries]
+                )
                 for transfer_entry in transfer_entries:
-                    await self._handle_event_data(transfer_entry)
+                    self._handle_event_data(transfer_entry, float(timestamps[transfer_entry["blockHash"]]))
                 for approval_entry in approval_entries:
-                    await self._handle_event_data(approval_entry)
+                    self._handle_event_data(approval_entry, float(timestamps[approval_entry["blockHash"]]))
 
             except asyncio.CancelledError:
                 raise
@@ -132,9 +135,8 @@ class ERC20EventsWatcher(BaseWatcher):
             except Exception:
                 self.logger().error("Unknown error trying to fetch new events from ERC20 contracts.", exc_info=True)
 
-    async def _handle_event_data(self, event_data: AttributeDict):
+    def _handle_event_data(self, event_data: AttributeDict, timestamp: float):
         event_type: str = event_data["event"]
-        timestamp: float = float(await self._blocks_watcher.get_timestamp_for_block(event_data["blockHash"]))
         tx_hash: str = event_data["transactionHash"].hex()
         contract_address: str = event_data["address"]
         token_asset_name: str = self._address_to_asset_name_map.get(contract_address)
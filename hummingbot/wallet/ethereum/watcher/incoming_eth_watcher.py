@@ -11,7 +11,6 @@ from typing import (
 from web3 import Web3
 from web3.datastructures import AttributeDict
 
-import hummingbot
 from hummingbot.core.event.events import (
     NewBlocksWatcherEvent,
     IncomingEthWatcherEvent,
@@ -33,17 +32,21 @@ class IncomingEthWatcher(BaseWatcher):
         self._event_forwarder: EventForwarder = EventForwarder(self.did_receive_new_blocks)
 
     async def start_network(self):
+        self._blocks_watcher.require_full_transactions(self)
         self._blocks_watcher.add_listener(NewBlocksWatcherEvent.NewBlocks, self._event_forwarder)
 
     async def stop_network(self):
         self._blocks_watcher.remove_listener(NewBlocksWatcherEvent.NewBlocks, self._event_forwarder)
+        self._blocks_watcher.release_full_transactions(self)
 
     def did_receive_new_blocks(self, new_blocks: List[AttributeDict]):
         asyncio.ensure_future(self.check_incoming_eth(new_blocks))
 
     async def check_incoming_eth(self, new_blocks: List[AttributeDict]):
         watch_addresses: Set[str] = self._watch_addresses
-        filtered_blocks: List[AttributeDict] = [block for block in new_blocks if block is not None]
+        filtered_blocks: List[AttributeDict] = await self._blocks_watcher.get_full_blocks(
+            [block for block in new_blocks if block is not None]
+        )
         block_to_timestamp: Dict[str, float] = dict((block.hash, float(block.timestamp))
                                                     for block in filtered_blocks)
         transactions: List[AttributeDict] = list(cytoolz.concat(b.transactions for b in filtered_blocks))
@@ -51,19 +54,13 @@ class IncomingEthWatcher(BaseWatcher):
                                                           if ((t.get("to") in watch_addresses) and
                                                               (t.get("value", 0) > 0))]
 
-        get_receipt_tasks: List[asyncio.Task] = [
-            self._ev_loop.run_in_executor(
-                hummingbot.get_executor(),
-                self._w3.eth.getTransactionReceipt,
-                t.hash
-            )
-            for t in incoming_eth_transactions
-        ]
-        transaction_receipts: List[AttributeDict] = await asyncio.gather(*get_receipt_tasks)
+        transaction_receipts: List[AttributeDict] = await self._blocks_watcher.block_cache.get_transaction_receipts(
+            [t.hash for t in incoming_eth_transactions]
+        )
 
         for incoming_transaction, receipt in zip(incoming_eth_transactions, transaction_receipts):
             # Filter out failed transactions.
-            if receipt.status != 1:
+            if receipt is None or receipt.status != 1:
                 continue
 
             # Emit event.
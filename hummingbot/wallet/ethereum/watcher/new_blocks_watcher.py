@@ -8,16 +8,22 @@ from hexbytes import HexBytes
 import logging
 import time
 from typing import (
+    Any,
     Dict,
+    Iterable,
     List,
-    Optional
+    Optional,
+    Set
 )
 from web3 import Web3
 from web3.datastructures import AttributeDict
 
 import hummingbot
+from hummingbot.core.utils.executor_pools import CHAIN_RPC_POOL
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import NewBlocksWatcherEvent
+from hummingbot.wallet.ethereum.block_cache import BlockCache
+from hummingbot.wallet.ethereum.json_rpc_batch import JsonRpcBatch
 from .base_watcher import BaseWatcher
 
 DEFAULT_BLOCK_WINDOW_SIZE = 30
@@ -32,23 +38,70 @@ class NewBlocksWatcher(BaseWatcher):
             cls._nbw_logger = logging.getLogger(__name__)
         return cls._nbw_logger
 
-    def __init__(self, w3: Web3, block_window_size: Optional[int] = DEFAULT_BLOCK_WINDOW_SIZE):
+    def __init__(self,
+                 w3: Web3,
+                 block_window_size: Optional[int] = DEFAULT_BLOCK_WINDOW_SIZE,
+                 light_mode: bool = True):
         super().__init__(w3)
         self._block_window_size = block_window_size
+        # In light mode, only block headers are polled - unless a subscriber has asked for full transactions.
+        self._light_mode: bool = light_mode
+        self._full_transactions_subscribers: Set[Any] = set()
         self._current_block_number: int = -1
         self._block_number_to_fetch: int = -1
         self._blocks_window: Dict = {}
         self._block_number_to_hash_map: OrderedDict = OrderedDict()
         self._fetch_new_blocks_task: Optional[asyncio.Task] = None
+        self._block_cache: BlockCache = BlockCache(w3)
 
     @property
     def web3(self) -> Web3:
         return self._w3
 
+    @property
+    def block_cache(self) -> BlockCache:
+        return self._block_cache
+
     @property
     def block_number(self) -> int:
         return self._current_block_number
 
+    @property
+    def fetch_full_transactions(self) -> bool:
+        return not self._light_mode or len(self._full_transactions_subscribers) > 0
+
+    def require_full_transactions(self, subscriber: Any):
+        """
+        Makes the new blocks events include the full transactions of each block, rather than only the transaction
+        hashes, until the subscriber calls `release_full_transactions()`.
+        """
+        self._full_transactions_subscribers.add(subscriber)
+
+    def release_full_transactions(self, subscriber: Any):
+        self._full_transactions_subscribers.discard(subscriber)
+
+    @staticmethod
+    def has_full_transactions(block: AttributeDict) -> bool:
+        transactions: List[Any] = block.get("transactions", [])
+        return len(transactions) < 1 or not isinstance(transactions[0], (bytes, str))
+
+    async def get_full_blocks(self, blocks: List[AttributeDict]) -> List[AttributeDict]:
+        """
+        Returns the given blocks with their full transactions. Blocks with only transaction hashes, e.g. blocks polled
+        before the subscriber asked for full transactions, are fetched again in one JSON-RPC batch request.
+        """
+        header_only_blocks: List[AttributeDict] = [block for block in blocks if not self.has_full_transactions(block)]
+        if len(header_only_blocks) < 1:
+            return blocks
+        batch: JsonRpcBatch = JsonRpcBatch(self._w3)
+        for block in header_only_blocks:
+            batch.get_block(block.hash, full_transactions=True)
+        full_blocks: Dict[HexBytes, AttributeDict] = dict((block.hash, block)
+                                                          for block in await batch.execute()
+                                                          if block is not None)
+        return [full_blocks.get(block.hash, block) if not self.has_full_transactions(block) else block
+                for block in blocks]
+
     async def start_network(self):
         if self._fetch_new_blocks_task is not None:
             await self.stop_network()
@@ -63,30 +116,45 @@ class NewBlocksWatcher(BaseWatcher):
             self._fetch_new_blocks_task = None
 
     async def get_timestamp_for_block(self, block_hash: HexBytes, max_tries: Optional[int] = 10) -> int:
+        timestamps: Dict[HexBytes, int] = await self.get_timestamps_for_blocks([block_hash], max_tries=max_tries)
+        return timestamps[block_hash]
+
+    async def get_timestamps_for_blocks(self,
+                                        block_hashes: Iterable[HexBytes],
+                                        max_tries: Optional[int] = 10) -> Dict[HexBytes, int]:
+        """
+        Looks up the timestamps of a number of blocks. Blocks outside of the block window are fetched from the block
+        cache together, and blocks the node does not know about yet are retried up to `max_tries` times.
+        """
+        timestamps: Dict[HexBytes, int] = {}
+        missing_block_hashes: List[HexBytes] = []
+        for block_hash in block_hashes:
+            if block_hash in timestamps or block_hash in missing_block_hashes:
+                continue
+            if block_hash in self._blocks_window:
+                timestamps[block_hash] = self._blocks_window[block_hash].timestamp
+            else:
+                missing_block_hashes.append(block_hash)
+
         counter = 0
-        block: AttributeDict = None
-        if block_hash in self._blocks_window:
-            block = self._blocks_window[block_hash]
-            return block.timestamp
-        else:
-            while block is None:
-                try:
-                    if counter == max_tries:
-                        raise ValueError(f"Block hash {block_hash.hex()} does not exist.")
-                    counter += 1
-                    async with timeout(10.0):
-                        ev_loop: asyncio.BaseEventLoop = self._ev_loop
-                        block = await ev_loop.run_in_executor(
-                            hummingbot.get_executor(),
-                            functools.partial(
-                                self._w3.eth.getBlock,
-                                block_hash,
-                                full_transactions=False))
-                except TimeoutError:
-                    self.logger().error("Timed out fetching new block - '{block_hash}'.", exc_info=True)
-                finally:
-                    await asyncio.sleep(0.5)
-            return block.timestamp
+        while len(missing_block_hashes) > 0:
+            if counter == max_tries:
+                raise ValueError(f"Block hash {missing_block_hashes[0].hex()} does not exist.")
+            counter += 1
+            try:
+                async with timeout(10.0):
+                    blocks: List[Optional[AttributeDict]] = await self._block_cache.get_blocks(missing_block_hashes)
+                for block_hash, block in zip(missing_block_hashes, blocks):
+                    if block is not None:
+                        timestamps[block_hash] = block.timestamp
+                missing_block_hashes = [block_hash for block_hash in missing_block_hashes
+                                        if block_hash not in timestamps]
+            except asyncio.TimeoutError:
+                self.logger().error(f"Timed out fetching blocks - {[h.hex() for h in missing_block_hashes]}.",
+                                    exc_info=True)
+            if len(missing_block_hashes) > 0:
+                await asyncio.sleep(0.5)
+        return timestamps
 
     async def fetch_new_blocks_loop(self):
         ev_loop: asyncio.BaseEventLoop = self._ev_loop
@@ -94,11 +162,11 @@ class NewBlocksWatcher(BaseWatcher):
             try:
                 async with timeout(30.0):
                     incoming_block: AttributeDict = await ev_loop.run_in_executor(
-                        hummingbot.get_executor(),
+                        hummingbot.get_executor(CHAIN_RPC_POOL),
                         functools.partial(
                             self._w3.eth.getBlock,
                             self._block_number_to_fetch,
-                            full_transactions=True))
+                            full_transactions=self.fetch_full_transactions))
                     if incoming_block is not None:
                         current_block_hash: HexBytes = self._block_number_to_hash_map.get(
                             self._current_block_number,
@@ -112,6 +180,7 @@ class NewBlocksWatcher(BaseWatcher):
 
                         self._block_number_to_hash_map[self._block_number_to_fetch] = incoming_block_hash
                         self._blocks_window[incoming_block_hash] = incoming_block
+                        self._block_cache.add_block(incoming_block)
                         new_blocks.append(incoming_block)
                         
                         self._current_block_number = self._block_number_to_fetch
@@ -141,11 +210,11 @@ class NewBlocksWatcher(BaseWatcher):
             replacement_block = None
             while replacement_block is None:
                 replacement_block = await ev_loop.run_in_executor(
-                    hummingbot.get_executor(),
+                    hummingbot.get_executor(CHAIN_RPC_POOL),
                     functools.partial(
                         self._w3.eth.getBlock,
                         expected_parent_hash,
-                        full_transactions=True))
+                        full_transactions=self.fetch_full_transactions))
                 if replacement_block is None:
                     await asyncio.sleep(0.5)
 
@@ -154,6 +223,7 @@ class NewBlocksWatcher(BaseWatcher):
             replacement_block_parent_hash: HexBytes = replacement_block.parentHash
             self._block_number_to_hash_map[replacement_block_number] = replacement_block_hash
             self._blocks_window[replacement_block_hash] = replacement_block
+            self._block_cache.add_block(replacement_block)
             block_reorganization.append(replacement_block)
             expected_parent_hash = replacement_block_parent_hash
         
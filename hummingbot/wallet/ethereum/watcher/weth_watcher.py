@@ -86,10 +86,13 @@ class WethWatcher(BaseWatcher):
                     WITHDRAWAL_EVENT_NAME,
                     block_hashes
                 )
+                timestamps: Dict[HexBytes, int] = await self._blocks_watcher.get_timestamps_for_blocks(
+                    [entry["blockHash"] for entry in list(deposit_entries) + list(withdrawal_entries)]
+                )
                 for deposit_entry in deposit_entries:
-                    await self._handle_event_data(deposit_entry)
+                    self._handle_event_data(deposit_entry, float(timestamps[deposit_entry["blockHash"]]))
                 for withdrawal_entry in withdrawal_entries:
-                    await self._handle_event_data(withdrawal_entry)
+                    self._handle_event_data(withdrawal_entry, float(timestamps[withdrawal_entry["blockHash"]]))
 
             except asyncio.CancelledError:
                 raise
@@ -98,9 +101,8 @@ class WethWatcher(BaseWatcher):
             except Exception:
                 self.logger().error("Unknown error trying to fetch new events from WETH contract.", exc_info=True)
     
-    async def _handle_event_data(self, event_data: AttributeDict):
+    def _handle_event_data(self, event_data: AttributeDict, timestamp: float):
         event_type: str = event_data["event"]
-        timestamp: float = float(await self._blocks_watcher.get_timestamp_for_block(event_data["blockHash"]))
         tx_hash: str = event_data["transactionHash"].hex()
         if event_type == DEPOSIT_EVENT_NAME:
             self.handle_wrapping_eth_event(timestamp, tx_hash, event_data)
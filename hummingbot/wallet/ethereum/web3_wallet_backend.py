@@ -23,6 +23,7 @@ from web3.contract import (
 from web3.datastructures import AttributeDict
 
 import hummingbot
+from hummingbot.core.utils.executor_pools import CHAIN_RPC_POOL
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
 from hummingbot.core.event.event_forwarder import EventForwarder
@@ -46,6 +47,7 @@ from hummingbot.wallet.ethereum.watcher import (
     WethWatcher,
 )
 from hummingbot.wallet.ethereum.erc20_token import ERC20Token
+from hummingbot.wallet.ethereum.json_rpc_batch import JsonRpcBatch
 from hummingbot.logger import HummingbotLogger
 
 
@@ -197,7 +199,8 @@ class Web3WalletBackend(PubSub):
 
             # Fetch blockchain data.
             self._local_nonce = await async_scheduler.call_async(
-                lambda: self._w3.eth.getTransactionCount(self.address, block_identifier="pending")
+                lambda: self._w3.eth.getTransactionCount(self.address, block_identifier="pending"),
+                executor_pool=CHAIN_RPC_POOL
             )
 
             # Create event watchers.
@@ -293,7 +296,7 @@ class Web3WalletBackend(PubSub):
 
     async def check_network(self) -> NetworkStatus:
         try:
-            await self._ev_loop.run_in_executor(hummingbot.get_executor(),
+            await self._ev_loop.run_in_executor(hummingbot.get_executor(CHAIN_RPC_POOL),
                                                 getattr,
                                                 self._w3.eth,
                                                 "blockNumber")
@@ -344,17 +347,19 @@ class Web3WalletBackend(PubSub):
         """
         Look for failed transactions, and emit transaction fail event if any are found.
         """
-        ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
-        tasks = [ev_loop.run_in_executor(hummingbot.get_executor(), self._w3.eth.getTransactionReceipt, tx_hash)
-                 for tx_hash in self._pending_tx_dict.keys()]
-        transaction_receipts: List[AttributeDict] = [tr for tr in await asyncio.gather(*tasks)
+        # The receipts of all pending transactions are fetched in one JSON-RPC batch request, and then their blocks in
+        # another.
+        batch: JsonRpcBatch = JsonRpcBatch(self._w3)
+        for tx_hash in self._pending_tx_dict.keys():
+            batch.get_transaction_receipt(tx_hash)
+        transaction_receipts: List[AttributeDict] = [tr for tr in await batch.execute()
                                                      if (tr is not None and tr.get("blockHash") is not None)]
         block_hash_set: Set[HexBytes] = set(tr.blockHash for tr in transaction_receipts)
-        fetch_block_tasks = [ev_loop.run_in_executor(hummingbot.get_executor(), self._w3.eth.getBlock, block_hash)
-                             for block_hash in block_hash_set]
+        for block_hash in block_hash_set:
+            batch.get_block(block_hash)
         blocks: Dict[HexBytes, AttributeDict] = dict((block.hash, block)
                                                      for block
-                                                     in await asyncio.gather(*fetch_block_tasks)
+                                                     in await batch.execute()
                                                      if block is not None)
 
         for receipt in transaction_receipts:
@@ -390,7 +395,8 @@ class Web3WalletBackend(PubSub):
             signed_transaction: AttributeDict = await self._outgoing_transactions_queue.get()
             tx_hash: str = signed_transaction.hash.hex()
             try:
-                await ev_loop.run_in_executor(hummingbot.get_executor(), self._w3.eth.sendRawTransaction,
+                await ev_loop.run_in_executor(hummingbot.get_executor(CHAIN_RPC_POOL),
+                                              self._w3.eth.sendRawTransaction,
                                               signed_transaction.rawTransaction)
             except asyncio.CancelledError:
                 raise
@@ -572,15 +578,11 @@ class Web3WalletBackend(PubSub):
         min_approve_amount: int = int(Decimal("1e35"))
         target_approve_amount: int = int(Decimal("1e36"))
 
-        # Get currently approved amounts
-        get_approved_amounts_tasks: List[asyncio.Task] = [
-            self._ev_loop.run_in_executor(
-                hummingbot.get_executor(),
-                erc20_token.contract.functions.allowance(self.address, spender).call
-            )
-            for erc20_token in self._erc20_token_list
-        ]
-        approved_amounts: List[int] = await asyncio.gather(*get_approved_amounts_tasks)
+        # Get currently approved amounts, in one JSON-RPC batch request.
+        batch: JsonRpcBatch = JsonRpcBatch(self._w3)
+        for erc20_token in self._erc20_token_list:
+            batch.call(erc20_token.contract.functions.allowance(self.address, spender))
+        approved_amounts: List[int] = await batch.execute()
 
         # Check and fix the approved amounts
         tx_hashes: List[str] = []
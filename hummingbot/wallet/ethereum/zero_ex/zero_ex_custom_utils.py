@@ -1,10 +1,18 @@
-from typing import Tuple
+from eth_account import Account
+from eth_account.messages import defunct_hash_message
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
 from zero_ex.order_utils import (
     _Constants,
     _convert_ec_signature_to_vrs_hex,
     _parse_signature_hex_as_vrs,
     _parse_signature_hex_as_rsv,
-    is_valid_signature,
     Order
 )
 
@@ -25,6 +33,31 @@ def convert_order_to_tuple(order: Order) -> Tuple[str, any]:
     return order_tuple
 
 
+# Signature layouts, i.e. r + s + v or v + r + s, returned by the signer of each address. The layout is a property of
+# the signer backend, so it only needs to be detected once.
+_signature_layouts: Dict[str, str] = {}
+
+_signature_parsers: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    "rsv": _parse_signature_hex_as_rsv,
+    "vrs": _parse_signature_hex_as_vrs,
+}
+
+
+def _recovers_signer(hash_hex: str, ec_signature: Dict[str, Any], signer_address: str) -> bool:
+    """
+    Checks an ETH_SIGN signature locally with ecrecover, like the 0x exchange contract does for the ETH_SIGN signature
+    type.
+    """
+    try:
+        message_hash: bytes = defunct_hash_message(hexstr=hash_hex)
+        recovered_address: str = Account.recoverHash(message_hash, vrs=(ec_signature["v"],
+                                                                        int(ec_signature["r"], 16),
+                                                                        int(ec_signature["s"], 16)))
+    except Exception:
+        return False
+    return recovered_address.lower() == signer_address.lower()
+
+
 # fix_signature extracts the logic used for formatting the signature required by the 0x protocol from 0x's custom
 # sign_hash helper.
 # https://github.com/0xProject/0x-monorepo/blob/development/python-packages/order_utils/src/zero_ex/order_utils/__init__.py#L462
@@ -38,40 +71,31 @@ def fix_signature(provider, signer_address, hash_hex, signature) -> str:
     # parse the signature in both ways, and evaluate if either one is a valid
     # signature.  r + s + v is the most prevalent format from eth_sign, so we
     # attempt this first.
+    #
+    # The signatures are checked locally with ecrecover rather than with the exchange contract, and the layout that
+    # worked is remembered for the signer - so signing an order does not need any RPC calls. `provider` is kept for
+    # compatibility with the 0x helper.
+    cached_layout: Optional[str] = _signature_layouts.get(signer_address)
+    layouts: List[str] = ["rsv", "vrs"]
+    if cached_layout is not None:
+        layouts.remove(cached_layout)
+        layouts.insert(0, cached_layout)
 
-    ec_signature = _parse_signature_hex_as_rsv(signature)
-    if ec_signature["v"] in valid_v_param_values:
-        signature_as_vrst_hex = (
-            _convert_ec_signature_to_vrs_hex(ec_signature)
-            + _Constants.SignatureType.ETH_SIGN.value.to_bytes(
-                1, byteorder="big"
-            ).hex()
-        )
-
-        (valid, _) = is_valid_signature(
-            provider, hash_hex, signature_as_vrst_hex, signer_address
-        )
-
-        if valid is True:
-            return signature_as_vrst_hex
+    for layout in layouts:
+        ec_signature = _signature_parsers[layout](signature)
+        if ec_signature["v"] in valid_v_param_values:
+            signature_as_vrst_hex = (
+                _convert_ec_signature_to_vrs_hex(ec_signature)
+                + _Constants.SignatureType.ETH_SIGN.value.to_bytes(
+                    1, byteorder="big"
+                ).hex()
+            )
 
-    ec_signature = _parse_signature_hex_as_vrs(signature)
-    if ec_signature["v"] in valid_v_param_values:
-        signature_as_vrst_hex = (
-            _convert_ec_signature_to_vrs_hex(ec_signature)
-            + _Constants.SignatureType.ETH_SIGN.value.to_bytes(
-                1, byteorder="big"
-            ).hex()
-        )
-        (valid, _) = is_valid_signature(
-            provider, hash_hex, signature_as_vrst_hex, signer_address
-        )
-
-        if valid is True:
-            return signature_as_vrst_hex
+            if _recovers_signer(hash_hex, ec_signature, signer_address):
+                _signature_layouts[signer_address] = layout
+                return signature_as_vrst_hex
 
     raise RuntimeError(
         "Signature returned from web3 provider is in an unknown format."
         + " Attempted to parse as RSV and as VRS."
     )
-
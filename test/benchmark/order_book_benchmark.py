@@ -0,0 +1,462 @@
+#!/usr/bin/env python
+"""
+Order book micro-benchmark suite.
+
+Measures the apply, snapshot and query paths of OrderBook, and the end-to-end latency of OrderBookTracker, over
+synthetic diff streams at several book depths and update rates, and over recorded exchange streams. Results are
+printed as tables, and written as JSON with --output so that runs can be compared against each other.
+
+Recorded streams are Binance depth streams, as JSON lines: the REST depth snapshot with its symbol added, followed by
+the raw depthUpdate messages of the websocket stream. They are converted with BinanceOrderBook, like the order book
+tracker does. A short sample in this format, fixtures/binance_ethusdt_depth_sample.jsonl, is benchmarked by default.
+--record-binance records a new stream, e.g. a longer one or one of another symbol:
+    python test/benchmark/order_book_benchmark.py --record-binance ETHUSDT ethusdt_depth.jsonl --record-duration 600
+
+Fixture files are JSON objects of the form
+    {"snapshot": {"update_id": 1, "bids": [["price", "amount"], ...], "asks": [...]},
+     "diffs": [{"update_id": 2, "bids": [...], "asks": [...]}, ...]}
+which is the content format of OrderBookMessage. --save-fixture writes the synthetic stream of the largest depth in
+the same format.
+
+Run this as a script, from the repository root:
+    python test/benchmark/order_book_benchmark.py --output order_book_benchmark.json
+"""
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import argparse
+import asyncio
+import json
+import numpy as np
+import pandas as pd
+import platform
+import random
+import subprocess
+import time
+import timeit
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+
+from order_book_query_benchmark import query_functions
+
+SAMPLE_RECORDING: str = realpath(join(__file__, "../fixtures/binance_ethusdt_depth_sample.jsonl"))
+
+DEPTHS: List[int] = [10, 100, 1000, 10000]
+UPDATE_RATES: List[int] = [100, 1000, 10000]
+DIFF_STREAM_LENGTH: int = 2000
+LEVELS_PER_DIFF: int = 5
+MID_PRICE: float = 100.0
+PRICE_STEP: float = 0.01
+TRACKER_TICK: float = 0.01
+TRACKER_DURATION: float = 2.0
+TRACKER_BURST_TIMEOUT: float = 10.0
+BENCHMARK_SYMBOL: str = "BENCHMARK-PAIR"
+
+
+class DiffStream(NamedTuple):
+    name: str
+    depth: int
+    snapshot: Dict[str, Any]
+    diffs: List[Dict[str, Any]]
+
+
+class BenchmarkResult(NamedTuple):
+    group: str
+    operation: str
+    stream: str
+    depth: int
+    update_rate: Optional[int]
+    value: float
+    unit: str
+
+
+def format_number(value: float) -> str:
+    return f"{value:.8g}"
+
+
+def synthetic_diff_stream(depth: int, length: int, rng: random.Random) -> DiffStream:
+    """
+    Generates a snapshot of `depth` levels per side, followed by `length` diffs. Each diff touches a few levels, with
+    a bias towards the top of the book, and removes a level about a fifth of the time.
+    """
+    snapshot: Dict[str, Any] = {
+        "update_id": 1,
+        "bids": [[format_number(MID_PRICE - (i + 1) * PRICE_STEP), format_number(rng.uniform(0.1, 10.0))]
+                 for i in range(depth)],
+        "asks": [[format_number(MID_PRICE + (i + 1) * PRICE_STEP), format_number(rng.uniform(0.1, 10.0))]
+                 for i in range(depth)]
+    }
+    diffs: List[Dict[str, Any]] = []
+    for update_id in range(2, length + 2):
+        diff: Dict[str, Any] = {"update_id": update_id, "bids": [], "asks": []}
+        for _ in range(rng.randint(1, LEVELS_PER_DIFF)):
+            level: int = min(int(rng.expovariate(10.0 / depth)), depth - 1)
+            amount: float = 0.0 if rng.random() < 0.2 else rng.uniform(0.1, 10.0)
+            if rng.random() < 0.5:
+                diff["bids"].append([format_number(MID_PRICE - (level + 1) * PRICE_STEP), format_number(amount)])
+            else:
+                diff["asks"].append([format_number(MID_PRICE + (level + 1) * PRICE_STEP), format_number(amount)])
+        diffs.append(diff)
+    return DiffStream(f"synthetic-{depth}", depth, snapshot, diffs)
+
+
+def load_fixture(path: str) -> DiffStream:
+    with open(path) as fd:
+        fixture: Dict[str, Any] = json.load(fd)
+    snapshot: Dict[str, Any] = fixture["snapshot"]
+    depth: int = max(len(snapshot["bids"]), len(snapshot["asks"]))
+    return DiffStream(f"fixture-{path}", depth, snapshot, fixture["diffs"])
+
+
+def load_binance_recording(path: str) -> DiffStream:
+    """
+    Loads a recorded Binance depth stream. Diffs that the snapshot already includes are dropped, as the order book
+    tracker does.
+    """
+    from hummingbot.market.binance.binance_order_book import BinanceOrderBook
+
+    with open(path) as fd:
+        records: List[Dict[str, Any]] = [json.loads(line) for line in fd if line.strip()]
+    if len(records) < 1:
+        raise ValueError(f"{path} does not contain a recorded order book snapshot.")
+    snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(records[0], 0.0)
+    diff_msgs: List[OrderBookMessage] = [BinanceOrderBook.diff_message_from_exchange(record, record["E"] * 1e-3)
+                                         for record in records[1:]]
+    # Only the price and amount of each level are used - REST snapshots can carry an extra, ignored field.
+    snapshot: Dict[str, Any] = {
+        "update_id": snapshot_msg.update_id,
+        "bids": [row[:2] for row in snapshot_msg.content["bids"]],
+        "asks": [row[:2] for row in snapshot_msg.content["asks"]]
+    }
+    diffs: List[Dict[str, Any]] = [
+        {"update_id": msg.update_id, "bids": msg.content["bids"], "asks": msg.content["asks"]}
+        for msg in diff_msgs if msg.update_id > snapshot_msg.update_id
+    ]
+    if len(diffs) < 1:
+        raise ValueError(f"{path} does not contain any diffs past its order book snapshot.")
+    depth: int = max(len(snapshot["bids"]), len(snapshot["asks"]))
+    return DiffStream(f"binance-{snapshot_msg.content['symbol']}", depth, snapshot, diffs)
+
+
+async def record_binance_stream(symbol: str, duration: float, path: str, limit: int = 1000):
+    """
+    Records the depth stream of a Binance symbol for `duration` seconds. The websocket stream is opened before the
+    snapshot is fetched, so that no diffs are missed between them.
+    """
+    import aiohttp
+    import websockets
+    from hummingbot.market.binance.binance_api_order_book_data_source import (
+        BinanceAPIOrderBookDataSource,
+        DIFF_STREAM_URL
+    )
+
+    records: List[Dict[str, Any]] = []
+    async with websockets.connect(f"{DIFF_STREAM_URL}/{symbol.lower()}@depth") as ws:
+        async with aiohttp.ClientSession() as client:
+            snapshot: Dict[str, Any] = await BinanceAPIOrderBookDataSource.get_snapshot(client, symbol, limit=limit)
+        records.append(dict(snapshot, symbol=symbol))
+        end_time: float = time.time() + duration
+        while time.time() < end_time:
+            try:
+                records.append(json.loads(await asyncio.wait_for(ws.recv(), timeout=end_time - time.time())))
+            except asyncio.TimeoutError:
+                break
+    with open(path, "w") as fd:
+        for record in records:
+            fd.write(json.dumps(record) + "\n")
+
+
+def snapshot_message(stream: DiffStream) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.SNAPSHOT, dict(stream.snapshot, symbol=BENCHMARK_SYMBOL),
+                            timestamp=0.0)
+
+
+def diff_messages(stream: DiffStream) -> List[OrderBookMessage]:
+    return [OrderBookMessage(OrderBookMessageType.DIFF, dict(diff, symbol=BENCHMARK_SYMBOL),
+                             timestamp=float(diff["update_id"]))
+            for diff in stream.diffs]
+
+
+def build_order_book(stream: DiffStream) -> OrderBook:
+    order_book: OrderBook = OrderBook()
+    order_book.apply_raw_snapshot(stream.snapshot["bids"], stream.snapshot["asks"], stream.snapshot["update_id"])
+    return order_book
+
+
+def best_time(function: Callable, repeat: int, number: int) -> float:
+    return min(timeit.repeat(function, repeat=repeat, number=number)) / number
+
+
+def benchmark_apply_paths(stream: DiffStream, repeat: int) -> List[BenchmarkResult]:
+    """
+    Measures the diff and snapshot application paths of OrderBook over the whole diff stream.
+    """
+    results: List[BenchmarkResult] = []
+    messages: List[OrderBookMessage] = diff_messages(stream)
+    snapshot: OrderBookMessage = snapshot_message(stream)
+    row_diffs = [(message.bids, message.asks, message.update_id) for message in messages]
+    snapshot_bids: List[OrderBookRow] = snapshot.bids
+    snapshot_asks: List[OrderBookRow] = snapshot.asks
+    numpy_bids: np.ndarray = np.array([[row.price, row.amount, row.update_id] for row in snapshot_bids],
+                                      dtype="float64").reshape((-1, 3))
+    numpy_asks: np.ndarray = np.array([[row.price, row.amount, row.update_id] for row in snapshot_asks],
+                                      dtype="float64").reshape((-1, 3))
+
+    def apply_diffs():
+        order_book: OrderBook = build_order_book(stream)
+        for bids, asks, update_id in row_diffs:
+            order_book.apply_diffs(bids, asks, update_id)
+
+    def apply_raw_diffs():
+        order_book: OrderBook = build_order_book(stream)
+        for message in messages:
+            order_book.apply_raw_diffs(message.content["bids"], message.content["asks"], message.update_id)
+
+    def apply_diff_messages():
+        order_book: OrderBook = build_order_book(stream)
+        order_book.apply_diff_messages(messages)
+
+    # The order book construction is part of every diff run above, so measure it separately and subtract it.
+    construction_time: float = best_time(lambda: build_order_book(stream), repeat, 1)
+    for operation, function in [("apply_diffs", apply_diffs),
+                                ("apply_raw_diffs", apply_raw_diffs),
+                                ("apply_diff_messages", apply_diff_messages)]:
+        elapsed: float = max(best_time(function, repeat, 1) - construction_time, 0.0)
+        results.append(BenchmarkResult("apply", operation, stream.name, stream.depth, None,
+                                       elapsed / max(len(messages), 1) * 1e6, "usec_per_diff"))
+
+    order_book: OrderBook = OrderBook()
+    past_diffs: List[OrderBookMessage] = messages[-OrderBookTracker.PAST_DIFF_WINDOW_SIZE:]
+    for operation, function in [
+        ("apply_snapshot", lambda: order_book.apply_snapshot(snapshot_bids, snapshot_asks, snapshot.update_id)),
+        ("apply_raw_snapshot", lambda: order_book.apply_raw_snapshot(snapshot.content["bids"],
+                                                                     snapshot.content["asks"],
+                                                                     snapshot.update_id)),
+        ("apply_numpy_snapshot", lambda: order_book.apply_numpy_snapshot(numpy_bids, numpy_asks,
+                                                                         snapshot.update_id)),
+        ("restore_from_snapshot_and_diffs", lambda: order_book.restore_from_snapshot_and_diffs(snapshot, past_diffs))
+    ]:
+        results.append(BenchmarkResult("snapshot", operation, stream.name, stream.depth, None,
+                                       best_time(function, repeat, 10) * 1e6, "usec_per_snapshot"))
+    return results
+
+
+def benchmark_queries(stream: DiffStream, repeat: int, number: int) -> List[BenchmarkResult]:
+    """
+    Measures every depth query, on an order book with the whole diff stream applied - with and without the
+    cumulative depth index.
+    """
+    results: List[BenchmarkResult] = []
+    for use_depth_index in [False, True]:
+        order_book: OrderBook = build_order_book(stream)
+        order_book.apply_diff_messages(diff_messages(stream))
+        order_book.use_depth_index = use_depth_index
+        for query_name, query_function in query_functions(order_book, stream.depth).items():
+            # Each call runs the query once on each side of the book.
+            operation: str = f"{query_name}{' (depth index)' if use_depth_index else ''}"
+            results.append(BenchmarkResult("query", operation, stream.name, stream.depth, None,
+                                           best_time(query_function, repeat, number) / 2 * 1e6, "usec_per_query"))
+    return results
+
+
+class BenchmarkDataSource(OrderBookTrackerDataSource):
+    def __init__(self, order_book: OrderBook):
+        self._order_book: OrderBook = order_book
+
+    async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
+        return {BENCHMARK_SYMBOL: OrderBookTrackerEntry(BENCHMARK_SYMBOL, time.time(), self._order_book)}
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class BenchmarkOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker fed directly by the benchmark, through the diff stream queue.
+    """
+    def __init__(self, order_book: OrderBook, coalesce_diffs: bool):
+        super().__init__(coalesce_diffs=coalesce_diffs)
+        self._data_source: BenchmarkDataSource = BenchmarkDataSource(order_book)
+
+    @property
+    def data_source(self) -> OrderBookTrackerDataSource:
+        return self._data_source
+
+    async def start(self):
+        await self._refresh_tracking_tasks()
+        self._order_book_diff_router_task = asyncio.ensure_future(self._order_book_diff_router())
+
+    def stop(self):
+        for task in self.tasks:
+            task.cancel()
+
+    @property
+    def tasks(self) -> List[asyncio.Task]:
+        return [self._order_book_diff_router_task] + [task for task in self._tracking_tasks.values()]
+
+    @property
+    def diff_stream(self) -> asyncio.Queue:
+        return self._order_book_diff_stream
+
+
+async def measure_tracker_latency(stream: DiffStream, update_rate: int, coalesce_diffs: bool) -> List[float]:
+    """
+    Feeds the diff stream into an order book tracker at `update_rate` messages per second, in bursts every
+    TRACKER_TICK seconds, and returns the time from enqueuing each burst until its last diff is applied.
+    """
+    order_book: OrderBook = build_order_book(stream)
+    tracker: BenchmarkOrderBookTracker = BenchmarkOrderBookTracker(order_book, coalesce_diffs)
+    await tracker.start()
+    messages: List[OrderBookMessage] = diff_messages(stream)
+    burst_size: int = max(int(update_rate * TRACKER_TICK), 1)
+    burst_count: int = max(int(TRACKER_DURATION / TRACKER_TICK), 1)
+    latencies: List[float] = []
+    try:
+        for burst_index in range(burst_count):
+            start_index: int = (burst_index * burst_size) % len(messages)
+            burst: List[OrderBookMessage] = [messages[(start_index + i) % len(messages)] for i in range(burst_size)]
+            # Give every diff a fresh update ID, since the stream wraps around.
+            burst = [OrderBookMessage(OrderBookMessageType.DIFF,
+                                      dict(message.content,
+                                           update_id=stream.snapshot["update_id"] + burst_index * burst_size + i + 1),
+                                      timestamp=message.timestamp)
+                     for i, message in enumerate(burst)]
+            last_update_id: int = burst[-1].update_id
+            burst_start: float = time.perf_counter()
+            for message in burst:
+                tracker.diff_stream.put_nowait(message)
+            # Fail the run, rather than waiting forever, if the tracker stops applying diffs.
+            while order_book.last_diff_uid < last_update_id:
+                stopped_tasks: List[asyncio.Task] = [task for task in tracker.tasks if task.done()]
+                if len(stopped_tasks) > 0:
+                    cause: Optional[BaseException] = (stopped_tasks[0].exception()
+                                                      if not stopped_tasks[0].cancelled() else None)
+                    raise RuntimeError("Order book tracker stopped before applying all diffs.") from cause
+                if time.perf_counter() - burst_start > TRACKER_BURST_TIMEOUT:
+                    raise TimeoutError(f"Order book tracker did not apply a burst of {burst_size} diffs within "
+                                       f"{TRACKER_BURST_TIMEOUT} seconds.")
+                await asyncio.sleep(0)
+            latencies.append(time.perf_counter() - burst_start)
+            await asyncio.sleep(max(TRACKER_TICK - (time.perf_counter() - burst_start), 0))
+    finally:
+        tracker.stop()
+    return latencies
+
+
+def benchmark_tracker(stream: DiffStream, update_rates: List[int]) -> List[BenchmarkResult]:
+    results: List[BenchmarkResult] = []
+    ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+    for update_rate in update_rates:
+        for coalesce_diffs in [False, True]:
+            latencies: np.ndarray = np.array(ev_loop.run_until_complete(
+                measure_tracker_latency(stream, update_rate, coalesce_diffs)
+            )) * 1e6
+            operation: str = f"tracker_burst_latency{' (coalesced)' if coalesce_diffs else ''}"
+            for statistic, value in [("mean", latencies.mean()),
+                                     ("p50", np.percentile(latencies, 50)),
+                                     ("p99", np.percentile(latencies, 99))]:
+                results.append(BenchmarkResult("tracker", f"{operation} {statistic}", stream.name, stream.depth,
+                                               update_rate, float(value), "usec_per_burst"))
+    return results
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=realpath(join(__file__, "../../../")),
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return None
+
+
+def print_results(results: List[BenchmarkResult]):
+    results_df: pd.DataFrame = pd.DataFrame([result._asdict() for result in results])
+    for group, group_df in results_df.groupby("group", sort=False):
+        unit: str = group_df["unit"].iloc[0]
+        index: List[str] = ["operation", "update_rate"] if group == "tracker" else ["operation"]
+        # Keep the rows and columns in the order they were measured in, rather than pivot_table()'s sorted order.
+        rows = (group_df["operation"].unique() if len(index) == 1
+                else pd.MultiIndex.from_frame(group_df[index].drop_duplicates()))
+        table: pd.DataFrame = group_df.pivot_table(index=index, columns="stream", values="value").reindex(
+            index=rows, columns=group_df["stream"].unique())
+        print(f"\n{group} ({unit}):")
+        print(table.to_string(float_format=lambda x: f"{x:.3f}"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the OrderBook apply, snapshot and query paths, and "
+                                                 "OrderBookTracker latency.")
+    parser.add_argument("--depths", type=int, nargs="+", default=DEPTHS)
+    parser.add_argument("--update-rates", type=int, nargs="+", default=UPDATE_RATES,
+                        help="Diff messages per second fed into the order book tracker.")
+    parser.add_argument("--diffs", type=int, default=DIFF_STREAM_LENGTH,
+                        help="Number of diffs in each synthetic diff stream.")
+    parser.add_argument("--fixture", type=str, nargs="*", default=[], help="Diff stream fixture files.")
+    parser.add_argument("--recording", type=str, nargs="*", default=[SAMPLE_RECORDING],
+                        help="Recorded Binance depth stream files.")
+    parser.add_argument("--record-binance", type=str, nargs=2, default=None, metavar=("SYMBOL", "PATH"),
+                        help="Records the depth stream of a Binance symbol to PATH, and benchmarks it.")
+    parser.add_argument("--record-duration", type=float, default=60.0,
+                        help="Number of seconds of the depth stream to record.")
+    parser.add_argument("--save-fixture", type=str, default=None,
+                        help="Writes the synthetic diff stream of the largest depth to this file.")
+    parser.add_argument("--skip-tracker", action="store_true")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=str, default=None, help="Writes the results to this JSON file.")
+    args = parser.parse_args()
+
+    rng: random.Random = random.Random(args.seed)
+    streams: List[DiffStream] = [synthetic_diff_stream(depth, args.diffs, rng) for depth in sorted(args.depths)]
+    if args.save_fixture is not None and len(streams) > 0:
+        with open(args.save_fixture, "w") as fd:
+            json.dump({"snapshot": streams[-1].snapshot, "diffs": streams[-1].diffs}, fd)
+    streams.extend(load_fixture(path) for path in args.fixture)
+    recordings: List[str] = list(args.recording)
+    if args.record_binance is not None:
+        symbol, path = args.record_binance
+        asyncio.get_event_loop().run_until_complete(record_binance_stream(symbol, args.record_duration, path))
+        recordings.append(path)
+    streams.extend(load_binance_recording(path) for path in recordings)
+
+    results: List[BenchmarkResult] = []
+    for stream in streams:
+        results.extend(benchmark_apply_paths(stream, args.repeat))
+        results.extend(benchmark_queries(stream, args.repeat, args.number))
+        if not args.skip_tracker:
+            results.extend(benchmark_tracker(stream, args.update_rates))
+
+    print_results(results)
+    if args.output is not None:
+        with open(args.output, "w") as fd:
+            json.dump({
+                "timestamp": time.time(),
+                "git_revision": git_revision(),
+                "python_version": platform.python_version(),
+                "platform": platform.platform(),
+                "arguments": vars(args),
+                "results": [result._asdict() for result in results]
+            }, fd, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
+
+import argparse
+import pandas as pd
+import timeit
+from typing import (
+    Callable,
+    Dict,
+    List
+)
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+DEPTHS: List[int] = [10, 100, 1000, 10000]
+MID_PRICE: float = 100.0
+PRICE_STEP: float = 0.01
+LEVEL_AMOUNT: float = 1.0
+
+
+def build_order_book(depth: int) -> OrderBook:
+    bids: List[OrderBookRow] = [OrderBookRow(MID_PRICE - (i + 1) * PRICE_STEP, LEVEL_AMOUNT, 1)
+                                for i in range(depth)]
+    asks: List[OrderBookRow] = [OrderBookRow(MID_PRICE + (i + 1) * PRICE_STEP, LEVEL_AMOUNT, 1)
+                                for i in range(depth)]
+    order_book: OrderBook = OrderBook()
+    order_book.apply_snapshot(bids, asks, 1)
+    return order_book
+
+
+def query_functions(order_book: OrderBook, depth: int) -> Dict[str, Callable]:
+    # Every query is sized to walk through (almost) the whole book side, which is the worst case.
+    full_volume: float = depth * LEVEL_AMOUNT * 0.99
+    far_ask_price: float = MID_PRICE + depth * PRICE_STEP
+    far_bid_price: float = MID_PRICE - depth * PRICE_STEP
+    return {
+        "get_price_for_volume": lambda: (order_book.get_price_for_volume(True, full_volume),
+                                         order_book.get_price_for_volume(False, full_volume)),
+        "get_vwap_for_volume": lambda: (order_book.get_vwap_for_volume(True, full_volume),
+                                        order_book.get_vwap_for_volume(False, full_volume)),
+        "get_price_for_quote_volume": lambda: (order_book.get_price_for_quote_volume(True, full_volume * MID_PRICE),
+                                               order_book.get_price_for_quote_volume(False, full_volume * MID_PRICE)),
+        "get_quote_volume_for_base_amount": lambda: (order_book.get_quote_volume_for_base_amount(True, full_volume),
+                                                     order_book.get_quote_volume_for_base_amount(False, full_volume)),
+        "get_volume_for_price": lambda: (order_book.get_volume_for_price(True, far_ask_price),
+                                         order_book.get_volume_for_price(False, far_bid_price)),
+        "get_quote_volume_for_price": lambda: (order_book.get_quote_volume_for_price(True, far_ask_price),
+                                               order_book.get_quote_volume_for_price(False, far_bid_price)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measures per-query latency of OrderBook depth walks vs. book depth.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    rows: List[Dict[str, any]] = []
+    for depth in DEPTHS:
+        order_book: OrderBook = build_order_book(depth)
+        for query_name, query_function in query_functions(order_book, depth).items():
+            # Each call runs the query once on each side of the book.
+            best_time: float = min(timeit.repeat(query_function, repeat=args.repeat, number=args.number))
+            rows.append({
+                "query": query_name,
+                "depth": depth,
+                "usec_per_query": best_time / (args.number * 2) * 1e6
+            })
+
+    results: pd.DataFrame = pd.DataFrame(rows).pivot(index="query", columns="depth", values="usec_per_query")
+    print("Per-query latency (microseconds) by book depth:")
+    print(results.to_string(float_format=lambda x: f"{x:.3f}"))
+
+
+if __name__ == "__main__":
+    main()
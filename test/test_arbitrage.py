@@ -2,6 +2,7 @@
 from os.path import join, realpath
 import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
 
+import asyncio
 from nose.plugins.attrib import attr
 
 from hummingbot.strategy.market_symbol_pair import MarketSymbolPair
@@ -24,6 +25,7 @@ from hummingbot.core.event.events import (
     MarketEvent
 )
 from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.strategy.arbitrage.arbitrage import ArbitrageStrategy
 from hummingbot.strategy.arbitrage.arbitrage_market_pair import ArbitrageMarketPair
 
@@ -137,6 +139,46 @@ class ArbitrageUnitTest(unittest.TestCase):
         market_orders = self.strategy.tracked_taker_orders
         self.assertTrue(len(market_orders) == 0)
 
+    def test_reactive_mode(self):
+        self.market_2_data.order_book.apply_diffs(
+            [OrderBookRow(1.05, 1.0, 2)],
+            [], 2)
+        self.strategy.enable_reactive_mode(debounce_interval=0.01)
+        clock: Clock = Clock(ClockMode.REALTIME, 1.0)
+        for iterator in [self.market_1, self.market_2, self.strategy]:
+            clock.add_iterator(iterator)
+
+        async def change_order_book_between_ticks() -> float:
+            # Let the clock tick, so the markets are ready and the strategy watches their order books.
+            while clock.tick_count < 2:
+                await asyncio.sleep(0.05)
+            await asyncio.sleep(0.3)
+            self.assertEqual(0, len(self.strategy.tracked_taker_orders))
+
+            # An arbitrage opportunity comes up between two ticks, and is taken before the next tick.
+            last_tick: float = clock.current_timestamp
+            self.market_2_data.order_book.apply_diffs([], [OrderBookRow(0.9, 5.0, 3)], 3)
+            OrderBookTracker._did_change_order_book(self.market_2_symbols[0], self.market_2_data.order_book)
+            await asyncio.sleep(0.1)
+            self.assertEqual(last_tick, clock.current_timestamp)
+            return last_tick
+
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        with clock:
+            clock_task: asyncio.Task = asyncio.ensure_future(clock.run())
+            try:
+                last_tick: float = ev_loop.run_until_complete(change_order_book_between_ticks())
+            finally:
+                clock_task.cancel()
+                ev_loop.run_until_complete(asyncio.wait([clock_task]))
+
+        market_orders = self.strategy.tracked_taker_orders
+        self.assertEqual(2, len(market_orders))
+        # The orders are timed at the order book change, rather than at the last tick.
+        for market, market_order in market_orders:
+            self.assertGreater(market_order.timestamp, last_tick)
+            self.assertLess(market_order.timestamp, last_tick + 1.0)
+
     def test_find_best_profitable_amount(self):
         self.market_2_data.order_book.apply_diffs(
             [OrderBookRow(1.1, 30, 2)],
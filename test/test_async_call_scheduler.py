@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from nose.plugins.attrib import attr
+import time
+from typing import List
+import unittest
+
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallLaneMetrics,
+    AsyncCallPriority,
+    AsyncCallScheduler
+)
+
+
+@attr('stable')
+class AsyncCallSchedulerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0.0)
+
+    def tearDown(self):
+        self.scheduler.stop()
+        self.ev_loop.run_until_complete(asyncio.sleep(0))
+        self.ev_loop.close()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    def test_priorities(self):
+        call_order: List[str] = []
+
+        async def call(name: str):
+            call_order.append(name)
+            await asyncio.sleep(0.01)
+
+        async def schedule_calls():
+            # The first call keeps the single worker busy while the others are queued.
+            first = asyncio.ensure_future(self.scheduler.schedule_async_call(call("first"), 1.0))
+            await asyncio.sleep(0.001)
+            await asyncio.gather(
+                first,
+                self.scheduler.schedule_async_call(call("poll_1"), 1.0, priority=AsyncCallPriority.POLLING),
+                self.scheduler.schedule_async_call(call("order"), 1.0, priority=AsyncCallPriority.ORDER),
+                self.scheduler.schedule_async_call(call("poll_2"), 1.0, priority=AsyncCallPriority.POLLING),
+                self.scheduler.schedule_async_call(call("cancel"), 1.0, priority=AsyncCallPriority.CANCEL),
+            )
+
+        self.run_async(schedule_calls())
+        self.assertEqual(["first", "cancel", "order", "poll_1", "poll_2"], call_order)
+
+    def test_concurrent_lane(self):
+        self.scheduler.add_lane("exchange", concurrency=4)
+
+        async def call(result: int) -> int:
+            await asyncio.sleep(0.1)
+            return result
+
+        start_time: float = time.time()
+        results: List[int] = self.run_async(asyncio.gather(*[
+            self.scheduler.schedule_async_call(call(i), 1.0, lane="exchange") for i in range(8)
+        ]))
+        self.assertEqual(list(range(8)), results)
+        self.assertAlmostEqual(0.2, time.time() - start_time, delta=0.08)
+
+        metrics: AsyncCallLaneMetrics = self.scheduler.lane_metrics("exchange")
+        self.assertEqual(4, metrics.concurrency)
+        self.assertEqual(8, metrics.completed_calls)
+        self.assertEqual(0, metrics.queue_depth)
+        self.assertEqual(0, metrics.in_flight)
+        self.assertAlmostEqual(0.1, metrics.max_wait_time, delta=0.05)
+        self.assertIn("default", self.scheduler.lane_metrics())
+
+    def test_call_async_starts_when_due(self):
+        start_times: List[float] = []
+
+        def blocking_call(result: str) -> str:
+            start_times.append(time.time())
+            time.sleep(0.05)
+            return result
+
+        results: List[str] = self.run_async(asyncio.gather(
+            self.scheduler.call_async(blocking_call, "a"),
+            self.scheduler.call_async(blocking_call, "b"),
+        ))
+        self.assertEqual(["a", "b"], results)
+        # The default lane runs one call at a time, so the second executor call must not start with the first.
+        self.assertGreaterEqual(start_times[1] - start_times[0], 0.04)
+
+    def test_timeout(self):
+        # Not using assertRaises() here, since it clears the frames of the exception traceback - which include the
+        # frame of the scheduler task that raised the exception.
+        timed_out: bool = False
+        try:
+            self.run_async(self.scheduler.schedule_async_call(asyncio.sleep(1.0), 0.05))
+        except asyncio.TimeoutError:
+            timed_out = True
+        self.assertTrue(timed_out)
+        self.assertEqual("ok", self.run_async(self.scheduler.call_async(lambda: "ok")))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import contextlib
+from decimal import Decimal
+from nose.plugins.attrib import attr
+from typing import (
+    Any,
+    Dict,
+    List
+)
+import unittest
+from unittest.mock import (
+    MagicMock,
+    patch
+)
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode
+)
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCompletedEvent,
+    MarketEvent,
+    OrderFilledEvent,
+    OrderType
+)
+from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.market.binance.binance_market import (
+    BinanceMarket,
+    InFlightOrder
+)
+
+FILLED_ORDER_ID = "buy-ZRXETH-1"
+OPEN_ORDER_ID = "buy-ZRXETH-2"
+PARTIALLY_FILLED_ORDER_ID = "sell-LOOMETH-3"
+
+
+def make_order_update(client_order_id: str, symbol: str, side: str, status: str, executed_qty: str) -> Dict[str, Any]:
+    return {"symbol": symbol, "clientOrderId": client_order_id, "price": "0.002", "origQty": "100.0",
+            "executedQty": executed_qty, "status": status, "type": "LIMIT", "side": side}
+
+
+@attr('stable')
+class BinanceOrderStatusUnitTest(unittest.TestCase):
+    """
+    Tests the order status polling of the Binance market, which is the backup to the user stream, against a mocked
+    Binance client.
+    """
+    events: List[MarketEvent] = [
+        MarketEvent.OrderFilled,
+        MarketEvent.BuyOrderCompleted,
+        MarketEvent.SellOrderCompleted,
+        MarketEvent.OrderFailure
+    ]
+
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.stack: contextlib.ExitStack = contextlib.ExitStack()
+        # The market's API calls go through a scheduler of its own, on this test's event loop.
+        self.stack.enter_context(patch.object(AsyncCallScheduler, "_acs_shared_instance", None))
+        self.stack.enter_context(patch("hummingbot.market.binance.binance_market.binance_client_module"))
+        self.stack.enter_context(patch("hummingbot.market.binance.binance_market.BinanceTime"))
+        self.client: MagicMock = self.stack.enter_context(
+            patch("hummingbot.market.binance.binance_market.BinanceClient")
+        ).return_value
+        for method_name in ["ping", "get_open_orders", "get_order"]:
+            getattr(self.client, method_name).__name__ = method_name
+        self.client.ping.side_effect = IOError("The network is not used in unit tests.")
+        self.client.get_open_orders.side_effect = self.get_open_orders
+        self.client.get_order.side_effect = self.get_order
+
+        self.market: BinanceMarket = BinanceMarket("http://localhost:8545", "", "",
+                                                   symbols=["ZRXETH", "LOOMETH"])
+        self.market_logger: EventLogger = EventLogger()
+        for event_tag in self.events:
+            self.market.add_listener(event_tag, self.market_logger)
+        self.market.in_flight_orders[FILLED_ORDER_ID] = InFlightOrder(
+            FILLED_ORDER_ID, 1, "ZRXETH", True, Decimal(100), OrderType.LIMIT)
+        self.market.in_flight_orders[OPEN_ORDER_ID] = InFlightOrder(
+            OPEN_ORDER_ID, 2, "ZRXETH", True, Decimal(100), OrderType.LIMIT)
+        self.market.in_flight_orders[PARTIALLY_FILLED_ORDER_ID] = InFlightOrder(
+            PARTIALLY_FILLED_ORDER_ID, 3, "LOOMETH", False, Decimal(100), OrderType.LIMIT)
+
+        # The first order status poll is due at the first timestamp the market sees.
+        self.clock: Clock = Clock(ClockMode.BACKTEST, start_time=10.0)
+        self.market.start(self.clock)
+
+    def tearDown(self):
+        self.market.stop(self.clock)
+        self.run_async(asyncio.sleep(0.01))
+        AsyncCallScheduler.shared_instance().stop()
+        self.run_async(asyncio.sleep(0.01))
+        self.stack.close()
+        self.ev_loop.close()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    @staticmethod
+    def get_open_orders(symbol: str) -> List[Dict[str, Any]]:
+        return {
+            "ZRXETH": [make_order_update(OPEN_ORDER_ID, "ZRXETH", "BUY", "NEW", "0.0")],
+            "LOOMETH": [make_order_update(PARTIALLY_FILLED_ORDER_ID, "LOOMETH", "SELL", "PARTIALLY_FILLED", "40.0")]
+        }[symbol]
+
+    @staticmethod
+    def get_order(symbol: str, origClientOrderId: str) -> Dict[str, Any]:
+        if origClientOrderId != FILLED_ORDER_ID:
+            raise ValueError(f"Order {origClientOrderId} is still open, and should not be queried by itself.")
+        return make_order_update(FILLED_ORDER_ID, symbol, "BUY", "FILLED", "100.0")
+
+    def test_reconcile_order_updates(self):
+        tracked_orders: List[InFlightOrder] = list(self.market.in_flight_orders.values())
+        order_updates: List[Dict[str, Any]] = self.run_async(self.market._reconcile_order_updates(tracked_orders))
+
+        # The updates come back in the order of the tracked orders.
+        self.assertEqual([FILLED_ORDER_ID, OPEN_ORDER_ID, PARTIALLY_FILLED_ORDER_ID],
+                         [order_update["clientOrderId"] for order_update in order_updates])
+        self.assertEqual(["FILLED", "NEW", "PARTIALLY_FILLED"],
+                         [order_update["status"] for order_update in order_updates])
+
+        # One open orders call per symbol, and one order status call for the order that is no longer open.
+        self.assertEqual(["LOOMETH", "ZRXETH"],
+                         sorted(call[1]["symbol"] for call in self.client.get_open_orders.call_args_list))
+        self.assertEqual([{"symbol": "ZRXETH", "origClientOrderId": FILLED_ORDER_ID}],
+                         [call[1] for call in self.client.get_order.call_args_list])
+
+    def test_update_order_status(self):
+        self.run_async(self.market._update_order_status())
+
+        # The order that disappeared from the open orders has been filled, and is no longer tracked.
+        self.assertNotIn(FILLED_ORDER_ID, self.market.in_flight_orders)
+        completed_events: List[BuyOrderCompletedEvent] = [event for event in self.market_logger.event_log
+                                                          if isinstance(event, BuyOrderCompletedEvent)]
+        self.assertEqual([FILLED_ORDER_ID], [event.order_id for event in completed_events])
+
+        # The partially filled order emits a fill, and is still tracked.
+        fill_events: Dict[str, OrderFilledEvent] = {event.order_id: event for event in self.market_logger.event_log
+                                                    if isinstance(event, OrderFilledEvent)}
+        self.assertEqual({FILLED_ORDER_ID, PARTIALLY_FILLED_ORDER_ID}, set(fill_events.keys()))
+        self.assertEqual(100.0, fill_events[FILLED_ORDER_ID].amount)
+        self.assertEqual(40.0, fill_events[PARTIALLY_FILLED_ORDER_ID].amount)
+        self.assertEqual("PARTIALLY_FILLED", self.market.in_flight_orders[PARTIALLY_FILLED_ORDER_ID].last_state)
+
+        # The order that is still open emits nothing, and is still tracked.
+        self.assertEqual("NEW", self.market.in_flight_orders[OPEN_ORDER_ID].last_state)
+        self.assertEqual(3, len(self.market_logger.event_log))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
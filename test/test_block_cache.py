@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from aiohttp import web
+import asyncio
+from hexbytes import HexBytes
+from nose.plugins.attrib import attr
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional
+)
+import unittest
+from web3 import Web3
+from web3.datastructures import AttributeDict
+
+from hummingbot.core.utils.http_client_manager import HttpClientManager
+from hummingbot.wallet.ethereum.block_cache import BlockCache
+
+KNOWN_BLOCK_HASHES: List[str] = ["0x" + f"{i:02x}" * 32 for i in range(1, 4)]
+UNKNOWN_BLOCK_HASH = "0x" + "ff" * 32
+
+
+@attr('stable')
+class BlockCacheUnitTest(unittest.TestCase):
+    """
+    Runs the block cache against a local HTTP server, which answers JSON-RPC batch requests like an Ethereum node.
+    """
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.rpc_calls: List[Dict[str, Any]] = []
+        self.runner: web.AppRunner = self.run_async(self.start_node())
+        self.block_cache: BlockCache = BlockCache(Web3(Web3.HTTPProvider(f"http://127.0.0.1:{self.port}")))
+
+    def tearDown(self):
+        self.run_async(HttpClientManager.shared_instance().close())
+        self.run_async(self.runner.cleanup())
+        self.ev_loop.close()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    async def start_node(self) -> web.AppRunner:
+        app: web.Application = web.Application()
+        app.router.add_post("/", self.handle_request)
+        runner: web.AppRunner = web.AppRunner(app)
+        await runner.setup()
+        site: web.TCPSite = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        self.port: int = site._server.sockets[0].getsockname()[1]
+        return runner
+
+    async def handle_request(self, request: web.Request) -> web.Response:
+        calls: List[Dict[str, Any]] = await request.json()
+        self.rpc_calls.extend(calls)
+        # Give concurrent lookups the time to find the pending calls.
+        await asyncio.sleep(0.05)
+        return web.json_response([{"jsonrpc": "2.0", "id": call["id"], "result": self.get_block(call["params"][0])}
+                                  for call in calls])
+
+    @staticmethod
+    def get_block(block_hash: str) -> Optional[Dict[str, Any]]:
+        if block_hash not in KNOWN_BLOCK_HASHES:
+            return None
+        number: int = KNOWN_BLOCK_HASHES.index(block_hash)
+        return {"hash": block_hash, "parentHash": "0x" + "00" * 32, "number": hex(number),
+                "timestamp": hex(1500000000 + number), "transactions": []}
+
+    def test_coalesced_lookups(self):
+        hashes: List[HexBytes] = [HexBytes(h) for h in KNOWN_BLOCK_HASHES]
+        results = self.run_async(asyncio.gather(
+            self.block_cache.get_blocks(hashes),
+            self.block_cache.get_block(hashes[0]),
+            self.block_cache.get_block(hashes[0]),
+        ))
+        self.assertEqual([1500000000, 1500000001, 1500000002], [block.timestamp for block in results[0]])
+        self.assertEqual(hashes[0], results[1].hash)
+        self.assertIs(results[1], results[2])
+        self.assertEqual(3, len(self.rpc_calls))
+
+        # Cached blocks do not make any more calls.
+        self.run_async(self.block_cache.get_blocks(reversed(hashes)))
+        self.assertEqual(3, len(self.rpc_calls))
+        self.assertEqual(3, self.block_cache.rpc_call_count)
+
+    def test_unknown_blocks_are_not_cached(self):
+        self.assertIsNone(self.run_async(self.block_cache.get_block(HexBytes(UNKNOWN_BLOCK_HASH))))
+        self.assertIsNone(self.run_async(self.block_cache.get_block(HexBytes(UNKNOWN_BLOCK_HASH))))
+        self.assertEqual(2, len(self.rpc_calls))
+
+    def test_add_block(self):
+        block: AttributeDict = AttributeDict({
+            "hash": HexBytes(UNKNOWN_BLOCK_HASH),
+            "timestamp": 1500000100,
+            "transactions": [AttributeDict({"hash": HexBytes("0x" + "aa" * 32), "value": 1})],
+        })
+        self.block_cache.add_block(block)
+        cached_block: AttributeDict = self.run_async(self.block_cache.get_block(HexBytes(UNKNOWN_BLOCK_HASH)))
+        self.assertEqual(1500000100, cached_block.timestamp)
+        # Only the transaction hashes are kept.
+        self.assertEqual([HexBytes("0x" + "aa" * 32)], cached_block.transactions)
+        self.assertEqual(0, len(self.rpc_calls))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
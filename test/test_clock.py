@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from nose.plugins.attrib import attr
+import time
+import unittest
+
+from hummingbot.core.clock import (
+    Clock,
+    TickDurationHistogram
+)
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.time_iterator import TimeIterator
+
+
+@attr('stable')
+class ClockUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+
+    def tearDown(self):
+        self.ev_loop.close()
+
+    def test_tick_duration_histogram(self):
+        histogram: TickDurationHistogram = TickDurationHistogram()
+        for duration in [0.0002] * 98 + [0.03, 7.0]:
+            histogram.record(duration)
+        self.assertEqual(100, histogram.count)
+        self.assertAlmostEqual((0.0002 * 98 + 0.03 + 7.0) / 100, histogram.mean)
+        self.assertEqual(7.0, histogram.max)
+        self.assertEqual(0.00025, histogram.percentile(50))
+        self.assertEqual(0.05, histogram.percentile(99))
+        self.assertEqual(7.0, histogram.percentile(100))
+        self.assertEqual(98, dict(histogram.buckets)[0.00025])
+
+    def test_backtest_metrics(self):
+        clock: Clock = Clock(ClockMode.BACKTEST, tick_size=0.5, start_time=1000.0, end_time=1010.0)
+        iterators = [TimeIterator(), TimeIterator()]
+        for iterator in iterators:
+            clock.add_iterator(iterator)
+        clock.backtest()
+
+        self.assertEqual(20, clock.tick_count)
+        self.assertEqual(1010.0, iterators[0].current_timestamp)
+        self.assertEqual(20, clock.tick_durations.count)
+        self.assertEqual([20, 20], [histogram.count for histogram in clock.iterator_tick_durations.values()])
+        self.assertIn("TimeIterator", clock.format_status())
+
+    def test_skipped_ticks(self):
+        clock: Clock = Clock(ClockMode.REALTIME, tick_size=0.1)
+        clock.add_iterator(TimeIterator())
+
+        async def run_clock():
+            with clock:
+                await clock.run_til(time.time() + 1.0)
+
+        # Block the event loop for a while, so the clock misses a few ticks.
+        self.ev_loop.call_later(0.25, time.sleep, 0.35)
+        self.ev_loop.run_until_complete(run_clock())
+
+        self.assertGreaterEqual(clock.skipped_tick_count, 2)
+        self.assertAlmostEqual(10, clock.tick_count + clock.skipped_tick_count, delta=1)
+        self.assertEqual(0, clock.overrun_count)
+
+        with self.assertRaises(ValueError):
+            Clock(ClockMode.REALTIME, tick_size=0)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from nose.plugins.attrib import attr
+from typing import (
+    Any,
+    Dict
+)
+import unittest
+
+from hummingbot.core.data_type.order_book_message import (
+    CoinbaseProOrderBookMessage,
+    OrderBookMessageType
+)
+from hummingbot.market.coinbase_pro.coinbase_pro_active_order_tracker import CoinbaseProActiveOrderTracker
+
+
+def diff_message(sequence: int, **content: Any) -> CoinbaseProOrderBookMessage:
+    message_content: Dict[str, Any] = {"product_id": "ETH-USD", "sequence": sequence}
+    message_content.update(content)
+    return CoinbaseProOrderBookMessage(OrderBookMessageType.DIFF, message_content, timestamp=float(sequence))
+
+
+@attr('stable')
+class CoinbaseProActiveOrderTrackerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.tracker: CoinbaseProActiveOrderTracker = CoinbaseProActiveOrderTracker(
+            active_asks={"101.0": {"ask-1": "2.0"}},
+            active_bids={"99.0": {"bid-1": "1.0", "bid-2": "3.0"}, "98.0": {"bid-3": "5.0"}}
+        )
+
+    def apply(self, **content: Any):
+        return self.tracker.convert_diff_message_to_order_book_row(diff_message(10, **content))
+
+    def test_open_change_match_done(self):
+        bids, asks = self.apply(type="open", order_id="bid-4", side="buy", price="99.0", remaining_size="0.5")
+        self.assertEqual([(99.0, 4.5)], [(row.price, row.amount) for row in bids])
+        self.assertEqual([], asks)
+
+        bids, asks = self.apply(type="change", order_id="bid-1", side="buy", price="99.0", new_size="0.25")
+        self.assertEqual([(99.0, 3.75)], [(row.price, row.amount) for row in bids])
+
+        bids, asks = self.apply(type="match", maker_order_id="ask-1", side="sell", price="101.0", size="0.5")
+        self.assertEqual([], bids)
+        self.assertEqual([(101.0, 1.5)], [(row.price, row.amount) for row in asks])
+
+        bids, asks = self.apply(type="done", order_id="bid-3", side="buy", price="98.0", reason="canceled")
+        self.assertEqual([(98.0, 0.0)], [(row.price, row.amount) for row in bids])
+        self.assertNotIn(98.0, self.tracker.active_bids)
+
+    def test_mismatched_price_or_side(self):
+        # Messages for a tracked order at another price or side are ignored, and leave the tracked orders as they are.
+        for content in [dict(type="change", order_id="bid-1", side="buy", price="98.0", new_size="0.25"),
+                        dict(type="change", order_id="bid-1", side="sell", price="99.0", new_size="0.25"),
+                        dict(type="match", maker_order_id="bid-2", side="buy", price="98.0", size="1.0"),
+                        dict(type="done", order_id="bid-3", side="sell", price="98.0", reason="filled"),
+                        dict(type="done", order_id="bid-3", side="buy", price="99.0", reason="filled")]:
+            self.assertEqual(([], []), self.apply(**content))
+        self.assertEqual(4.0, self.tracker.volume_for_bid_price(99.0))
+        self.assertEqual(5.0, self.tracker.volume_for_bid_price(98.0))
+        self.assertEqual(0.0, self.tracker.volume_for_bid_price(101.0))
+
+    def test_open_moves_tracked_order(self):
+        # An open message for a tracked order at another level also updates the order's old level.
+        bids, asks = self.apply(type="open", order_id="bid-2", side="buy", price="98.0", remaining_size="3.0")
+        self.assertEqual([(99.0, 1.0), (98.0, 8.0)], [(row.price, row.amount) for row in bids])
+        self.assertEqual([], asks)
+
+        bids, asks = self.apply(type="open", order_id="bid-1", side="sell", price="102.0", remaining_size="1.0")
+        self.assertEqual([(99.0, 0.0)], [(row.price, row.amount) for row in bids])
+        self.assertEqual([(102.0, 1.0)], [(row.price, row.amount) for row in asks])
+        self.assertEqual({98.0: {"bid-2": 3.0, "bid-3": 5.0}}, self.tracker.active_bids)
+
+        # Reopening an order at the same level only updates that level.
+        bids, asks = self.apply(type="open", order_id="bid-2", side="buy", price="98.0", remaining_size="1.0")
+        self.assertEqual([(98.0, 6.0)], [(row.price, row.amount) for row in bids])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,22 @@
 
 from os.path import join, realpath
 import sys;
-from unittest.mock import create_autospec
+from unittest.mock import (
+    create_autospec,
+    patch
+)
 
 sys.path.insert(0, realpath(join(__file__, "../../")))
 
 from nose.plugins.attrib import attr
 
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.utils.exchange_rate_conversion import ExchangeRateConversion
 from hummingbot.strategy.discovery import DiscoveryStrategy, DiscoveryMarketPair
 import logging; logging.basicConfig(level=logging.ERROR)
 import pandas as pd
@@ -133,3 +143,48 @@ class DiscoveryUnitTest(unittest.TestCase):
 
         run(self.strategy.fetch_market_info(self.market_pair))
         self.assertTrue(self.strategy.get_matching_pair(self.market_pair) == expected_pair)
+
+    def test_recompute_changed_order_books(self):
+        order_books = {}
+        symbols = list(self.mock_binance_active_markets["baseAsset"]) + list(self.mock_ddex_active_markets["baseAsset"])
+        for symbol in symbols:
+            order_book = OrderBook()
+            order_book.apply_snapshot([OrderBookRow(100.0 - i, 1.0, 1) for i in range(1, 6)],
+                                      [OrderBookRow(100.0 + i, 1.0, 1) for i in range(1, 6)], 1)
+            order_book.apply_diffs([OrderBookRow(97.0, 2.0, 2)], [], 2)
+            order_books[symbol] = order_book
+        for market, name in [(self.binance_market, "binance"), (self.ddex_market, "ddex")]:
+            market.name = name
+            market.get_order_book.side_effect = order_books.__getitem__
+
+        clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.end_timestamp)
+        clock.add_iterator(self.strategy)
+        with patch.object(ExchangeRateConversion, "adjust_token_rate", side_effect=lambda symbol, price: price):
+            # The first tick starts fetching the market info, and the second one computes all the stats.
+            clock.backtest_til(self.start_timestamp + 1)
+            run(asyncio.sleep(0.01))
+            clock.backtest_til(self.start_timestamp + 2)
+            market_stats = dict(self.strategy.discovery_stats["market_stats"])
+            arbitrage_stats = dict(self.strategy.discovery_stats["arbitrage"])
+            self.assertEqual(8, len(market_stats))
+            self.assertEqual(16, len(arbitrage_stats))
+
+            # Change a level deep in one order book, without changing its update IDs, best prices or number of levels.
+            order_books["ETHUSDT"].apply_diffs([OrderBookRow(97.0, 3.0, 2)], [], 2)
+            self.assertEqual((1, 2), (order_books["ETHUSDT"].snapshot_uid, order_books["ETHUSDT"].last_diff_uid))
+            self.assertEqual((99.0, 101.0), (order_books["ETHUSDT"].get_price(False),
+                                             order_books["ETHUSDT"].get_price(True)))
+            self.assertEqual((5, 5), order_books["ETHUSDT"].entry_counts)
+            clock.backtest_til(self.start_timestamp + 3)
+
+        # Only the stats of the changed order book are recomputed, the others are the cached results.
+        new_market_stats = self.strategy.discovery_stats["market_stats"]
+        new_arbitrage_stats = self.strategy.discovery_stats["arbitrage"]
+        self.assertEqual({("binance", "ETHUSDT")},
+                         {key for key, stats in new_market_stats.items() if stats is not market_stats[key]})
+        recomputed_pairs = {matching_pair for (market_pair, matching_pair), stats in new_arbitrage_stats.items()
+                            if stats is not arbitrage_stats[(market_pair, matching_pair)]}
+        self.assertEqual({matching_pair for market_pair, matching_pair in arbitrage_stats
+                          if matching_pair[0][0] == "ETHUSDT"},
+                         recomputed_pairs)
+        self.assertEqual(4, len(recomputed_pairs))
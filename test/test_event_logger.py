@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from nose.plugins.attrib import attr
+import os
+import tempfile
+from typing import NamedTuple
+import unittest
+
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType
+)
+from hummingbot.market.market_base import MarketBase
+
+
+class MockEventA(NamedTuple):
+    value: int
+
+
+class MockEventB(NamedTuple):
+    value: int
+
+
+class SmallEventLogMarket(MarketBase):
+    EVENT_LOG_CAPACITY = 100
+
+
+@attr('stable')
+class EventLoggerUnitTest(unittest.TestCase):
+    def test_ring_buffer(self):
+        event_logger: EventLogger = EventLogger(capacity=3)
+        for i in range(10):
+            event_logger(MockEventA(i))
+        self.assertEqual([MockEventA(7), MockEventA(8), MockEventA(9)], list(event_logger.event_log))
+        self.assertEqual(0, event_logger.spilled_event_count)
+        self.assertEqual([MockEventA(7), MockEventA(8), MockEventA(9)], event_logger.all_events)
+
+    def test_unbounded_by_default(self):
+        event_logger: EventLogger = EventLogger()
+        for i in range(20000):
+            event_logger(MockEventA(i))
+        self.assertIsNone(event_logger.capacity)
+        self.assertEqual(20000, len(event_logger.event_log))
+        self.assertEqual(MockEventA(0), event_logger.event_log[0])
+
+        with self.assertRaises(ValueError):
+            EventLogger(spill_path="events.spill")
+        with self.assertRaises(ValueError):
+            EventLogger(spill_to_disk=True)
+
+    def test_market_keeps_all_fills(self):
+        # The strategy trade lists are built from the market event logs, so no fill may be dropped - the market keeps
+        # its latest events in memory, and spills the older ones to disk.
+        market: MarketBase = SmallEventLogMarket()
+        fill_count: int = 250
+        for i in range(fill_count):
+            market.trigger_event(MarketEvent.OrderFilled,
+                                 OrderFilledEvent(float(i), f"order-{i}", "ETHUSDT", TradeType.BUY,
+                                                  OrderType.LIMIT, 100.0, 1.0, TradeFee(0.001)))
+        fills = [event for event in market.event_logs if isinstance(event, OrderFilledEvent)]
+        self.assertEqual(fill_count, len(fills))
+        self.assertEqual([f"order-{i}" for i in range(fill_count)], [fill.order_id for fill in fills])
+
+    def test_spill_to_disk(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            event_logger: EventLogger = EventLogger(capacity=2, spill_path=os.path.join(temp_dir, "events.spill"))
+            for i in range(5):
+                event_logger(MockEventA(i))
+            self.assertEqual([MockEventA(3), MockEventA(4)], list(event_logger.event_log))
+            self.assertEqual(3, event_logger.spilled_event_count)
+            self.assertEqual([MockEventA(0), MockEventA(1), MockEventA(2)], event_logger.spilled_events())
+
+            # Events keep being spilled after the spilled events are read back.
+            event_logger(MockEventA(5))
+            self.assertEqual([MockEventA(i) for i in range(6)], event_logger.all_events)
+            event_logger.close()
+
+    def test_clear_spilled_events(self):
+        event_logger: EventLogger = EventLogger(capacity=2, spill_to_disk=True)
+        for i in range(5):
+            event_logger(MockEventA(i))
+        event_logger.clear()
+        self.assertEqual(0, event_logger.spilled_event_count)
+        self.assertEqual([], event_logger.all_events)
+
+        for i in range(5, 8):
+            event_logger(MockEventA(i))
+        self.assertEqual([MockEventA(5)], event_logger.spilled_events())
+        self.assertEqual([MockEventA(5), MockEventA(6), MockEventA(7)], event_logger.all_events)
+        event_logger.close()
+        self.assertEqual([MockEventA(6), MockEventA(7)], event_logger.all_events)
+
+    def test_wait_for(self):
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        event_logger: EventLogger = EventLogger()
+
+        async def wait_and_emit():
+            wait_task: asyncio.Task = asyncio.ensure_future(event_logger.wait_for(MockEventB, 1.0))
+            await asyncio.sleep(0.01)
+            event_logger(MockEventA(1))
+            event_logger(MockEventB(2))
+            event_logger(MockEventB(3))
+            return await wait_task
+
+        self.assertEqual(MockEventB(2), ev_loop.run_until_complete(wait_and_emit()))
+        with self.assertRaises(asyncio.TimeoutError):
+            ev_loop.run_until_complete(event_logger.wait_for(MockEventB, 0.01))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
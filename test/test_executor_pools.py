@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from concurrent.futures import Future
+from nose.plugins.attrib import attr
+import threading
+import time
+from typing import List
+import unittest
+
+import hummingbot
+from hummingbot.core.utils.executor_pools import (
+    CHAIN_RPC_POOL,
+    EXCHANGE_REST_POOL,
+    ExecutorPool,
+    ExecutorPoolMetrics,
+    configure_executor_pool,
+    executor_pool_metrics,
+    get_executor_pool
+)
+
+
+@attr('stable')
+class ExecutorPoolsUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.chain_rpc_pool_size: int = get_executor_pool(CHAIN_RPC_POOL).max_workers
+
+    def tearDown(self):
+        configure_executor_pool(CHAIN_RPC_POOL, self.chain_rpc_pool_size)
+
+    def test_metrics(self):
+        pool: ExecutorPool = ExecutorPool("test", 2)
+        release_event: threading.Event = threading.Event()
+        futures: List[Future] = [pool.submit(release_event.wait) for _ in range(5)]
+        time.sleep(0.05)
+
+        metrics: ExecutorPoolMetrics = pool.metrics
+        self.assertEqual(2, metrics.running)
+        self.assertEqual(3, metrics.queue_depth)
+        self.assertEqual(1.0, metrics.saturation)
+
+        # A call cancelled while queued is no longer counted.
+        self.assertTrue(futures[-1].cancel())
+        self.assertEqual(2, pool.metrics.queue_depth)
+
+        release_event.set()
+        for future in futures[:-1]:
+            self.assertTrue(future.result(timeout=1.0))
+        metrics = pool.metrics
+        self.assertEqual(0, metrics.running)
+        self.assertEqual(0, metrics.queue_depth)
+        self.assertGreaterEqual(metrics.max_queue_depth, 3)
+        self.assertEqual(4, metrics.completed)
+        pool.shutdown()
+
+    def test_pools_are_isolated(self):
+        configure_executor_pool(CHAIN_RPC_POOL, 1)
+        chain_rpc_pool: ExecutorPool = get_executor_pool(CHAIN_RPC_POOL)
+        self.assertIs(chain_rpc_pool, hummingbot.get_executor(CHAIN_RPC_POOL))
+        self.assertIsNot(chain_rpc_pool, hummingbot.get_executor(EXCHANGE_REST_POOL))
+
+        # A stuck chain RPC call must not hold up exchange calls.
+        release_event: threading.Event = threading.Event()
+        stuck_call: Future = chain_rpc_pool.submit(release_event.wait)
+        self.assertEqual("ok", hummingbot.get_executor(EXCHANGE_REST_POOL).submit(lambda: "ok").result(timeout=1.0))
+        self.assertEqual(1, executor_pool_metrics()[CHAIN_RPC_POOL].running)
+        release_event.set()
+        self.assertTrue(stuck_call.result(timeout=1.0))
+
+        with self.assertRaises(ValueError):
+            configure_executor_pool(CHAIN_RPC_POOL, 0)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
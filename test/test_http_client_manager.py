@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import aiohttp
+import asyncio
+from nose.plugins.attrib import attr
+import unittest
+
+from hummingbot.core.utils.http_client_manager import HttpClientManager
+
+
+@attr('stable')
+class HttpClientManagerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.manager: HttpClientManager = HttpClientManager(connection_limit=10, connection_limit_per_host=2)
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(self.manager.close())
+        self.ev_loop.close()
+
+    async def get_client(self) -> aiohttp.ClientSession:
+        return self.manager.client()
+
+    def test_shared_client(self):
+        client: aiohttp.ClientSession = self.ev_loop.run_until_complete(self.get_client())
+        self.assertIs(client, self.ev_loop.run_until_complete(self.get_client()))
+        self.assertEqual(10, client.connector.limit)
+        self.assertEqual(2, client.connector.limit_per_host)
+        self.assertTrue(self.manager.client_started)
+
+        self.ev_loop.run_until_complete(self.manager.close())
+        self.assertTrue(client.closed)
+        self.assertFalse(self.manager.client_started)
+        self.assertIsNot(client, self.ev_loop.run_until_complete(self.get_client()))
+
+    def test_configure(self):
+        client: aiohttp.ClientSession = self.ev_loop.run_until_complete(self.get_client())
+        self.manager.configure(connection_limit_per_host=4)
+        self.assertTrue(client.closed)
+        client = self.ev_loop.run_until_complete(self.get_client())
+        self.assertEqual(10, client.connector.limit)
+        self.assertEqual(4, client.connector.limit_per_host)
+
+    def test_client_per_event_loop(self):
+        client: aiohttp.ClientSession = self.ev_loop.run_until_complete(self.get_client())
+        other_ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(other_ev_loop)
+        try:
+            other_client: aiohttp.ClientSession = other_ev_loop.run_until_complete(self.get_client())
+            self.assertIsNot(client, other_client)
+            self.assertIs(other_client, other_ev_loop.run_until_complete(self.get_client()))
+            other_ev_loop.run_until_complete(self.manager.close())
+        finally:
+            asyncio.set_event_loop(self.ev_loop)
+            other_ev_loop.close()
+            self.ev_loop.run_until_complete(client.close())
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
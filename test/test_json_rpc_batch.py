@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from aiohttp import web
+import asyncio
+import json
+from nose.plugins.attrib import attr
+from typing import (
+    Any,
+    Dict,
+    List
+)
+import unittest
+from web3 import Web3
+from web3.contract import Contract
+
+from hummingbot.core.utils.http_client_manager import HttpClientManager
+from hummingbot.wallet.ethereum.json_rpc_batch import JsonRpcBatch
+
+ACCOUNT_ADDRESS = "0x5409ED021D9299bf6814279A6A1411A7e866A631"
+TOKEN_ADDRESS = "0x1dC4c1cEFEF38a777b15aA20260a54E584b16C48"
+TX_HASH = "0x" + "ab" * 32
+BLOCK_HASH = "0x" + "cd" * 32
+
+
+@attr('stable')
+class JsonRpcBatchUnitTest(unittest.TestCase):
+    """
+    Runs the batch client against a local HTTP server, which answers JSON-RPC batch requests like an Ethereum node.
+    """
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.http_requests: List[List[Dict[str, Any]]] = []
+        self.runner: web.AppRunner = self.run_async(self.start_node())
+        self.w3: Web3 = Web3(Web3.HTTPProvider(f"http://127.0.0.1:{self.port}"))
+        with open(realpath(join(__file__, "../../hummingbot/wallet/ethereum/token_abi/erc20_abi.json"))) as fd:
+            self.token: Contract = self.w3.eth.contract(address=TOKEN_ADDRESS, abi=json.load(fd))
+
+    def tearDown(self):
+        self.run_async(HttpClientManager.shared_instance().close())
+        self.run_async(self.runner.cleanup())
+        self.ev_loop.close()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    async def start_node(self) -> web.AppRunner:
+        app: web.Application = web.Application()
+        app.router.add_post("/", self.handle_request)
+        runner: web.AppRunner = web.AppRunner(app)
+        await runner.setup()
+        site: web.TCPSite = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        self.port: int = site._server.sockets[0].getsockname()[1]
+        return runner
+
+    async def handle_request(self, request: web.Request) -> web.Response:
+        calls: List[Dict[str, Any]] = await request.json()
+        self.http_requests.append(calls)
+        # Answer in reverse order, since nodes do not have to keep the order of the batch.
+        return web.json_response([self.handle_call(call) for call in reversed(calls)])
+
+    @staticmethod
+    def handle_call(call: Dict[str, Any]) -> Dict[str, Any]:
+        method: str = call["method"]
+        if method == "eth_getBalance":
+            result: Any = hex(10 ** 18)
+        elif method == "eth_call":
+            result = "0x" + (500).to_bytes(32, "big").hex()
+        elif method == "eth_getTransactionReceipt" and call["params"][0] == TX_HASH:
+            result = {"transactionHash": TX_HASH, "transactionIndex": "0x0", "blockHash": BLOCK_HASH,
+                      "blockNumber": "0x10", "cumulativeGasUsed": "0x5208", "gasUsed": "0x5208", "status": "0x1",
+                      "contractAddress": None, "logs": []}
+        elif method == "eth_getTransactionReceipt":
+            result = None
+        else:
+            return {"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32601, "message": "Method not found"}}
+        return {"jsonrpc": "2.0", "id": call["id"], "result": result}
+
+    def test_batch(self):
+        batch: JsonRpcBatch = JsonRpcBatch(self.w3)
+        batch.get_balance(ACCOUNT_ADDRESS)
+        batch.call(self.token.functions.balanceOf(ACCOUNT_ADDRESS))
+        batch.get_transaction_receipt(TX_HASH)
+        batch.get_transaction_receipt("0x" + "00" * 32)
+        self.assertEqual(4, len(batch))
+
+        eth_balance, token_balance, receipt, missing_receipt = self.run_async(batch.execute())
+        self.assertEqual(1, len(self.http_requests))
+        self.assertEqual(10 ** 18, eth_balance)
+        self.assertEqual(500, token_balance)
+        self.assertEqual(BLOCK_HASH, receipt.blockHash.hex())
+        self.assertEqual(21000, receipt.gasUsed)
+        self.assertEqual(1, receipt.status)
+        self.assertIsNone(missing_receipt)
+
+        # The calls are sent in batches of at most max_batch_size calls.
+        batch = JsonRpcBatch(self.w3, max_batch_size=2)
+        for _ in range(5):
+            batch.get_balance(ACCOUNT_ADDRESS)
+        self.assertEqual([10 ** 18] * 5, self.run_async(batch.execute()))
+        self.assertEqual([2, 2, 1], [len(calls) for calls in self.http_requests[1:]])
+
+    def test_errors(self):
+        batch: JsonRpcBatch = JsonRpcBatch(self.w3)
+        batch.get_balance(ACCOUNT_ADDRESS)
+        batch.add("eth_unknownMethod", [])
+        results: List[Any] = self.run_async(batch.execute(return_exceptions=True))
+        self.assertEqual(10 ** 18, results[0])
+        self.assertIsInstance(results[1], ValueError)
+
+        batch.add("eth_unknownMethod", [])
+        with self.assertRaises(ValueError):
+            self.run_async(batch.execute())
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from collections import defaultdict
+from nose.plugins.attrib import attr
+import random
+import unittest
+
+from hummingbot.core.data_type.l3_order_store import L3OrderStore
+
+
+@attr('stable')
+class L3OrderStoreUnitTest(unittest.TestCase):
+    def test_level_totals(self):
+        store: L3OrderStore = L3OrderStore(initial_capacity=2)
+        self.assertEqual(1.0, store.set_order("a", True, 10.0, 1.0))
+        self.assertEqual(3.0, store.set_order("b", True, 10.0, 2.0))
+        self.assertEqual(5.0, store.set_order("c", False, 11.0, 5.0))
+        self.assertEqual(2.5, store.set_order_amount("b", 1.5))
+        self.assertEqual(1.5, store.remove_order("a"))
+        self.assertEqual(0.0, store.remove_order("b"))
+        self.assertEqual(0.0, store.get_level_total(True, 10.0))
+        self.assertEqual(0, store.bid_level_count)
+        self.assertEqual((False, 11.0, 5.0), store.get_order("c"))
+        self.assertIsNone(store.get_order("a"))
+
+        # Replacing an order with a different price moves it to the new level.
+        self.assertEqual(5.0, store.set_order("c", False, 12.0, 5.0))
+        self.assertEqual(0.0, store.get_level_total(False, 11.0))
+        self.assertEqual({12.0: {"c": 5.0}}, store.get_active_orders(False))
+        self.assertEqual(1, len(store))
+
+    def test_load_snapshot(self):
+        store: L3OrderStore = L3OrderStore(initial_capacity=1)
+        bids, asks = store.load_snapshot(["a", "b", "c"], ["10", "9", "10"], ["1", "2", "3"],
+                                         ["d", "e"], ["11", "12"], ["4", "5"],
+                                         timestamp=1.0, update_id=7)
+        self.assertEqual([[1.0, 10.0, 4.0, 7.0], [1.0, 9.0, 2.0, 7.0]], bids.tolist())
+        self.assertEqual([[1.0, 12.0, 5.0, 7.0], [1.0, 11.0, 4.0, 7.0]], asks.tolist())
+        self.assertEqual(5, len(store))
+
+        # The snapshot is followed by diffs.
+        self.assertEqual(3.0, store.remove_order("a"))
+        self.assertEqual(0.0, store.remove_order("c"))
+        self.assertEqual(6.0, store.set_order("f", False, 11.0, 2.0))
+
+        bids, asks = store.load_snapshot([], [], [], [], [], [])
+        self.assertEqual((0, 4), bids.shape)
+        self.assertEqual((0, 4), asks.shape)
+        self.assertEqual(0, len(store))
+
+    def test_load_snapshot_with_duplicated_order_ids(self):
+        store: L3OrderStore = L3OrderStore()
+        bids, asks = store.load_snapshot(["a", "a"], [10.0, 9.0], [1.0, 2.0], [], [], [])
+        self.assertEqual([[0.0, 9.0, 2.0, 0.0]], bids.tolist())
+        self.assertEqual(1, len(store))
+
+    def test_random_updates(self):
+        rng: random.Random = random.Random(42)
+        store: L3OrderStore = L3OrderStore(initial_capacity=4)
+        orders = {}
+        for i in range(5000):
+            order_id = f"order-{rng.randrange(200)}"
+            if order_id in orders and rng.random() < 0.4:
+                store.remove_order(order_id)
+                del orders[order_id]
+            else:
+                is_bid = rng.random() < 0.5
+                price = float(rng.randrange(90, 110))
+                amount = float(rng.randrange(1, 100))
+                store.set_order(order_id, is_bid, price, amount)
+                orders[order_id] = (is_bid, price, amount)
+
+        expected_totals = defaultdict(float)
+        for is_bid, price, amount in orders.values():
+            expected_totals[(is_bid, price)] += amount
+        self.assertEqual(len(orders), len(store))
+        self.assertEqual(len(expected_totals), store.bid_level_count + store.ask_level_count)
+        for (is_bid, price), total in expected_totals.items():
+            self.assertAlmostEqual(total, store.get_level_total(is_bid, price))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
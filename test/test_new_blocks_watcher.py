@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from nose.plugins.attrib import attr
+import threading
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple
+)
+import unittest
+from web3 import Web3
+from web3.datastructures import AttributeDict
+from web3.providers.base import BaseProvider
+
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import NewBlocksWatcherEvent
+from hummingbot.wallet.ethereum.watcher.new_blocks_watcher import NewBlocksWatcher
+
+START_BLOCK_NUMBER = 100
+WATCH_ADDRESS = "0x" + "11" * 20
+
+
+class MockNodeProvider(BaseProvider):
+    """
+    Answers block requests like an Ethereum node, on a chain where every block number exists and every block holds one
+    transaction.
+    """
+    def __init__(self):
+        self._lock: threading.Lock = threading.Lock()
+        self.block_requests: List[Tuple[str, Any, bool]] = []
+
+    @staticmethod
+    def block_hash(number: int) -> str:
+        return "0x" + f"{number:064x}"
+
+    @classmethod
+    def get_block(cls, number: int, full_transactions: bool) -> Dict[str, Any]:
+        transaction_hash: str = "0x" + f"{number + 1000000:064x}"
+        transaction: Any = transaction_hash
+        if full_transactions:
+            transaction = {"hash": transaction_hash, "from": WATCH_ADDRESS, "to": WATCH_ADDRESS, "value": hex(1),
+                           "blockHash": cls.block_hash(number), "blockNumber": hex(number)}
+        return {"hash": cls.block_hash(number), "parentHash": cls.block_hash(number - 1), "number": hex(number),
+                "timestamp": hex(1500000000 + number), "transactions": [transaction]}
+
+    def make_request(self, method: str, params: List[Any]) -> Dict[str, Any]:
+        result: Any = None
+        if method == "eth_blockNumber":
+            result = hex(START_BLOCK_NUMBER)
+        elif method in ("eth_getBlockByNumber", "eth_getBlockByHash"):
+            block_identifier, full_transactions = params
+            with self._lock:
+                self.block_requests.append((method, block_identifier, full_transactions))
+            result = self.get_block(int(block_identifier, 16), full_transactions)
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+    def isConnected(self) -> bool:
+        return True
+
+
+@attr('stable')
+class NewBlocksWatcherUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.provider: MockNodeProvider = MockNodeProvider()
+        self.watcher: NewBlocksWatcher = NewBlocksWatcher(Web3(self.provider))
+        self.new_blocks: asyncio.Queue = asyncio.Queue()
+        self.forwarder: EventForwarder = EventForwarder(self.new_blocks.put_nowait)
+        self.watcher.add_listener(NewBlocksWatcherEvent.NewBlocks, self.forwarder)
+
+    def tearDown(self):
+        self.run_async(self.watcher.stop_network())
+        self.ev_loop.close()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    def next_block(self) -> AttributeDict:
+        new_blocks: List[AttributeDict] = self.run_async(asyncio.wait_for(self.new_blocks.get(), timeout=5.0))
+        return new_blocks[-1]
+
+    def test_full_transactions_subscription(self):
+        self.run_async(self.watcher.start_network())
+
+        # Light mode only polls the block headers.
+        block: AttributeDict = self.next_block()
+        self.assertFalse(self.watcher.fetch_full_transactions)
+        self.assertFalse(NewBlocksWatcher.has_full_transactions(block))
+        self.assertEqual(("eth_getBlockByNumber", hex(block.number), False), self.provider.block_requests[-1])
+
+        # Blocks polled as headers are fetched again with their transactions, by hash.
+        full_blocks: List[AttributeDict] = self.run_async(self.watcher.get_full_blocks([block]))
+        self.assertTrue(NewBlocksWatcher.has_full_transactions(full_blocks[0]))
+        self.assertEqual(WATCH_ADDRESS, full_blocks[0].transactions[0]["to"].lower())
+        self.assertEqual(("eth_getBlockByHash", MockNodeProvider.block_hash(block.number), True),
+                         self.provider.block_requests[-1])
+
+        # Full transactions are polled while a subscriber holds the flag.
+        subscriber: object = object()
+        self.watcher.require_full_transactions(subscriber)
+        self.assertTrue(self.watcher.fetch_full_transactions)
+        block = self.next_block()
+        self.assertTrue(NewBlocksWatcher.has_full_transactions(block))
+        self.assertEqual(("eth_getBlockByNumber", hex(block.number), True), self.provider.block_requests[-1])
+
+        # Blocks that already have their transactions are not fetched again.
+        request_count: int = len(self.provider.block_requests)
+        self.assertEqual([block], self.run_async(self.watcher.get_full_blocks([block])))
+        self.assertEqual(request_count, len(self.provider.block_requests))
+
+        # Header only polling resumes after the subscriber releases the flag.
+        self.watcher.release_full_transactions(subscriber)
+        self.assertFalse(self.watcher.fetch_full_transactions)
+        block = self.next_block()
+        self.assertFalse(NewBlocksWatcher.has_full_transactions(block))
+        self.assertEqual(("eth_getBlockByNumber", hex(block.number), False), self.provider.block_requests[-1])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
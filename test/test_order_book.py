@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import math
+from nose.plugins.attrib import attr
+import numpy as np
+from typing import List
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType
+)
+from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_snapshot import (
+    decode_order_book_snapshots,
+    encode_order_book_snapshots,
+    load_order_book_snapshots
+)
+
+
+@attr('stable')
+class OrderBookUnitTest(unittest.TestCase):
+    use_depth_index: bool = False
+
+    def setUp(self):
+        # Bids: 99 x 1, 98 x 2, 97 x 3, 96 x 4, 95 x 5
+        # Asks: 101 x 1, 102 x 2, 103 x 3, 104 x 4, 105 x 5
+        bids: List[OrderBookRow] = [OrderBookRow(99.0 - i, 1.0 + i, 1) for i in range(5)]
+        asks: List[OrderBookRow] = [OrderBookRow(101.0 + i, 1.0 + i, 1) for i in range(5)]
+        self.order_book: OrderBook = OrderBook(use_depth_index=self.use_depth_index)
+        self.order_book.apply_snapshot(bids, asks, 1)
+
+    def test_get_price_for_volume(self):
+        result: OrderBookQueryResult = self.order_book.get_price_for_volume(True, 2.5)
+        self.assertEqual(102.0, result.result_price)
+        self.assertEqual(2.5, result.result_volume)
+        result = self.order_book.get_price_for_volume(False, 2.5)
+        self.assertEqual(98.0, result.result_price)
+        result = self.order_book.get_price_for_volume(True, 100.0)
+        self.assertTrue(math.isnan(result.result_price))
+        self.assertEqual(15.0, result.result_volume)
+
+    def test_get_vwap_for_volume(self):
+        result: OrderBookQueryResult = self.order_book.get_vwap_for_volume(True, 2.0)
+        self.assertAlmostEqual((101.0 + 102.0) / 2, result.result_price)
+        self.assertEqual(2.0, result.result_volume)
+        result = self.order_book.get_vwap_for_volume(False, 3.0)
+        self.assertAlmostEqual((99.0 + 98.0 * 2) / 3, result.result_price)
+
+    def test_get_price_for_quote_volume(self):
+        result: OrderBookQueryResult = self.order_book.get_price_for_quote_volume(True, 200.0)
+        self.assertEqual(102.0, result.result_price)
+        result = self.order_book.get_price_for_quote_volume(False, 99.0)
+        self.assertEqual(99.0, result.result_price)
+
+    def test_get_quote_volume_for_base_amount(self):
+        result: OrderBookQueryResult = self.order_book.get_quote_volume_for_base_amount(True, 2.0)
+        self.assertAlmostEqual(101.0 + 102.0, result.result_volume)
+        result = self.order_book.get_quote_volume_for_base_amount(False, 2.0)
+        self.assertAlmostEqual(99.0 + 98.0, result.result_volume)
+
+    def test_get_volume_for_price(self):
+        result: OrderBookQueryResult = self.order_book.get_volume_for_price(True, 102.5)
+        self.assertEqual(102.0, result.result_price)
+        self.assertEqual(3.0, result.result_volume)
+        result = self.order_book.get_volume_for_price(False, 97.0)
+        self.assertEqual(97.0, result.result_price)
+        self.assertEqual(6.0, result.result_volume)
+        result = self.order_book.get_volume_for_price(True, 100.0)
+        self.assertTrue(math.isnan(result.result_price))
+        self.assertEqual(0.0, result.result_volume)
+
+    def test_get_quote_volume_for_price(self):
+        result: OrderBookQueryResult = self.order_book.get_quote_volume_for_price(True, 102.0)
+        self.assertAlmostEqual(101.0 + 102.0 * 2, result.result_volume)
+        result = self.order_book.get_quote_volume_for_price(False, 98.0)
+        self.assertAlmostEqual(99.0 + 98.0 * 2, result.result_volume)
+
+    def test_apply_raw_diffs(self):
+        self.order_book.apply_raw_diffs([["98.0", "0"], ["99.5", "0.25", []]], [["101", "1.5"]], 2)
+        bids: List[OrderBookRow] = list(self.order_book.bid_entries())
+        asks: List[OrderBookRow] = list(self.order_book.ask_entries())
+        self.assertEqual(OrderBookRow(99.5, 0.25, 2), bids[0])
+        self.assertNotIn(98.0, [row.price for row in bids])
+        self.assertEqual(OrderBookRow(101.0, 1.5, 2), asks[0])
+        self.assertEqual(2, self.order_book.last_diff_uid)
+
+        self.order_book.apply_raw_snapshot([[97, 2]], [["1e2", "3"]], 3)
+        self.assertEqual([OrderBookRow(97.0, 2.0, 3)], list(self.order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(100.0, 3.0, 3)], list(self.order_book.ask_entries()))
+
+        with self.assertRaises(ValueError):
+            self.order_book.apply_raw_diffs([["not a number", "1"]], [], 4)
+
+    def test_apply_diff_messages(self):
+        diff_messages: List[OrderBookMessage] = [
+            OrderBookMessage(OrderBookMessageType.DIFF,
+                             {"update_id": 2, "bids": [["99", "5"]], "asks": [["101", "0"]]}),
+            OrderBookMessage(OrderBookMessageType.DIFF,
+                             {"update_id": 3, "bids": [["99", "0"], ["98", "4"]], "asks": [["101", "2"]]}),
+            OrderBookMessage(OrderBookMessageType.DIFF,
+                             {"update_id": 4, "bids": [["99", "6"]], "asks": []}),
+        ]
+        self.order_book.apply_diff_messages(diff_messages)
+        bids: List[OrderBookRow] = list(self.order_book.bid_entries())
+        asks: List[OrderBookRow] = list(self.order_book.ask_entries())
+        self.assertEqual([OrderBookRow(99.0, 6.0, 4), OrderBookRow(98.0, 4.0, 3)], bids[:2])
+        self.assertEqual(OrderBookRow(101.0, 2.0, 3), asks[0])
+        self.assertEqual(4, self.order_book.last_diff_uid)
+
+    def test_apply_numpy_snapshot(self):
+        # Level tables in the (timestamp, price, amount, update_id) layout of the active order trackers, unsorted and
+        # with a duplicated price.
+        bids: np.ndarray = np.array([[0.0, 97.0, 3.0, 5.0], [0.0, 99.0, 1.0, 5.0], [0.0, 99.0, 7.0, 5.0]])
+        asks: np.ndarray = np.array([[0.0, 103.0, 3.0, 5.0], [0.0, 101.0, 1.0, 6.0]])
+        self.order_book.apply_numpy_snapshot(bids[:, 1:], asks[:, 1:])
+        self.assertEqual([OrderBookRow(99.0, 1.0, 5), OrderBookRow(97.0, 3.0, 5)],
+                         list(self.order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(101.0, 1.0, 6), OrderBookRow(103.0, 3.0, 5)],
+                         list(self.order_book.ask_entries()))
+        self.assertEqual(6, self.order_book.snapshot_uid)
+        self.assertEqual(99.0, self.order_book.get_price(False))
+        self.assertEqual(101.0, self.order_book.get_price(True))
+        self.assertEqual(101.0, self.order_book.get_price_for_volume(True, 1.0).result_price)
+
+        empty: np.ndarray = np.ndarray(shape=(0, 3), dtype="float64")
+        self.order_book.apply_numpy_snapshot(empty, empty, 7)
+        self.assertEqual([], list(self.order_book.bid_entries()))
+        self.assertEqual([], list(self.order_book.ask_entries()))
+        self.assertEqual(7, self.order_book.snapshot_uid)
+
+    def test_binary_snapshot(self):
+        empty_order_book: OrderBook = OrderBook()
+        data: bytes = encode_order_book_snapshots({"ETHUSDT": self.order_book, "ZRX-WETH": empty_order_book})
+        arrays = decode_order_book_snapshots(data)
+        self.assertEqual(["ETHUSDT", "ZRX-WETH"], list(arrays.keys()))
+        bids_array, asks_array = arrays["ETHUSDT"]
+        self.assertEqual([99.0, 1.0, 1.0], list(bids_array[0]))
+        self.assertEqual([105.0, 5.0, 1.0], list(asks_array[-1]))
+        self.assertEqual((0, 3), arrays["ZRX-WETH"][0].shape)
+
+        order_books = load_order_book_snapshots(data)
+        self.assertEqual(list(self.order_book.bid_entries()), list(order_books["ETHUSDT"].bid_entries()))
+        self.assertEqual(list(self.order_book.ask_entries()), list(order_books["ETHUSDT"].ask_entries()))
+        self.assertEqual(1, order_books["ETHUSDT"].snapshot_uid)
+        self.assertEqual((0, 0), order_books["ZRX-WETH"].entry_counts)
+        self.assertEqual(data, encode_order_book_snapshots(order_books))
+
+        self.assertEqual(0, len(decode_order_book_snapshots(encode_order_book_snapshots({}))))
+        with self.assertRaises(ValueError):
+            decode_order_book_snapshots(data[:-8])
+        with self.assertRaises(ValueError):
+            decode_order_book_snapshots(b"\x80\x03" + data[2:])
+
+        # Row counts that are negative, or that run past the end of the snapshot, are rejected before slicing.
+        row_counts_offset: int = 16
+        bad_row_counts: List[np.ndarray] = [np.array([[5, 5], [-2, 0]], dtype="<i8"),
+                                            np.array([[5, 5], [1 << 40, 0]], dtype="<i8"),
+                                            np.array([[5, 5], [1, 0]], dtype="<i8")]
+        for row_counts in bad_row_counts:
+            bad_data: bytes = data[:row_counts_offset] + row_counts.tobytes() + data[row_counts_offset + 32:]
+            with self.assertRaisesRegex(ValueError, "row counts"):
+                decode_order_book_snapshots(bad_data)
+
+
+@attr('stable')
+class OrderBookDepthIndexUnitTest(OrderBookUnitTest):
+    use_depth_index: bool = True
+
+    def test_depth_index_follows_diffs(self):
+        # Remove the 102 ask level, add a 100.5 ask level, and cross the book with a newer 101 bid.
+        self.order_book.apply_diffs([OrderBookRow(101.0, 2.0, 2)],
+                                    [OrderBookRow(102.0, 0.0, 2), OrderBookRow(100.5, 1.0, 1)],
+                                    2)
+        walked_order_book: OrderBook = OrderBook()
+        walked_order_book.apply_snapshot(list(self.order_book.bid_entries()), list(self.order_book.ask_entries()), 2)
+        for is_buy in [True, False]:
+            for volume in [0.5, 2.0, 4.5, 10.0]:
+                self.assertEqual(walked_order_book.get_price_for_volume(is_buy, volume).result_price,
+                                 self.order_book.get_price_for_volume(is_buy, volume).result_price)
+                self.assertAlmostEqual(walked_order_book.get_quote_volume_for_base_amount(is_buy, volume).result_volume,
+                                       self.order_book.get_quote_volume_for_base_amount(is_buy, volume).result_volume)
+            for price in [96.5, 100.5, 101.0, 103.0]:
+                self.assertAlmostEqual(walked_order_book.get_volume_for_price(is_buy, price).result_volume,
+                                       self.order_book.get_volume_for_price(is_buy, price).result_volume)
+
+    def test_toggle_depth_index(self):
+        self.order_book.use_depth_index = False
+        self.assertFalse(self.order_book.use_depth_index)
+        self.order_book.use_depth_index = True
+        self.assertEqual(102.0, self.order_book.get_price_for_volume(True, 2.5).result_price)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from nose.plugins.attrib import attr
+import time
+from typing import (
+    List,
+    Set
+)
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.utils.order_book_change_trigger import OrderBookChangeTrigger
+
+
+@attr('stable')
+class OrderBookChangeTriggerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.callbacks: List[Set[str]] = []
+        self.trigger: OrderBookChangeTrigger = OrderBookChangeTrigger(self.callbacks.append, debounce_interval=0.05)
+        self.order_books: List[OrderBook] = [OrderBook(), OrderBook()]
+        self.trigger.watch("ETHUSDT", self.order_books[0])
+        self.trigger.watch("WETH-DAI", self.order_books[1])
+
+    def tearDown(self):
+        self.trigger.stop()
+        self.ev_loop.close()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    def change_order_book(self, symbol: str, order_book: OrderBook, update_id: int):
+        order_book.apply_diffs([], [], update_id)
+        OrderBookTracker._did_change_order_book(symbol, order_book)
+
+    def test_debounced_changes(self):
+        start_time: float = time.time()
+        for update_id in range(1, 10):
+            self.change_order_book("ETHUSDT", self.order_books[0], update_id)
+        self.change_order_book("WETH-DAI", self.order_books[1], 1)
+        self.run_async(asyncio.sleep(0.1))
+
+        # A burst of changes results in one callback, shortly after the first change.
+        self.assertEqual([{"ETHUSDT", "WETH-DAI"}], self.callbacks)
+        self.assertLess(time.time() - start_time, 0.2)
+
+        self.change_order_book("WETH-DAI", self.order_books[1], 2)
+        self.run_async(asyncio.sleep(0.1))
+        self.assertEqual([{"ETHUSDT", "WETH-DAI"}, {"WETH-DAI"}], self.callbacks)
+
+    def test_unwatch(self):
+        self.trigger.watch("ETHUSDT", self.order_books[0])
+        self.trigger.unwatch("WETH-DAI")
+        self.assertEqual({"ETHUSDT"}, self.trigger.watched_keys)
+        # Order books that are not watched have no listeners, so the tracker does not build change events for them.
+        self.assertTrue(self.order_books[0].has_listeners(OrderBookEvent.OrderBookChanged))
+        self.assertFalse(self.order_books[1].has_listeners(OrderBookEvent.OrderBookChanged))
+        self.change_order_book("ETHUSDT", self.order_books[0], 1)
+        self.change_order_book("WETH-DAI", self.order_books[1], 1)
+        self.run_async(asyncio.sleep(0.1))
+        self.assertEqual([{"ETHUSDT"}], self.callbacks)
+
+        self.trigger.stop()
+        self.change_order_book("ETHUSDT", self.order_books[0], 2)
+        self.run_async(asyncio.sleep(0.1))
+        self.assertEqual([{"ETHUSDT"}], self.callbacks)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from nose.plugins.attrib import attr
+import time
+from typing import (
+    Dict,
+    List
+)
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+
+
+class MockOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    def __init__(self, symbols: List[str]):
+        self.order_books: Dict[str, OrderBook] = {}
+        for symbol in symbols:
+            order_book: OrderBook = OrderBook()
+            order_book.apply_snapshot([OrderBookRow(99.0 - i, 1.0, 1) for i in range(5)],
+                                      [OrderBookRow(101.0 + i, 1.0, 1) for i in range(5)],
+                                      1)
+            self.order_books[symbol] = order_book
+
+    async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
+        return {symbol: OrderBookTrackerEntry(symbol, time.time(), order_book)
+                for symbol, order_book in self.order_books.items()}
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class MockOrderBookTracker(OrderBookTracker):
+    def __init__(self, symbols: List[str], use_depth_index: bool = False, coalesce_diffs: bool = False):
+        super().__init__(coalesce_diffs=coalesce_diffs, use_depth_index=use_depth_index)
+        self._data_source: MockOrderBookTrackerDataSource = MockOrderBookTrackerDataSource(symbols)
+
+    @property
+    def data_source(self) -> OrderBookTrackerDataSource:
+        return self._data_source
+
+    async def start(self):
+        await self._refresh_tracking_tasks()
+
+    def stop(self):
+        for task in self._tracking_tasks.values():
+            task.cancel()
+
+
+@attr('stable')
+class OrderBookTrackerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+
+    def tearDown(self):
+        self.ev_loop.close()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    def test_use_depth_index(self):
+        tracker: MockOrderBookTracker = MockOrderBookTracker(["ETHUSDT", "ZRXETH"], use_depth_index=True)
+        self.run_async(tracker.start())
+        try:
+            self.assertEqual({"ETHUSDT", "ZRXETH"}, set(tracker.order_books.keys()))
+            self.assertTrue(all(order_book.use_depth_index for order_book in tracker.order_books.values()))
+            self.assertEqual(2.0, tracker.order_books["ETHUSDT"].get_volume_for_price(True, 102.0).result_volume)
+
+            tracker.use_depth_index = False
+            self.assertFalse(any(order_book.use_depth_index for order_book in tracker.order_books.values()))
+        finally:
+            tracker.stop()
+            self.run_async(asyncio.sleep(0))
+
+    def test_coalesce_diffs(self):
+        tracker: MockOrderBookTracker = MockOrderBookTracker(["ETHUSDT"], coalesce_diffs=True)
+        self.run_async(tracker.start())
+        try:
+            # Messages that are queued up before the tracking task runs are applied as one batch.
+            message_queue: asyncio.Queue = tracker._tracking_message_queues["ETHUSDT"]
+            for update_id, bid_amount in [(2, "2"), (3, "0"), (4, "5")]:
+                message_queue.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, {
+                    "symbol": "ETHUSDT",
+                    "update_id": update_id,
+                    "bids": [["99", bid_amount], ["98", "3"]],
+                    "asks": []
+                }, timestamp=float(update_id)))
+            self.run_async(asyncio.sleep(0.01))
+
+            order_book: OrderBook = tracker.order_books["ETHUSDT"]
+            self.assertEqual(4, order_book.last_diff_uid)
+            self.assertEqual([(99.0, 5.0), (98.0, 3.0)],
+                             [(row.price, row.amount) for row in list(order_book.bid_entries())[:2]])
+            self.assertEqual([2, 3, 4], [message.update_id for message in tracker._past_diffs_windows["ETHUSDT"]])
+        finally:
+            tracker.stop()
+            self.run_async(asyncio.sleep(0))
+
+    def test_no_depth_index_by_default(self):
+        tracker: MockOrderBookTracker = MockOrderBookTracker(["ETHUSDT"])
+        self.run_async(tracker.start())
+        try:
+            self.assertFalse(tracker.order_books["ETHUSDT"].use_depth_index)
+        finally:
+            tracker.stop()
+            self.run_async(asyncio.sleep(0))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
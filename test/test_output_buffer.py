@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from nose.plugins.attrib import attr
+from typing import List
+import unittest
+
+from hummingbot.client.ui.output_buffer import OutputBuffer
+
+
+@attr('stable')
+class OutputBufferUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.rendered_texts: List[str] = []
+
+    def tearDown(self):
+        self.ev_loop.close()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    def test_coalesced_redraws(self):
+        output_buffer: OutputBuffer = OutputBuffer(self.rendered_texts.append, 5, refresh_interval=0.1)
+        for i in range(10):
+            output_buffer.append(f"line {i}")
+        self.run_async(asyncio.sleep(0.01))
+        self.assertEqual(["line 5\nline 6\nline 7\nline 8\nline 9"], self.rendered_texts)
+
+        # Lines appended within the refresh interval are drawn together, once the interval is over.
+        output_buffer.append("line 10")
+        output_buffer.append("line 11\nline 12")
+        self.run_async(asyncio.sleep(0.05))
+        self.assertEqual(1, len(self.rendered_texts))
+        self.run_async(asyncio.sleep(0.1))
+        self.assertEqual(2, len(self.rendered_texts))
+        self.assertEqual("line 8\nline 9\nline 10\nline 11\nline 12", self.rendered_texts[-1])
+
+    def test_dropped_lines(self):
+        output_buffer: OutputBuffer = OutputBuffer(self.rendered_texts.append, 100, maximum_pending_line_count=3)
+        for i in range(10):
+            output_buffer.append(f"line {i}")
+        self.assertEqual(3, output_buffer.pending_line_count)
+        self.assertEqual(7, output_buffer.dropped_line_count)
+        self.run_async(asyncio.sleep(0.01))
+        self.assertEqual(["... 7 lines dropped ...", "line 7", "line 8", "line 9"], list(output_buffer.lines))
+        self.assertEqual(0, output_buffer.pending_line_count)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import json
+import logging
+from nose.plugins.attrib import attr
+from typing import (
+    Any,
+    Dict,
+    List
+)
+import unittest
+from unittest.mock import (
+    MagicMock,
+    patch
+)
+
+from hummingbot.logger.reporting_proxy_handler import ReportingProxyHandler
+
+
+@attr('stable')
+class ReportingProxyHandlerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.log_server_client_patcher = patch("hummingbot.logger.reporting_proxy_handler.LogServerClient")
+        self.log_server_client: MagicMock = self.log_server_client_patcher.start().get_instance.return_value
+
+    def tearDown(self):
+        self.log_server_client_patcher.stop()
+        self.ev_loop.close()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    @staticmethod
+    def make_record(msg: str) -> logging.LogRecord:
+        return logging.LogRecord("test", logging.INFO, __file__, 1, msg, None, None)
+
+    @property
+    def sent_payloads(self) -> List[List[Dict[str, Any]]]:
+        return [json.loads(call[0][0]["request_obj"]["data"]) for call in self.log_server_client.request.call_args_list]
+
+    def test_batch_size_flush(self):
+        handler: ReportingProxyHandler = ReportingProxyHandler(capacity=3, batched=True, flush_interval=10.0,
+                                                               max_queue_size=5)
+        for i in range(2):
+            handler.emit(self.make_record(f"record {i}"))
+        self.run_async(asyncio.sleep(0.01))
+        self.assertEqual([], self.sent_payloads)
+
+        handler.emit(self.make_record("record 2"))
+        self.run_async(asyncio.sleep(0.01))
+        self.assertEqual([["record 0", "record 1", "record 2"]],
+                         [[log["msg"] for log in payload] for payload in self.sent_payloads])
+
+        # Records emitted faster than they are flushed overflow the queue, and the oldest ones are dropped.
+        for i in range(3, 10):
+            handler.emit(self.make_record(f"record {i}"))
+        self.assertEqual(2, handler.dropped_record_count)
+        self.run_async(asyncio.sleep(0.01))
+        self.assertEqual(["record 5", "record 6", "record 7", "record 8", "record 9"],
+                         [log["msg"] for log in self.sent_payloads[-1]])
+
+        flush_task: asyncio.Task = handler._flush_task
+        handler.close()
+        self.run_async(asyncio.sleep(0.01))
+        self.assertTrue(flush_task.cancelled())
+        self.assertEqual(2, len(self.sent_payloads))
+
+    def test_flush_interval(self):
+        handler: ReportingProxyHandler = ReportingProxyHandler(capacity=100, batched=True, flush_interval=0.1)
+        handler.emit(self.make_record("record 0"))
+        self.run_async(asyncio.sleep(0.05))
+        self.assertEqual([], self.sent_payloads)
+        self.run_async(asyncio.sleep(0.1))
+        self.assertEqual([["record 0"]], [[log["msg"] for log in payload] for payload in self.sent_payloads])
+        handler.close()
+        self.run_async(asyncio.sleep(0.01))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
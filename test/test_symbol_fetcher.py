@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import json
+from nose.plugins.attrib import attr
+import os
+import tempfile
+import time
+from typing import List
+import unittest
+
+from hummingbot.core.utils.symbol_fetcher import (
+    SymbolFetcher,
+    SYMBOLS_CACHE_VERSION
+)
+
+
+class MockSymbolFetcher(SymbolFetcher):
+    @staticmethod
+    async def fetch_binance_symbols() -> List[str]:
+        await asyncio.sleep(0.1)
+        return ["ETHBTC", "ZRXETH"]
+
+    @staticmethod
+    async def fetch_ddex_symbols() -> List[str]:
+        await asyncio.sleep(0.1)
+        return ["WETH-DAI"]
+
+    @staticmethod
+    async def fetch_radar_relay_symbols() -> List[str]:
+        await asyncio.sleep(0.1)
+        raise IOError("Network is unreachable.")
+
+    @staticmethod
+    async def fetch_bamboo_relay_symbols() -> List[str]:
+        await asyncio.sleep(0.1)
+        return []
+
+    @staticmethod
+    async def fetch_coinbase_pro_symbols() -> List[str]:
+        await asyncio.sleep(0.1)
+        return ["ETH-USDC"]
+
+
+@attr('stable')
+class SymbolFetcherUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+        self.temp_dir: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.cache_path: str = join(self.temp_dir.name, "symbols_cache.json")
+
+    def tearDown(self):
+        self.ev_loop.close()
+        self.temp_dir.cleanup()
+
+    def write_cache(self, timestamp: float, version: int = SYMBOLS_CACHE_VERSION):
+        with open(self.cache_path, "w") as fd:
+            json.dump({
+                "version": version,
+                "timestamp": timestamp,
+                "symbols": {"binance": ["ETHBTC"], "radar_relay": ["ZRX-WETH"]}
+            }, fd)
+
+    def test_concurrent_fetch(self):
+        symbol_fetcher: SymbolFetcher = MockSymbolFetcher(cache_path=self.cache_path)
+        self.assertFalse(symbol_fetcher.ready)
+
+        start_time: float = time.time()
+        self.ev_loop.run_until_complete(symbol_fetcher.fetch_task)
+        self.assertLess(time.time() - start_time, 0.3)
+        self.assertTrue(symbol_fetcher.ready)
+        self.assertEqual(["ETHBTC", "ZRXETH"], symbol_fetcher.symbols["binance"])
+        self.assertEqual([], symbol_fetcher.symbols["radar_relay"])
+        self.assertTrue(os.path.isfile(self.cache_path))
+
+        # The next launch is served from the cache.
+        cached_symbol_fetcher: SymbolFetcher = MockSymbolFetcher(cache_path=self.cache_path)
+        self.assertTrue(cached_symbol_fetcher.ready)
+        self.assertEqual(symbol_fetcher.symbols, cached_symbol_fetcher.symbols)
+        self.ev_loop.run_until_complete(cached_symbol_fetcher.fetch_task)
+
+    def test_cached_symbols(self):
+        self.write_cache(time.time() - 60)
+        symbol_fetcher: SymbolFetcher = MockSymbolFetcher(cache_path=self.cache_path)
+        self.assertTrue(symbol_fetcher.ready)
+        self.assertEqual({"binance": ["ETHBTC"], "radar_relay": ["ZRX-WETH"]}, symbol_fetcher.symbols)
+
+        # The background refresh updates the cached symbols, but keeps those of unreachable exchanges.
+        self.ev_loop.run_until_complete(symbol_fetcher.fetch_task)
+        self.assertEqual(["ETHBTC", "ZRXETH"], symbol_fetcher.symbols["binance"])
+        self.assertEqual(["ZRX-WETH"], symbol_fetcher.symbols["radar_relay"])
+
+    def test_expired_cache(self):
+        self.write_cache(time.time() - 60, version=SYMBOLS_CACHE_VERSION + 1)
+        symbol_fetcher: SymbolFetcher = MockSymbolFetcher(cache_path=self.cache_path)
+        self.assertFalse(symbol_fetcher.ready)
+        self.ev_loop.run_until_complete(symbol_fetcher.fetch_task)
+
+        self.write_cache(time.time() - 60)
+        symbol_fetcher = MockSymbolFetcher(cache_path=self.cache_path, cache_ttl=30)
+        self.assertFalse(symbol_fetcher.ready)
+        self.ev_loop.run_until_complete(symbol_fetcher.fetch_task)
+        self.assertTrue(symbol_fetcher.ready)
+        self.assertEqual([], symbol_fetcher.symbols["radar_relay"])
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
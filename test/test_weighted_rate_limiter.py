@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from nose.plugins.attrib import attr
+import time
+from typing import List
+import unittest
+
+from hummingbot.core.utils.weighted_rate_limiter import WeightedRateLimiter
+
+
+@attr('stable')
+class WeightedRateLimiterUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.ev_loop)
+
+    def tearDown(self):
+        self.ev_loop.close()
+
+    def run_async(self, coro):
+        return self.ev_loop.run_until_complete(coro)
+
+    async def timed_acquire(self, limiter: WeightedRateLimiter, start_time: float, weight: float,
+                            reserve: float = 0.0) -> float:
+        await limiter.acquire(weight, reserve=reserve)
+        return time.monotonic() - start_time
+
+    def test_concurrent_requests_within_budget(self):
+        limiter: WeightedRateLimiter = WeightedRateLimiter(20, 1.0)
+        start_time: float = time.monotonic()
+        elapsed: List[float] = self.run_async(asyncio.gather(*[self.timed_acquire(limiter, start_time, 10)
+                                                                for _ in range(2)]))
+        self.assertLess(max(elapsed), 0.05)
+        self.assertLess(limiter.available_weight, 1.0)
+
+    def test_backpressure(self):
+        limiter: WeightedRateLimiter = WeightedRateLimiter(20, 1.0)
+        start_time: float = time.monotonic()
+        # The first two requests use up the budget, and the bucket refills at 20 per second.
+        elapsed: List[float] = self.run_async(asyncio.gather(*[self.timed_acquire(limiter, start_time, 10)
+                                                                for _ in range(4)]))
+        self.assertLess(elapsed[1], 0.05)
+        self.assertAlmostEqual(0.5, elapsed[2], delta=0.1)
+        self.assertAlmostEqual(1.0, elapsed[3], delta=0.1)
+        self.assertEqual(0, limiter.waiting_count)
+
+        with self.assertRaises(ValueError):
+            self.run_async(limiter.acquire(21))
+
+    def test_reserve(self):
+        # The background request must leave 10 in the bucket, so the later request without a reserve goes first.
+        limiter: WeightedRateLimiter = WeightedRateLimiter(20, 1.0)
+        self.run_async(limiter.acquire(15))
+        start_time: float = time.monotonic()
+        background = asyncio.ensure_future(self.timed_acquire(limiter, start_time, 5, reserve=10))
+        foreground = asyncio.ensure_future(self.timed_acquire(limiter, start_time, 5))
+        background_elapsed, foreground_elapsed = self.run_async(asyncio.gather(background, foreground))
+        self.assertLess(foreground_elapsed, 0.05)
+        self.assertAlmostEqual(0.75, background_elapsed, delta=0.1)
+
+    def test_pause(self):
+        limiter: WeightedRateLimiter = WeightedRateLimiter(100, 1.0)
+        limiter.pause(0.3)
+        start_time: float = time.monotonic()
+        elapsed: float = self.run_async(self.timed_acquire(limiter, start_time, 1))
+        self.assertAlmostEqual(0.3, elapsed, delta=0.1)
+
+    def test_cancellation(self):
+        limiter: WeightedRateLimiter = WeightedRateLimiter(10, 1.0)
+        self.run_async(limiter.acquire(10))
+        start_time: float = time.monotonic()
+        large_request = asyncio.ensure_future(self.timed_acquire(limiter, start_time, 8))
+        small_request = asyncio.ensure_future(self.timed_acquire(limiter, start_time, 1))
+        self.ev_loop.call_later(0.05, large_request.cancel)
+        elapsed: float = self.run_async(small_request)
+        self.assertTrue(large_request.cancelled())
+        self.assertAlmostEqual(0.1, elapsed, delta=0.05)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()
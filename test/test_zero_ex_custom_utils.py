@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from eth_account import Account
+from eth_account.messages import defunct_hash_message
+from nose.plugins.attrib import attr
+import unittest
+from unittest.mock import (
+    MagicMock,
+    patch
+)
+from zero_ex.order_utils import (
+    _parse_signature_hex_as_rsv,
+    _parse_signature_hex_as_vrs
+)
+
+from hummingbot.wallet.ethereum.zero_ex import zero_ex_custom_utils
+from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils import fix_signature
+
+PRIVATE_KEY = "0x" + "11" * 32
+OTHER_PRIVATE_KEY = "0x" + "22" * 32
+ORDER_HASH_HEX = "0x" + "ab" * 32
+ETH_SIGN_SIGNATURE_TYPE = "03"
+
+
+@attr('stable')
+class ZeroExCustomUtilsUnitTest(unittest.TestCase):
+    def setUp(self):
+        zero_ex_custom_utils._signature_layouts.clear()
+        self.account = Account.privateKeyToAccount(PRIVATE_KEY)
+        signed = Account.signHash(defunct_hash_message(hexstr=ORDER_HASH_HEX), PRIVATE_KEY)
+        self.v: str = f"{signed.v:02x}"
+        self.r: str = f"{signed.r:064x}"
+        self.s: str = f"{signed.s:064x}"
+        self.expected_signature: str = "0x" + self.v + self.r + self.s + ETH_SIGN_SIGNATURE_TYPE
+
+    def tearDown(self):
+        zero_ex_custom_utils._signature_layouts.clear()
+
+    def test_rsv_signature(self):
+        signature: str = "0x" + self.r + self.s + self.v
+        self.assertEqual(self.expected_signature, fix_signature(None, self.account.address, ORDER_HASH_HEX, signature))
+        self.assertEqual("rsv", zero_ex_custom_utils._signature_layouts[self.account.address])
+
+    def test_vrs_signature(self):
+        signature: str = "0x" + self.v + self.r + self.s
+        self.assertEqual(self.expected_signature, fix_signature(None, self.account.address, ORDER_HASH_HEX, signature))
+        self.assertEqual("vrs", zero_ex_custom_utils._signature_layouts[self.account.address])
+
+    def test_cached_layout(self):
+        signature: str = "0x" + self.v + self.r + self.s
+        fix_signature(None, self.account.address, ORDER_HASH_HEX, signature)
+
+        # The second signature of the same signer is parsed with the cached layout only.
+        parsers = {"rsv": MagicMock(wraps=_parse_signature_hex_as_rsv),
+                   "vrs": MagicMock(wraps=_parse_signature_hex_as_vrs)}
+        with patch.dict(zero_ex_custom_utils._signature_parsers, parsers):
+            self.assertEqual(self.expected_signature,
+                             fix_signature(None, self.account.address, ORDER_HASH_HEX, signature))
+        parsers["vrs"].assert_called_once_with(signature)
+        parsers["rsv"].assert_not_called()
+
+    def test_wrong_signer(self):
+        other_address: str = Account.privateKeyToAccount(OTHER_PRIVATE_KEY).address
+        for signature in ["0x" + self.r + self.s + self.v, "0x" + self.v + self.r + self.s]:
+            with self.assertRaises(RuntimeError):
+                fix_signature(None, other_address, ORDER_HASH_HEX, signature)
+        self.assertNotIn(other_address, zero_ex_custom_utils._signature_layouts)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == "__main__":
+    main()